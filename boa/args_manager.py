@@ -32,7 +32,7 @@ class ArgsManager:
         """
         # Mandatory
         self.parser.add_argument("target",
-                                 help="Target file to analyze, which should be either a code file (e.g. /path/to/file.c) or a binary (e.g. /usr/bin/pwd)")
+                                 help="Target file to analyze, which should be either a code file (e.g. /path/to/file.c), a directory (e.g. /path/to/java/project) or a binary (e.g. /usr/bin/pwd)")
         self.parser.add_argument("rules_file", metavar="rules-file",
                                  help="Rules file")
 
@@ -41,6 +41,10 @@ class ArgsManager:
                                  help="Show the version and exit")
         self.parser.add_argument("--no-fail", action="store_true",
                                  help="Continue the execution even if some user module could not be loaded")
+        self.parser.add_argument("--rules-cache", metavar="DIR",
+                                 help="Directory where the checked rules will be cached, so the rules file is not checked again unless it changes")
+        self.parser.add_argument("--result-cache", metavar="DIR",
+                                 help="Directory where the reports of the static analyses will be cached, so the analysis is not executed again unless the target, the rules file, the environment variables or the code of BOA change")
         ## Debug
         self.parser.add_argument("--print-traceback", action="store_true",
                                  help="Print traceback when an exception is raised")
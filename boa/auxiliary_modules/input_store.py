@@ -0,0 +1,151 @@
+"""File which contains the content-addressed store of the inputs of
+the fuzzing modules.
+
+The inputs are written once to a file whose name is the SHA-256 of the
+input (in a subdirectory with the first 2 characters of the hash in
+order to avoid huge directories), so the duplicated inputs are stored
+once, and the threats only need to contain the hash of the input and a
+short preview instead of the whole input.
+"""
+
+# Std libs
+import os
+import hashlib
+import tempfile
+
+class InputStoreConstants:
+    """Class which contains the necessary constants
+    for working with the input store.
+    """
+    hash_prefix = "sha256:"
+    default_preview_length = 16
+
+class InputStore:
+    """InputStore class.
+
+    It stores inputs by their content.
+    """
+
+    def __init__(self, directory):
+        """It initializes the store.
+
+        Arguments:
+            directory (str): directory of the store. It will be
+                created if it does not exist.
+
+        Raises:
+            OSError: if the directory could not be created.
+        """
+        self.directory = directory
+        self.hashes = set()     # Hashes of the inputs which are known to be stored
+
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def get_bytes(data):
+        """It returns an input as bytes.
+
+        Arguments:
+            data (str or bytes): input.
+
+        Returns:
+            bytes: input. If *data* is a *str*, it is encoded with UTF-8
+        """
+        if isinstance(data, str):
+            return data.encode()
+
+        return bytes(data)
+
+    def get_path(self, input_hash):
+        """It returns the path of an input.
+
+        Arguments:
+            input_hash (str): hash of the input.
+
+        Returns:
+            str: path
+        """
+        return os.path.join(self.directory, input_hash[:2], input_hash)
+
+    def store(self, data):
+        """It stores an input unless it was already stored.
+
+        Arguments:
+            data (str or bytes): input.
+
+        Returns:
+            str: hash of the input
+
+        Raises:
+            OSError: if the input could not be written.
+        """
+        data = self.get_bytes(data)
+        input_hash = hashlib.sha256(data).hexdigest()
+
+        if input_hash in self.hashes:
+            return input_hash
+
+        path = self.get_path(input_hash)
+
+        if not os.path.isfile(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            # The file is replaced atomically, so other process which stores the same input does not find it incomplete
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".input_")
+
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.isfile(tmp_path):
+                    os.remove(tmp_path)
+
+                raise
+
+        self.hashes.add(input_hash)
+
+        return input_hash
+
+    def load(self, input_hash):
+        """It loads an input.
+
+        Arguments:
+            input_hash (str): hash of the input. The prefix
+                *InputStoreConstants.hash_prefix* is optional.
+
+        Returns:
+            bytes: input
+
+        Raises:
+            OSError: if the input could not be read.
+        """
+        if input_hash.startswith(InputStoreConstants.hash_prefix):
+            input_hash = input_hash[len(InputStoreConstants.hash_prefix):]
+
+        with open(self.get_path(input_hash), "rb") as f:
+            return f.read()
+
+    def get_reference(self, data, preview_length=InputStoreConstants.default_preview_length):
+        """It stores an input and returns the text which references it
+        in the threats: its hash and a preview.
+
+        Arguments:
+            data (str or bytes): input.
+            preview_length (int): maximum number of bytes of the preview.
+
+        Returns:
+            str: reference
+
+        Raises:
+            OSError: if the input could not be written.
+        """
+        data = self.get_bytes(data)
+        input_hash = self.store(data)
+        preview = f"{data[:preview_length]}"
+
+        if len(data) > preview_length:
+            preview += "..."
+
+        return f"{InputStoreConstants.hash_prefix}{input_hash} ({preview})"
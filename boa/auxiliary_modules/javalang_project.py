@@ -0,0 +1,320 @@
+"""File which contains the necessary logic in order to analyze
+a Java project (i.e. all the ".java" files of a directory) with
+javalang.
+
+The files are parsed in a pool of processes, and the parses are
+cached by the hash of the content of the files, so a file which
+has not changed (or a file duplicated in the project) is not parsed
+again. The analysis of each file is also executed in the pool and
+only its (compact) result is sent back to the main process.
+"""
+
+# Std libs
+import os
+import hashlib
+import logging
+import multiprocessing
+
+# Own libs
+import auxiliary_modules.signed_cache as signed_cache
+
+# 3rd libs
+import javalang
+
+def find_java_files(path):
+    """It looks for the Java files of a directory recursively.
+
+    Arguments:
+        path (str): directory or file. If it is a file, it will
+            be returned as the only Java file.
+
+    Returns:
+        list: sorted list of *str* which contains the paths of
+        the Java files
+    """
+    if os.path.isfile(path):
+        return [path]
+
+    result = []
+
+    for root, dirs, files in os.walk(path):
+        # Deterministic order
+        dirs.sort()
+
+        for filename in sorted(files):
+            if filename.endswith(".java"):
+                result.append(os.path.join(root, filename))
+
+    return result
+
+def get_code_hash(code):
+    """It returns the hash of the content of a file.
+
+    Arguments:
+        code (str): content of the file.
+
+    Returns:
+        str: hex digest (SHA-256)
+    """
+    return hashlib.sha256(code.encode("utf-8", errors="surrogateescape")).hexdigest()
+
+class ParseCache:
+    """ParseCache class.
+
+    It stores the javalang ASTs in a directory by the hash of the content
+    of the files and the version of javalang. If no directory is provided,
+    the ASTs are not stored.
+
+    The ASTs are pickled, so the directory is not used if it can be
+    modified by other users and the entries are signed (check
+    *auxiliary_modules.signed_cache*).
+    """
+
+    def __init__(self, directory=None):
+        """It initializes the cache.
+
+        Arguments:
+            directory (str): directory where the ASTs will be stored. If
+                it can not be trusted, the ASTs will not be stored.
+        """
+        self.directory = directory
+        self.key = None
+
+        if self.directory is not None:
+            try:
+                signed_cache.check_directory(self.directory)
+
+                self.key = signed_cache.get_key(self.directory)
+            except (signed_cache.SignedCacheError, OSError) as e:
+                logging.warning("the cache of ASTs will not be used: %s", str(e))
+
+                self.directory = None
+
+    def get_path(self, code_hash):
+        """It returns the path of a cached AST.
+
+        Arguments:
+            code_hash (str): hash of the content of the file.
+
+        Returns:
+            str: path
+        """
+        # The ASTs of different versions of javalang might not be compatible
+        version = getattr(javalang, "__version__", "unknown")
+
+        return os.path.join(self.directory, f"{code_hash}.javalang-{version}.pickle")
+
+    def load(self, code_hash):
+        """It loads an AST from the cache.
+
+        Arguments:
+            code_hash (str): hash of the content of the file.
+
+        Returns:
+            AST (Abstract Syntax Tree). If the AST is not cached,
+            *None* will be returned
+        """
+        if self.directory is None:
+            return None
+
+        path = self.get_path(code_hash)
+
+        try:
+            with open(path, "rb") as f:
+                return signed_cache.loads(f.read(), self.key, os.path.basename(path))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning("could not load the cached AST '%s': %s", code_hash, str(e))
+
+        return None
+
+    def store(self, code_hash, ast):
+        """It stores an AST in the cache.
+
+        Arguments:
+            code_hash (str): hash of the content of the file.
+            ast: AST (Abstract Syntax Tree).
+        """
+        if self.directory is None:
+            return
+
+        path = self.get_path(code_hash)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(signed_cache.dumps(ast, self.key, os.path.basename(path)))
+
+            # Atomic in order to avoid races between processes
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logging.warning("could not store the AST '%s' in the cache: %s", code_hash, str(e))
+
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+
+class JavaProject:
+    """JavaProject class.
+
+    It contains the Java files of a project and allows to apply an
+    analysis to all of them in parallel (check *map*).
+    """
+
+    def __init__(self, path, processes=None, cache_directory=None):
+        """It looks for the Java files and reads them.
+
+        Arguments:
+            path (str): directory of the project (a single file is
+                allowed as well).
+            processes (int): number of processes of the pool. If *None*,
+                the number of CPUs will be used.
+            cache_directory (str): directory where the ASTs will be cached.
+                If *None*, the ASTs will not be cached.
+
+        Raises:
+            OSError: if a file could not be read.
+        """
+        self.path = path
+        self.processes = processes
+        self.cache_directory = cache_directory
+        self.files = []     # [path, code, hash of code]
+
+        for java_file in find_java_files(path):
+            with open(java_file, "r", errors="surrogateescape") as f:
+                code = f.read()
+
+            self.files.append([java_file, code, get_code_hash(code)])
+
+    def get_relative_path(self, path):
+        """It returns the path of a file relative to the project.
+
+        Arguments:
+            path (str): path of a file of the project.
+
+        Returns:
+            str: relative path
+        """
+        if os.path.isfile(self.path):
+            return os.path.basename(path)
+
+        return os.path.relpath(path, self.path)
+
+    def map(self, analysis, analysis_args):
+        """It applies an analysis to the AST of all the files.
+
+        The files with the same content are parsed and analyzed only once.
+
+        Arguments:
+            analysis (function): function which receives the AST of a file
+                and *analysis_args* and returns the result. It has to be
+                defined at module level in order to be sent to the pool.
+            analysis_args: arguments of *analysis*.
+
+        Returns:
+            list: list of tuples of format (str, result) which contains the path
+            of the file and the result of *analysis*. If a file could not be parsed,
+            the result will be *None*
+        """
+        unique_files = {}   # {hash: code}
+
+        for _, code, code_hash in self.files:
+            if code_hash not in unique_files:
+                unique_files[code_hash] = code
+
+        # The cache directory is checked once (None if it can not be trusted)
+        cache_directory = ParseCache(self.cache_directory).directory
+        tasks = [(code_hash, code, cache_directory, analysis, analysis_args)
+                 for code_hash, code in unique_files.items()]
+        results = {}
+        processes = self.processes
+
+        if processes is None:
+            processes = os.cpu_count() or 1
+
+        if (len(tasks) <= 1 or processes == 1):
+            for task in tasks:
+                code_hash, result = analyze_file(task)
+                results[code_hash] = result
+        else:
+            chunksize = max(1, len(tasks) // (processes * 4))
+
+            with multiprocessing.Pool(processes) as pool:
+                for code_hash, result in pool.imap_unordered(analyze_file, tasks, chunksize):
+                    results[code_hash] = result
+
+        return [(path, results[code_hash]) for path, _, code_hash in self.files]
+
+def analyze_file(task):
+    """It parses a file (or loads its AST from the cache) and applies
+    an analysis. This function is executed in the pool of processes.
+
+    Arguments:
+        task (tuple): tuple of format (str, str, str, function, object)
+            which contains the hash of the content of the file, the
+            content, the cache directory, the analysis and its arguments.
+
+    Returns:
+        tuple: tuple of format (str, result) which contains the hash of
+        the content of the file and the result of the analysis. If the file
+        could not be parsed, the result will be *None*
+    """
+    code_hash, code, cache_directory, analysis, analysis_args = task
+    cache = ParseCache(cache_directory)
+    ast = cache.load(code_hash)
+
+    if ast is None:
+        try:
+            ast = javalang.parse.parse(code)
+        except Exception as e:
+            logging.warning("could not parse a Java file (hash '%s'): %s", code_hash, str(e))
+
+            return (code_hash, None)
+
+        cache.store(code_hash, ast)
+
+    return (code_hash, analysis(ast, analysis_args))
+
+def get_method_invocation_names(node):
+    """It returns the names of a method invocation: the qualified name
+    (e.g. "Runtime.getRuntime"), if there is qualifier, and the name
+    (e.g. "getRuntime").
+
+    Arguments:
+        node (javalang.tree.MethodInvocation): method invocation.
+
+    Returns:
+        list: list of *str*
+    """
+    if node.qualifier:
+        return [f"{node.qualifier}.{node.member}", node.member]
+
+    return [node.member]
+
+def get_method_invocations(ast, matcher):
+    """It looks for the method invocations which match a rule. It is
+    expected to be used as analysis of *JavaProject.map*.
+
+    Arguments:
+        ast: javalang AST.
+        matcher (auxiliary_modules.method_matcher.MethodMatcher): rules
+            of the methods.
+
+    Returns:
+        list: list of tuples of format (str, int, int) which contains the
+        name of the method which matched a rule, the row and the column
+    """
+    result = []
+
+    for _, node in ast.filter(javalang.tree.MethodInvocation):
+        name, _ = matcher.match_any(get_method_invocation_names(node))
+
+        if name is not None:
+            row, col = -1, -1
+
+            if node.position is not None:
+                row, col = node.position.line, node.position.column
+
+            result.append((name, row, col))
+
+    return result
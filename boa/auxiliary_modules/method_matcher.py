@@ -0,0 +1,204 @@
+"""File which contains the matcher of the methods (or functions)
+which are defined in the rules file by the function match modules.
+
+A method can be defined with its exact name ("method"), with a glob
+pattern ("glob", e.g. "str*cpy") or with a regular expression
+("regex", e.g. ".*printf"). The rules are compiled once: the exact
+names are looked up in a dict and the patterns are combined in a
+single regular expression, so the rules do not have to be iterated for
+each method invocation. Moreover, the result of each looked up name is
+memoized.
+
+The patterns which contain groups (e.g. backreferences like "(a)\\1" or
+named groups) cannot be combined, since the groups would be renumbered or
+duplicated, so they are matched on their own (check *get_segments*).
+"""
+
+# Std libs
+import re
+import fnmatch
+
+class MethodMatcherException(Exception):
+    """MethodMatcherException exception class.
+
+    This exception is intented to be used when the rules of the
+    methods are not valid.
+    """
+
+    def __init__(self, message):
+        """It initializes the exception.
+
+        Arguments:
+            message (str): message to be displayed.
+        """
+        super().__init__(message)
+
+        self.message = message
+
+class MethodMatcher:
+    """MethodMatcher class.
+
+    It looks for the rule of a method by its name. The exact names
+    have priority over the patterns, and the patterns are checked in
+    the same order that they are defined.
+    """
+
+    allowed_keys = ("method", "glob", "regex")
+
+    def __init__(self, methods):
+        """It compiles the rules.
+
+        Arguments:
+            methods (list): list of dicts which contains the rules of the
+                methods. Each rule has to contain one of the keys defined in
+                *MethodMatcher.allowed_keys* and might contain other keys
+                (e.g. "severity", "description", "advice").
+
+        Raises:
+            MethodMatcherException: if a rule is not valid or is duplicated.
+        """
+        self.exact = {}         # {name: rule}
+        self.patterns = []      # [rule]
+        self.cache = {}         # {name: rule or None}
+        self.segments = []      # [(compiled regex, index of the rule or None if combined)]
+        defined_patterns = set()
+        regexes = []
+
+        for method in methods:
+            keys = list(filter(lambda key: key in method, MethodMatcher.allowed_keys))
+
+            if len(keys) != 1:
+                raise MethodMatcherException("each method has to be defined with only one"
+                                             f" of the keys {MethodMatcher.allowed_keys}"
+                                             f" (found: {keys})")
+
+            key = keys[0]
+            value = method[key]
+
+            if key == "method":
+                if value in self.exact:
+                    raise MethodMatcherException(f"method '{value}' duplicated in rules")
+
+                self.exact[value] = method
+
+                continue
+
+            if (key, value) in defined_patterns:
+                raise MethodMatcherException(f"{key} '{value}' duplicated in rules")
+
+            if key == "glob":
+                regex = fnmatch.translate(value)
+            else:
+                regex = value
+
+            try:
+                compiled_regex = re.compile(regex)
+            except re.error as e:
+                raise MethodMatcherException(f"{key} '{value}' is not valid: {str(e)}") from e
+
+            defined_patterns.add((key, value))
+            regexes.append((regex, compiled_regex))
+            self.patterns.append(method)
+
+        self.segments = MethodMatcher.get_segments(regexes)
+
+    @staticmethod
+    def get_segments(regexes):
+        """It combines the consecutive patterns which do not contain
+        groups in a single regular expression. The patterns which contain
+        groups, and the ones which could not be combined (e.g. because of
+        inline flags), are matched on their own. The order of the patterns
+        is kept.
+
+        Arguments:
+            regexes (list): list of tuples of format (str, re.Pattern)
+                which contains the regular expression of each pattern.
+
+        Returns:
+            list: list of tuples of format (re.Pattern, int) which contains
+            the regular expressions and, if the regular expression only
+            contains one pattern, its index (otherwise, *None*, and the
+            name of the matched group contains the index)
+        """
+        segments = []
+        combined = []
+
+        def add_combined():
+            if len(combined) == 0:
+                return
+
+            try:
+                # Combined pattern (the name of the matched group contains the index of the rule)
+                segments.append((re.compile("|".join(f"(?P<_method_{idx}>(?:{regex})\\Z)"
+                                                     for idx, regex, _ in combined)), None))
+            except re.error:
+                for idx, _, compiled_regex in combined:
+                    segments.append((compiled_regex, idx))
+
+            combined.clear()
+
+        for idx, (regex, compiled_regex) in enumerate(regexes):
+            if compiled_regex.groups == 0:
+                combined.append((idx, regex, compiled_regex))
+            else:
+                add_combined()
+                segments.append((compiled_regex, idx))
+
+        add_combined()
+
+        return segments
+
+    def match(self, name):
+        """It looks for the rule of a method.
+
+        Arguments:
+            name (str): name of the method.
+
+        Returns:
+            dict: rule of the method. If there is no rule for the
+            method, *None* will be returned
+        """
+        if name in self.cache:
+            return self.cache[name]
+
+        rule = self.exact.get(name)
+
+        if rule is None:
+            for regex, idx in self.segments:
+                match = regex.fullmatch(name) if idx is not None else regex.match(name)
+
+                if match is not None:
+                    rule = self.patterns[idx if idx is not None else int(match.lastgroup[len("_method_"):])]
+
+                    break
+
+        self.cache[name] = rule
+
+        return rule
+
+    def match_any(self, names):
+        """It looks for the rule of the first name which has a rule.
+
+        Arguments:
+            names (list): list of *str* which contains the names
+                of the method (e.g. qualified and unqualified name).
+
+        Returns:
+            tuple: tuple of format (str, dict) which contains the name which
+            has matched and its rule. If there is no rule for any name,
+            (*None*, *None*) will be returned
+        """
+        for name in names:
+            rule = self.match(name)
+
+            if rule is not None:
+                return (name, rule)
+
+        return (None, None)
+
+    def __getstate__(self):
+        # The cache is not sent to other processes
+        state = self.__dict__.copy()
+        state["cache"] = {}
+
+        return state
@@ -0,0 +1,85 @@
+"""File which contains an index of the nodes of a pycparser AST.
+
+The index is created with only one traversal of the AST and allows
+to look for the nodes of a concrete type and the parent of each node
+without walking the AST again.
+"""
+
+class ASTIndex:
+    """ASTIndex class.
+
+    It indexes the nodes of an AST (e.g. a translation unit) by type and
+    stores the parent of each node.
+    """
+
+    def __init__(self, ast):
+        """It creates the index with one preorder traversal of the AST.
+
+        Arguments:
+            ast (pycparser.c_ast.Node): AST.
+        """
+        self.ast = ast
+        self.nodes_by_type = {}     # {type name: [node]} (preorder)
+        self.parents = {}           # {id(node): parent}
+
+        if ast is None:
+            return
+
+        # Iterative in order to avoid the recursion limit
+        stack = [(ast, None)]
+
+        while len(stack) != 0:
+            node, parent = stack.pop()
+            node_type = type(node).__name__
+
+            self.parents[id(node)] = parent
+
+            if node_type not in self.nodes_by_type:
+                self.nodes_by_type[node_type] = []
+
+            self.nodes_by_type[node_type].append(node)
+
+            children = node.children()
+
+            for _, child in reversed(children):
+                stack.append((child, node))
+
+    def get_nodes(self, node_type):
+        """It returns the nodes of a type.
+
+        Arguments:
+            node_type (str): name of the class of the nodes
+                (e.g. "FuncCall").
+
+        Returns:
+            list: list of nodes in preorder
+        """
+        return self.nodes_by_type.get(node_type, [])
+
+    def get_parent(self, node):
+        """It returns the parent of a node.
+
+        Arguments:
+            node (pycparser.c_ast.Node): node of the AST.
+
+        Returns:
+            pycparser.c_ast.Node: parent. If *node* is the root
+            or is not indexed, *None* will be returned
+        """
+        return self.parents.get(id(node))
+
+    def get_ancestors(self, node):
+        """It returns the ancestors of a node.
+
+        Arguments:
+            node (pycparser.c_ast.Node): node of the AST.
+
+        Returns:
+            generator: ancestors from the parent to the root
+        """
+        parent = self.get_parent(node)
+
+        while parent is not None:
+            yield parent
+
+            parent = self.get_parent(parent)
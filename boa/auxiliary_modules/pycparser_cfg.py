@@ -1,8 +1,21 @@
 """File which contains the CFG (i.e. Control Flow Graph)
 data structure.
+
+It also contains the data structures which allow to compute the CFG
+of the functions alone (*CFGFragment*) and of the files of a program
+(*CFGUnit*), and to store the latter in order to link the whole program
+(*CFGUnitStore*).
 """
 
+# Std libs
+import os
+import json
+import pickle
+import hashlib
+import logging
+
 # 3rd libs
+import pycparser
 import pycparser.c_ast as ast
 
 # Own libs
@@ -131,6 +144,42 @@ class Instruction():
         """
         self.succs = []
 
+    def replace_succ(self, succ_instr, succ_instrs):
+        """It replaces a successive instruction by a list of
+        instructions, which are inserted in the same position.
+
+        The instructions which are already in will be ignored.
+
+        Arguments:
+            succ_instr (Instruction): successive instruction which
+                is going to be replaced.
+            succ_instrs (list): instructions of type *Instruction*.
+        """
+        if not succ_instr in self.succs:
+            return
+
+        position = self.succs.index(succ_instr)
+        previous_succs = self.succs[:position]
+        next_succs = self.succs[position + 1:]
+        new_succs = []
+
+        for instr in succ_instrs:
+            if (instr not in previous_succs and instr not in next_succs and
+                    instr not in new_succs):
+                new_succs.append(instr)
+
+        self.succs = previous_succs + new_succs + next_succs
+
+    def remove_succ(self, succ_instr):
+        """It removes a successive instruction.
+
+        Arguments:
+            succ_instr (Instruction): successive instruction. If it
+                is not in, nothing will be done.
+        """
+        if succ_instr in self.succs:
+            self.succs.remove(succ_instr)
+
     def get_instruction(self):
         """It returns the pycparser instruction.
 
@@ -166,6 +215,439 @@ class Instruction():
         """
         return list(map(lambda instr: instr.get_instruction(), instructions))
 
+class PendingSucc(Instruction):
+    """PendingSucc class.
+
+    Successive instruction which could not be resolved while the CFG of
+    a function was being computed alone (check *CFGFragment*) because it
+    depends on other functions. It is replaced when the fragments are
+    linked.
+
+    A pending successive instruction is *weak* when it is not known yet if
+    it will be resolved to some instruction (e.g. a call to a function which
+    might be defined in other file). In that case, the instruction which would
+    have been appended if it was resolved to nothing is appended as well and
+    stored as *fallback*, and it is removed when the fragments are linked if
+    the pending successive instruction was resolved to some instruction.
+    """
+
+    call = "call"       # Link to the first instruction of a function (value: function name)
+    ret = "return"      # Links from the end of a function to its callers
+
+    def __init__(self, kind, value=None, weak=False, fallback=None):
+        """It initializes the pending successive instruction.
+
+        Arguments:
+            kind (str): *PendingSucc.call* or *PendingSucc.ret*.
+            value (str): name of the function if *kind* is
+                *PendingSucc.call*.
+            weak (bool): if *True*, it might be resolved to nothing.
+            fallback (Instruction): instruction which was appended
+                because the weak successive instruction might be
+                resolved to nothing.
+        """
+        super().__init__(ast.EmptyStatement())
+
+        self.kind = kind
+        self.value = value
+        self.weak = weak
+        self.fallback = fallback
+
+class CFGFragment():
+    """CFGFragment class.
+
+    It contains the CFG of a single function in a compact format which can
+    be sent between processes: the instructions (the pycparser nodes) and
+    the successive instructions as indexes. The successive instructions
+    which were pending (*PendingSucc*) are stored as tuples of format
+    (kind, value).
+
+    The nodes are the same objects that the AST of the function only if
+    the fragment was computed in the same process. If the fragment was sent
+    from other process or loaded from a file, the nodes are copies (the
+    nodes which were inserted while the CFG was computed, like
+    *EndOfIfElse*, are only in the copies) until *share_function* is used.
+    """
+
+    def __init__(self, function_name, instructions, function_calls, is_static=False):
+        """It creates a fragment.
+
+        Arguments:
+            function_name (str): function.
+            instructions (list): instructions of the function. The type
+                is *Instruction*.
+            function_calls (list): functions which are invoked by the
+                function (*str*).
+            is_static (bool): if *True*, the function is not visible
+                from other files.
+        """
+        positions = {id(instr): idx for idx, instr in enumerate(instructions)}
+
+        self.function_name = function_name
+        self.nodes = Instruction.get_instructions(instructions)
+        self.succs = []
+        self.function_calls = list(function_calls)
+        self.is_static = is_static
+
+        for instr in instructions:
+            succs = []
+
+            for succ in instr.get_succs():
+                if isinstance(succ, PendingSucc):
+                    fallback = None
+
+                    if succ.fallback is not None:
+                        fallback = positions[id(succ.fallback)]
+
+                    succs.append((succ.kind, succ.value, succ.weak, fallback))
+                elif id(succ) in positions:
+                    succs.append(positions[id(succ)])
+                else:
+                    raise CFGException(f"the function '{function_name}' has a successive"
+                                       " instruction which belongs to other function"
+                                       " and is not pending")
+
+            self.succs.append(succs)
+
+    def share_function(self, function):
+        """It makes the AST of the function and the fragment share the
+        same nodes. The children of *function* are replaced by the ones of
+        the copy of the fragment, so the AST contains the nodes which were
+        inserted while the CFG was computed, like when the CFG is computed
+        in the same process.
+
+        Arguments:
+            function (pycparser.c_ast.FuncDef): function of the AST which
+                the fragment was computed from.
+        """
+        copy = self.nodes[0]
+
+        if copy is function:
+            return
+
+        for attribute in function.__slots__:
+            if attribute != "__weakref__":
+                setattr(function, attribute, getattr(copy, attribute))
+
+        self.nodes[0] = function
+
+    def get_instructions(self):
+        """It rebuilds the instructions of the fragment.
+
+        Returns:
+            list: instructions of type *Instruction*. The successive
+            instructions which were pending are *PendingSucc* (one
+            object for each different pending successive instruction)
+        """
+        instructions = [Instruction(node) for node in self.nodes]
+        pending_succs = {}
+
+        for instr, succs in zip(instructions, self.succs):
+            for succ in succs:
+                if isinstance(succ, tuple):
+                    if succ not in pending_succs:
+                        kind, value, weak, fallback = succ
+
+                        if fallback is not None:
+                            fallback = instructions[fallback]
+
+                        pending_succs[succ] = PendingSucc(kind, value, weak, fallback)
+
+                    instr.append_succ(pending_succs[succ])
+                else:
+                    instr.append_succ(instructions[succ])
+
+        return instructions
+
+class CFGUnit():
+    """CFGUnit class.
+
+    It contains the fragments of the functions which are defined in a
+    file and its symbol tables: the functions which are visible from other
+    files (exported) and the functions which are invoked but not defined
+    in the file (imported).
+    """
+
+    def __init__(self, path, key, fragments):
+        """It creates a unit.
+
+        Arguments:
+            path (str): file where the functions are defined.
+            key (str): key of the content of the functions (check
+                *get_key*).
+            fragments (list): fragments of the functions. The type
+                is *CFGFragment*.
+        """
+        defined_functions = set(fragment.function_name for fragment in fragments)
+
+        self.path = path
+        self.key = key
+        self.fragments = fragments
+        self.exported = set(fragment.function_name for fragment in fragments
+                            if not fragment.is_static)
+        self.imported = set()
+
+        for fragment in fragments:
+            for function_call in fragment.function_calls:
+                if function_call not in defined_functions:
+                    self.imported.add(function_call)
+
+    @staticmethod
+    def get_key(functions, propagate_func_call):
+        """It returns the key of the functions of a file. If the key of
+        a stored unit does not change, its fragments can be reused.
+
+        Arguments:
+            functions (list): list of tuples of format (str,
+                pycparser.c_ast.FuncDef) which contains the name and
+                the code of the functions. The functions have to be
+                provided before computing their CFG because the
+                computation modifies them.
+            propagate_func_call (bool): check *ProcessCFG*.
+
+        Returns:
+            str: hex digest (SHA-256)
+        """
+        # The code is already preprocessed, so the key changes if a macro changes
+        content = pickle.dumps((propagate_func_call, functions),
+                               protocol=pickle.HIGHEST_PROTOCOL)
+
+        return hashlib.sha256(content).hexdigest()
+
+class CFGUnitStore():
+    """CFGUnitStore class.
+
+    It stores the units (i.e. *CFGUnit*) of the files of a program in a
+    directory, one file for each unit, in order to link them later.
+
+    The symbol tables of the units are kept in a manifest (check
+    *get_manifest*), so the units do not have to be loaded in order to
+    know which one defines a function.
+    """
+
+    def __init__(self, directory):
+        """It initializes the store.
+
+        Arguments:
+            directory (str): directory where the units will be stored.
+        """
+        self.directory = directory
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get_path(self, path):
+        """It returns the path of a stored unit.
+
+        Arguments:
+            path (str): file of the unit.
+
+        Returns:
+            str: path
+        """
+        path_hash = hashlib.sha256(os.path.normpath(path).encode("utf-8",
+                                                                 errors="surrogateescape"))\
+                           .hexdigest()
+
+        # The ASTs of different versions of pycparser might not be compatible
+        return os.path.join(self.directory,
+                            f"{path_hash}.pycparser-{pycparser.__version__}.cfg.pickle")
+
+    def get_manifest_path(self):
+        """It returns the path of the manifest.
+
+        Returns:
+            str: path
+        """
+        return os.path.join(self.directory, f"manifest.pycparser-{pycparser.__version__}.json")
+
+    def get_paths(self):
+        """It returns the paths of the stored units.
+
+        Returns:
+            list: sorted list of *str*
+        """
+        suffix = f".pycparser-{pycparser.__version__}.cfg.pickle"
+
+        return sorted(os.path.join(self.directory, filename)
+                      for filename in os.listdir(self.directory)
+                      if filename.endswith(suffix))
+
+    def load(self, path, stored_path=None):
+        """It loads a unit.
+
+        Arguments:
+            path (str): file of the unit.
+            stored_path (str): path of the stored unit. If provided,
+                *path* is ignored.
+
+        Returns:
+            CFGUnit: unit. If the unit is not stored, *None* will
+            be returned
+        """
+        if stored_path is None:
+            stored_path = self.get_path(path)
+
+        try:
+            with open(stored_path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning("could not load the stored CFG unit '%s': %s", stored_path, str(e))
+
+        return None
+
+    def store(self, unit):
+        """It stores a unit.
+
+        Arguments:
+            unit (CFGUnit): unit.
+        """
+        path = self.get_path(unit.path)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(unit, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            # Atomic in order to avoid races between processes
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logging.warning("could not store the CFG unit '%s': %s", unit.path, str(e))
+
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+
+            return
+
+        manifest = self.read_manifest()
+        manifest[os.path.basename(path)] = CFGUnitStore.get_manifest_entry(unit, path)
+
+        self.write_manifest(manifest)
+
+    @staticmethod
+    def get_manifest_entry(unit, stored_path):
+        """It returns the entry of a unit in the manifest.
+
+        Arguments:
+            unit (CFGUnit): unit.
+            stored_path (str): path of the stored unit.
+
+        Returns:
+            dict: file, exported functions and imported functions of the
+            unit, and modification time of the stored unit (the entry is
+            not valid if the stored unit is modified)
+        """
+        return {"path": unit.path, "exported": sorted(unit.exported), "imported": sorted(unit.imported),
+                "mtime_ns": os.stat(stored_path).st_mtime_ns}
+
+    def read_manifest(self):
+        """It reads the manifest as it is stored.
+
+        Returns:
+            dict: entries (check *get_manifest_entry*) by the name of the
+            stored unit. If the manifest is not stored or is not valid, an
+            empty dict will be returned
+        """
+        try:
+            with open(self.get_manifest_path()) as f:
+                manifest = json.load(f)
+
+            if isinstance(manifest, dict):
+                return manifest
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning("could not load the manifest of the CFG units: %s", str(e))
+
+        return {}
+
+    def write_manifest(self, manifest):
+        """It writes the manifest.
+
+        Arguments:
+            manifest (dict): entries (check *get_manifest_entry*) by the
+                name of the stored unit.
+        """
+        path = self.get_manifest_path()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(manifest, f, sort_keys=True)
+
+            # Atomic in order to avoid races between processes
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logging.warning("could not store the manifest of the CFG units: %s", str(e))
+
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+
+    def get_manifest(self):
+        """It returns the manifest of the stored units, which contains
+        the symbol tables of each unit.
+
+        The manifest is synchronized with the stored units: the units
+        which are not in the manifest or were modified after their entry
+        was written (e.g. because other process rewrote the manifest at
+        the same time) are loaded again, and the
+        entries of the units which are not stored anymore are removed.
+        Moreover, the units of the files which do not exist anymore
+        are removed from the store.
+
+        Returns:
+            dict: entries (check *get_manifest_entry*) by the path
+            of the stored unit
+        """
+        manifest = self.read_manifest()
+        stored_paths = self.get_paths()
+        result = {}
+        changed = len(manifest) != len(stored_paths)
+
+        for stored_path in stored_paths:
+            entry = manifest.get(os.path.basename(stored_path))
+
+            try:
+                valid_entry = (isinstance(entry, dict) and
+                               entry.get("mtime_ns") == os.stat(stored_path).st_mtime_ns)
+            except FileNotFoundError:
+                continue
+
+            if not valid_entry:
+                unit = self.load(None, stored_path)
+
+                if unit is None:
+                    continue
+
+                try:
+                    entry = CFGUnitStore.get_manifest_entry(unit, stored_path)
+                except FileNotFoundError:
+                    continue
+
+                changed = True
+
+            if not os.path.isfile(entry["path"]):
+                logging.info("removing the stored CFG unit of '%s' since the file does not exist",
+                             entry["path"])
+
+                try:
+                    os.remove(stored_path)
+                except FileNotFoundError:
+                    pass
+
+                changed = True
+
+                continue
+
+            result[stored_path] = entry
+
+        if changed:
+            self.write_manifest({os.path.basename(stored_path): entry
+                                 for stored_path, entry in result.items()})
+
+        return result
+
 class CFG():
 
     def __init__(self):
@@ -203,6 +685,37 @@ class CFG():
         else:
             self.instructions[function_name].append(instr)
 
+    def reserve_function(self, function_name):
+        """It appends a function without instructions, which will be
+        appended later (the order of the functions is kept).
+
+        Arguments:
+            function_name (str): function.
+        """
+        if not is_key_in_dict(self.instructions, function_name):
+            self.instructions[function_name] = []
+
+    def append_fragment(self, fragment):
+        """It appends the instructions and the function calls of a
+        function which were computed alone.
+
+        Arguments:
+            fragment (CFGFragment): fragment of the function.
+
+        Raises:
+            CFGException: if the function was already in the CFG.
+        """
+        if is_key_in_dict(self.instructions, fragment.function_name):
+            raise CFGException(f"the function '{fragment.function_name}' was already"
+                               " in the CFG")
+
+        self.instructions[fragment.function_name] = fragment.get_instructions()
+
+        self.append_function_call(fragment.function_name, None)
+
+        for function_call in fragment.function_calls:
+            self.append_function_call(fragment.function_name, function_call)
+
     def append_function_call(self, origin, destiny):
         """It appends a function call from other function
         (or itself if recursive). Moreover, it appends
@@ -289,3 +802,66 @@ class CFG():
             dict: functions which invokes a concrete function
         """
         return self.function_invoked_by
+
+    def get_instruction_positions(self):
+        """It returns the position of every instruction of the CFG, which
+        allows to look for the function and the index of a successive
+        instruction in constant time.
+
+        Returns:
+            dict: dict of format {id(Instruction): (str, int)} which
+            contains the function and the index of each instruction
+        """
+        positions = {}
+
+        for function_name in self.get_function_calls():
+            instructions = self.get_cfg(function_name)
+
+            if instructions is None:
+                continue
+
+            for index, instruction in enumerate(instructions):
+                positions[id(instruction)] = (function_name, index)
+
+        return positions
+
+class LazyCFG(CFG):
+    """LazyCFG class.
+
+    It shares the data structures of a *CFG* whose successors have not
+    been resolved yet, and resolves them on demand: the first time that
+    the CFG of a function is requested, a callback is invoked in order to
+    resolve it (and whatever is needed to link it). The callback is expected
+    to memoize the functions which have already been resolved.
+    """
+
+    def __init__(self, basic_cfg, resolve_callback):
+        """It initializes the lazy CFG.
+
+        Arguments:
+            basic_cfg (CFG): CFG whose successors have not been resolved.
+            resolve_callback (function): callback which receives the name of
+                a function and resolves it. If the name is *None*, all the
+                functions have to be resolved.
+        """
+        super().__init__()
+
+        self.function_calls = basic_cfg.function_calls
+        self.function_invoked_by = basic_cfg.function_invoked_by
+        self.instructions = basic_cfg.instructions
+        self.resolve_callback = resolve_callback
+
+    def get_cfg(self, function_name):
+        """It returns the CFG starting in a concrete function, which
+        is resolved if it was not resolved before (check *CFG.get_cfg*).
+
+        Arguments:
+            function_name (str): function.
+
+        Returns:
+            list: CFG of a function
+        """
+        if (function_name is None or is_key_in_dict(self.instructions, function_name)):
+            self.resolve_callback(function_name)
+
+        return super().get_cfg(function_name)
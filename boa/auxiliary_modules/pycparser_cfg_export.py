@@ -0,0 +1,287 @@
+"""File which contains the necessary logic in order to export a CFG
+(check *auxiliary_modules.pycparser_cfg*) to a file which can be
+inspected with external viewers.
+
+The supported formats are DOT (e.g. Graphviz), GraphML (e.g. yEd,
+Gephi) and JSON lines (one JSON object for each instruction). The
+instructions are identified by an id which is assigned the first time
+that they are found, so the CFG is written while it is traversed
+(the instructions are traversed once, and once again for the edges if
+the format needs the nodes to be declared before) and the size of the
+graph does not need to fit in other data structures than the CFG itself.
+"""
+
+# Std libs
+import json
+from xml.sax.saxutils import escape, quoteattr
+
+# Own libs
+from utils import get_just_type
+
+class CFGExportConstants:
+    """Class which contains the necessary constants
+    for exporting the CFG.
+    """
+    format_dot = "dot"
+    format_graphml = "graphml"
+    format_jsonl = "jsonl"
+    formats = (format_dot, format_graphml, format_jsonl)
+    # Default format by extension of the file
+    extensions = {".dot": format_dot,
+                  ".gv": format_dot,
+                  ".graphml": format_graphml,
+                  ".jsonl": format_jsonl,
+                  ".json": format_jsonl}
+    # Attributes of the nodes: (name, GraphML type)
+    node_attributes = (("label", "string"),
+                       ("type", "string"),
+                       ("function", "string"),
+                       ("index", "int"),
+                       ("row", "int"),
+                       ("col", "int"))
+
+def get_format_by_extension(path):
+    """It returns the format of a file by its extension.
+
+    Arguments:
+        path (str): path of the file.
+
+    Returns:
+        str: format. If the extension is not known, DOT will be
+        returned
+    """
+    for extension, export_format in CFGExportConstants.extensions.items():
+        if path.lower().endswith(extension):
+            return export_format
+
+    return CFGExportConstants.format_dot
+
+class CFGExporter:
+    """CFGExporter class.
+
+    It writes a CFG to a file in one of the formats of
+    *CFGExportConstants.formats*.
+    """
+
+    def __init__(self, graph, export_format, clusters=True):
+        """It initializes the exporter.
+
+        Arguments:
+            graph (pycparser_cfg.CFG): CFG.
+            export_format (str): format (check *CFGExportConstants.formats*).
+            clusters (bool): if *True*, the instructions are grouped by
+                function (DOT subgraphs or GraphML nested graphs). The JSON
+                lines always contain the function of each instruction.
+
+        Raises:
+            ValueError: if the format is not supported.
+        """
+        if export_format not in CFGExportConstants.formats:
+            raise ValueError(f"format '{export_format}' is not supported (supported"
+                             f" formats: {', '.join(CFGExportConstants.formats)})")
+
+        self.graph = graph
+        self.export_format = export_format
+        self.clusters = clusters
+        self.ids = {}       # {id(Instruction): node id}
+
+    def get_node_id(self, instruction):
+        """It returns the id of an instruction, which is assigned
+        the first time that the instruction is found.
+
+        Arguments:
+            instruction (pycparser_cfg.Instruction): instruction.
+
+        Returns:
+            int: id
+        """
+        key = id(instruction)
+
+        if key not in self.ids:
+            self.ids[key] = len(self.ids)
+
+        return self.ids[key]
+
+    def get_functions(self):
+        """It returns the functions of the CFG and their instructions.
+
+        Returns:
+            generator: tuples of format (str, list) which contain the
+            name of the function and its instructions
+        """
+        for function_name in self.graph.get_function_calls():
+            instructions = self.graph.get_cfg(function_name)
+
+            if instructions is not None:
+                yield function_name, instructions
+
+    @staticmethod
+    def get_node_attributes(function_name, index, instruction):
+        """It returns the attributes of an instruction.
+
+        Arguments:
+            function_name (str): function which contains the instruction.
+            index (int): index of the instruction in the function.
+            instruction (pycparser_cfg.Instruction): instruction.
+
+        Returns:
+            dict: attributes (check *CFGExportConstants.node_attributes*)
+        """
+        node = instruction.get_instruction()
+        instr_type = get_just_type(None, instruction.get_type()).split(".")[-1]
+        row, col = -1, -1
+
+        if node.coord is not None:
+            row = node.coord.line
+            col = node.coord.column
+
+            if col is None:
+                col = -1
+
+        return {"label": f"{function_name}.{instr_type}",
+                "type": instr_type,
+                "function": function_name,
+                "index": index,
+                "row": row,
+                "col": col}
+
+    def export(self, path):
+        """It writes the CFG to a file.
+
+        Arguments:
+            path (str): path of the file.
+
+        Raises:
+            OSError: if the file could not be written.
+        """
+        self.ids = {}
+
+        with open(path, "w") as f:
+            if self.export_format == CFGExportConstants.format_dot:
+                self.export_dot(f)
+            elif self.export_format == CFGExportConstants.format_graphml:
+                self.export_graphml(f)
+            else:
+                self.export_jsonl(f)
+
+    @staticmethod
+    def get_dot_string(value):
+        """It returns a quoted DOT string.
+
+        Arguments:
+            value: value.
+
+        Returns:
+            str: quoted string
+        """
+        value = str(value).replace("\\", "\\\\").replace("\"", "\\\"")
+
+        return f"\"{value}\""
+
+    def export_dot(self, f):
+        """It writes the CFG in DOT format. The nodes are written first
+        because, otherwise, a node which is found in an edge before it is
+        declared would be placed in the wrong cluster.
+
+        Arguments:
+            f (file): file.
+        """
+        f.write("digraph CFG {\n")
+        f.write("    node [shape=box];\n")
+
+        for cluster, (function_name, instructions) in enumerate(self.get_functions()):
+            indent = "    "
+
+            if self.clusters:
+                f.write(f"    subgraph cluster_{cluster} {{\n")
+                f.write(f"        label={self.get_dot_string(function_name)};\n")
+
+                indent = "        "
+
+            for index, instruction in enumerate(instructions):
+                attributes = self.get_node_attributes(function_name, index, instruction)
+                attributes = ", ".join(f"{name}={self.get_dot_string(value)}"
+                                       for name, value in attributes.items())
+
+                f.write(f"{indent}n{self.get_node_id(instruction)} [{attributes}];\n")
+
+            if self.clusters:
+                f.write("    }\n")
+
+        for _, instructions in self.get_functions():
+            for instruction in instructions:
+                node_id = self.get_node_id(instruction)
+
+                for succ in instruction.get_succs():
+                    f.write(f"    n{node_id} -> n{self.get_node_id(succ)};\n")
+
+        f.write("}\n")
+
+    def export_graphml(self, f):
+        """It writes the CFG in GraphML format.
+
+        Arguments:
+            f (file): file.
+        """
+        f.write("<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n")
+        f.write("<graphml xmlns=\"http://graphml.graphdrawing.org/xmlns\">\n")
+
+        for name, attribute_type in CFGExportConstants.node_attributes:
+            f.write(f"  <key id={quoteattr(name)} for=\"node\" attr.name={quoteattr(name)}"
+                    f" attr.type={quoteattr(attribute_type)}/>\n")
+
+        f.write("  <graph id=\"CFG\" edgedefault=\"directed\">\n")
+
+        for cluster, (function_name, instructions) in enumerate(self.get_functions()):
+            indent = "    "
+
+            if self.clusters:
+                f.write(f"    <node id=\"f{cluster}\">\n")
+                f.write(f"      <graph id=\"f{cluster}:\" edgedefault=\"directed\">\n")
+
+                indent = "        "
+
+            for index, instruction in enumerate(instructions):
+                attributes = self.get_node_attributes(function_name, index, instruction)
+
+                f.write(f"{indent}<node id=\"n{self.get_node_id(instruction)}\">")
+
+                for name, value in attributes.items():
+                    f.write(f"<data key={quoteattr(name)}>{escape(str(value))}</data>")
+
+                f.write("</node>\n")
+
+            if self.clusters:
+                f.write("      </graph>\n")
+                f.write("    </node>\n")
+
+        for _, instructions in self.get_functions():
+            for instruction in instructions:
+                node_id = self.get_node_id(instruction)
+
+                for succ in instruction.get_succs():
+                    f.write(f"    <edge source=\"n{node_id}\""
+                            f" target=\"n{self.get_node_id(succ)}\"/>\n")
+
+        f.write("  </graph>\n")
+        f.write("</graphml>\n")
+
+    def export_jsonl(self, f):
+        """It writes the CFG in JSON lines format: one object for each
+        instruction with its attributes (check
+        *CFGExportConstants.node_attributes*), its id and the ids of
+        its successive instructions.
+
+        Arguments:
+            f (file): file.
+        """
+        for function_name, instructions in self.get_functions():
+            for index, instruction in enumerate(instructions):
+                node = {"id": self.get_node_id(instruction)}
+
+                node.update(self.get_node_attributes(function_name, index, instruction))
+
+                node["succs"] = [self.get_node_id(succ) for succ in instruction.get_succs()]
+
+                f.write(json.dumps(node))
+                f.write("\n")
@@ -0,0 +1,1116 @@
+"""File which contains a compact IR (i.e. Intermediate Representation)
+of the functions of a pycparser AST.
+
+The functions are lowered to a three-address-style IR:
+
+* The instructions are stored in typed arrays (one array per field), so
+  a function is not a tree of Python objects but a few contiguous
+  buffers.
+* The identifiers, constants and operators are interned in a string
+  table which is shared by all the functions of the translation unit.
+* The control flow is explicit: the instructions are split in basic
+  blocks, and the loops, conditions (including short-circuit operators
+  and ternary operators), switches and gotos are lowered to jumps.
+* The source coordinates are kept in a side table, so they do not
+  increase the size of the instructions.
+
+Once a translation unit has been lowered, the AST is not needed
+anymore in order to analyze the functions.
+"""
+
+# Std libs
+from array import array
+
+# 3rd libs
+from pycparser import c_ast
+from pycparser.c_generator import CGenerator
+
+class IRException(Exception):
+    """IRException exception class.
+
+    This exception is intented to be used when something
+    goes wrong while an AST is being lowered.
+    """
+
+    def __init__(self, message):
+        """It initializes the exception.
+
+        Arguments:
+            message (str): message to be displayed.
+        """
+        super().__init__(message)
+
+        self.message = message
+
+class IRConstants:
+    """Class which contains the necessary constants
+    for working with the IR.
+
+    Fields of each opcode (*dst*, *src1*, *src2*, *extra*):
+
+    * DECL: variable, -, -, -
+    * ASSIGN: variable or temporary, value, -, -
+    * BINARY: temporary, left value, right value, operator
+    * UNARY: temporary, value, -, operator
+    * ADDRESS: temporary, value, -, -
+    * LOAD: temporary, pointer, -, -
+    * STORE: -, pointer, value, -
+    * LOAD_INDEX: temporary, base, index, -
+    * STORE_INDEX: -, base, index, value
+    * LOAD_FIELD: temporary, base, field, operator ("." or "->")
+    * STORE_FIELD: -, base, field, value (the operator is not stored)
+    * CAST: temporary, value, -, type
+    * PARAM: -, value, -, position of the argument (starts with 1)
+    * CALL: temporary, function, -, number of arguments
+    * JUMP: -, -, -, target block
+    * BRANCH: -, condition, true block, false block
+    * RETURN: -, value (or none), -, -
+    * OPAQUE: temporary, -, -, type of the node which is not lowered
+
+    The variables, temporaries and constants are encoded as operands (check
+    *make_operand*), the operators, fields and types are identifiers of the
+    string table, and the blocks and positions are plain integers. The
+    fields which are not used are -1.
+    """
+    DECL = 0
+    ASSIGN = 1
+    BINARY = 2
+    UNARY = 3
+    ADDRESS = 4
+    LOAD = 5
+    STORE = 6
+    LOAD_INDEX = 7
+    STORE_INDEX = 8
+    LOAD_FIELD = 9
+    STORE_FIELD = 10
+    CAST = 11
+    PARAM = 12
+    CALL = 13
+    JUMP = 14
+    BRANCH = 15
+    RETURN = 16
+    OPAQUE = 17
+
+    opcode_names = ("DECL", "ASSIGN", "BINARY", "UNARY", "ADDRESS", "LOAD", "STORE",
+                    "LOAD_INDEX", "STORE_INDEX", "LOAD_FIELD", "STORE_FIELD", "CAST",
+                    "PARAM", "CALL", "JUMP", "BRANCH", "RETURN", "OPAQUE")
+    terminators = (JUMP, BRANCH, RETURN)
+
+    # Kinds of the operands (2 lower bits)
+    operand_variable = 0
+    operand_temporary = 1
+    operand_constant = 2
+    operand_kind_bits = 2
+    operand_kind_mask = 3
+    no_operand = -1
+
+def make_operand(kind, value):
+    """It encodes an operand as an integer.
+
+    Arguments:
+        kind (int): kind of the operand (check *IRConstants*).
+        value (int): identifier of the string table (variables and
+            constants) or number of temporary.
+
+    Returns:
+        int: operand
+    """
+    return (value << IRConstants.operand_kind_bits) | kind
+
+def get_operand_kind(operand):
+    """It returns the kind of an operand.
+
+    Arguments:
+        operand (int): operand.
+
+    Returns:
+        int: kind of the operand (check *IRConstants*)
+    """
+    return operand & IRConstants.operand_kind_mask
+
+def get_operand_value(operand):
+    """It returns the value of an operand.
+
+    Arguments:
+        operand (int): operand.
+
+    Returns:
+        int: identifier of the string table (variables and constants)
+        or number of temporary
+    """
+    return operand >> IRConstants.operand_kind_bits
+
+class StringTable:
+    """StringTable class.
+
+    It interns the strings (identifiers, constants, operators, ...)
+    of the IR.
+    """
+
+    def __init__(self):
+        """It initializes the table.
+        """
+        self.strings = []   # [str]
+        self.ids = {}       # {str: id}
+
+    def intern(self, string):
+        """It returns the identifier of a string, which is added if
+        it was not in the table.
+
+        Arguments:
+            string (str): string.
+
+        Returns:
+            int: identifier
+        """
+        string_id = self.ids.get(string)
+
+        if string_id is None:
+            string_id = len(self.strings)
+            self.ids[string] = string_id
+            self.strings.append(string)
+
+        return string_id
+
+    def get(self, string_id):
+        """It returns the string of an identifier.
+
+        Arguments:
+            string_id (int): identifier.
+
+        Returns:
+            str: string
+        """
+        return self.strings[string_id]
+
+    def __len__(self):
+        return len(self.strings)
+
+class CoordTable:
+    """CoordTable class.
+
+    It is the side table which contains the source coordinates of the
+    instructions of a function. The unknown values are -1.
+    """
+
+    def __init__(self):
+        """It initializes the table.
+        """
+        self.files = array("l")     # identifiers of the string table
+        self.rows = array("l")
+        self.cols = array("l")
+
+    def append(self, file_id, row, col):
+        """It appends the coordinates of an instruction.
+
+        Arguments:
+            file_id (int): identifier of the file in the string table.
+            row (int): row.
+            col (int): column.
+        """
+        self.files.append(file_id)
+        self.rows.append(row)
+        self.cols.append(col)
+
+    def get(self, idx):
+        """It returns the coordinates of an instruction.
+
+        Arguments:
+            idx (int): index of the instruction.
+
+        Returns:
+            tuple: tuple of format (int, int, int) which contains the
+            identifier of the file, the row and the column
+        """
+        return (self.files[idx], self.rows[idx], self.cols[idx])
+
+class IRFunction:
+    """IRFunction class.
+
+    It contains the IR of a function. The instruction *i* is the element
+    *i* of the arrays *opcodes*, *dsts*, *srcs1*, *srcs2* and *extras*,
+    and its coordinates are the element *i* of *coords*. The block *b*
+    contains the instructions from *block_starts[b]* to *block_ends[b]*
+    (not included). The block 0 is the entry block.
+    """
+
+    def __init__(self, name, strings):
+        """It initializes the function.
+
+        Arguments:
+            name (str): name of the function.
+            strings (StringTable): string table of the translation unit.
+        """
+        self.name = name
+        self.strings = strings
+        self.parameters = array("l")    # operands
+        self.opcodes = array("B")
+        self.dsts = array("q")
+        self.srcs1 = array("q")
+        self.srcs2 = array("q")
+        self.extras = array("q")
+        self.coords = CoordTable()
+        self.block_starts = array("l")
+        self.block_ends = array("l")
+        self.block_order = array("l")   # blocks in the same order that their instructions
+        self.successors = []            # [tuple of blocks] (check *finalize*)
+        self.temporaries = 0
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    def get_number_of_blocks(self):
+        """It returns the number of blocks.
+
+        Returns:
+            int: number of blocks
+        """
+        return len(self.block_starts)
+
+    def get_instruction(self, idx):
+        """It returns an instruction.
+
+        Arguments:
+            idx (int): index of the instruction.
+
+        Returns:
+            tuple: tuple of format (int, int, int, int, int) which contains
+            the opcode, *dst*, *src1*, *src2* and *extra*
+        """
+        return (self.opcodes[idx], self.dsts[idx], self.srcs1[idx],
+                self.srcs2[idx], self.extras[idx])
+
+    def get_block_instructions(self, block):
+        """It returns the indexes of the instructions of a block.
+
+        Arguments:
+            block (int): block.
+
+        Returns:
+            range: indexes of the instructions
+        """
+        return range(self.block_starts[block], self.block_ends[block])
+
+    def get_successors(self, block):
+        """It returns the successors of a block.
+
+        Arguments:
+            block (int): block.
+
+        Returns:
+            tuple: successors
+        """
+        return self.successors[block]
+
+    def get_predecessors(self):
+        """It returns the predecessors of all the blocks.
+
+        Returns:
+            list: list of lists of *int* where the element *b* contains
+            the predecessors of the block *b*
+        """
+        preds = [[] for _ in range(self.get_number_of_blocks())]
+
+        for block, successors in enumerate(self.successors):
+            for successor in successors:
+                if block not in preds[successor]:
+                    preds[successor].append(block)
+
+        return preds
+
+    def finalize(self):
+        """It calculates the end of the blocks and their successors.
+        It is invoked once the function has been lowered.
+
+        The successors of a block are defined by its last instruction:
+        the target of *JUMP*, the true and false blocks of *BRANCH*, none
+        for *RETURN* and the next block (in instruction order) otherwise.
+
+        Raises:
+            IRException: if some block has not been placed (e.g. the
+                label of a *goto* does not exist).
+        """
+        if len(self.block_order) != len(self.block_starts):
+            raise IRException(f"function '{self.name}': some blocks have not been placed"
+                              " (check the labels)")
+
+        self.block_ends = array("l", [0] * len(self.block_starts))
+        self.successors = [()] * len(self.block_starts)
+
+        for position, block in enumerate(self.block_order):
+            if position + 1 < len(self.block_order):
+                self.block_ends[block] = self.block_starts[self.block_order[position + 1]]
+            else:
+                self.block_ends[block] = len(self.opcodes)
+
+        for position, block in enumerate(self.block_order):
+            start, end = self.block_starts[block], self.block_ends[block]
+            opcode = self.opcodes[end - 1] if start != end else None
+
+            if opcode == IRConstants.JUMP:
+                self.successors[block] = (self.extras[end - 1],)
+            elif opcode == IRConstants.BRANCH:
+                if self.srcs2[end - 1] == self.extras[end - 1]:
+                    self.successors[block] = (self.srcs2[end - 1],)
+                else:
+                    self.successors[block] = (self.srcs2[end - 1], self.extras[end - 1])
+            elif opcode == IRConstants.RETURN:
+                self.successors[block] = ()
+            elif position + 1 < len(self.block_order):
+                self.successors[block] = (self.block_order[position + 1],)
+
+    def format_operand(self, operand):
+        """It returns the textual representation of an operand.
+
+        Arguments:
+            operand (int): operand.
+
+        Returns:
+            str: representation
+        """
+        if operand == IRConstants.no_operand:
+            return "_"
+
+        kind = get_operand_kind(operand)
+        value = get_operand_value(operand)
+
+        if kind == IRConstants.operand_temporary:
+            return f"%t{value}"
+
+        return self.strings.get(value)
+
+    def format_instruction(self, idx):
+        """It returns the textual representation of an instruction.
+
+        Arguments:
+            idx (int): index of the instruction.
+
+        Returns:
+            str: representation
+        """
+        opcode, dst, src1, src2, extra = self.get_instruction(idx)
+        op = self.format_operand
+        string = self.strings.get
+
+        if opcode == IRConstants.DECL:
+            return f"decl {op(dst)}"
+        if opcode == IRConstants.ASSIGN:
+            return f"{op(dst)} = {op(src1)}"
+        if opcode == IRConstants.BINARY:
+            return f"{op(dst)} = {op(src1)} {string(extra)} {op(src2)}"
+        if opcode == IRConstants.UNARY:
+            return f"{op(dst)} = {string(extra)} {op(src1)}"
+        if opcode == IRConstants.ADDRESS:
+            return f"{op(dst)} = &{op(src1)}"
+        if opcode == IRConstants.LOAD:
+            return f"{op(dst)} = *{op(src1)}"
+        if opcode == IRConstants.STORE:
+            return f"*{op(src1)} = {op(src2)}"
+        if opcode == IRConstants.LOAD_INDEX:
+            return f"{op(dst)} = {op(src1)}[{op(src2)}]"
+        if opcode == IRConstants.STORE_INDEX:
+            return f"{op(src1)}[{op(src2)}] = {op(extra)}"
+        if opcode == IRConstants.LOAD_FIELD:
+            return f"{op(dst)} = {op(src1)}{string(extra)}{string(src2)}"
+        if opcode == IRConstants.STORE_FIELD:
+            return f"{op(src1)}.{string(src2)} = {op(extra)}"
+        if opcode == IRConstants.CAST:
+            return f"{op(dst)} = ({string(extra)}) {op(src1)}"
+        if opcode == IRConstants.PARAM:
+            return f"param {extra} {op(src1)}"
+        if opcode == IRConstants.CALL:
+            return f"{op(dst)} = call {op(src1)}, {extra}"
+        if opcode == IRConstants.JUMP:
+            return f"jump B{extra}"
+        if opcode == IRConstants.BRANCH:
+            return f"branch {op(src1)}, B{src2}, B{extra}"
+        if opcode == IRConstants.RETURN:
+            return f"return {op(src1)}"
+
+        return f"{op(dst)} = opaque {string(extra)}"
+
+    def format(self):
+        """It returns the textual representation of the function.
+
+        Returns:
+            str: representation
+        """
+        parameters = ", ".join(map(self.format_operand, self.parameters))
+        lines = [f"function {self.name}({parameters})"]
+
+        for block in self.block_order:
+            successors = ", ".join(f"B{successor}" for successor in self.successors[block])
+            lines.append(f"  B{block}: -> [{successors}]")
+
+            for idx in self.get_block_instructions(block):
+                lines.append(f"    {self.format_instruction(idx)}")
+
+        return "\n".join(lines)
+
+class IRModule:
+    """IRModule class.
+
+    It contains the IR of the functions of a translation unit.
+    """
+
+    def __init__(self):
+        """It initializes the module.
+        """
+        self.strings = StringTable()
+        self.functions = {}     # {name: IRFunction}
+
+class IRLowering:
+    """IRLowering class.
+
+    It lowers the body of a function (*pycparser.c_ast.FuncDef*) to
+    an *IRFunction*.
+    """
+
+    def __init__(self, func_def, strings):
+        """It initializes the lowering.
+
+        Arguments:
+            func_def (pycparser.c_ast.FuncDef): function.
+            strings (StringTable): string table of the translation unit.
+        """
+        self.func_def = func_def
+        self.strings = strings
+        self.function = IRFunction(func_def.decl.name, strings)
+        self.current_coord = (-1, -1, -1)
+        self.terminated = False     # last instruction is a terminator
+        self.labels = {}            # {label: block}
+        self.break_targets = []     # stack of blocks
+        self.continue_targets = []  # stack of blocks
+        self.generator = CGenerator()
+
+    def lower(self):
+        """It lowers the function.
+
+        Returns:
+            IRFunction: IR of the function
+        """
+        func_decl = self.func_def.decl.type
+
+        if (isinstance(func_decl, c_ast.FuncDecl) and func_decl.args is not None):
+            for param in func_decl.args.params:
+                name = getattr(param, "name", None)
+
+                if name is not None:
+                    self.function.parameters.append(self.variable(name))
+
+        self.place_block(self.new_block())
+        self.lower_statement(self.func_def.body)
+        self.function.finalize()
+
+        return self.function
+
+    # Operands and instructions
+
+    def variable(self, name):
+        """It returns the operand of a variable.
+        """
+        return make_operand(IRConstants.operand_variable, self.strings.intern(name))
+
+    def constant(self, value):
+        """It returns the operand of a constant.
+        """
+        return make_operand(IRConstants.operand_constant, self.strings.intern(value))
+
+    def temporary(self):
+        """It returns the operand of a new temporary.
+        """
+        self.function.temporaries += 1
+
+        return make_operand(IRConstants.operand_temporary, self.function.temporaries - 1)
+
+    def set_coord(self, node):
+        """It sets the coordinates of the next instructions from a node.
+
+        Arguments:
+            node (pycparser.c_ast.Node): node.
+        """
+        coord = getattr(node, "coord", None)
+
+        if coord is not None:
+            self.current_coord = (self.strings.intern(str(coord.file)),
+                                  coord.line if coord.line is not None else -1,
+                                  coord.column if coord.column is not None else -1)
+
+    def emit(self, opcode, dst=-1, src1=-1, src2=-1, extra=-1):
+        """It appends an instruction to the current block. If the previous
+        instruction was a terminator and no block has been placed since then,
+        a new block is started (it is unreachable unless some jump targets it).
+
+        Returns:
+            int: *dst*
+        """
+        function = self.function
+
+        if self.terminated:
+            self.place_block(self.new_block())
+
+        function.opcodes.append(opcode)
+        function.dsts.append(dst)
+        function.srcs1.append(src1)
+        function.srcs2.append(src2)
+        function.extras.append(extra)
+        function.coords.append(*self.current_coord)
+
+        self.terminated = opcode in IRConstants.terminators
+
+        return dst
+
+    def new_block(self):
+        """It creates a block which will be placed later.
+
+        Returns:
+            int: block
+        """
+        self.function.block_starts.append(-1)
+
+        return len(self.function.block_starts) - 1
+
+    def place_block(self, block):
+        """It places a block: the next instructions will belong to it.
+
+        Arguments:
+            block (int): block.
+
+        Raises:
+            IRException: if the block was already placed.
+        """
+        function = self.function
+
+        if function.block_starts[block] != -1:
+            raise IRException(f"block {block} was already placed")
+
+        function.block_starts[block] = len(function.opcodes)
+        function.block_order.append(block)
+        self.terminated = False
+
+    def jump(self, block):
+        """It appends a jump to a block. If the previous instruction is
+        a terminator, the jump is not appended since it is not reachable.
+        """
+        if self.terminated:
+            return
+
+        self.emit(IRConstants.JUMP, extra=block)
+
+    def branch(self, condition, true_block, false_block):
+        """It appends a conditional jump.
+        """
+        self.emit(IRConstants.BRANCH, src1=condition, src2=true_block, extra=false_block)
+
+    def get_label(self, name):
+        """It returns the block of a label.
+        """
+        if name not in self.labels:
+            self.labels[name] = self.new_block()
+
+        return self.labels[name]
+
+    # Statements
+
+    def lower_statement(self, node):
+        """It lowers a statement.
+
+        Arguments:
+            node (pycparser.c_ast.Node): statement.
+        """
+        if node is None:
+            return
+
+        self.set_coord(node)
+        method = getattr(self, f"lower_{type(node).__name__}", None)
+
+        if method is not None:
+            method(node)
+        else:
+            # Expression statement
+            self.lower_expression(node)
+
+    def lower_Compound(self, node):
+        for item in node.block_items or []:
+            self.lower_statement(item)
+
+    def lower_DeclList(self, node):
+        for decl in node.decls:
+            self.lower_statement(decl)
+
+    def lower_Decl(self, node):
+        if (node.name is None or isinstance(node.type, c_ast.FuncDecl)):
+            return
+
+        variable = self.variable(node.name)
+
+        self.emit(IRConstants.DECL, dst=variable)
+
+        if node.init is not None:
+            value = self.lower_expression(node.init)
+
+            self.set_coord(node)
+            self.emit(IRConstants.ASSIGN, dst=variable, src1=value)
+
+    def lower_Typedef(self, node):
+        pass
+
+    def lower_EmptyStatement(self, node):
+        pass
+
+    def lower_Pragma(self, node):
+        pass
+
+    def lower_If(self, node):
+        true_block = self.new_block()
+        end_block = self.new_block()
+        false_block = self.new_block() if node.iffalse is not None else end_block
+
+        self.lower_condition(node.cond, true_block, false_block)
+        self.place_block(true_block)
+        self.lower_statement(node.iftrue)
+        self.jump(end_block)
+
+        if node.iffalse is not None:
+            self.place_block(false_block)
+            self.lower_statement(node.iffalse)
+            self.jump(end_block)
+
+        self.place_block(end_block)
+
+    def lower_While(self, node):
+        cond_block = self.new_block()
+        body_block = self.new_block()
+        end_block = self.new_block()
+
+        self.jump(cond_block)
+        self.place_block(cond_block)
+        self.lower_condition(node.cond, body_block, end_block)
+        self.place_block(body_block)
+        self.lower_loop_body(node.stmt, end_block, cond_block)
+        self.jump(cond_block)
+        self.place_block(end_block)
+
+    def lower_DoWhile(self, node):
+        body_block = self.new_block()
+        cond_block = self.new_block()
+        end_block = self.new_block()
+
+        self.jump(body_block)
+        self.place_block(body_block)
+        self.lower_loop_body(node.stmt, end_block, cond_block)
+        self.jump(cond_block)
+        self.place_block(cond_block)
+        self.lower_condition(node.cond, body_block, end_block)
+        self.place_block(end_block)
+
+    def lower_For(self, node):
+        cond_block = self.new_block()
+        body_block = self.new_block()
+        next_block = self.new_block()
+        end_block = self.new_block()
+
+        self.lower_statement(node.init)
+        self.jump(cond_block)
+        self.place_block(cond_block)
+
+        if node.cond is not None:
+            self.lower_condition(node.cond, body_block, end_block)
+        else:
+            self.jump(body_block)
+
+        self.place_block(body_block)
+        self.lower_loop_body(node.stmt, end_block, next_block)
+        self.jump(next_block)
+        self.place_block(next_block)
+
+        if node.next is not None:
+            self.lower_expression(node.next)
+
+        self.jump(cond_block)
+        self.place_block(end_block)
+
+    def lower_loop_body(self, stmt, break_block, continue_block):
+        """It lowers the body of a loop.
+        """
+        self.break_targets.append(break_block)
+        self.continue_targets.append(continue_block)
+        self.lower_statement(stmt)
+        self.break_targets.pop()
+        self.continue_targets.pop()
+
+    def lower_Switch(self, node):
+        value = self.lower_expression(node.cond)
+        end_block = self.new_block()
+        items = []
+        cases = []          # [(value, block)]
+        default_block = end_block
+
+        if isinstance(node.stmt, c_ast.Compound):
+            items = node.stmt.block_items or []
+        elif node.stmt is not None:
+            items = [node.stmt]
+
+        blocks = []
+
+        for item in items:
+            if isinstance(item, (c_ast.Case, c_ast.Default)):
+                block = self.new_block()
+
+                blocks.append(block)
+
+                if isinstance(item, c_ast.Case):
+                    cases.append((item.expr, block))
+                else:
+                    default_block = block
+            else:
+                blocks.append(None)
+
+        # Chain of comparisons
+        for case_expr, block in cases:
+            self.set_coord(case_expr)
+
+            next_block = self.new_block()
+            case_value = self.lower_expression(case_expr)
+            condition = self.emit(IRConstants.BINARY, dst=self.temporary(), src1=value,
+                                  src2=case_value, extra=self.strings.intern("=="))
+
+            self.branch(condition, block, next_block)
+            self.place_block(next_block)
+
+        self.jump(default_block)
+
+        # Bodies (fall through)
+        self.break_targets.append(end_block)
+
+        for item, block in zip(items, blocks):
+            if block is not None:
+                self.place_block(block)
+
+                for stmt in item.stmts or []:
+                    self.lower_statement(stmt)
+            else:
+                self.lower_statement(item)
+
+        self.break_targets.pop()
+        self.place_block(end_block)
+
+    def lower_Case(self, node):
+        # Case which is not a direct child of the switch (not supported)
+        for stmt in node.stmts or []:
+            self.lower_statement(stmt)
+
+    def lower_Default(self, node):
+        self.lower_Case(node)
+
+    def lower_Break(self, node):
+        if len(self.break_targets) == 0:
+            raise IRException(f"'break' outside of a loop or switch ({node.coord})")
+
+        self.jump(self.break_targets[-1])
+
+    def lower_Continue(self, node):
+        if len(self.continue_targets) == 0:
+            raise IRException(f"'continue' outside of a loop ({node.coord})")
+
+        self.jump(self.continue_targets[-1])
+
+    def lower_Label(self, node):
+        block = self.get_label(node.name)
+
+        self.jump(block)
+        self.place_block(block)
+        self.lower_statement(node.stmt)
+
+    def lower_Goto(self, node):
+        self.jump(self.get_label(node.name))
+
+    def lower_Return(self, node):
+        value = IRConstants.no_operand
+
+        if node.expr is not None:
+            value = self.lower_expression(node.expr)
+
+        self.set_coord(node)
+        self.emit(IRConstants.RETURN, src1=value)
+
+    # Expressions
+
+    def lower_condition(self, node, true_block, false_block):
+        """It lowers a condition and jumps to *true_block* or *false_block*.
+        The short-circuit operators are lowered to jumps.
+
+        Arguments:
+            node (pycparser.c_ast.Node): condition.
+            true_block (int): block.
+            false_block (int): block.
+        """
+        if (isinstance(node, c_ast.BinaryOp) and node.op in ("&&", "||")):
+            rhs_block = self.new_block()
+
+            if node.op == "&&":
+                self.lower_condition(node.left, rhs_block, false_block)
+            else:
+                self.lower_condition(node.left, true_block, rhs_block)
+
+            self.place_block(rhs_block)
+            self.lower_condition(node.right, true_block, false_block)
+        elif (isinstance(node, c_ast.UnaryOp) and node.op == "!"):
+            self.lower_condition(node.expr, false_block, true_block)
+        else:
+            condition = self.lower_expression(node)
+
+            self.set_coord(node)
+            self.branch(condition, true_block, false_block)
+
+    def lower_expression(self, node):
+        """It lowers an expression.
+
+        Arguments:
+            node (pycparser.c_ast.Node): expression.
+
+        Returns:
+            int: operand which contains the value of the expression
+        """
+        if node is None:
+            return IRConstants.no_operand
+
+        self.set_coord(node)
+
+        if isinstance(node, c_ast.ID):
+            return self.variable(node.name)
+        if isinstance(node, c_ast.Constant):
+            return self.constant(node.value)
+
+        method = getattr(self, f"lower_expression_{type(node).__name__}", None)
+
+        if method is None:
+            return self.emit(IRConstants.OPAQUE, dst=self.temporary(),
+                             extra=self.strings.intern(type(node).__name__))
+
+        return method(node)
+
+    def lower_expression_BinaryOp(self, node):
+        if node.op in ("&&", "||"):
+            result = self.temporary()
+            true_block = self.new_block()
+            false_block = self.new_block()
+            end_block = self.new_block()
+
+            self.lower_condition(node, true_block, false_block)
+            self.place_block(true_block)
+            self.emit(IRConstants.ASSIGN, dst=result, src1=self.constant("1"))
+            self.jump(end_block)
+            self.place_block(false_block)
+            self.emit(IRConstants.ASSIGN, dst=result, src1=self.constant("0"))
+            self.jump(end_block)
+            self.place_block(end_block)
+
+            return result
+
+        left = self.lower_expression(node.left)
+        right = self.lower_expression(node.right)
+
+        self.set_coord(node)
+
+        return self.emit(IRConstants.BINARY, dst=self.temporary(), src1=left,
+                         src2=right, extra=self.strings.intern(node.op))
+
+    def lower_expression_UnaryOp(self, node):
+        if node.op in ("++", "--", "p++", "p--"):
+            old_value = self.lower_expression(node.expr)
+            operator = self.strings.intern(node.op[-1])
+
+            self.set_coord(node)
+
+            new_value = self.emit(IRConstants.BINARY, dst=self.temporary(), src1=old_value,
+                                  src2=self.constant("1"), extra=operator)
+
+            if node.op.startswith("p"):
+                # The old value has to be preserved
+                result = self.emit(IRConstants.ASSIGN, dst=self.temporary(), src1=old_value)
+                self.store(node.expr, new_value)
+
+                return result
+
+            self.store(node.expr, new_value)
+
+            return new_value
+        if node.op == "&":
+            value = self.lower_expression(node.expr)
+
+            self.set_coord(node)
+
+            return self.emit(IRConstants.ADDRESS, dst=self.temporary(), src1=value)
+        if node.op == "*":
+            value = self.lower_expression(node.expr)
+
+            self.set_coord(node)
+
+            return self.emit(IRConstants.LOAD, dst=self.temporary(), src1=value)
+        if (node.op == "sizeof" and isinstance(node.expr, c_ast.Typename)):
+            return self.constant(f"sizeof({self.generator.visit(node.expr)})")
+
+        value = self.lower_expression(node.expr)
+
+        self.set_coord(node)
+
+        return self.emit(IRConstants.UNARY, dst=self.temporary(), src1=value,
+                         extra=self.strings.intern(node.op))
+
+    def lower_expression_Assignment(self, node):
+        value = self.lower_expression(node.rvalue)
+
+        if node.op != "=":
+            # Compound assignment (e.g. "+=")
+            current = self.lower_expression(node.lvalue)
+
+            self.set_coord(node)
+
+            value = self.emit(IRConstants.BINARY, dst=self.temporary(), src1=current,
+                              src2=value, extra=self.strings.intern(node.op[:-1]))
+
+        self.set_coord(node)
+
+        return self.store(node.lvalue, value)
+
+    def store(self, lvalue, value):
+        """It stores a value in a lvalue.
+
+        Arguments:
+            lvalue (pycparser.c_ast.Node): lvalue.
+            value (int): operand.
+
+        Returns:
+            int: *value*
+        """
+        if isinstance(lvalue, c_ast.ID):
+            self.emit(IRConstants.ASSIGN, dst=self.variable(lvalue.name), src1=value)
+        elif isinstance(lvalue, c_ast.ArrayRef):
+            base = self.lower_expression(lvalue.name)
+            index = self.lower_expression(lvalue.subscript)
+
+            self.emit(IRConstants.STORE_INDEX, src1=base, src2=index, extra=value)
+        elif isinstance(lvalue, c_ast.StructRef):
+            base = self.lower_expression(lvalue.name)
+
+            if lvalue.type == "->":
+                base = self.emit(IRConstants.LOAD, dst=self.temporary(), src1=base)
+
+            self.emit(IRConstants.STORE_FIELD, src1=base,
+                      src2=self.strings.intern(lvalue.field.name), extra=value)
+        elif (isinstance(lvalue, c_ast.UnaryOp) and lvalue.op == "*"):
+            pointer = self.lower_expression(lvalue.expr)
+
+            self.emit(IRConstants.STORE, src1=pointer, src2=value)
+        else:
+            # e.g. cast as lvalue (compiler extension)
+            pointer = self.lower_expression(lvalue)
+
+            self.emit(IRConstants.STORE, src1=pointer, src2=value)
+
+        return value
+
+    def lower_expression_ArrayRef(self, node):
+        base = self.lower_expression(node.name)
+        index = self.lower_expression(node.subscript)
+
+        self.set_coord(node)
+
+        return self.emit(IRConstants.LOAD_INDEX, dst=self.temporary(), src1=base, src2=index)
+
+    def lower_expression_StructRef(self, node):
+        base = self.lower_expression(node.name)
+
+        self.set_coord(node)
+
+        return self.emit(IRConstants.LOAD_FIELD, dst=self.temporary(), src1=base,
+                         src2=self.strings.intern(node.field.name),
+                         extra=self.strings.intern(node.type))
+
+    def lower_expression_FuncCall(self, node):
+        function = self.lower_expression(node.name)
+        arguments = []
+
+        if node.args is not None:
+            arguments = [self.lower_expression(arg) for arg in node.args.exprs]
+
+        self.set_coord(node)
+
+        for position, argument in enumerate(arguments, 1):
+            self.emit(IRConstants.PARAM, src1=argument, extra=position)
+
+        return self.emit(IRConstants.CALL, dst=self.temporary(), src1=function,
+                         extra=len(arguments))
+
+    def lower_expression_Cast(self, node):
+        value = self.lower_expression(node.expr)
+
+        self.set_coord(node)
+
+        return self.emit(IRConstants.CAST, dst=self.temporary(), src1=value,
+                         extra=self.strings.intern(self.generator.visit(node.to_type)))
+
+    def lower_expression_TernaryOp(self, node):
+        result = self.temporary()
+        true_block = self.new_block()
+        false_block = self.new_block()
+        end_block = self.new_block()
+
+        self.lower_condition(node.cond, true_block, false_block)
+        self.place_block(true_block)
+        self.emit(IRConstants.ASSIGN, dst=result, src1=self.lower_expression(node.iftrue))
+        self.jump(end_block)
+        self.place_block(false_block)
+        self.emit(IRConstants.ASSIGN, dst=result, src1=self.lower_expression(node.iffalse))
+        self.jump(end_block)
+        self.place_block(end_block)
+
+        return result
+
+    def lower_expression_ExprList(self, node):
+        value = IRConstants.no_operand
+
+        for expr in node.exprs:
+            value = self.lower_expression(expr)
+
+        return value
+
+def lower_function(func_def, strings=None):
+    """It lowers a function to the IR.
+
+    Arguments:
+        func_def (pycparser.c_ast.FuncDef): function.
+        strings (StringTable): string table. If *None*, a new one
+            will be created.
+
+    Returns:
+        IRFunction: IR of the function
+
+    Raises:
+        IRException: if the function could not be lowered.
+    """
+    if strings is None:
+        strings = StringTable()
+
+    return IRLowering(func_def, strings).lower()
+
+def lower_ast(ast):
+    """It lowers all the functions of a translation unit to the IR.
+
+    Arguments:
+        ast (pycparser.c_ast.FileAST): AST.
+
+    Returns:
+        IRModule: IR of the translation unit
+
+    Raises:
+        IRException: if some function could not be lowered.
+    """
+    module = IRModule()
+
+    for ext in ast.ext:
+        if isinstance(ext, c_ast.FuncDef):
+            module.functions[ext.decl.name] = lower_function(ext, module.strings)
+
+    return module
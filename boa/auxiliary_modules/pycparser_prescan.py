@@ -0,0 +1,372 @@
+"""File which contains a fast prescan of C source code which looks
+for function calls (i.e. "identifier (") without preprocessing nor
+parsing the file.
+
+The prescan is a single pass of a lexer over the raw source code, so it
+is not affected by the compiler extensions which pycparser does not
+support. The comments, literals and preprocessor directives are skipped,
+as well as the regions which the preprocessor disables with constant
+conditions (e.g. "#if 0"), and the coordinates of the found function calls are the row and column
+of the name of the function in the file, both starting with 1 (i.e. the
+same that pycparser assigns to *pycparser.c_ast.FuncCall* unless a macro
+is expanded before the function call in the same row).
+
+The pycparser lexer is not used because it expects preprocessed code
+(e.g. it does not handle comments).
+"""
+
+# Std libs
+import re
+import bisect
+
+class PrescanConstants:
+    # The source code is split in runs of characters which are not relevant
+    #  by themselves and the tokens which are relevant in order to recognize
+    #  function calls (the name of a function is at the end of a run which
+    #  is followed by '(')
+    token_regex = re.compile(r"""
+        (?P<run>(?:[^"'/\#{}(\n]|/(?![/*])|\n(?![ \t]*\#))+)
+        |(?P<parenthesis>\()
+        |(?P<brace>[{}])
+        |(?P<comment>/\*.*?(?:\*/|\Z)|//(?:\\\n|[^\n])*)
+        |(?P<preprocessor>(?:(?<=\n)|\A)[ \t]*\#(?:\\\n|/\*.*?\*/|[^\n])*)
+        |(?P<literal>"(?:\\.|[^"\\\n])*"?|'(?:\\.|[^'\\\n])*'?)
+        |(?P<other>.)
+        """, re.VERBOSE | re.DOTALL)
+    # Name of the function and the 2 previous tokens at the end of a run
+    run_end_regex = re.compile(r"""
+        (?:(?:(?P<prev2>(?<![\w$])[A-Za-z_$][\w$]*|[^\s\w])\s*)?
+        (?P<prev1>(?<![\w$])[A-Za-z_$][\w$]*|[^\s\w])\s*)?
+        (?<![\w$])(?P<name>[A-Za-z_$][\w$]*)\s*\Z
+        """, re.VERBOSE)
+    # Max. length of the end of a run which is checked
+    run_end_max_length = 128
+    # Conditional preprocessor directives (the comments have to be removed)
+    conditional_regex = re.compile(r"[ \t]*\#[ \t]*(?P<directive>if|ifdef|ifndef|elif|else|endif)\b"
+                                   r"(?P<condition>.*)", re.DOTALL)
+    comment_regex = re.compile(r"/\*.*?\*/|//.*", re.DOTALL)
+    false_condition_regex = re.compile(r"\(?\s*0+[uUlL]*\s*\)?")
+    true_condition_regex = re.compile(r"\(?\s*0*[1-9][0-9]*[uUlL]*\s*\)?")
+
+    # Keywords which can be followed by '(' without being a function call
+    keywords_not_call = {"if", "for", "while", "switch", "return", "sizeof", "else",
+                         "case", "do", "goto", "_Alignof", "_Alignas", "_Generic",
+                         "_Static_assert", "__attribute__", "__attribute", "__declspec",
+                         "__asm__", "__asm", "asm", "__typeof__", "__typeof", "typeof",
+                         "__extension__", "__builtin_offsetof", "offsetof", "__alignof__",
+                         "__alignof", "defined", "void", "char", "short", "int", "long",
+                         "float", "double", "signed", "unsigned", "_Bool", "_Complex",
+                         "const", "volatile", "restrict", "struct", "union", "enum",
+                         "static", "extern", "register", "auto", "inline", "typedef"}
+    # Keywords which can appear before a function call
+    keywords_before_call = {"return", "else", "case", "do", "goto"}
+
+class FunctionCallCandidate:
+    """FunctionCallCandidate class.
+
+    It represents a function call found by the prescan.
+    """
+
+    def __init__(self, name, row, col, ambiguous):
+        """It initializes the function call.
+
+        Arguments:
+            name (str): name of the function.
+            row (int): row of the name of the function (starts with 1).
+            col (int): column of the name of the function (starts with 1).
+            ambiguous (bool): *True* if the prescan could not decide
+                if it is a function call or a declaration (e.g.
+                "a * f(b)" and "type * f(b)"), which needs the AST in order
+                to be disambiguated.
+        """
+        self.name = name
+        self.row = row
+        self.col = col
+        self.ambiguous = ambiguous
+
+    def get_coord(self):
+        """It returns the coordinates of the function call.
+
+        Returns:
+            tuple: tuple of format (str, int, int) which contains the name,
+            row and column
+        """
+        return (self.name, self.row, self.col)
+
+    def __repr__(self):
+        return f"FunctionCallCandidate({self.name!r}, {self.row}, {self.col}, {self.ambiguous})"
+
+class ConditionalStack:
+    """ConditionalStack class.
+
+    It keeps track of the conditional preprocessor directives (i.e. *#if*,
+    *#ifdef*, *#ifndef*, *#elif*, *#else* and *#endif*) in order to know
+    if the current region is disabled. Only the constant conditions (e.g.
+    "#if 0" or "#if 1") are evaluated, so the regions of the rest of
+    conditions are never considered disabled.
+    """
+
+    def __init__(self):
+        """It initializes the stack.
+        """
+        # List of [disabled, taken] for each nested conditional: *disabled*
+        #  is *True* if the current branch is disabled and *taken* is *True*
+        #  if a previous branch is always enabled (the next ones are disabled)
+        self.stack = []
+
+    def is_disabled(self):
+        """It checks if the current region is disabled.
+
+        Returns:
+            bool: *True* if any of the nested conditionals is in a disabled
+            branch. Otherwise, *False*
+        """
+        return any(disabled for disabled, _ in self.stack)
+
+    def process_directive(self, directive):
+        """It updates the stack with a preprocessor directive. The directives
+        which are not conditionals are ignored.
+
+        Arguments:
+            directive (str): preprocessor directive (i.e. from '#' until the
+                end of the directive).
+        """
+        directive = PrescanConstants.comment_regex.sub(" ", directive.replace("\\\n", ""))
+        match = PrescanConstants.conditional_regex.match(directive)
+
+        if match is None:
+            return
+
+        name = match.group("directive")
+        condition = match.group("condition").strip()
+
+        if name in ("if", "ifdef", "ifndef"):
+            self.stack.append([False, False])
+
+            if name == "if":
+                self.enter_branch(self.evaluate(condition))
+        elif len(self.stack) == 0:
+            # Unbalanced directive
+            return
+        elif name == "elif":
+            self.enter_branch(self.evaluate(condition))
+        elif name == "else":
+            self.enter_branch(True)
+        else:
+            self.stack.pop()
+
+    def enter_branch(self, condition):
+        """It updates the last conditional when a branch starts.
+
+        Arguments:
+            condition (bool): value of the condition of the branch. *None*
+                if it is unknown.
+        """
+        branch = self.stack[-1]
+
+        # The branch is disabled if a previous branch is always enabled
+        branch[0] = branch[1] or condition is False
+        branch[1] = branch[1] or condition is True
+
+    def evaluate(self, condition):
+        """It evaluates the condition of *#if* or *#elif* if it is constant.
+
+        Arguments:
+            condition (str): condition without comments.
+
+        Returns:
+            bool: value of the condition. If it is not constant, *None* will
+            be returned
+        """
+        if PrescanConstants.false_condition_regex.fullmatch(condition):
+            return False
+        if PrescanConstants.true_condition_regex.fullmatch(condition):
+            return True
+
+        return None
+
+def prescan_function_calls(source):
+    """It looks for the function calls of C source code.
+
+    Only the function calls inside a function body (i.e. with a brace
+    depth greater than 0) are taken into account, since C does not allow
+    function calls at file scope. If the name of the function is preceded
+    by a type or an identifier, it is a declaration. The function calls
+    inside preprocessor directives (e.g. *#define*) or inside regions
+    disabled by the preprocessor (check *ConditionalStack*) are not found,
+    neither the calls through members (e.g. "s->fp(3)" and "s.fp(3)"),
+    whose name is not the name of a function.
+
+    Arguments:
+        source (str): C source code.
+
+    Returns:
+        list: list of *FunctionCallCandidate* sorted by appearance
+    """
+    result = []
+    brace_depth = 0
+    conditionals = ConditionalStack()
+    # Last token which is not a comment nor a preprocessor directive
+    prev = None
+
+    for match in PrescanConstants.token_regex.finditer(source):
+        kind = match.lastgroup
+
+        if kind == "preprocessor":
+            conditionals.process_directive(match.group())
+
+            continue
+        if conditionals.is_disabled():
+            continue
+
+        if kind == "parenthesis":
+            if (brace_depth != 0 and prev is not None and prev.lastgroup == "run"):
+                function_call = get_function_call(source, prev.start(), match.start())
+
+                if function_call is not None:
+                    result.append(function_call)
+        elif kind == "brace":
+            if source[match.start()] == "{":
+                brace_depth += 1
+            else:
+                brace_depth = max(brace_depth - 1, 0)
+        elif kind == "comment":
+            continue
+
+        prev = match
+
+    if len(result) == 0:
+        return []
+
+    # The rows and columns are only calculated for the function calls
+    line_starts = [0] + [match.end() for match in re.finditer("\n", source)]
+    function_calls = []
+
+    for name, position, ambiguous in result:
+        row = bisect.bisect_right(line_starts, position)
+        col = position - line_starts[row - 1] + 1
+
+        function_calls.append(FunctionCallCandidate(name, row, col, ambiguous))
+
+    return function_calls
+
+def prescan_function_definitions(source):
+    """It looks for the function definitions of C source code.
+
+    A function definition is a body (i.e. '{' with a brace depth of 0)
+    which is preceded by a parenthesis since the previous declaration
+    (i.e. ';' or '}' with a brace depth of 0). The name of the function is
+    the first name which is followed by '(' and is not a keyword (e.g.
+    "int (*f(int a))(int) {" defines *f*). The function definitions inside
+    regions disabled by the preprocessor (check *ConditionalStack*) are
+    not found.
+
+    Arguments:
+        source (str): C source code.
+
+    Returns:
+        list: list of tuples of format (str, int, int) which contains the
+        name of the function, the row where the definition starts (i.e.
+        the row of the name) and the row where the body finishes, both
+        starting with 1, sorted by appearance
+    """
+    result = []
+    brace_depth = 0
+    conditionals = ConditionalStack()
+    # Name and position of the function of the current declaration
+    candidate = None
+    # Last token which is not a comment nor a preprocessor directive
+    prev = None
+
+    for match in PrescanConstants.token_regex.finditer(source):
+        kind = match.lastgroup
+
+        if kind == "preprocessor":
+            conditionals.process_directive(match.group())
+
+            continue
+        if (conditionals.is_disabled() or kind == "comment"):
+            continue
+
+        if brace_depth == 0:
+            if kind == "run" and (";" in match.group() or "=" in match.group()):
+                # Declaration which is not a function definition
+                candidate = None
+            elif (kind == "parenthesis" and candidate is None and
+                    prev is not None and prev.lastgroup == "run"):
+                run_start = max(prev.start(), match.start() - PrescanConstants.run_end_max_length)
+                name = PrescanConstants.run_end_regex.search(source, run_start, match.start())
+
+                if (name is not None and
+                        name.group("name") not in PrescanConstants.keywords_not_call):
+                    candidate = (name.group("name"), name.start("name"))
+
+        if kind == "brace":
+            if source[match.start()] == "{":
+                if (brace_depth == 0 and candidate is not None):
+                    result.append([*candidate, None])
+
+                brace_depth += 1
+            elif brace_depth > 0:
+                brace_depth -= 1
+
+                if (brace_depth == 0 and len(result) != 0 and result[-1][2] is None):
+                    result[-1][2] = match.start()
+
+            if brace_depth == 0:
+                candidate = None
+
+        prev = match
+
+    # The rows are only calculated for the function definitions
+    line_starts = [0] + [match.end() for match in re.finditer("\n", source)]
+    function_definitions = []
+
+    for name, start, end in result:
+        end = len(source) if end is None else end
+
+        function_definitions.append((name, bisect.bisect_right(line_starts, start),
+                                     bisect.bisect_right(line_starts, end)))
+
+    return function_definitions
+
+def get_function_call(source, run_start, run_end):
+    """It checks if the end of a run which is followed by '(' is
+    a function call.
+
+    Arguments:
+        source (str): C source code.
+        run_start (int): position where the run starts.
+        run_end (int): position where the run finishes (i.e. '(').
+
+    Returns:
+        tuple: tuple of format (str, int, bool) which contains the name
+        of the function, its position in *source* and if is ambiguous
+        (check *FunctionCallCandidate*). If it is not a function call,
+        *None* will be returned
+    """
+    run_start = max(run_start, run_end - PrescanConstants.run_end_max_length)
+    match = PrescanConstants.run_end_regex.search(source, run_start, run_end)
+
+    if (match is None or match.group("name") in PrescanConstants.keywords_not_call):
+        return None
+
+    prev1 = match.group("prev1")
+    prev2 = match.group("prev2")
+    ambiguous = False
+
+    def is_identifier(token):
+        return (token is not None and (token[0].isalpha() or token[0] in "_$") and
+                token not in PrescanConstants.keywords_before_call)
+
+    if is_identifier(prev1):
+        # Declaration (e.g. "int f(void)")
+        return None
+    if (prev1 == "." or (prev1 == ">" and prev2 == "-")):
+        # Call through a member (e.g. "s.fp(3)" or "s->fp(3)")
+        return None
+    if (prev1 == "*" and (prev2 == "*" or is_identifier(prev2))):
+        # Multiplication or declaration (e.g. "a * f(b)" or "type * f(b)")
+        ambiguous = True
+
+    return (match.group("name"), match.start("name"), ambiguous)
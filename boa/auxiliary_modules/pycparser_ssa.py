@@ -0,0 +1,298 @@
+"""File which contains the SSA (i.e. Static Single Assignment) form
+of a function of the CFG (i.e. Control Flow Graph).
+
+The SSA form is built over the whole instructions of a function (check
+*pycparser_utils.get_full_instruction_function*), which are the nodes of
+the graph, with the phi placement based on the dominance frontiers
+(Cytron et al.). The dominators are calculated with the algorithm of
+Cooper, Harvey and Kennedy.
+"""
+
+class SSAException(Exception):
+    """SSAException exception class.
+
+    This exception is intented to be used when something
+    goes wrong while the SSA form is being built.
+    """
+
+    def __init__(self, message):
+        """It initializes the exception.
+
+        Arguments:
+            message (str): message to be displayed.
+        """
+        super().__init__(message)
+
+        self.message = message
+
+class SSA:
+    """SSA class.
+
+    It contains the SSA form of a graph. The definitions are
+    represented with tuples:
+
+    * ("entry", variable): initial definition of the variables.
+    * ("phi", node, variable): phi function at the beginning of *node*.
+    * ("def", node, variable): definition of the statement *node*.
+    """
+
+    def __init__(self, preds, definitions, entry=0):
+        """It builds the SSA form.
+
+        Arguments:
+            preds (list): list of lists of *int* where the element *i*
+                contains the predecessors of the node *i*.
+            definitions (list): list of iterables of *str* where the element
+                *i* contains the variables which the node *i* defines.
+            entry (int): entry node.
+
+        Raises:
+            SSAException: if *preds* and *definitions* have not the same
+                length or *entry* is not a node.
+        """
+        if len(preds) != len(definitions):
+            raise SSAException(f"the number of nodes of 'preds' ({len(preds)}) and"
+                               f" 'definitions' ({len(definitions)}) have to be equal")
+        if not 0 <= entry < len(preds):
+            raise SSAException(f"the entry node '{entry}' does not exist")
+
+        # A virtual node, which is the only predecessor of the entry node, defines
+        #  all the variables, so the entry node might need phi functions as well
+        self.virtual_entry = len(preds)
+        self.preds = [list(pred) for pred in preds] + [[]]
+        self.preds[entry].append(self.virtual_entry)
+        self.definitions = [set(definition) for definition in definitions] + [set()]
+        self.succs = [[] for _ in self.preds]
+
+        for node, node_preds in enumerate(self.preds):
+            for pred in node_preds:
+                self.succs[pred].append(node)
+
+        self.order = self.get_reverse_postorder()
+        self.idom = self.get_immediate_dominators()
+        self.frontiers = self.get_dominance_frontiers()
+        self.phis = self.place_phis()
+        self.reaching_definitions = {}   # {(node, variable): definition}
+
+    def get_reverse_postorder(self):
+        """It returns the reachable nodes from the virtual entry in
+        reverse postorder.
+
+        Returns:
+            list: list of *int*
+        """
+        result = []
+        visited = {self.virtual_entry}
+        stack = [[self.virtual_entry, 0]]
+
+        while len(stack) != 0:
+            node, succ_index = stack[-1]
+
+            if succ_index < len(self.succs[node]):
+                stack[-1][1] += 1
+                succ = self.succs[node][succ_index]
+
+                if succ not in visited:
+                    visited.add(succ)
+                    stack.append([succ, 0])
+            else:
+                stack.pop()
+                result.append(node)
+
+        result.reverse()
+
+        return result
+
+    def get_immediate_dominators(self):
+        """It calculates the immediate dominators of the reachable nodes.
+
+        Returns:
+            dict: dict with the nodes as keys and their immediate dominator as
+            values. The virtual entry node has not immediate dominator (*None*)
+        """
+        order_index = {node: index for index, node in enumerate(self.order)}
+        idom = {self.virtual_entry: self.virtual_entry}
+        changed = True
+
+        def intersect(node1, node2):
+            while node1 != node2:
+                while order_index[node1] > order_index[node2]:
+                    node1 = idom[node1]
+                while order_index[node2] > order_index[node1]:
+                    node2 = idom[node2]
+
+            return node1
+
+        while changed:
+            changed = False
+
+            for node in self.order[1:]:
+                new_idom = None
+
+                for pred in self.preds[node]:
+                    if pred not in idom:
+                        # Not processed yet or not reachable
+                        continue
+
+                    new_idom = pred if new_idom is None else intersect(pred, new_idom)
+
+                if idom.get(node) != new_idom:
+                    idom[node] = new_idom
+                    changed = True
+
+        idom[self.virtual_entry] = None
+
+        return idom
+
+    def get_dominance_frontiers(self):
+        """It calculates the dominance frontiers of the reachable nodes.
+
+        Returns:
+            dict: dict with the nodes as keys and a set of nodes as values
+        """
+        frontiers = {node: set() for node in self.order}
+
+        for node in self.order:
+            preds = list(filter(lambda pred: pred in self.idom, self.preds[node]))
+
+            if len(preds) < 2:
+                continue
+
+            for pred in preds:
+                runner = pred
+
+                while runner != self.idom[node]:
+                    frontiers[runner].add(node)
+                    runner = self.idom[runner]
+
+        return frontiers
+
+    def place_phis(self):
+        """It places the phi functions of the variables in the iterated
+        dominance frontiers of their definitions.
+
+        Returns:
+            dict: dict with the nodes as keys and the set of variables which
+            need a phi function at the beginning of the node as values
+        """
+        phis = {}
+        definition_nodes = {}   # {variable: set of nodes}
+
+        for node in self.order:
+            for variable in self.definitions[node]:
+                definition_nodes.setdefault(variable, set()).add(node)
+
+        for variable, nodes in definition_nodes.items():
+            # The virtual entry defines all the variables
+            worklist = list(nodes) + [self.virtual_entry]
+            inserted = set()
+            enqueued = set(worklist)
+
+            while len(worklist) != 0:
+                node = worklist.pop()
+
+                for frontier in self.frontiers[node]:
+                    if frontier in inserted:
+                        continue
+
+                    phis.setdefault(frontier, set()).add(variable)
+                    inserted.add(frontier)
+
+                    if frontier not in enqueued:
+                        worklist.append(frontier)
+                        enqueued.add(frontier)
+
+        return phis
+
+    def is_reachable(self, node):
+        """It checks if a node is reachable from the entry node.
+
+        Arguments:
+            node (int): node.
+
+        Returns:
+            bool: *True* if reachable. Otherwise, *False*
+        """
+        return node in self.idom
+
+    def get_phi_operands(self, node, variable):
+        """It returns the definitions which reach a phi function.
+
+        Arguments:
+            node (int): node which contains the phi function.
+            variable (str): variable of the phi function.
+
+        Returns:
+            list: list of definitions (one for each reachable predecessor)
+        """
+        result = []
+
+        for pred in self.preds[node]:
+            if not self.is_reachable(pred):
+                continue
+
+            result.append(self.get_output_definition(pred, variable))
+
+        return result
+
+    def get_output_definition(self, node, variable):
+        """It returns the definition of a variable which leaves a node.
+
+        Arguments:
+            node (int): reachable node.
+            variable (str): variable.
+
+        Returns:
+            tuple: definition
+        """
+        if node == self.virtual_entry:
+            return ("entry", variable)
+        if variable in self.definitions[node]:
+            return ("def", node, variable)
+
+        return self.get_reaching_definition(node, variable)
+
+    def get_reaching_definition(self, node, variable):
+        """It returns the definition of a variable which reaches the
+        beginning of a node.
+
+        Arguments:
+            node (int): node.
+            variable (str): variable.
+
+        Returns:
+            tuple: definition. If the node is not reachable, *None* will
+            be returned
+        """
+        if not self.is_reachable(node):
+            return None
+
+        path = []
+        current = node
+        result = None
+
+        # Walk the dominator tree until a definition is found
+        while result is None:
+            key = (current, variable)
+
+            if key in self.reaching_definitions:
+                result = self.reaching_definitions[key]
+                break
+
+            path.append(key)
+
+            if current == self.virtual_entry:
+                result = ("entry", variable)
+            elif variable in self.phis.get(current, ()):
+                result = ("phi", current, variable)
+            else:
+                current = self.idom[current]
+
+                if (current != self.virtual_entry and
+                        variable in self.definitions[current]):
+                    result = ("def", current, variable)
+
+        for key in path:
+            self.reaching_definitions[key] = result
+
+        return result
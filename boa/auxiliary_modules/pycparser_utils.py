@@ -3,6 +3,7 @@ Pycparser.
 """
 
 # Std libs
+import os
 import logging
 
 # Pycparser imports
@@ -48,6 +49,12 @@ class PycparserUtilConstants:
                              ast.If, ast.Switch, ast.While)
     compound_instr = strict_compound_instr + (ast.Case, ast.Default)
     fake_instr = (Separator,)
+    # Origins of the external declarations (check *get_ext_origins*)
+    origin_main = "main"
+    origin_header = "header"
+    origin_system = "system"
+    origins = (origin_main, origin_header, origin_system)
+    system_include_directories = ("/usr/include", "/usr/local/include", "/usr/lib")
 
 def get_instruction_path(instruction, include_instruction=False):
     """It returns the path of a instruction.
@@ -1003,3 +1010,58 @@ def get_full_instruction_from_id(all_instructions, reference_id):
 
     raise PycparserException(f"element with reference '{reference_id}'"
                              " was not found")
+
+def get_ext_origins(file_ast, main_file, system_directories=None):
+    """It tags each external declaration of a translation unit with the
+    file where it is defined (i.e. its coordinates) and the kind of origin:
+
+    * *PycparserUtilConstants.origin_main*: the main file (or unknown).
+    * *PycparserUtilConstants.origin_system*: a file inside of one of
+      *system_directories* or *PycparserUtilConstants.system_include_directories*
+      (e.g. the fake libc headers of pycparser) or a pseudo file of the
+      preprocessor (e.g. "<built-in>").
+    * *PycparserUtilConstants.origin_header*: other file.
+
+    Arguments:
+        file_ast (pycparser.c_ast.FileAST): AST.
+        main_file (str): path of the main file (as it was provided to
+            the preprocessor).
+        system_directories (list): list of *str* which contains other
+            directories which should be considered as system directories.
+
+    Returns:
+        list: list of tuples of format (str, str) which contains the file and
+        the kind of origin of the external declaration with the same index in
+        *file_ast.ext*. The file is *None* if the external declaration has
+        not coordinates
+    """
+    directories = list(PycparserUtilConstants.system_include_directories)
+
+    if system_directories is not None:
+        directories.extend(system_directories)
+
+    directories = [os.path.join(os.path.normpath(directory), "") for directory in directories]
+    main_file = os.path.normpath(main_file)
+    kinds = {}          # {file: kind}
+    result = []
+
+    for ext in file_ast.ext:
+        filename = None
+
+        if (ext.coord is not None and ext.coord.file):
+            filename = ext.coord.file
+
+        if filename not in kinds:
+            if (filename is None or os.path.normpath(filename) == main_file):
+                kind = PycparserUtilConstants.origin_main
+            elif (filename.startswith("<") or
+                  any(map(os.path.normpath(filename).startswith, directories))):
+                kind = PycparserUtilConstants.origin_system
+            else:
+                kind = PycparserUtilConstants.origin_header
+
+            kinds[filename] = kind
+
+        result.append((filename, kinds[filename]))
+
+    return result
@@ -0,0 +1,229 @@
+"""File which contains the necessary logic in order to write the
+threats of a report to shard files and to merge them.
+
+A shard is a JSON lines file whose first line contains the severity
+enumeration of each module and whose next lines contain the threats
+sorted by severity (higher values first), with the signature of the
+threat at the end if it has one. Since the shards are sorted,
+several shards (e.g. the reports of parallel executions) are merged
+with a streaming k-way merge: only one threat of each shard is kept in
+memory, and the threats of each module keep the order which they had
+in their shard (the ties are resolved by the order of the shards).
+"""
+
+# Std libs
+import os
+import sys
+import json
+import heapq
+import tempfile
+
+# Own libs
+from modules_importer import ModulesImporter
+from utils import get_current_path
+
+class ReportShardConstants:
+    """Class which contains the necessary constants
+    for working with the report shards.
+    """
+    header_key = "severity_enum_mapping"
+    severity_enum_directory = "enumerations/severity"
+
+def get_severity_enum_name(severity_enum):
+    """It returns the name of a severity enumeration.
+
+    Arguments:
+        severity_enum (type): severity enumeration.
+
+    Returns:
+        str: name in format "module_name.class_name"
+    """
+    return f"{severity_enum.__module__}.{severity_enum.__name__}"
+
+def get_severity_enum(name):
+    """It returns a severity enumeration by its name. If its module
+    is not loaded, it is loaded the same way that BOA loads the
+    severity enumerations.
+
+    Arguments:
+        name (str): name in format "module_name.class_name".
+
+    Returns:
+        type: severity enumeration
+
+    Raises:
+        ValueError: if the severity enumeration could not be loaded.
+    """
+    module_name, class_name = name.split(".", 1)
+
+    if module_name in sys.modules:
+        severity_enum = getattr(sys.modules[module_name], class_name, None)
+    else:
+        path = f"{get_current_path(__file__)}/../{ReportShardConstants.severity_enum_directory}/{module_name}.py"
+        severity_enum = ModulesImporter.load_and_get_instance(module_name, path, class_name, verbose=False)
+
+    if not isinstance(severity_enum, type):
+        raise ValueError(f"could not load the severity enumeration '{name}'")
+
+    return severity_enum
+
+def write_shard(path, threats, severity_enum_mapping):
+    """It writes a shard. The file is replaced atomically.
+
+    Arguments:
+        path (str): path of the file.
+        threats (iterable): threat records sorted by severity (higher
+            values first). The threats are written while they are
+            iterated.
+        severity_enum_mapping (dict): severity enumeration of each module
+            of the threats.
+
+    Returns:
+        int: number of written threats
+
+    Raises:
+        OSError: if the file could not be written.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".report_shard_")
+    count = 0
+
+    try:
+        with os.fdopen(fd, "w") as f:
+            mapping = {who: get_severity_enum_name(severity_enum)
+                       for who, severity_enum in severity_enum_mapping.items()}
+
+            f.write(json.dumps({ReportShardConstants.header_key: mapping}))
+            f.write("\n")
+
+            for threat in threats:
+                who, description, severity, advice, row, col = threat[:6]
+                record = [who, description, int(severity), advice, row, col]
+
+                if (len(threat) > 7 and threat[7] is not None):
+                    record.append(threat[7])
+
+                f.write(json.dumps(record))
+                f.write("\n")
+
+                count += 1
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.isfile(tmp_path):
+            os.remove(tmp_path)
+
+        raise
+
+    return count
+
+def read_shard_header(path):
+    """It reads the severity enumerations of the modules of a shard.
+
+    Arguments:
+        path (str): path of the file.
+
+    Returns:
+        dict: severity enumeration (type) of each module
+
+    Raises:
+        OSError: if the file could not be read.
+        ValueError: if the file is not a shard or a severity enumeration
+            could not be loaded.
+    """
+    with open(path) as f:
+        header = json.loads(f.readline() or "null")
+
+    if (not isinstance(header, dict) or ReportShardConstants.header_key not in header):
+        raise ValueError(f"'{path}' is not a report shard")
+
+    return {who: get_severity_enum(name) for who, name in header[ReportShardConstants.header_key].items()}
+
+def read_shard(path, severity_enum_mapping=None, raw=False):
+    """It reads the threats of a shard while they are iterated.
+
+    Arguments:
+        path (str): path of the file.
+        severity_enum_mapping (dict): severity enumeration of each module.
+            If *None*, the header of the shard will be used.
+        raw (bool): if *True*, the threats will be returned as they are
+            stored (the severity is an *int* and the severity enumeration
+            is *None*), which is faster if they are going to be written
+            to other shard.
+
+    Returns:
+        generator: threat records with the format of the reports (check
+        *BOAReportAbstract.pretty_print_tuple*)
+
+    Raises:
+        OSError: if the file could not be read.
+        ValueError: if the file is not a shard or a severity enumeration
+            could not be loaded.
+    """
+    if severity_enum_mapping is None:
+        severity_enum_mapping = read_shard_header(path)
+
+    with open(path) as f:
+        # Header
+        f.readline()
+
+        for line in f:
+            who, description, severity, advice, row, col, *signature = json.loads(line)
+            signature = signature[0] if len(signature) != 0 else None
+
+            if raw:
+                yield (who, description, severity, advice, row, col, None, signature)
+
+                continue
+
+            severity_enum = severity_enum_mapping[who]
+
+            yield (who, description, severity_enum(severity), advice, row, col, severity_enum, signature)
+
+def merge_shards(paths, raw=False):
+    """It merges shards with a k-way merge by severity.
+
+    Arguments:
+        paths (list): paths of the shards.
+        raw (bool): check *read_shard*.
+
+    Returns:
+        tuple: severity enumeration of each module (dict) and a generator
+        of the threat records sorted by severity (higher values first)
+
+    Raises:
+        OSError: if some file could not be read.
+        ValueError: if some file is not a shard or a module has different
+            severity enumerations in different shards.
+    """
+    severity_enum_mapping = {}
+
+    for path in paths:
+        for who, severity_enum in read_shard_header(path).items():
+            if severity_enum_mapping.setdefault(who, severity_enum) is not severity_enum:
+                raise ValueError(f"the module '{who}' has different severity enumerations"
+                                 f" in different shards ('{path}')")
+
+    threats = heapq.merge(*[read_shard(path, severity_enum_mapping, raw) for path in paths],
+                          key=lambda threat: threat[2], reverse=True)
+
+    return severity_enum_mapping, threats
+
+def merge_shard_files(paths, path):
+    """It merges shards in a new shard.
+
+    Arguments:
+        paths (list): paths of the shards.
+        path (str): path of the new shard.
+
+    Returns:
+        int: number of threats of the new shard
+
+    Raises:
+        OSError: if some file could not be read or written.
+        ValueError: if some file is not a shard or a module has different
+            severity enumerations in different shards.
+    """
+    severity_enum_mapping, threats = merge_shards(paths, raw=True)
+
+    return write_shard(path, threats, severity_enum_mapping)
@@ -0,0 +1,326 @@
+"""File which contains the cache of the results of whole executions.
+
+A static analysis whose target (including the headers which a C file
+includes), rules file, environment variables and source code (BOA and
+its modules) did not change produces the same report, so the final report is stored
+with a key which is computed from all of them (check *get_key*) and
+replayed in the next executions instead of running the analysis again.
+
+The cached reports use the format of the report shards (check
+*auxiliary_modules.report_shards*), but the threats keep the order which
+they had in the report instead of being sorted by severity, so the
+replayed report is displayed the same way.
+"""
+
+# Std libs
+import os
+import re
+import json
+import hashlib
+import logging
+import subprocess
+
+# Own libs
+from constants import Meta
+from utils import get_current_path, get_environment_varibles
+import auxiliary_modules.report_shards as report_shards
+
+class ResultCacheConstants:
+    """Class which contains the necessary constants
+    for working with the result cache.
+    """
+    # Environment variables which are read by BOA and its modules
+    env_var_prefixes = ("BOA_", "PYCPARSER_")
+    source_extension = ".py"
+    excluded_directories = ("docs", "__pycache__")
+    chunk_size = 1024 * 1024
+    # Files whose preprocessor dependencies (i.e. #include) are part of the key
+    preprocessed_extensions = (".c", ".h")
+    preprocessor = "gcc"
+
+def get_file_hash(path):
+    """It returns the hash of the content of a file.
+
+    Arguments:
+        path (str): path of the file.
+
+    Returns:
+        str: hex digest (SHA-256)
+
+    Raises:
+        OSError: if the file could not be read.
+    """
+    file_hash = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(ResultCacheConstants.chunk_size), b""):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
+
+def get_target_hash(target):
+    """It returns the hash of the target of the analysis. If the target
+    is a directory (e.g. a project), the hash is computed from the
+    relative path and the content of all its files.
+
+    Arguments:
+        target (str): path of the file or directory.
+
+    Returns:
+        str: hex digest (SHA-256)
+
+    Raises:
+        OSError: if some file could not be read.
+    """
+    if not os.path.isdir(target):
+        return get_file_hash(target)
+
+    target_hash = hashlib.sha256()
+
+    for root, dirs, files in os.walk(target):
+        dirs.sort()
+
+        for filename in sorted(files):
+            path = os.path.join(root, filename)
+
+            target_hash.update(json.dumps([os.path.relpath(path, target), get_file_hash(path)]).encode("utf-8"))
+
+    return target_hash.hexdigest()
+
+def get_dependency_files(target):
+    """It returns the files which are included by a C file, using the
+    same preprocessor and args as the pycparser parser module. If the
+    environment variable "PYCPARSER_FAKE_LIBC_INCLUDE_PATH" is not
+    defined, the parser does not use the preprocessor, so the file does
+    not have dependencies.
+
+    Arguments:
+        target (str): path of the file.
+
+    Returns:
+        list: sorted absolute paths (the target is not included)
+
+    Raises:
+        OSError: if the dependencies could not be listed (e.g. the
+            preprocessor is not installed or failed). The key must not
+            be computed in this case, since a change in a header would
+            not be detected.
+    """
+    if (os.path.isdir(target) or not target.endswith(ResultCacheConstants.preprocessed_extensions)):
+        return []
+
+    env_vars = get_environment_varibles(["PYCPARSER_FAKE_LIBC_INCLUDE_PATH", "PYCPARSER_CPP_ARGS",
+                                         "PYCPARSER_CPP_ARGS_SPLIT_CHAR"])
+
+    if "PYCPARSER_FAKE_LIBC_INCLUDE_PATH" not in env_vars:
+        return []
+
+    compiler_args = []
+
+    if "PYCPARSER_CPP_ARGS" in env_vars:
+        split_char = env_vars.get("PYCPARSER_CPP_ARGS_SPLIT_CHAR", ";")
+        split_char = split_char if len(split_char) == 1 else ";"
+        compiler_args = env_vars["PYCPARSER_CPP_ARGS"].split(split_char)
+
+    try:
+        result = subprocess.run([ResultCacheConstants.preprocessor, "-M",
+                                 f"-I{env_vars['PYCPARSER_FAKE_LIBC_INCLUDE_PATH']}"] + compiler_args + [target],
+                                capture_output=True, check=False, text=True)
+    except (OSError, ValueError) as e:
+        raise OSError(f"could not run the preprocessor: {str(e)}") from e
+
+    if result.returncode != 0:
+        raise OSError(f"could not list the dependencies of '{target}': {result.stderr.strip()}")
+
+    # Make rule (e.g. "target.o: target.c header.h"), whose lines might be continued with a backslash
+    rule = result.stdout.replace("\\\n", " ").split(":", 1)[-1]
+    target_path = os.path.abspath(target)
+    dependency_files = set()
+
+    for dependency in re.split(r'(?<!\\)\s+', rule.strip()):
+        if not dependency:
+            continue
+
+        dependency = os.path.abspath(dependency.replace("\\ ", " "))
+
+        if dependency != target_path:
+            dependency_files.add(dependency)
+
+    return sorted(dependency_files)
+
+def get_source_files():
+    """It returns the source files of BOA, which contain all the modules
+    which might be loaded (they must be in *Other.modules_directory*).
+
+    Returns:
+        list: sorted absolute paths
+    """
+    directory = os.path.abspath(f"{get_current_path(__file__)}/..")
+    source_files = set()
+
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if d not in ResultCacheConstants.excluded_directories)
+
+        for filename in files:
+            if filename.endswith(ResultCacheConstants.source_extension):
+                source_files.add(os.path.join(root, filename))
+
+    return sorted(source_files)
+
+def get_env_var_names(env_vars_rules):
+    """It returns the names of the environment variables which
+    might change the results of an execution: the ones of the rules
+    file and the ones which are read by BOA and its modules (check
+    *ResultCacheConstants.env_var_prefixes*).
+
+    Arguments:
+        env_vars_rules (OrderedDict): rules of the environment variables
+            (i.e. "boa_rules.env_vars").
+
+    Returns:
+        list: sorted names
+    """
+    names = set(name for name in os.environ if name.startswith(ResultCacheConstants.env_var_prefixes))
+
+    if env_vars_rules:
+        env_vars = env_vars_rules["env_var"]
+
+        if not isinstance(env_vars, list):
+            env_vars = [env_vars]
+
+        for env_var in env_vars:
+            names.add(env_var["#text"] if isinstance(env_var, dict) else env_var)
+
+    return sorted(names)
+
+def get_key(target, rules_file, env_var_names, source_files, other_files=None):
+    """It returns the key of an execution.
+
+    Arguments:
+        target (str): path of the target of the analysis. The files
+            which it includes are part of the key as well (check
+            *get_dependency_files*).
+        rules_file (str): path of the rules file.
+        env_var_names (list): names of the environment variables whose
+            values are part of the key.
+        source_files (list): paths of the source files.
+        other_files (list): paths of other files which change the
+            results (e.g. the baseline of the threats).
+
+    Returns:
+        str: hex digest (SHA-256)
+
+    Raises:
+        OSError: if some file could not be read.
+    """
+    if other_files is None:
+        other_files = []
+
+    data = {"version": str(Meta.version),
+            "target": get_target_hash(target),
+            "dependencies": [[path, get_file_hash(path)] for path in get_dependency_files(target)],
+            "rules_file": get_file_hash(rules_file),
+            "env_vars": {name: os.environ.get(name) for name in env_var_names},
+            "source_files": [get_file_hash(path) for path in source_files],
+            "other_files": [get_file_hash(path) if os.path.isfile(path) else None for path in other_files]}
+
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+class ResultCache:
+    """ResultCache class.
+
+    It stores the final reports by the key of the execution.
+    """
+
+    def __init__(self, directory):
+        """It initializes the cache.
+
+        Arguments:
+            directory (str): directory of the cache. It will be
+                created if it does not exist.
+
+        Raises:
+            OSError: if the directory could not be created.
+        """
+        self.directory = directory
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get_path(self, key):
+        """It returns the path of a cached report.
+
+        Arguments:
+            key (str): key of the execution.
+
+        Returns:
+            str: path
+        """
+        return os.path.join(self.directory, f"{key}.report")
+
+    def store(self, key, report):
+        """It stores the threats of a report. The file is replaced
+        atomically in order to avoid races between processes.
+
+        Arguments:
+            key (str): key of the execution.
+            report (BOAReportAbstract): final report.
+
+        Returns:
+            bool: *True* if the report was stored; *False* otherwise
+        """
+        summary = report.summary
+        threats = (threat for who in summary for threat in summary[who])
+
+        try:
+            report_shards.write_shard(self.get_path(key), threats, report.severity_enum_mapping)
+        except Exception as e:
+            logging.warning("could not store the report '%s' in the cache: %s", key, str(e))
+
+            return False
+
+        return True
+
+    def replay(self, key, report):
+        """It adds the threats of a cached report to a report.
+
+        Arguments:
+            key (str): key of the execution.
+            report (BOAReportAbstract): empty report.
+
+        Returns:
+            bool: *True* if the report was cached; *False* otherwise
+
+        Raises:
+            ValueError: if the name of a module of the cached report is
+                not valid.
+        """
+        path = self.get_path(key)
+
+        if not os.path.isfile(path):
+            return False
+
+        # The cached report is read before adding any threat, so the report is not modified if it is not valid
+        try:
+            severity_enum_mapping = report_shards.read_shard_header(path)
+            threats = list(report_shards.read_shard(path, severity_enum_mapping))
+        except Exception as e:
+            logging.warning("could not read the cached report '%s': %s", key, str(e))
+
+            return False
+
+        checked_who = set()
+
+        for who, severity_enum in severity_enum_mapping.items():
+            if who not in report.severity_enum_mapping:
+                report.set_severity_enum_mapping(who, severity_enum)
+
+        for threat in threats:
+            if threat[0] not in checked_who:
+                if report.check_who(threat[0], threat[6]) != Meta.ok_code:
+                    raise ValueError(f"not valid module '{threat[0]}'")
+
+                checked_who.add(threat[0])
+
+            report.add_threat(threat, sort_by_severity=False)
+
+        return True
@@ -0,0 +1,243 @@
+"""File which contains the local database where the results of the
+executions are stored in order to query them later (e.g. which threats
+appeared since last week or which files have the most findings of a
+module) without executing the analysis again.
+
+The database is a SQLite file which contains the executions (table
+"runs"), the time that the lifecycle of each module took (table
+"module_timings") and the found threats (table "threats"). The threats
+are identified by their fingerprint (check
+*auxiliary_modules.threat_index*), so the same threat can be tracked
+across executions, and they are indexed by fingerprint, file, module
+and severity. The database can be shared by several executions, since
+each execution is stored in one transaction.
+"""
+
+# Std libs
+import os
+import sqlite3
+import urllib.request
+
+# Own libs
+import auxiliary_modules.threat_index as threat_index
+
+class ResultsStoreConstants:
+    """Class which contains the necessary constants
+    for working with the results store.
+    """
+    timeout = 60.0  # Seconds to wait for other executions which are writing
+    schema = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            started REAL NOT NULL,
+            finished REAL NOT NULL,
+            target TEXT,
+            rules_file TEXT,
+            version TEXT,
+            threats INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS module_timings (
+            run_id INTEGER NOT NULL REFERENCES runs(id),
+            module TEXT NOT NULL,
+            seconds REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS threats (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id INTEGER NOT NULL REFERENCES runs(id),
+            fingerprint TEXT NOT NULL,
+            file TEXT,
+            module TEXT NOT NULL,
+            severity TEXT NOT NULL,
+            severity_value INTEGER NOT NULL,
+            description TEXT,
+            advice TEXT,
+            row INTEGER,
+            col INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS runs_started ON runs(started);
+        CREATE INDEX IF NOT EXISTS module_timings_run_id ON module_timings(run_id);
+        CREATE INDEX IF NOT EXISTS threats_run_id ON threats(run_id);
+        CREATE INDEX IF NOT EXISTS threats_fingerprint ON threats(fingerprint);
+        CREATE INDEX IF NOT EXISTS threats_file ON threats(file);
+        CREATE INDEX IF NOT EXISTS threats_module ON threats(module);
+        CREATE INDEX IF NOT EXISTS threats_severity_value ON threats(severity_value);
+    """
+
+class ResultsStore:
+    """ResultsStore class.
+
+    It stores and queries the results of the executions.
+    """
+
+    def __init__(self, path, read_only=False):
+        """It opens the database and creates the tables and indexes
+        if they do not exist.
+
+        Arguments:
+            path (str): path of the database.
+            read_only (bool): if *True*, the database is opened in
+                read-only mode (e.g. for querying it), so it is not
+                created if it does not exist and the tables are not
+                created.
+
+        Raises:
+            sqlite3.Error: if the database could not be opened.
+        """
+        self.path = path
+
+        if read_only:
+            uri = f"file:{urllib.request.pathname2url(os.path.abspath(path))}?mode=ro"
+
+            self.connection = sqlite3.connect(uri, timeout=ResultsStoreConstants.timeout, uri=True)
+        else:
+            self.connection = sqlite3.connect(path, timeout=ResultsStoreConstants.timeout)
+
+        self.connection.row_factory = sqlite3.Row
+
+        if not read_only:
+            with self.connection:
+                self.connection.executescript(ResultsStoreConstants.schema)
+
+    def close(self):
+        """It closes the database.
+        """
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def store_run(self, started, finished, target, rules_file, version, threats, module_timings=None):
+        """It stores an execution.
+
+        Arguments:
+            started (float): timestamp of the beginning of the execution.
+            finished (float): timestamp of the end of the execution.
+            target (str): path of the analyzed file. It is stored as
+                absolute path.
+            rules_file (str): path of the rules file.
+            version (str): version of BOA.
+            threats (iterable): threat records (check
+                *BOAReportAbstract.pretty_print_tuple*).
+            module_timings (dict): seconds that the lifecycle of
+                each module took.
+
+        Returns:
+            int: id of the execution
+
+        Raises:
+            sqlite3.Error: if the execution could not be stored.
+        """
+        file = None if target is None else os.path.abspath(target)
+        rows = []
+
+        for threat in threats:
+            who, description, severity, advice, row, col, severity_enum = threat[:7]
+
+            rows.append((threat_index.get_fingerprint(threat, target), file, who,
+                         severity_enum(severity).name, int(severity), description, advice,
+                         -1 if row is None else row, -1 if col is None else col))
+
+        # One transaction for each execution
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (started, finished, target, rules_file, version, threats)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (started, finished, file, rules_file, version, len(rows)))
+            run_id = cursor.lastrowid
+
+            self.connection.executemany(
+                "INSERT INTO threats (run_id, fingerprint, file, module, severity, severity_value,"
+                " description, advice, row, col) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, *row) for row in rows])
+
+            if module_timings:
+                self.connection.executemany(
+                    "INSERT INTO module_timings (run_id, module, seconds) VALUES (?, ?, ?)",
+                    [(run_id, module, seconds) for module, seconds in module_timings.items()])
+
+        return run_id
+
+    def get_runs(self, limit=10):
+        """It returns the last executions.
+
+        Arguments:
+            limit (int): maximum number of executions.
+
+        Returns:
+            list: executions (*sqlite3.Row*) sorted by date (newest first)
+        """
+        return self.connection.execute(
+            "SELECT * FROM runs ORDER BY started DESC, id DESC LIMIT ?", (limit,)).fetchall()
+
+    def get_new_threats(self, since, module=None):
+        """It returns the threats which were found for the first time
+        since a date.
+
+        Arguments:
+            since (float): timestamp.
+            module (str): if not *None*, only the threats of the modules
+                whose name contains *module* are returned.
+
+        Returns:
+            list: threats (*sqlite3.Row*, with the column "first_seen")
+            sorted by date (newest first) and severity. The threats are
+            identified by file and fingerprint, since the fingerprint
+            contains the path relative to the directory where the
+            analysis was executed (e.g. the same file analyzed from
+            different directories)
+        """
+        # SQLite returns the columns of the row which contains the minimum
+        query = ("SELECT t.fingerprint, t.file, t.module, t.severity, t.severity_value,"
+                 " t.description, t.advice, t.row, t.col, MIN(r.started) AS first_seen"
+                 " FROM threats t JOIN runs r ON t.run_id = r.id")
+        parameters = []
+
+        if module is not None:
+            query += " WHERE t.module LIKE ?"
+            parameters.append(f"%{module}%")
+
+        query += (" GROUP BY t.file, t.fingerprint HAVING first_seen >= ?"
+                  " ORDER BY first_seen DESC, t.severity_value DESC")
+        parameters.append(since)
+
+        return self.connection.execute(query, parameters).fetchall()
+
+    def get_top_files(self, module=None, limit=10):
+        """It returns the files which have the most threats. Each threat
+        is counted once regardless of the number of executions which
+        found it.
+
+        Arguments:
+            module (str): if not *None*, only the threats of the modules
+                whose name contains *module* are counted.
+            limit (int): maximum number of files.
+
+        Returns:
+            list: files (*sqlite3.Row*, with the columns "file" and
+            "threats") sorted by number of threats
+        """
+        query = "SELECT file, COUNT(DISTINCT fingerprint) AS threats FROM threats"
+        parameters = []
+
+        if module is not None:
+            query += " WHERE module LIKE ?"
+            parameters.append(f"%{module}%")
+
+        query += " GROUP BY file ORDER BY threats DESC, file LIMIT ?"
+        parameters.append(limit)
+
+        return self.connection.execute(query, parameters).fetchall()
+
+    def get_module_timings(self):
+        """It returns the time that the lifecycle of each module took.
+
+        Returns:
+            list: modules (*sqlite3.Row*, with the columns "module", "runs",
+            "average" and "maximum") sorted by average time
+        """
+        return self.connection.execute(
+            "SELECT module, COUNT(*) AS runs, AVG(seconds) AS average, MAX(seconds) AS maximum"
+            " FROM module_timings GROUP BY module ORDER BY average DESC").fetchall()
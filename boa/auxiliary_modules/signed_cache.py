@@ -0,0 +1,158 @@
+"""File which contains the necessary logic in order to store pickled
+objects in a cache directory without trusting the content of the
+directory blindly.
+
+Unpickling executes code, so a pickle which was written by someone else
+must never be loaded. The cache directories are only used if they are
+owned by the current user and are not writable by the group or others
+(check *check_directory*), and every entry is signed with an HMAC whose
+key is stored in the directory with permissions 0600 (check *get_key*).
+The signature covers the name of the entry (e.g. the hash of the content
+and the version), so an entry can not be renamed to replace another one.
+"""
+
+# Std libs
+import os
+import hmac
+import stat
+import pickle
+import hashlib
+
+class SignedCacheConstants:
+    """Class which contains the necessary constants
+    for working with the signed caches.
+    """
+    # Format of the entries: magic (with the version of the format) + HMAC + pickle
+    magic = b"BOA-SIGNED-PICKLE-1\n"
+    digest = hashlib.sha256
+    digest_size = hashlib.sha256().digest_size
+    key_filename = "cache.key"
+    key_size = 32
+
+class SignedCacheError(Exception):
+    """Exception raised when a cache directory or a cache entry can not
+    be trusted.
+    """
+
+def check_directory(directory):
+    """It creates, if it does not exist, and checks a cache directory.
+
+    Arguments:
+        directory (str): cache directory.
+
+    Raises:
+        SignedCacheError: if the directory is writable by the group or
+            others or it is not owned by the current user.
+        OSError: if the directory could not be created.
+    """
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    status = os.stat(directory)
+
+    if status.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise SignedCacheError(f"the cache directory '{directory}' is writable by the group"
+                               " or others")
+    if (hasattr(os, "getuid") and status.st_uid != os.getuid()):
+        raise SignedCacheError(f"the cache directory '{directory}' is not owned by the"
+                               " current user")
+
+def get_key(directory):
+    """It returns the key of the signatures of a cache directory. The key
+    is created the first time that is needed.
+
+    Arguments:
+        directory (str): cache directory (check *check_directory*).
+
+    Returns:
+        bytes: key
+
+    Raises:
+        SignedCacheError: if the key file is not private or is not valid.
+        OSError: if the key could not be read or created.
+    """
+    path = os.path.join(directory, SignedCacheConstants.key_filename)
+
+    if not os.path.isfile(path):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(os.urandom(SignedCacheConstants.key_size))
+
+            # The key of the first process is kept if there are races between processes
+            os.link(tmp_path, path)
+        except FileExistsError:
+            pass
+        finally:
+            os.remove(tmp_path)
+
+    with open(path, "rb") as f:
+        status = os.fstat(f.fileno())
+        key = f.read()
+
+    if status.st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+        raise SignedCacheError(f"the key '{path}' is accessible by the group or others")
+    if (hasattr(os, "getuid") and status.st_uid != os.getuid()):
+        raise SignedCacheError(f"the key '{path}' is not owned by the current user")
+    if len(key) != SignedCacheConstants.key_size:
+        raise SignedCacheError(f"the key '{path}' is not valid")
+
+    return key
+
+def get_signature(key, name, data):
+    """It returns the signature of an entry.
+
+    Arguments:
+        key (bytes): key (check *get_key*).
+        name (str): name of the entry.
+        data (bytes): pickled object.
+
+    Returns:
+        bytes: HMAC
+    """
+    return hmac.new(key, name.encode("utf-8") + b"\0" + data,
+                    SignedCacheConstants.digest).digest()
+
+def dumps(obj, key, name):
+    """It pickles and signs an object.
+
+    Arguments:
+        obj: object.
+        key (bytes): key (check *get_key*).
+        name (str): name of the entry (e.g. the name of the file).
+
+    Returns:
+        bytes: signed entry
+    """
+    data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return SignedCacheConstants.magic + get_signature(key, name, data) + data
+
+def loads(entry, key, name):
+    """It checks the signature of an entry and unpickles the object.
+
+    Arguments:
+        entry (bytes): signed entry (check *dumps*).
+        key (bytes): key (check *get_key*).
+        name (str): name of the entry.
+
+    Returns:
+        object
+
+    Raises:
+        SignedCacheError: if the entry has not the expected format or
+            its signature is not valid (nothing is unpickled).
+    """
+    magic = SignedCacheConstants.magic
+    signature_end = len(magic) + SignedCacheConstants.digest_size
+
+    if (len(entry) < signature_end or not entry.startswith(magic)):
+        raise SignedCacheError(f"the cache entry '{name}' has not the expected format")
+
+    data = entry[signature_end:]
+
+    if not hmac.compare_digest(entry[len(magic):signature_end], get_signature(key, name, data)):
+        raise SignedCacheError(f"the signature of the cache entry '{name}' is not valid")
+
+    return pickle.loads(data)
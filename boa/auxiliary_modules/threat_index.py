@@ -0,0 +1,250 @@
+"""File which contains the index of the threats by fingerprint.
+
+A fingerprint identifies a threat regardless of the execution which
+found it: it is computed from the module which reported the threat, the
+rule (i.e. the description of the threat) and the normalized location
+(relative path of the analyzed file and the function which contains the
+row of the threat, check *get_enclosing_function*). The row and the
+column are not used, so the fingerprint does not change when lines are
+inserted or removed above the threat (the threats of the same rule in the
+same function have the same fingerprint). The threats of the dynamic
+modules have no location and their descriptions contain values which
+change in each execution (e.g. the input or the time that the
+execution took), so they provide a crash signature (check
+*get_crash_signature*) which is used instead of the description.
+
+The index is used by the reports in order to drop the duplicated
+threats and to suppress the threats of a baseline (e.g. known false
+positives or the threats of a previous execution), and it can be
+stored in order to be used as baseline of other executions. The files
+of the index contain one fingerprint for each line (empty lines and
+lines which start with '#' are ignored, so the fingerprints can be
+commented).
+"""
+
+# Std libs
+import os
+import json
+import hashlib
+import tempfile
+
+# Own libs
+from auxiliary_modules.pycparser_prescan import prescan_function_definitions
+
+class ThreatIndexConstants:
+    """Class which contains the necessary constants
+    for working with the threat index.
+    """
+    comment = "#"
+
+def get_crash_signature(status_code, instrumentation_id=None):
+    """It returns the crash signature of an execution of a dynamic
+    module, which is provided as signature of its threat (check
+    *BOAReportAbstract.add*).
+
+    Arguments:
+        status_code (int): status code of the execution.
+        instrumentation_id (int): id of the execution path which was
+            provided by the instrumentation. If *None* (e.g. the
+            execution was not instrumented or the id was faked), the
+            signature will only contain the status code.
+
+    Returns:
+        str: crash signature
+    """
+    signature = f"status code {status_code}"
+
+    if instrumentation_id is not None:
+        signature += f"; instrumentation id {instrumentation_id}"
+
+    return signature
+
+__function_definitions__ = {}   # {path: (mtime_ns, [(name, start row, end row)])}
+
+def get_relative_path(target):
+    """It returns the normalized path of the analyzed file relative to
+    the current directory, so the fingerprints do not depend on the
+    directory where the project is (e.g. a checkout in other machine)
+    if the analysis is executed from the same directory of the project.
+
+    Arguments:
+        target (str): path of the analyzed file.
+
+    Returns:
+        str: relative path with '/' as separator
+    """
+    path = os.path.normpath(target)
+
+    try:
+        path = os.path.relpath(path)
+    except ValueError:
+        # Other drive
+        pass
+
+    return path.replace(os.sep, "/")
+
+def get_enclosing_function(target, row):
+    """It returns the function whose definition contains a row of
+    the analyzed file (check
+    *auxiliary_modules.pycparser_prescan.prescan_function_definitions*).
+    The function definitions of each file are looked for once while
+    the file does not change.
+
+    Arguments:
+        target (str): path of the analyzed file.
+        row (int): row (starts with 1).
+
+    Returns:
+        str: name of the function. If the row is not inside a function
+        definition or the file could not be read, *None* will be returned
+    """
+    try:
+        mtime_ns = os.stat(target).st_mtime_ns
+
+        if (target not in __function_definitions__ or
+                __function_definitions__[target][0] != mtime_ns):
+            with open(target, errors="replace") as f:
+                __function_definitions__[target] = (mtime_ns, prescan_function_definitions(f.read()))
+    except OSError:
+        return None
+
+    for name, start_row, end_row in __function_definitions__[target][1]:
+        if start_row <= row <= end_row:
+            return name
+
+    return None
+
+def get_fingerprint(threat, target=None):
+    """It returns the fingerprint of a threat.
+
+    Arguments:
+        threat (tuple): threat record (check
+            *BOAReportAbstract.pretty_print_tuple*).
+        target (str): path of the analyzed file (check
+            *get_relative_path*).
+
+    Returns:
+        str: fingerprint
+    """
+    who, description, _, _, row = threat[:5]
+    signature = threat[7] if len(threat) > 7 else None
+    rule = str(description) if signature is None else signature
+    location = None
+    function = None
+
+    if target is not None:
+        location = get_relative_path(target)
+
+        if row is not None:
+            function = get_enclosing_function(target, row)
+
+    data = json.dumps([who, rule, location, function])
+
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+class ThreatIndex:
+    """ThreatIndex class.
+
+    It contains a set of fingerprints, so the lookups are O(1).
+    """
+
+    def __init__(self, path=None):
+        """It initializes the index.
+
+        Arguments:
+            path (str): path of a file which contains fingerprints
+                to be loaded. If *None*, the index will be empty.
+
+        Raises:
+            OSError: if the file could not be read.
+        """
+        self.fingerprints = set()
+
+        if path is not None:
+            self.load(path)
+
+    def __contains__(self, fingerprint):
+        return fingerprint in self.fingerprints
+
+    def __len__(self):
+        return len(self.fingerprints)
+
+    def add(self, fingerprint):
+        """It adds a fingerprint to the index.
+
+        Arguments:
+            fingerprint (str): fingerprint.
+
+        Returns:
+            bool: *True* if the fingerprint was not in the index
+        """
+        if fingerprint in self.fingerprints:
+            return False
+
+        self.fingerprints.add(fingerprint)
+
+        return True
+
+    def load(self, path):
+        """It loads the fingerprints of a file.
+
+        Arguments:
+            path (str): path of the file.
+
+        Raises:
+            OSError: if the file could not be read.
+        """
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+
+                if (line == "" or line.startswith(ThreatIndexConstants.comment)):
+                    continue
+
+                self.fingerprints.add(line)
+
+    def store(self, path):
+        """It stores the fingerprints in a file. The file is replaced
+        atomically, so a baseline which is being read by other execution
+        is never found incomplete.
+
+        Arguments:
+            path (str): path of the file.
+
+        Raises:
+            OSError: if the file could not be written.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".threat_index_")
+
+        try:
+            with os.fdopen(fd, "w") as f:
+                for fingerprint in sorted(self.fingerprints):
+                    f.write(f"{fingerprint}\n")
+
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+
+            raise
+
+__threat_indexes__ = {}     # {path: ThreatIndex}
+
+def get_threat_index(path):
+    """It returns the index of a file, which is loaded the first
+    time that it is requested.
+
+    Arguments:
+        path (str): path of the file.
+
+    Returns:
+        ThreatIndex: index
+
+    Raises:
+        OSError: if the file could not be read.
+    """
+    if path not in __threat_indexes__:
+        __threat_indexes__[path] = ThreatIndex(path)
+
+    return __threat_indexes__[path]
@@ -0,0 +1,216 @@
+"""File which contains the threat sinks, which allow to report threats
+from any process (e.g. the workers of a *multiprocessing.Pool*) to the
+main process while the analysis is running.
+
+The threats are sent through a bounded *multiprocessing.Queue*: the
+processes which emit threats block when the queue is full, so the
+memory which is used by the threats which have not been processed yet
+is bounded. In the main process, a thread drains the queue and invokes
+a callback for each threat (e.g. in order to add it to the report).
+
+The sinks are registered by name (check *open_sink*) and have to be
+opened before the worker processes are created. The queue of a sink
+has to be provided to the workers when they are created (e.g. with
+*attach_sink* as initializer of a *multiprocessing.Pool*), since the
+registered sinks are only inherited by the workers when the start
+method is "fork" (the sinks cannot be provided as arguments of the
+tasks either).
+"""
+
+# Std libs
+import logging
+import threading
+import multiprocessing
+
+class ThreatSinkConstants:
+    """Class which contains the necessary constants
+    for working with the threat sinks.
+    """
+    default_buffer_size = 1000
+    end_of_stream = None
+
+class ThreatSink:
+    """ThreatSink class.
+
+    It sends threats from any process to a callback which is
+    invoked in the process which created the sink.
+    """
+
+    def __init__(self, callback, buffer_size=ThreatSinkConstants.default_buffer_size, context=None):
+        """It creates the queue of the sink. The thread which drains the
+        queue is not started until *start* is invoked.
+
+        Arguments:
+            callback (function): function which will be invoked with each
+                threat. It is invoked from the thread of the sink, so
+                *lock* should be acquired if the data which is modified by
+                the callback is accessed from other threads.
+            buffer_size (int): maximum number of threats in the queue.
+            context: multiprocessing context which will be used to create
+                the queue. It has to be the same context which is used to
+                create the workers. If *None*, the default context will be
+                used.
+        """
+        if context is None:
+            context = multiprocessing.get_context()
+
+        self.callback = callback
+        self.queue = context.Queue(buffer_size)
+        self.lock = threading.Lock()
+        self.thread = None
+        self.drained = 0
+
+    def start(self):
+        """It starts the thread which drains the queue. It should be
+        invoked after the worker processes have been created, since
+        creating processes while other threads are running might
+        lead to deadlocks.
+        """
+        if self.thread is not None:
+            return
+
+        self.thread = threading.Thread(target=self.drain, daemon=True)
+
+        self.thread.start()
+
+    def emit(self, threat):
+        """It sends a threat. It can be invoked from any process which
+        inherited the sink. If the queue is full, it blocks until the
+        queue has free space.
+
+        Arguments:
+            threat (tuple): threat.
+        """
+        self.queue.put(threat)
+
+    def drain(self):
+        """It invokes the callback for each threat until the end of
+        the stream is received.
+        """
+        while True:
+            threat = self.queue.get()
+
+            if threat is ThreatSinkConstants.end_of_stream:
+                break
+
+            with self.lock:
+                try:
+                    self.callback(threat)
+                except Exception as e:
+                    logging.error("threat sink: could not process the threat %s: %s", threat, str(e))
+
+                self.drained += 1
+
+    def close(self):
+        """It waits until all the emitted threats have been processed
+        and releases the resources of the sink. It has to be invoked
+        from the process which created the sink once the processes
+        which emit threats have finished.
+        """
+        self.queue.put(ThreatSinkConstants.end_of_stream)
+
+        if self.thread is None:
+            # The sink was not started: the threats are processed now
+            self.drain()
+        else:
+            self.thread.join()
+
+        self.thread = None
+
+        self.queue.close()
+        self.queue.join_thread()
+
+__sinks__ = {}  # {name: ThreatSink}
+__worker_queues__ = {}  # {name: multiprocessing.Queue} queues of the sinks which were attached in a worker
+
+def open_sink(name, callback, buffer_size=ThreatSinkConstants.default_buffer_size, context=None):
+    """It creates and registers a sink.
+
+    Arguments:
+        name (str): name of the sink (e.g. the name of the module).
+        callback (function): check *ThreatSink*.
+        buffer_size (int): check *ThreatSink*.
+        context: check *ThreatSink*.
+
+    Returns:
+        ThreatSink: sink
+
+    Raises:
+        ValueError: if a sink with the same name is already open.
+    """
+    if name in __sinks__:
+        raise ValueError(f"the threat sink '{name}' is already open")
+
+    sink = ThreatSink(callback, buffer_size, context)
+    __sinks__[name] = sink
+
+    return sink
+
+def get_sink(name):
+    """It returns a registered sink.
+
+    Arguments:
+        name (str): name of the sink.
+
+    Returns:
+        ThreatSink: sink. If the sink is not registered, *None* will
+        be returned
+    """
+    return __sinks__.get(name)
+
+def attach_sink(name, queue):
+    """It registers the queue of a sink in a worker process. It is
+    intended to be the initializer of the workers (e.g. the arguments
+    *initializer* and *initargs* of *multiprocessing.Pool*), since the
+    queues can only be provided to other processes when they are created.
+
+    Arguments:
+        name (str): name of the sink.
+        queue (multiprocessing.Queue): queue of the sink (i.e. *ThreatSink.queue*).
+    """
+    __worker_queues__[name] = queue
+
+def emit(name, threat):
+    """It sends a threat to a sink from any process: the sink has to be
+    either open in the current process or attached (check *attach_sink*).
+
+    Arguments:
+        name (str): name of the sink.
+        threat (tuple): threat.
+
+    Returns:
+        bool: *True* if the threat was sent; *False* if the sink was not
+        found
+    """
+    queue = __worker_queues__.get(name)
+
+    if queue is None:
+        sink = __sinks__.get(name)
+
+        if sink is None:
+            return False
+
+        queue = sink.queue
+
+    queue.put(threat)
+
+    return True
+
+def close_sink(name):
+    """It closes and unregisters a sink.
+
+    Arguments:
+        name (str): name of the sink.
+
+    Returns:
+        int: number of threats which were processed by the sink. If the
+        sink is not registered, 0 will be returned
+    """
+    sink = __sinks__.pop(name, None)
+
+    if sink is None:
+        return 0
+
+    sink.close()
+
+    return sink.drained
@@ -0,0 +1,245 @@
+"""File which contains the streams which write the threats to a file
+as soon as they are reported (e.g. in order to inspect the threats of
+a long fuzzing campaign while it is running or to process them with
+other tools).
+
+The supported formats are JSON lines (one JSON object for each threat)
+and SARIF (Static Analysis Results Interchange Format). The streams
+are shared by path (check *get_stream*), so all the reports of an
+execution write to the same file, and they are closed when the
+execution finishes (check *close_streams*).
+"""
+
+# Std libs
+import json
+import atexit
+import logging
+
+# Own libs
+from constants import Meta
+
+class ThreatStreamConstants:
+    """Class which contains the necessary constants
+    for working with the threat streams.
+    """
+    format_jsonl = "jsonl"
+    format_sarif = "sarif"
+    sarif_version = "2.1.0"
+    sarif_schema = "https://json.schemastore.org/sarif-2.1.0.json"
+
+class ThreatStream:
+    """ThreatStream class.
+
+    It writes threats to a file. It has to be inherited in order to
+    define the format.
+    """
+
+    def __init__(self, path):
+        """It opens the file.
+
+        Arguments:
+            path (str): path of the file.
+
+        Raises:
+            OSError: if the file could not be opened.
+        """
+        self.path = path
+        self.file = open(path, "w")
+        self.count = 0
+
+    @staticmethod
+    def get_threat_dict(threat):
+        """It returns a threat as a dict.
+
+        Arguments:
+            threat (tuple): threat record (check
+                *BOAReportAbstract.pretty_print_tuple*).
+
+        Returns:
+            dict: threat
+        """
+        who, description, severity, advice, row, col, severity_enum = threat[:7]
+
+        return {"who": who,
+                "description": description,
+                "severity": severity_enum(severity).name,
+                "severity_value": int(severity),
+                "advice": advice,
+                "row": -1 if row is None else row,
+                "col": -1 if col is None else col}
+
+    def write(self, threat):
+        """It writes a threat.
+
+        Arguments:
+            threat (tuple): threat record (check
+                *BOAReportAbstract.pretty_print_tuple*).
+        """
+        self.count += 1
+
+    def close(self):
+        """It closes the file.
+        """
+        if not self.file.closed:
+            self.file.close()
+
+class JSONLThreatStream(ThreatStream):
+    """JSONLThreatStream class.
+
+    It writes one JSON object for each threat.
+    """
+
+    def write(self, threat):
+        """It writes a threat.
+
+        Arguments:
+            threat (tuple): threat record.
+        """
+        super().write(threat)
+
+        self.file.write(json.dumps(self.get_threat_dict(threat)))
+        self.file.write("\n")
+
+class SARIFThreatStream(ThreatStream):
+    """SARIFThreatStream class.
+
+    It writes a SARIF log with one run whose results are written as
+    soon as they are reported. The log is a valid JSON file once the
+    stream is closed.
+    """
+
+    def __init__(self, path, artifact_uri=None):
+        """It opens the file and writes the beginning of the log.
+
+        Arguments:
+            path (str): path of the file.
+            artifact_uri (str): URI of the analyzed file (e.g. the target).
+                If *None*, the results will not have locations.
+
+        Raises:
+            OSError: if the file could not be opened.
+        """
+        super().__init__(path)
+
+        self.artifact_uri = artifact_uri
+        driver = json.dumps({"name": Meta.name, "version": str(Meta.version),
+                             "informationUri": "https://github.com/cgr71ii/BOA"})
+
+        self.file.write(f"{{\"$schema\": \"{ThreatStreamConstants.sarif_schema}\",\n"
+                        f" \"version\": \"{ThreatStreamConstants.sarif_version}\",\n"
+                        f" \"runs\": [{{\"tool\": {{\"driver\": {driver}}},\n"
+                        "  \"results\": [\n")
+
+    @staticmethod
+    def get_level(severity, severity_enum):
+        """It returns the SARIF level of a severity. The values of the
+        severity enumeration are split in three ranges ("note", "warning"
+        and "error") since the meaning of each enumeration is different.
+
+        Arguments:
+            severity (SeverityBase): severity.
+            severity_enum (type): severity enumeration.
+
+        Returns:
+            str: level
+        """
+        values = sorted(set(int(value) for value in severity_enum))
+        position = values.index(int(severity))
+
+        if len(values) == 1:
+            return "warning"
+
+        position /= len(values) - 1
+
+        if position < 1.0 / 3.0:
+            return "note"
+        if position < 2.0 / 3.0:
+            return "warning"
+
+        return "error"
+
+    def write(self, threat):
+        """It writes a threat as a SARIF result.
+
+        Arguments:
+            threat (tuple): threat record.
+        """
+        threat_dict = self.get_threat_dict(threat)
+        result = {"ruleId": threat_dict["who"],
+                  "level": self.get_level(threat[2], threat[6]),
+                  "message": {"text": threat_dict["description"]},
+                  "properties": {"severity": threat_dict["severity"],
+                                 "advice": threat_dict["advice"]}}
+
+        if self.artifact_uri is not None:
+            physical_location = {"artifactLocation": {"uri": self.artifact_uri}}
+
+            if threat_dict["row"] >= 1:
+                physical_location["region"] = {"startLine": threat_dict["row"]}
+
+                if threat_dict["col"] >= 1:
+                    physical_location["region"]["startColumn"] = threat_dict["col"]
+
+            result["locations"] = [{"physicalLocation": physical_location}]
+
+        if self.count != 0:
+            self.file.write(",\n")
+
+        self.file.write(f"    {json.dumps(result)}")
+
+        super().write(threat)
+
+    def close(self):
+        """It writes the end of the log and closes the file.
+        """
+        if not self.file.closed:
+            self.file.write("\n  ]}]}\n")
+
+        super().close()
+
+__streams__ = {}    # {path: ThreatStream}
+
+def get_stream(export_format, path, artifact_uri=None):
+    """It returns the stream of a file, which is opened the first
+    time that it is requested.
+
+    Arguments:
+        export_format (str): *ThreatStreamConstants.format_jsonl* or
+            *ThreatStreamConstants.format_sarif*.
+        path (str): path of the file.
+        artifact_uri (str): URI of the analyzed file (only SARIF).
+
+    Returns:
+        ThreatStream: stream
+
+    Raises:
+        ValueError: if the format is not supported.
+        OSError: if the file could not be opened.
+    """
+    if path in __streams__:
+        return __streams__[path]
+
+    if export_format == ThreatStreamConstants.format_jsonl:
+        stream = JSONLThreatStream(path)
+    elif export_format == ThreatStreamConstants.format_sarif:
+        stream = SARIFThreatStream(path, artifact_uri)
+    else:
+        raise ValueError(f"format '{export_format}' is not supported")
+
+    __streams__[path] = stream
+
+    return stream
+
+def close_streams():
+    """It closes all the streams.
+    """
+    for path, stream in list(__streams__.items()):
+        try:
+            stream.close()
+        except Exception as e:
+            logging.warning("could not close the threat stream '%s': %s", path, str(e))
+
+        del __streams__[path]
+
+# The streams are closed even if the execution did not finish as expected
+atexit.register(close_streams)
@@ -12,6 +12,7 @@ Main tasks:\n
 """
 
 # Std libs
+import os
 import sys
 import logging
 import traceback
@@ -48,6 +49,24 @@ def manage_args():
 
     return Meta.ok_code
 
+def display_report(report):
+    """It merges the threats of other executions, displays the
+    final report and closes it.
+
+    Arguments:
+        report (BOAReportAbstract): final report.
+
+    Raises:
+        BOAFlowException: if the threats of other executions could
+            not be merged.
+    """
+    # Threats of other executions (e.g. parallel workers)
+    if report.merge_shards() != Meta.ok_code:
+        raise BOAFlowException("could not merge the report shards", Error.error_report_append_failed)
+
+    report.display_all()
+    report.close()
+
 def main():
     """It handles the main BOA's flow at a high level.
 
@@ -81,8 +100,8 @@ def main():
         set_up_logging(filename=ArgsManager.args.log_file, level=ArgsManager.args.logging_level,
                        display_when_file=ArgsManager.args.log_display)
 
-        # Check if lang. file exists
-        if not file_exists(ArgsManager.args.target):
+        # Check if lang. file (or directory, e.g. a project) exists
+        if not (file_exists(ArgsManager.args.target) or os.path.isdir(ArgsManager.args.target)):
             raise BOAFlowException(f"file '{ArgsManager.args.target}' not found",
                                    Error.error_file_not_found)
 
@@ -117,6 +136,17 @@ def main():
         # Handle environment variables
         boa_utilities.handle_env_vars(rules_manager.get_rules("boa_rules.env_vars"))
 
+        # Replay the report of a previous execution if nothing changed
+        first_report = reports[0] if len(reports) != 0 else None
+        result_cache, result_cache_key = boa_utilities.get_result_cache(rules_manager, analysis, first_report)
+
+        if (result_cache is not None and result_cache.replay(result_cache_key, first_report)):
+            logging.info("report replayed from the result cache")
+
+            display_report(first_report)
+
+            return Meta.ok_code
+
         # Get args for BOAModuleAbstract modules
         lifecycle_args = {}
 
@@ -169,7 +199,10 @@ def main():
         report = lifecycle_handler.get_final_report()
 
         if report:
-            report.display_all()
+            if result_cache is not None:
+                result_cache.store(result_cache_key, report)
+
+            display_report(report)
     except BOAFlowException as e:
         # Error in some internal function.
 
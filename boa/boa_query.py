@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+"""BOA query file.
+
+This file queries the results of the executions which were stored
+in a database (check the report arg "results_database" and
+*auxiliary_modules.results_store*).
+
+Main tasks:\n
+* It lists the last executions.\n
+* It lists the threats which appeared since a date.\n
+* It lists the files which have the most threats.\n
+* It lists the time that the lifecycle of each module took.\n
+"""
+
+# Std libs
+import re
+import sys
+import time
+import sqlite3
+import argparse
+import datetime
+
+# Own libs
+from constants import Meta, Error
+import auxiliary_modules.results_store as results_store
+
+def parse_since(value):
+    """It parses a date, which can be relative to the current date
+    (e.g. "7d", "12h" or "30m") or a date in ISO format (e.g.
+    "2021-06-01" or "2021-06-01T12:00:00").
+
+    Arguments:
+        value (str): date.
+
+    Returns:
+        float: timestamp
+
+    Raises:
+        argparse.ArgumentTypeError: if the date is not valid.
+    """
+    relative = re.match(r'^([0-9]+)([dhm])$', value)
+
+    if relative is not None:
+        seconds = {"d": 86400, "h": 3600, "m": 60}[relative.group(2)]
+
+        return time.time() - int(relative.group(1)) * seconds
+
+    try:
+        return datetime.datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not valid date: '{value}'")
+
+def format_timestamp(timestamp):
+    """It formats a timestamp.
+
+    Arguments:
+        timestamp (float): timestamp.
+
+    Returns:
+        str: date in ISO format
+    """
+    return datetime.datetime.fromtimestamp(timestamp).isoformat(sep=" ", timespec="seconds")
+
+def get_args():
+    """It parses the args.
+
+    Returns:
+        argparse.Namespace: args
+    """
+    parser = argparse.ArgumentParser(description=f"Query the results which were stored by {Meta.name}")
+
+    parser.add_argument("database", help="Database of the results (report arg \"results_database\")")
+
+    subparsers = parser.add_subparsers(dest="query", required=True)
+
+    runs = subparsers.add_parser("runs", help="List the last executions")
+    runs.add_argument("--limit", type=int, default=10, help="Maximum number of executions")
+
+    new = subparsers.add_parser("new", help="List the threats which appeared since a date")
+    new.add_argument("--since", type=parse_since, default="7d",
+                     help="Date (e.g. 7d, 12h, 30m or 2021-06-01). Default value is 7d")
+    new.add_argument("--module", help="Only the threats of the modules whose name contains this text")
+
+    top_files = subparsers.add_parser("top-files", help="List the files which have the most threats")
+    top_files.add_argument("--module", help="Only the threats of the modules whose name contains this text")
+    top_files.add_argument("--limit", type=int, default=10, help="Maximum number of files")
+
+    subparsers.add_parser("timings", help="List the time that the lifecycle of each module took")
+
+    return parser.parse_args()
+
+def main():
+    """It handles the query.
+
+    Returns:
+        int: status code
+    """
+    args = get_args()
+
+    try:
+        with results_store.ResultsStore(args.database, read_only=True) as store:
+            if args.query == "runs":
+                for run in store.get_runs(args.limit):
+                    print(f"{run['id']}\t{format_timestamp(run['started'])}\t"
+                          f"{run['finished'] - run['started']:.3f}s\t{run['threats']}\t"
+                          f"{run['target']}\t{run['rules_file']}")
+            elif args.query == "new":
+                for threat in store.get_new_threats(args.since, args.module):
+                    print(f"{format_timestamp(threat['first_seen'])}\t{threat['fingerprint']}\t"
+                          f"{threat['severity']}\t{threat['module']}\t{threat['file']}\t"
+                          f"{threat['row']}:{threat['col']}\t{threat['description']}")
+            elif args.query == "top-files":
+                for file in store.get_top_files(args.module, args.limit):
+                    print(f"{file['threats']}\t{file['file']}")
+            elif args.query == "timings":
+                for module in store.get_module_timings():
+                    print(f"{module['module']}\t{module['runs']}\t"
+                          f"{module['average']:.3f}s\t{module['maximum']:.3f}s")
+    except sqlite3.Error as e:
+        print(f"{Meta.name}: could not query the database '{args.database}': {str(e)}", file=sys.stderr)
+
+        return Error.error_unknown
+
+    return Meta.ok_code
+
+if __name__ == "__main__":
+    sys.exit(main())
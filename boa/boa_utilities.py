@@ -17,6 +17,7 @@ from constants import Meta, Error, Other
 from modules_importer import ModulesImporter
 from lifecycles.boalc_manager import BOALifeCycleManager
 from rules_manager import RulesManager
+import auxiliary_modules.result_cache as result_cache
 
 def load_modules(user_modules, analysis):
     """It handles the modules loading through ModulesImporter class.
@@ -322,7 +323,9 @@ def remove_not_loaded_modules(mod_loader, modules, classes, mods_args,
 
 def manage_rules_file():
     """It handles the rules file (parsing, checking and processing)
-    through RulesManager class.
+    through RulesManager class. If a rules cache directory was
+    provided and the rules file did not change, the rules are
+    loaded from the cache.
 
     Arguments:
         analysis (str): information about which analysis we are running.
@@ -335,7 +338,12 @@ def manage_rules_file():
         RulesManager: RulesManager instance
     """
 
-    rules_manager = RulesManager(ArgsManager.args.rules_file)
+    rules_manager = RulesManager(ArgsManager.args.rules_file, ArgsManager.args.rules_cache)
+
+    if rules_manager.load_cache():
+        logging.debug("rules loaded from the cache")
+
+        return rules_manager
 
     # Open file
     rtn_code = rules_manager.open()
@@ -359,8 +367,53 @@ def manage_rules_file():
         raise BOAFlowException("the rules did not pass the checking",
                                Error.error_rules_bad_checking)
 
+    rules_manager.store_cache()
+
     return rules_manager
 
+def get_result_cache(rules_manager, analysis, report):
+    """It handles the result cache (arg --result-cache) and computes
+    the key of the current execution. It should be invoked once the
+    environment variables of the rules file have been handled.
+
+    Only the static analyses use the result cache, since the results
+    of the dynamic analyses are not deterministic.
+
+    Arguments:
+        rules_manager (RulesManager): RulesManager instance.
+        analysis (str): information about which analysis we are running.
+        report (BOAReportAbstract): report whose args are going to be
+            used (the baseline of the threats is part of the key).
+
+    Returns:
+        tuple: *ResultCache* instance and key of the execution. If the
+        result cache is not enabled or could not be used, *(None, None)*
+        will be returned
+    """
+    if ArgsManager.args.result_cache is None:
+        return None, None
+
+    if analysis != "static":
+        logging.warning("the result cache is only used by the static analyses: skipping")
+        return None, None
+
+    other_files = []
+
+    if (report is not None and isinstance(report.args, dict) and
+            utils.is_key_in_dict(report.args, "threat_baseline")):
+        other_files.append(report.args["threat_baseline"])
+
+    try:
+        cache = result_cache.ResultCache(ArgsManager.args.result_cache)
+        env_var_names = result_cache.get_env_var_names(rules_manager.get_rules("boa_rules").get("env_vars"))
+        key = result_cache.get_key(ArgsManager.args.target, ArgsManager.args.rules_file, env_var_names,
+                                   result_cache.get_source_files(), other_files)
+    except Exception as e:
+        logging.warning("could not use the result cache: %s", str(e))
+        return None, None
+
+    return cache, key
+
 def manage_lifecycles(instances, reports, lifecycle_args, lifecycles, analysis):
     """It handles the lifecycles of the instances.
 
@@ -7,6 +7,7 @@ file.
 """
 
 # Std libs
+import time
 import logging
 
 # Own libs
@@ -124,10 +125,15 @@ class BOALifeCycleManager:
         method should be defined the phases that are going to be
         called.
 
+        The time that each lifecycle took is set in the final
+        report (check *BOAReportAbstract.set_module_timing*).
+
         Returns:
             int: self.rtn_code
         """
         for lifecycle in self.lifecycle_instances:
+            started = time.perf_counter()
+
             try:
                 # This method may change self.rtn_code value
                 lifecycle.execute_lifecycle()
@@ -136,6 +142,10 @@ class BOALifeCycleManager:
             except Exception as e:
                 logging.error("%s: %s", lifecycle.get_name(), str(e))
 
+            if self.final_report is not None:
+                self.final_report.set_module_timing(get_name_from_class_instance(lifecycle.instance),
+                                                    time.perf_counter() - started)
+
         return self.rtn_code
 
     def execute_instance_method(self, instance, method_name, args, force_invocation):
@@ -1,17 +1,45 @@
 """This file contains the class which defines the lifecycle
 to be executed when the parser Pycparser is being used and
 you want to use an AST and process each token separately.
+
+The external declarations which come from headers can be skipped
+(i.e. they and their subtrees are not visited) if the parser module
+provides their origins through the callback "origins" (check
+*BOAPMPycparser.get_origins*). Environment variable:
+
+* BOA_LC_PYCPARSER_AST_SKIP: "none" (all the external declarations are
+  visited), "system" (the external declarations from system headers, e.g.
+  the fake libc headers of pycparser, are skipped) or "headers" (only
+  the external declarations from the main file are visited). The default
+  value is "system".
 """
 
 # Std libs
 import logging
 
+# 3rd libs
+from pycparser.c_ast import FileAST
+
 # Own libs
 from boalc_abstract import BOALifeCycleAbstract
 from auxiliary_modules.pycparser_ast_preorder_visitor import PreorderVisitor
-from utils import is_key_in_dict
+from auxiliary_modules.pycparser_utils import PycparserUtilConstants
+from utils import is_key_in_dict, get_environment_varibles
 from exceptions import BOALCAnalysisException
 
+class BOALCPycparserASTConstants:
+    """Class which contains the necessary constants
+    for the lifecycle.
+    """
+    skip_env_var = "BOA_LC_PYCPARSER_AST_SKIP"
+    default_skip = "system"
+    # Origins which are skipped (check *pycparser_utils.get_ext_origins*)
+    skipped_origins = {
+        "none": (),
+        "system": (PycparserUtilConstants.origin_system,),
+        "headers": (PycparserUtilConstants.origin_system, PycparserUtilConstants.origin_header),
+    }
+
 class BOALCPycparserAST(BOALifeCycleAbstract):
     """BOALCPycparserAST class.
 
@@ -38,7 +66,8 @@ class BOALCPycparserAST(BOALifeCycleAbstract):
             5. *finish()*
 
         If the key "parser", "ast" is not found in *self.args*, the
-        execution will be stopped.
+        execution will be stopped. If the key "parser", "origins" is found,
+        the external declarations will be filtered (check *filter_ast*).
         """
         # Initialize
         self.execute_method(self.instance, "initialize", None, False)
@@ -51,6 +80,9 @@ class BOALCPycparserAST(BOALifeCycleAbstract):
         else:
             ast = self.args["parser"]["ast"]
 
+            if is_key_in_dict(self.args, "parser.origins", split="."):
+                ast = self.filter_ast(ast, self.args["parser"]["origins"])
+
             visitor = PreorderVisitor(self.process_each_ast_node)
 
             visitor.visit(ast)
@@ -66,6 +98,60 @@ class BOALCPycparserAST(BOALifeCycleAbstract):
         # Finish
         self.execute_method(self.instance, "finish", None, True)
 
+    def filter_ast(self, ast, origins):
+        """It removes the external declarations whose origin is skipped
+        (check the environment variable *BOA_LC_PYCPARSER_AST_SKIP*).
+
+        Arguments:
+            ast (pycparser.c_ast.FileAST): AST.
+            origins (list): origins of the external declarations (check
+                *auxiliary_modules.pycparser_utils.get_ext_origins*).
+
+        Returns:
+            pycparser.c_ast.FileAST: AST which only contains the external
+            declarations which are not skipped. If nothing is skipped or
+            the origins are not valid, *ast* will be returned
+        """
+        skipped_origins = self.get_skipped_origins()
+
+        if (len(skipped_origins) == 0 or not isinstance(ast, FileAST) or origins is None):
+            return ast
+        if len(origins) != len(ast.ext):
+            logging.warning("'%s': the origins do not match with the AST (nothing will be skipped)", self.who_i_am)
+
+            return ast
+
+        ext = [node for node, (_, origin) in zip(ast.ext, origins) if origin not in skipped_origins]
+
+        logging.debug("'%s': %d of %d external declarations skipped", self.who_i_am,
+                      len(ast.ext) - len(ext), len(ast.ext))
+
+        return FileAST(ext, ast.coord)
+
+    def get_skipped_origins(self):
+        """It returns the origins of the external declarations which have
+        to be skipped according to the environment variable
+        *BOA_LC_PYCPARSER_AST_SKIP*.
+
+        Returns:
+            tuple: skipped origins
+        """
+        skip = BOALCPycparserASTConstants.default_skip
+        env_vars = get_environment_varibles([BOALCPycparserASTConstants.skip_env_var])
+
+        if BOALCPycparserASTConstants.skip_env_var in env_vars:
+            skip = env_vars[BOALCPycparserASTConstants.skip_env_var].lower()
+
+            if skip not in BOALCPycparserASTConstants.skipped_origins:
+                logging.warning("'%s': environment variable '%s' has not a valid value ('%s'): allowed values"
+                                " are %s (nothing will be skipped)", self.who_i_am,
+                                BOALCPycparserASTConstants.skip_env_var, skip,
+                                str(list(BOALCPycparserASTConstants.skipped_origins.keys())))
+
+                skip = "none"
+
+        return BOALCPycparserASTConstants.skipped_origins[skip]
+
     def process_each_ast_node(self, node):
         """This method will be invoked as a callback while the
         *PreorderVisitor* instance is walking through the AST
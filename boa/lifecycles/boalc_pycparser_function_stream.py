@@ -0,0 +1,131 @@
+"""This file contains the class which defines the lifecycle
+to be executed when the parser Pycparser is being used and
+you want to process the functions one by one.
+
+The external declarations of the AST are streamed to the module in
+order: the nodes of each external declaration are given to *process*
+node by node (as *BOALCPycparserAST* does) and, after each function
+definition, *flush* is invoked in order to let the module release the
+state of the function (per-function *process*/*flush* contract). The
+external declarations are filtered by their origin in the same way
+that *BOALCPycparserAST* does.
+
+Environment variables:
+
+* BOA_LC_PYCPARSER_AST_SKIP: check *BOALCPycparserAST*.
+* BOA_LC_FUNCTION_STREAM_RELEASE: if "true", each function definition
+  is replaced by its declaration in the AST once it has been processed,
+  so its body can be garbage-collected and the peak memory is bounded by
+  the largest function instead of the whole file. The default value is
+  "false" because the AST is shared: only enable it when no other module
+  will need the bodies of the functions after this lifecycle.
+"""
+
+# Std libs
+import logging
+
+# 3rd libs
+from pycparser.c_ast import FileAST, FuncDef
+
+# Own libs
+from modules_importer import ModulesImporter
+from auxiliary_modules.pycparser_ast_preorder_visitor import PreorderVisitor
+from utils import is_key_in_dict, get_environment_varibles, get_current_path
+
+# The lifecycles are not in the path, so the parent class is loaded the same way that BOA loads the lifecycles
+BOALCPycparserAST = ModulesImporter.load_and_get_instance(
+    "boalc_pycparser_ast", f"{get_current_path(__file__)}/boalc_pycparser_ast.py",
+    "BOALCPycparserAST", verbose=False)
+
+class BOALCPycparserFunctionStream(BOALCPycparserAST):
+    """BOALCPycparserFunctionStream class.
+
+    It inherits from *BOALCPycparserAST* and streams the functions
+    of the AST to the module one by one.
+    """
+
+    def execute_lifecycle(self):
+        """It invokes the next methods:
+
+            1. *initialize()*
+            2. For each external declaration of *self.args["parser"]["ast"]*:
+
+                1. *process(node)*: it will be invoked node by node.
+                2. *flush()*: it will be invoked only after the function
+                   definitions.
+
+            3. *clean()*
+            4. *save(self.report)*
+            5. *finish()*
+
+        If the key "parser", "ast" is not found in *self.args*, the
+        execution will be stopped.
+        """
+        # Initialize
+        self.execute_method(self.instance, "initialize", None, False)
+
+        # Process
+        if not is_key_in_dict(self.args, "parser.ast", split="."):
+            logging.warning("'%s' needs to have 'ast' in the provided arguments to work: skipping lifecycle", self.who_i_am)
+
+            self.execute_method(self.instance, "set_stop_execution", True, False)
+        else:
+            self.stream_ast(self.args["parser"]["ast"])
+
+        # If the execution was stopped above, the next methods will not be executed
+
+        # Clean
+        self.execute_method(self.instance, "clean", None, False)
+
+        # Save
+        self.execute_method(self.instance, "save", self.report, False)
+
+        # Finish
+        self.execute_method(self.instance, "finish", None, True)
+
+    def stream_ast(self, ast):
+        """It streams the external declarations of the AST to the module.
+
+        Arguments:
+            ast (pycparser.c_ast.FileAST): AST.
+        """
+        if not isinstance(ast, FileAST):
+            logging.warning("'%s': the AST is not a 'FileAST': skipping lifecycle", self.who_i_am)
+
+            self.execute_method(self.instance, "set_stop_execution", True, False)
+
+            return
+
+        origins = None
+        skipped_origins = self.get_skipped_origins()
+        release = False
+        env_vars = get_environment_varibles(["BOA_LC_FUNCTION_STREAM_RELEASE"])
+        visitor = PreorderVisitor(self.process_each_ast_node)
+
+        if is_key_in_dict(self.args, "parser.origins", split="."):
+            origins = self.args["parser"]["origins"]
+
+            if (origins is not None and len(origins) != len(ast.ext)):
+                logging.warning("'%s': the origins do not match with the AST (nothing will be skipped)", self.who_i_am)
+
+                origins = None
+        if "BOA_LC_FUNCTION_STREAM_RELEASE" in env_vars:
+            release = env_vars["BOA_LC_FUNCTION_STREAM_RELEASE"].lower() == "true"
+
+        for idx in range(len(ast.ext)):
+            if (origins is not None and origins[idx][1] in skipped_origins):
+                continue
+
+            ext = ast.ext[idx]
+
+            # The visitor does not visit the root, but its children
+            visitor.visit(FileAST([ext]))
+
+            if isinstance(ext, FuncDef):
+                self.execute_method(self.instance, "flush", None, False)
+
+                if release:
+                    # The body is not referenced anymore
+                    ast.ext[idx] = ext.decl
+
+            ext = None
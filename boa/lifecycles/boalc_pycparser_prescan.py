@@ -0,0 +1,65 @@
+"""This file contains the class which defines the lifecycle
+to be executed when the parser module Pycparser Prescan is being
+used and you want to process each found function call separately
+without parsing the file (e.g. first-pass triage of huge files).
+"""
+
+# Std libs
+import logging
+
+# Own libs
+from boalc_abstract import BOALifeCycleAbstract
+from utils import is_key_in_dict
+from exceptions import BOALCAnalysisException
+
+class BOALCPycparserPrescan(BOALifeCycleAbstract):
+    """BOALCPycparserPrescan class.
+
+    It implements the necessary logic to process each function
+    call which has been found by the prescan.
+    """
+
+    def raise_exception_if_non_valid_analysis(self):
+        """This analysis is only compatible with static analysis
+        """
+        if self.analysis != "static":
+            raise BOALCAnalysisException(f"lifecycle '{self.who_i_am}' is only"
+                                         " compatible with 'static' analysis, but"
+                                         f" actual was '{self.analysis}'")
+
+    def execute_lifecycle(self):
+        """It invokes the next methods:
+
+            1. *initialize()*
+            2. *process(self.args["parser"]["function_calls"])*: it will be
+               invoked function call by function call.
+            3. *clean()*
+            4. *save(self.report)*
+            5. *finish()*
+
+        If the key "parser", "function_calls" is not found in *self.args*,
+        the execution will be stopped.
+        """
+        # Initialize
+        self.execute_method(self.instance, "initialize", None, False)
+
+        # Process
+        if (not is_key_in_dict(self.args, "parser.function_calls", split=".") or
+                self.args["parser"]["function_calls"] is None):
+            logging.warning("'%s' needs to have 'function_calls' in the provided arguments to work: skipping lifecycle", self.who_i_am)
+
+            self.execute_method(self.instance, "set_stop_execution", True, False)
+        else:
+            for function_call in self.args["parser"]["function_calls"]:
+                self.execute_method(self.instance, "process", function_call, False)
+
+        # If the execution was stopped above, the next methods will not be executed
+
+        # Clean
+        self.execute_method(self.instance, "clean", None, False)
+
+        # Save
+        self.execute_method(self.instance, "save", self.report, False)
+
+        # Finish
+        self.execute_method(self.instance, "finish", None, True)
@@ -92,16 +92,41 @@ class BOAModuleAbstract:
             report: report which will contain the threats records.
         """
         for idx, threat in enumerate(self.threats):
-            severity = report.get_severity_enum_instance_by_who(self.who_i_am)
+            self.save_threat(report, threat, idx)
 
-            if severity is None:
-                logging.error("could not append the threat record #%d in '%s': wrong severity enum instance", idx, self.who_i_am)
-            else:
-                severity = severity[threat[2]]
-                rtn_code = report.add(threat[0], threat[1], severity, threat[3], threat[4], threat[5])
+    def save_threat(self, report, threat, idx=-1):
+        """It saves a security threat in a report. It allows to save
+        the threats while they are found (e.g. from a threat sink; check
+        *auxiliary_modules.threat_sink*) instead of in *save*.
 
-                if rtn_code != Meta.ok_code:
-                    logging.error("could not append the threat record #%d (status code: %d) in '%s'", idx, rtn_code, self.who_i_am)
+        Arguments:
+            report: report which will contain the threat record.
+            threat (tuple): threat record with the format of *self.threats*.
+                An optional 7th element contains the signature of the
+                threat (check *BOAReportAbstract.add*).
+            idx (int): index of the threat, which is only used in the
+                logging messages.
+
+        Returns:
+            bool: *True* if the threat was saved
+        """
+        severity = report.get_severity_enum_instance_by_who(self.who_i_am)
+
+        if severity is None:
+            logging.error("could not append the threat record #%d in '%s': wrong severity enum instance", idx, self.who_i_am)
+
+            return False
+
+        severity = severity[threat[2]]
+        signature = threat[6] if len(threat) > 6 else None
+        rtn_code = report.add(threat[0], threat[1], severity, threat[3], threat[4], threat[5], signature=signature)
+
+        if rtn_code != Meta.ok_code:
+            logging.error("could not append the threat record #%d (status code: %d) in '%s'", idx, rtn_code, self.who_i_am)
+
+            return False
+
+        return True
 
     # This method will be invoked when all the tokens have been processed
     @abstractmethod
@@ -18,6 +18,9 @@ from boam_abstract import BOAModuleAbstract
 from constants import Regex, Other
 import utils
 from exceptions import BOAModuleException
+from auxiliary_modules.input_store import InputStore, InputStoreConstants
+import auxiliary_modules.threat_sink as threat_sink
+from auxiliary_modules.threat_index import get_crash_signature
 
 class BOAModuleBasicFuzzing(BOAModuleAbstract):
     """BOAModuleBasicFuzzing class. It implements the class BOAModuleAbstract.
@@ -42,6 +45,11 @@ class BOAModuleBasicFuzzing(BOAModuleAbstract):
         self.processes = 1 if not utils.is_key_in_dict(self.args, "processes") else min(int(self.args["processes"]), self.iterations)
         self.skip_process = False
         self.add_input_to_report = True
+        self.input_store = None
+        self.input_preview_length = InputStoreConstants.default_preview_length if not utils.is_key_in_dict(self.args, "input_preview_length") else int(self.args["input_preview_length"])
+        self.threat_sink = False
+        self.threat_sink_buffer_size = threat_sink.ThreatSinkConstants.default_buffer_size if not utils.is_key_in_dict(self.args, "threat_sink_buffer_size") else int(self.args["threat_sink_buffer_size"])
+        self.fails_instance = None  # Only set if the workers report the threats through the threat sink
 
         logging.debug("using %d processes", self.processes)
 
@@ -81,6 +89,21 @@ class BOAModuleBasicFuzzing(BOAModuleAbstract):
                 self.add_input_to_report = False
 
                 logging.debug("inputs are not going to be added to the report")
+        if "input_store" in self.args:
+            if self.add_input_to_report:
+                # The threats will contain a reference to the stored input instead of the whole input
+                self.input_store = InputStore(self.args["input_store"])
+
+                logging.debug("inputs are going to be stored in '%s'", self.args["input_store"])
+            else:
+                logging.warning("'input_store' is defined, but the inputs will not be stored since 'add_input_to_report' is 'false'")
+        if "threat_sink" in self.args:
+            threat_sink_value = self.args["threat_sink"].lower().strip()
+
+            if threat_sink_value == "true":
+                self.threat_sink = True
+
+                logging.debug("the workers are going to report the threats through a threat sink")
 
         logging.debug("iterations: %d", self.iterations)
 
@@ -239,8 +262,44 @@ class BOAModuleBasicFuzzing(BOAModuleAbstract):
             # Remove file
             os.remove(instrumentation_tmp_file)
 
+        if (self.fails_instance is not None and self.fails_instance.execution_has_failed(returncode)):
+            # The threat is reported from the worker (check process_worker_results)
+            if not threat_sink.emit(self.who_i_am, self.get_threat(input, returncode, instrumentation_result, time_it_took_secs)):
+                raise BOAModuleException(f"the threat sink '{self.who_i_am}' was not found in the worker")
+
         return return_id, returncode, instrumentation_result, time_it_took_secs
 
+    def get_threat(self, input, return_code, instrumentation, time_it_took_secs):
+        """It returns the threat of an execution which failed.
+
+        Arguments:
+            input (str): input which was provided to the target binary.
+            return_code (int): return code of the execution.
+            instrumentation (list): instrumentation result.
+            time_it_took_secs (float): time of the execution.
+
+        Returns:
+            tuple: threat record. Its signature contains the status code
+            and the instrumentation id unless it was faked, so the same
+            crash has the same fingerprint in every execution
+        """
+        instrumentation_id, instrumentation_id_faked = instrumentation[1]
+
+        if self.input_store is not None:
+            input = self.input_store.get_reference(input, self.input_preview_length)
+        elif self.add_input_to_report:
+            input = input.encode() # Encoded in order to avoid backslashes interpretation
+        else:
+            input = "-"
+
+        return (self.who_i_am,
+                f"the input {input} returned the status code {return_code} (time: {time_it_took_secs:.4f} secs; "
+                f"instrumentation: {' '.join(map(lambda v: str(v), instrumentation))})",
+                "FAILED",
+                "check if the fail is not a false positive",
+                None, None,
+                get_crash_signature(return_code, None if instrumentation_id_faked else instrumentation_id))
+
     def process_worker_results(self, fails_instance, worker_return_list, worker_args):
         """Method which should be invoked by the main thread instead of by every
         individually worker. This method has been implemented apart of the main
@@ -248,7 +307,9 @@ class BOAModuleBasicFuzzing(BOAModuleAbstract):
         have its own memory, and the results which would store in *self.threats*,
         they will be lost when the worker process finishes the execution.
 
-        This method stores the found threats reported by every worker.
+        This method stores the found threats reported by every worker. If the
+        threat sink is being used, the threats are not stored since the
+        workers reported them (check *auxiliary_modules.threat_sink*).
 
         Arguments:
             fails_instance (BOAFailModuleAbstract): fails module instance which
@@ -267,24 +328,15 @@ class BOAModuleBasicFuzzing(BOAModuleAbstract):
             # Has the execution failed?
             fail = fails_instance.execution_has_failed(return_code)
 
-            if fail:
-                if self.add_input_to_report:
-                    input = worker_args[multiprocessing_idx][1].encode() # Encoded in order to avoid backslashes interpretation
-                else:
-                    input = "-"
-
-                self.threats.append((self.who_i_am,
-                                     f"the input {input} returned the status code {return_code} (time: {time_it_took_secs:.4f} secs; "
-                                     f"instrumentation: {' '.join(map(lambda v: str(v), instrumentation))})",
-                                     "FAILED",
-                                     "check if the fail is not a false positive",
-                                     None, None))
+            if (fail and self.fails_instance is None):
+                self.threats.append(self.get_threat(worker_args[multiprocessing_idx][1], return_code,
+                                                    instrumentation, time_it_took_secs))
 
             fails.append((multiprocessing_idx, fail))
 
         return fails
 
-    def process_wrapper(self, runners_args, input_list=None):
+    def process_wrapper(self, runners_args, input_list=None, report=None):
         """Wrapper which contains all the behaviour which should contain
         *self.process*. This wrapper has been done since it might be necessary
         by other modules to run this module as dependency.
@@ -299,6 +351,9 @@ class BOAModuleBasicFuzzing(BOAModuleAbstract):
             is *None*), will be used as inputs for the execution of the target
             binary. If not defined, module from *runners_args* will be used to
             generate inputs.
+            report: report which will contain the threats which are
+                reported through the threat sink. If *None* (default value),
+                the threats will be stored in *self.threats*.
 
         Returns:
             tuple: the tuple contains the arguments which were provided to every
@@ -311,9 +366,23 @@ class BOAModuleBasicFuzzing(BOAModuleAbstract):
         binary_path = runners_args["binary"]
         fails_instance = runners_args["fails"]["instance"]
         workers = self.processes
-        pool = multiprocessing.Pool(processes=self.processes)
+        sink = None
+
+        pool_kwargs = {}
+
+        if self.threat_sink:
+            # The queue of the sink is provided to the workers when they are created, so it works with any start method
+            callback = self.threats.append if report is None else lambda threat: self.save_threat(report, threat)
+            sink = threat_sink.open_sink(self.who_i_am, callback, self.threat_sink_buffer_size)
+            pool_kwargs = {"initializer": threat_sink.attach_sink, "initargs": (self.who_i_am, sink.queue)}
+            self.fails_instance = fails_instance
+
+        pool = multiprocessing.Pool(processes=self.processes, **pool_kwargs)
         worker_args = []
 
+        if sink is not None:
+            sink.start()
+
         if (input_list is not None and len(input_list) != self.iterations):
             if len(input_list) < self.iterations:
                 logging.warning("not enought inputs were provided: %d inputs were provided, so %d inputs"
@@ -361,6 +430,16 @@ class BOAModuleBasicFuzzing(BOAModuleAbstract):
 
         # Close pool
         pool.close()
+
+        if sink is not None:
+            # The workers have to finish normally in order to send all the threats
+            pool.join()
+
+            threats = threat_sink.close_sink(self.who_i_am)
+            self.fails_instance = None
+
+            logging.debug("%d threats were reported through the threat sink", threats)
+
         pool.terminate()
 
         yield
@@ -374,7 +453,14 @@ class BOAModuleBasicFuzzing(BOAModuleAbstract):
         if self.skip_process:
             return
 
-        for _ in self.process_wrapper(runners_args):
+        report = None
+
+        # Check if the args were provided coded (the threats can be saved while they are found)
+        if utils.is_key_in_dict(runners_args, "__args__"):
+            report = runners_args["__report_instance__"] if utils.is_key_in_dict(runners_args, "__report_instance__") else None
+            runners_args = runners_args["__args__"]
+
+        for _ in self.process_wrapper(runners_args, report=report):
             pass
 
     def clean(self):
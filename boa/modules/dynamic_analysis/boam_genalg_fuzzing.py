@@ -17,6 +17,8 @@ import logging
 from boam_abstract import BOAModuleAbstract
 import utils
 from exceptions import BOAModuleException
+from auxiliary_modules.input_store import InputStore, InputStoreConstants
+from auxiliary_modules.threat_index import get_crash_signature
 
 class BOAModuleGenAlgFuzzing(BOAModuleAbstract):
     """BOAModuleGenAlgFuzzing class. It implements the class BOAModuleAbstract.
@@ -39,6 +41,14 @@ class BOAModuleGenAlgFuzzing(BOAModuleAbstract):
         # Dependency instance
         self.genalg_child_instance = self.dependencies["boam_basic_fuzzing.BOAModuleBasicFuzzing"]["instance"]()
 
+        if self.genalg_child_instance.threat_sink:
+            # The threats of the genetic algorithm depend on the state of the main process (e.g. the epoch and
+            #  the executed paths), so they cannot be reported by the workers (check 'save_threats_while_running')
+            self.genalg_child_instance.threat_sink = False
+
+            logging.warning("the threat sink of the dependency is not used by the genetic algorithm: use"
+                            " 'save_threats_while_running' in order to report the threats while running")
+
         # Args
         self.epochs = 1 if not utils.is_key_in_dict(self.args, "epochs") else int(self.args["epochs"])
         self.population = self.genalg_child_instance.iterations
@@ -48,9 +58,12 @@ class BOAModuleGenAlgFuzzing(BOAModuleAbstract):
         self.mutation_regex = "^.$" if not utils.is_key_in_dict(self.args, "mutation_regex") else self.args["mutation_regex"]
         self.mutation_binary_granularity = False
         self.add_input_to_report = True
+        self.input_store = None
+        self.input_preview_length = InputStoreConstants.default_preview_length if not utils.is_key_in_dict(self.args, "input_preview_length") else int(self.args["input_preview_length"])
         self.elements_from_input_module_new_population = 0 if not utils.is_key_in_dict(self.args, "elements_from_input_module_new_population") else int(self.args["elitism"])
         self.report_instance = None # It will set in the process method (maybe)
         self.print_threats_while_running = False
+        self.save_threats_while_running = False
         self.execution_ids = set()
         self.power_schedule = "exploit" if not utils.is_key_in_dict(self.args, "power_schedule") else self.args["power_schedule"]
         self.power_schedule_beta = 1.0 if not utils.is_key_in_dict(self.args, "power_schedule_beta") else float(self.args["power_schedule_beta"])
@@ -71,6 +84,13 @@ class BOAModuleGenAlgFuzzing(BOAModuleAbstract):
                 self.print_threats_while_running = True
 
                 logging.warning("threats will be displayed while running, but this option will 'fake' the reporting numbers since the found threats of this module will not be taked into account")
+        if "save_threats_while_running" in self.args:
+            save_threats_while_running = self.args["save_threats_while_running"].lower().strip()
+
+            if save_threats_while_running == "true":
+                self.save_threats_while_running = True
+
+                logging.debug("threats will be saved in the report when they are found")
         if "add_input_to_report" in self.args:
             add_input_to_report = self.args["add_input_to_report"].lower().strip()
 
@@ -78,6 +98,14 @@ class BOAModuleGenAlgFuzzing(BOAModuleAbstract):
                 self.add_input_to_report = False
 
                 logging.debug("inputs are not going to be added to the report")
+        if "input_store" in self.args:
+            if self.add_input_to_report:
+                # The threats will contain a reference to the stored input instead of the whole input
+                self.input_store = InputStore(self.args["input_store"])
+
+                logging.debug("inputs are going to be stored in '%s'", self.args["input_store"])
+            else:
+                logging.warning("'input_store' is defined, but the inputs will not be stored since 'add_input_to_report' is 'false'")
 
         if self.elitism > self.population:
             logging.warning("elitism value (%d) is higher than population (%d): elitism value is "
@@ -345,6 +373,10 @@ class BOAModuleGenAlgFuzzing(BOAModuleAbstract):
             self.print_threats_while_running = False
 
             logging.warning("the report instance was not provided and you set the printing of the threats while running, but this is not possible because the report instance is mandatory (this problema might be related to the selected lifecycle module)")
+        if (self.report_instance is None and self.save_threats_while_running):
+            self.save_threats_while_running = False
+
+            logging.warning("the report instance was not provided and you set the saving of the threats while running, but this is not possible because the report instance is mandatory (this problema might be related to the selected lifecycle module)")
 
         average_time = 0.0
         total_executions = 0
@@ -483,21 +515,29 @@ class BOAModuleGenAlgFuzzing(BOAModuleAbstract):
                     current_population_input.append(input_value)
                     current_population_reward.append(reward)
 
-                    if self.add_input_to_report:
-                        input_value = input_value.encode()
-                    else:
-                        input_value = "-"
-
                     # Threat? Add only if not had not been observed before
                     if (fail_bool and instrumentation_id_value not in self.execution_ids):
+                        if self.input_store is not None:
+                            input_value = self.input_store.get_reference(input_value, self.input_preview_length)
+                        elif self.add_input_to_report:
+                            input_value = input_value.encode()
+                        else:
+                            input_value = "-"
+
                         instrumentation_info = "" if instrumentation_id_faked else f" (id: {instrumentation_id_value})"
 
-                        self.threats.append((self.who_i_am,
-                                             f"genetic algorithm (epoch {epoch + 1}): the input {input_value} "
-                                             f"returned the status code {return_code}{instrumentation_info}",
-                                             "FAILED",
-                                             "check if the fail is not a false positive",
-                                             None, None))
+                        threat = (self.who_i_am,
+                                  f"genetic algorithm (epoch {epoch + 1}): the input {input_value} "
+                                  f"returned the status code {return_code}{instrumentation_info}",
+                                  "FAILED",
+                                  "check if the fail is not a false positive",
+                                  None, None,
+                                  get_crash_signature(return_code, None if instrumentation_id_faked else instrumentation_id_value))
+
+                        if self.save_threats_while_running:
+                            self.save_threat_while_running(threat)
+                        else:
+                            self.threats.append(threat)
 
                         self.execution_ids.add(instrumentation_id[0])
 
@@ -511,8 +551,8 @@ class BOAModuleGenAlgFuzzing(BOAModuleAbstract):
             # Mutation
             current_population = self.mutation(current_population)
 
-            # Check if we have available the report instance
-            if self.report_instance is not None:
+            # Check if we have available the report instance (the threats are already in the report if they were saved while running)
+            if (self.report_instance is not None and not self.save_threats_while_running):
                 # Save current threats in order to avoid filling up the memory
                 self.save(self.report_instance)
 
@@ -533,6 +573,25 @@ class BOAModuleGenAlgFuzzing(BOAModuleAbstract):
             logging.debug("average time of execution: %.4f", average_time)
             logging.info("epoch %d of %d finished: %.2f%% completed", epoch + 1, self.epochs, ((epoch + 1) / self.epochs) * 100.0)
 
+    def save_threat_while_running(self, threat):
+        """It saves a threat in the report when it is found instead of
+        at the end of the epoch, and displays it if the threats are
+        being displayed while running. Unlike saving the threats at the
+        end of the epoch, the displayed threats are kept in the report,
+        so the counts of the final report are not 'faked'.
+
+        Arguments:
+            threat (tuple): threat record with the format of *self.threats*.
+        """
+        if not self.save_threat(self.report_instance, threat):
+            return
+
+        if self.print_threats_while_running:
+            severity_enum = self.report_instance.get_severity_enum_instance_by_who(self.who_i_am)
+
+            self.report_instance.pretty_print_tuple((threat[0], threat[1], severity_enum[threat[2]], threat[3],
+                                                     threat[4], threat[5], severity_enum))
+
     def clean(self):
         """It does nothing.
         """
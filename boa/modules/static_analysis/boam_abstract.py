@@ -81,6 +81,16 @@ class BOAModuleAbstract:
         """It cleans the class before the next token is processed.
         """
 
+    # This method will be invoked by the lifecycles which process the functions one by one
+    #  (e.g. *boalc_pycparser_function_stream.BOALCPycparserFunctionStream*) after each function
+    def flush(self):
+        """It releases the state which the module only needs while
+        a function is being processed (e.g. the nodes of the function),
+        keeping only compact summaries and the found threats.
+
+        By default, it does nothing.
+        """
+
     # This method will be invoked after all tokens have been processed
     # This method has the responsibility of update the records in the given report
     #@abstractmethod
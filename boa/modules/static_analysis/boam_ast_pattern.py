@@ -0,0 +1,334 @@
+"""BOA module which looks for threats defined as declarative
+patterns over the AST.
+
+A pattern describes a node of the AST and, optionally, some conditions
+over its name, its arguments (for function calls), its parent, its
+ancestors and the function which contains it (e.g. "a *FuncCall* named
+'sprintf' whose 2nd argument is not a *Constant*"). The patterns are
+compiled in the initialization and grouped by the type of the node.
+
+The AST is traversed only once in order to create an index of the nodes
+by type and of the parent of each node
+(check *auxiliary_modules.pycparser_ast_index.ASTIndex*). Then, all the
+patterns are evaluated in one batched pass: only the nodes of the types
+which are used by some pattern are visited, and each node is visited
+once for all the patterns of its type.
+
+It uses the default lifecycle (*BOALCBasic*) because it needs the
+whole AST.
+"""
+
+# Std libs
+import re
+import fnmatch
+import logging
+
+# 3rd libs
+from pycparser import c_ast
+
+# Own libs
+from boam_abstract import BOAModuleAbstract
+from exceptions import BOAModuleException
+from auxiliary_modules.pycparser_ast_index import ASTIndex
+
+class ASTPatternConstants:
+    """Class which contains the necessary constants
+    for working with the AST patterns.
+    """
+    # Elements of the patterns which contain type names (separated by '|')
+    type_elements = ("argument_is", "argument_is_not", "parent_is",
+                     "parent_is_not", "inside", "not_inside")
+    # Elements of the patterns which contain glob patterns
+    glob_elements = ("name", "function")
+    allowed_elements = ("node", "argument", "severity", "description", "advice") + \
+                       type_elements + glob_elements
+
+class ASTPattern:
+    """ASTPattern class.
+
+    It represents a compiled pattern.
+    """
+
+    def __init__(self, pattern):
+        """It compiles a pattern.
+
+        Arguments:
+            pattern (dict): pattern from the rules file. The element
+                "node" is mandatory and the rest of elements of
+                *ASTPatternConstants.allowed_elements* are optional.
+
+        Raises:
+            ValueError: if the pattern is not valid.
+        """
+        for element in pattern:
+            if element not in ASTPatternConstants.allowed_elements:
+                raise ValueError(f"unknown element '{element}'")
+
+        if "node" not in pattern:
+            raise ValueError("element 'node' is mandatory")
+
+        self.node = self.get_type_names(pattern["node"], "node")
+
+        if len(self.node) != 1:
+            raise ValueError("element 'node' has to contain only one type")
+
+        self.node = self.node[0]
+        self.severity = pattern.get("severity")
+        self.description = pattern.get("description")
+        self.advice = pattern.get("advice")
+        self.argument = None
+        self.types = {}     # {element: (type name)}
+        self.globs = {}     # {element: compiled regex}
+
+        if "argument" in pattern:
+            try:
+                self.argument = int(pattern["argument"])
+            except ValueError as e:
+                raise ValueError("element 'argument' has to be an integer") from e
+
+            if self.argument <= 0:
+                raise ValueError("element 'argument' has to be greater than 0 (first argument is 1)")
+            if self.node != "FuncCall":
+                raise ValueError("element 'argument' is only allowed when 'node' is 'FuncCall'")
+        if (("argument_is" in pattern or "argument_is_not" in pattern) and
+                self.argument is None):
+            raise ValueError("elements 'argument_is' and 'argument_is_not' need"
+                             " the element 'argument'")
+
+        for element in ASTPatternConstants.type_elements:
+            if element in pattern:
+                self.types[element] = tuple(self.get_type_names(pattern[element], element))
+
+        for element in ASTPatternConstants.glob_elements:
+            if element in pattern:
+                self.globs[element] = re.compile(fnmatch.translate(pattern[element]))
+
+        self.needs_ancestors = ("inside" in self.types or "not_inside" in self.types or
+                                "function" in self.globs)
+
+    @staticmethod
+    def get_type_names(value, element):
+        """It returns the type names of an element.
+
+        Arguments:
+            value (str): value of the element. Several types can be
+                provided separated by '|' (e.g. "For|While|DoWhile").
+            element (str): name of the element.
+
+        Returns:
+            list: list of *str* which contains the names of the types
+
+        Raises:
+            ValueError: if some type is not a node of *pycparser.c_ast*.
+        """
+        type_names = [type_name.strip() for type_name in value.split("|")]
+
+        for type_name in type_names:
+            node_class = getattr(c_ast, type_name, None)
+
+            if (not isinstance(node_class, type) or not issubclass(node_class, c_ast.Node)):
+                raise ValueError(f"element '{element}': '{type_name}' is not a valid type")
+
+        return type_names
+
+    def match(self, node, index, ancestors):
+        """It checks if a node matches the pattern.
+
+        Arguments:
+            node (pycparser.c_ast.Node): node of the type of the pattern.
+            index (auxiliary_modules.pycparser_ast_index.ASTIndex): index
+                of the AST.
+            ancestors (list): list of the ancestors of *node* from the parent
+                to the root. It is only used if *needs_ancestors* is *True*
+                (otherwise, *None* can be provided).
+
+        Returns:
+            bool: *True* if *node* matches the pattern
+        """
+        if ("name" in self.globs and
+                not self.match_glob("name", get_node_name(node))):
+            return False
+
+        if self.argument is not None:
+            if (node.args is None or len(node.args.exprs) < self.argument):
+                return False
+
+            argument_type = type(node.args.exprs[self.argument - 1]).__name__
+
+            if not self.match_type("argument_is", "argument_is_not", argument_type):
+                return False
+
+        if ("parent_is" in self.types or "parent_is_not" in self.types):
+            parent_type = type(index.get_parent(node)).__name__
+
+            if not self.match_type("parent_is", "parent_is_not", parent_type):
+                return False
+
+        if self.needs_ancestors:
+            ancestors_types = set(type(ancestor).__name__ for ancestor in ancestors)
+
+            if ("inside" in self.types and
+                    ancestors_types.isdisjoint(self.types["inside"])):
+                return False
+            if ("not_inside" in self.types and
+                    not ancestors_types.isdisjoint(self.types["not_inside"])):
+                return False
+
+            if "function" in self.globs:
+                function_name = None
+
+                for ancestor in ancestors:
+                    if isinstance(ancestor, c_ast.FuncDef):
+                        function_name = ancestor.decl.name
+                        break
+
+                if not self.match_glob("function", function_name):
+                    return False
+
+        return True
+
+    def match_glob(self, element, value):
+        """It checks if a value matches the glob pattern of an element.
+
+        Arguments:
+            element (str): name of the element.
+            value (str): value. If *None*, it will not match.
+
+        Returns:
+            bool: *True* if *value* matches
+        """
+        if value is None:
+            return False
+
+        return self.globs[element].match(value) is not None
+
+    def match_type(self, element_is, element_is_not, type_name):
+        """It checks if a type name matches the positive and negative
+        elements of the pattern.
+
+        Arguments:
+            element_is (str): name of the positive element.
+            element_is_not (str): name of the negative element.
+            type_name (str): type name.
+
+        Returns:
+            bool: *True* if *type_name* matches
+        """
+        if (element_is in self.types and type_name not in self.types[element_is]):
+            return False
+        if (element_is_not in self.types and type_name in self.types[element_is_not]):
+            return False
+
+        return True
+
+def get_node_name(node):
+    """It returns the name of a node.
+
+    Arguments:
+        node (pycparser.c_ast.Node): node of the AST.
+
+    Returns:
+        str: name of the function which is invoked for *FuncCall*,
+        name of the function for *FuncDef* and the attribute *name*
+        for the rest of nodes. If the node has no name, *None* will
+        be returned
+    """
+    if isinstance(node, c_ast.FuncCall):
+        if isinstance(node.name, c_ast.ID):
+            return node.name.name
+
+        return None
+    if isinstance(node, c_ast.FuncDef):
+        return node.decl.name
+
+    name = getattr(node, "name", None)
+
+    if isinstance(name, str):
+        return name
+
+    return None
+
+class BOAModuleASTPattern(BOAModuleAbstract):
+    """BOAModuleASTPattern class. It implements the class BOAModuleAbstract.
+    """
+
+    def initialize(self):
+        """It compiles the patterns which are defined in the rules file
+        and groups them by the type of the node.
+
+        Raises:
+            BOAModuleException: if some pattern is not valid.
+        """
+        self.patterns = {}  # {type name: [ASTPattern]}
+
+        if "patterns" not in self.args:
+            raise BOAModuleException("mandatory argument 'patterns' not found", self)
+
+        for idx, pattern in enumerate(self.args["patterns"]):
+            try:
+                compiled_pattern = ASTPattern(pattern)
+            except ValueError as e:
+                raise BOAModuleException(f"pattern #{idx + 1} is not valid: {str(e)}", self) from e
+
+            if (compiled_pattern.severity is None or compiled_pattern.description is None):
+                raise BOAModuleException(f"pattern #{idx + 1} is not valid: elements 'severity'"
+                                         " and 'description' are mandatory", self)
+
+            if compiled_pattern.node not in self.patterns:
+                self.patterns[compiled_pattern.node] = []
+
+            self.patterns[compiled_pattern.node].append(compiled_pattern)
+
+    def process(self, args):
+        """It indexes the AST and evaluates all the patterns.
+
+        Arguments:
+            args (dict): lifecycle arguments. The AST is expected to be
+                in *args["parser"]["ast"]*.
+        """
+        ast = args["parser"]["ast"]
+
+        if ast is None:
+            logging.warning("'%s': AST is None: skipping", self.who_i_am)
+            return
+
+        index = ASTIndex(ast)
+
+        for node_type, patterns in self.patterns.items():
+            for node in index.get_nodes(node_type):
+                ancestors = None
+
+                for pattern in patterns:
+                    if (pattern.needs_ancestors and ancestors is None):
+                        ancestors = list(index.get_ancestors(node))
+
+                    if pattern.match(node, index, ancestors):
+                        self.append_threat(pattern, node)
+
+    def append_threat(self, pattern, node):
+        """It appends a threat for a node which matched a pattern.
+
+        Arguments:
+            pattern (ASTPattern): pattern.
+            node (pycparser.c_ast.Node): node.
+        """
+        row, col = -1, -1
+
+        if node.coord is not None:
+            row = node.coord.line
+            col = node.coord.column
+
+        self.threats.append((self.who_i_am,
+                             pattern.description,
+                             pattern.severity,
+                             pattern.advice,
+                             row,
+                             col))
+
+    def clean(self):
+        """It does nothing.
+        """
+
+    def finish(self):
+        """It does nothing.
+        """
@@ -2,7 +2,9 @@
 """
 
 # Std libs
+import os
 import sys
+import multiprocessing
 from copy import deepcopy
 import random
 import logging
@@ -15,6 +17,8 @@ from boam_abstract import BOAModuleAbstract
 from utils import is_key_in_dict, get_just_type
 from auxiliary_modules.pycparser_ast_preorder_visitor import PreorderVisitor
 import auxiliary_modules.pycparser_cfg as cfg
+from auxiliary_modules.pycparser_cfg_export import CFGExporter, CFGExportConstants,\
+                                                   get_format_by_extension
 import auxiliary_modules.pycparser_utils as pycutil
 from exceptions import BOAModuleException
 
@@ -79,8 +83,17 @@ class BOAModuleControlFlowGraph(BOAModuleAbstract):
         self.lines_clip = True
         self.random_x_offset = False
         self.random_y_offset = False
+        # Export
+        self.export_cfg = None
+        self.export_format = None
+        self.export_clusters = True
         # Other
         self.propagate_func_call = True
+        self.lazy = False
+        self.processes = 1
+        self.program_directory = None
+        self.functions = []     # Functions to be processed in parallel: [(name, FuncDef)]
+        self.graph = None
 
         # Check and set the rules from the rules file
         self.check_and_set_args()
@@ -128,6 +141,55 @@ class BOAModuleControlFlowGraph(BOAModuleAbstract):
                 raise BOAModuleException("the argument 'random_y_offset' only allows"
                                          " the values 'true' or 'false'")
 
+        if is_key_in_dict(self.args, "export_cfg"):
+            self.export_cfg = self.args["export_cfg"]
+            self.export_format = get_format_by_extension(self.export_cfg)
+
+        if is_key_in_dict(self.args, "export_format"):
+            self.export_format = self.args["export_format"].lower()
+
+            if self.export_format not in CFGExportConstants.formats:
+                raise BOAModuleException("the argument 'export_format' only allows the"
+                                         f" values {', '.join(CFGExportConstants.formats)}",
+                                         self)
+
+        if is_key_in_dict(self.args, "export_clusters"):
+            if self.args["export_clusters"].lower() == "false":
+                self.export_clusters = False
+            elif self.args["export_clusters"].lower() != "true":
+                raise BOAModuleException("the argument 'export_clusters' only allows"
+                                         " the values 'true' or 'false'")
+
+        if is_key_in_dict(self.args, "lazy"):
+            if self.args["lazy"].lower() == "true":
+                self.lazy = True
+            elif self.args["lazy"].lower() != "false":
+                raise BOAModuleException("the argument 'lazy' only allows"
+                                         " the values 'true' or 'false'")
+
+        if is_key_in_dict(self.args, "processes"):
+            try:
+                self.processes = int(self.args["processes"])
+            except ValueError as e:
+                raise BOAModuleException("the argument 'processes' has to"
+                                         " have a numeric value (check your rules"
+                                         " file)", self) from e
+
+            if self.processes == 0:
+                self.processes = os.cpu_count() or 1
+            elif self.processes < 0:
+                raise BOAModuleException("the argument 'processes' has to be"
+                                         " greater or equal than 0", self)
+
+        if is_key_in_dict(self.args, "program_directory"):
+            self.program_directory = self.args["program_directory"]
+
+        if (self.lazy and (self.processes != 1 or self.program_directory is not None)):
+            logging.warning("'%s': the argument 'lazy' is ignored when 'processes'"
+                            " is not 1 or 'program_directory' is defined", self.who_i_am)
+
+            self.lazy = False
+
         if is_key_in_dict(self.args, "propagate_func_call"):
             if self.args["propagate_func_call"].lower() == "false":
                 self.propagate_func_call = False
@@ -149,7 +211,14 @@ class BOAModuleControlFlowGraph(BOAModuleAbstract):
             # Store the declaration identified by name
             #self.functions[function_name] = function
 
-            self.process_cfg.process(function_name, function)
+            if (self.processes != 1 or self.program_directory is not None):
+                # The CFG of the functions will be computed in parallel
+                self.functions.append((function_name, function))
+            elif self.lazy:
+                # The CFG of the function will be computed on demand
+                self.process_cfg.defer(function_name, function)
+            else:
+                self.process_cfg.process(function_name, function)
 
     def clean(self):
         """It does nothing.
@@ -184,6 +253,7 @@ class BOAModuleControlFlowGraph(BOAModuleAbstract):
         function_x = CFGConstants.x_initial    # x coordinate of the current function
 
         _, ax = plt.subplots()
+        positions = graph.get_instruction_positions()
 
         for function in graph.get_function_calls():
             index = 0
@@ -269,22 +339,18 @@ class BOAModuleControlFlowGraph(BOAModuleAbstract):
                 txt.append(f"{function}.{instr_type}")
 
                 for dependency in instruction.get_succs():
-                    for inner_function in graph.get_function_calls():
-                        try:
-                            # Append the necessary information that will be necessary after
-                            #  all the process is done in order to calculate the dependencies
-                            #  and plot the lines. It is not done the calculus now because
-                            #  there are instructions that are dependencies that have not been
-                            #  reached yet. Once all those instructions are reached, which means
-                            #  have finished the process, it will be possible to process the
-                            #  dependencies and have the coordinates to plot the lines
-                            dependency_index = graph.get_cfg(inner_function).index(dependency)
-                            x_line_aux.append([inner_function, dependency_index])
-                            x_line.append(x_line_aux)
-                            y_line.append(y_line_aux)
-                        except Exception as _:
-                            # Avoid the throwness of exceptions
-                            pass
+                    if id(dependency) in positions:
+                        # Append the necessary information that will be necessary after
+                        #  all the process is done in order to calculate the dependencies
+                        #  and plot the lines. It is not done the calculus now because
+                        #  there are instructions that are dependencies that have not been
+                        #  reached yet. Once all those instructions are reached, which means
+                        #  have finished the process, it will be possible to process the
+                        #  dependencies and have the coordinates to plot the lines
+                        inner_function, dependency_index = positions[id(dependency)]
+                        x_line_aux.append([inner_function, dependency_index])
+                        x_line.append(x_line_aux)
+                        y_line.append(y_line_aux)
 
                 function_y += CFGConstants.y_increment
                 index += 1
@@ -294,6 +360,13 @@ class BOAModuleControlFlowGraph(BOAModuleAbstract):
 
         index = 0
 
+        # First instruction of each function
+        functions_offset = {}
+
+        for function_index, function in enumerate(functions):
+            if function not in functions_offset:
+                functions_offset[function] = function_index
+
         # Now that all the instructions have been processed, we have all
         #  the necessary information for process the dependencies/lines
         while index < len(x_line):
@@ -304,7 +377,7 @@ class BOAModuleControlFlowGraph(BOAModuleAbstract):
             for target in x_line[index][1:]:
                 target_function = target[0]
                 target_function_index = target[1]
-                x_index = functions.index(target_function) + target_function_index
+                x_index = functions_offset[target_function] + target_function_index
 
                 target_dest.append([x[x_index], y[x_index]])
 
@@ -353,6 +426,8 @@ class BOAModuleControlFlowGraph(BOAModuleAbstract):
                 This option can lead to false positives when
                 using recursion.
         """
+        positions = graph.get_instruction_positions()
+
         for function in graph.get_function_calls():
             print()
             print(f"---{'-' * len(function)}---")
@@ -381,52 +456,60 @@ class BOAModuleControlFlowGraph(BOAModuleAbstract):
                 for dependency in instruction.get_succs():
                     if not show_only_return_and_end_rel:
                         print(f"** {get_just_type(None, dependency.get_type())} **")
-                    for inner_function in graph.get_function_calls():
-                        try:
-                            if not show_only_return_and_end_rel:
-                                print(f"{graph.get_cfg(inner_function).index(dependency)}"
-                                      f" in '{inner_function}'.")
-                                print()
-                            elif (inner_function != function or
-                                  is_return or
-                                  index + 1 == len(instructions)):
-                                graph.get_cfg(inner_function).index(dependency)
-                                print(f"** {get_just_type(None, dependency.get_type())} **")
-                                print(f"** {graph.get_cfg(inner_function).index(dependency)}"
-                                      f" in '{inner_function}' **")
-                                print()
-                        except Exception as _:
-                            # Avoid the throwness of exceptions
-                            pass
+                    if id(dependency) not in positions:
+                        continue
+
+                    inner_function, dependency_index = positions[id(dependency)]
+
+                    if not show_only_return_and_end_rel:
+                        print(f"{dependency_index} in '{inner_function}'.")
+                        print()
+                    elif (inner_function != function or
+                          is_return or
+                          index + 1 == len(instructions)):
+                        print(f"** {get_just_type(None, dependency.get_type())} **")
+                        print(f"** {dependency_index} in '{inner_function}' **")
+                        print()
                 index += 1
 
     def finish(self):
-        """It resolves the succs of the instructions.
+        """It resolves the succs of the instructions. If the argument
+        *lazy* is *True*, the instructions and the succs will be computed
+        and resolved on demand (check *get_basic_cfg*). If the argument *processes* is not 1, the CFG
+        of each function is computed in a pool of processes and then the
+        functions are linked (check *ProcessCFG.compute_cfg_in_parallel*).
+        If the argument *program_directory* is defined, the functions are
+        linked with the functions of the other files of the program which
+        were stored in that directory (check
+        *ProcessCFG.compute_program_cfg*).
         """
-        function_invoked_by = self.process_cfg.get_function_invoked_by()
-
-        # Resolve special nodes
-
-        # Special node: end of function
-        self.process_cfg.append_end_of_function_nodes()
-
-        # Special node: functions not invoked
-        #self.process_cfg.resolve_functions_not_invoked()
-
-        # Special node: end of graph (e.g. last instruction in main,
-        #  exit(), ...)
-        self.process_cfg.resolve_end_of_graph_nodes()
-
-        # Resolve dependencies (successive instructions)
-        for function_name, invoked in function_invoked_by.items():
-            self.process_cfg.resolve_succs(function_name, invoked)
+        if self.program_directory is not None:
+            self.process_cfg.compute_program_cfg(self.functions, self.processes,
+                                                 cfg.CFGUnitStore(self.program_directory))
+
+            self.functions = []
+            graph = self.process_cfg.basic_cfg
+        elif self.processes != 1:
+            self.process_cfg.compute_cfg_in_parallel(self.functions, self.processes)
+
+            self.functions = []
+            graph = self.process_cfg.basic_cfg
+        elif self.lazy:
+            graph = self.process_cfg.get_lazy_cfg()
+        else:
+            self.process_cfg.resolve_all()
 
-        # Resolve those dependencies which could not be resolved before
-        #  for some reason
-        #self.process_cfg.resolve_broken_succs()
+            graph = self.process_cfg.basic_cfg
 
-        graph = self.process_cfg.basic_cfg
+        self.graph = graph
 
+        if self.export_cfg is not None:
+            try:
+                CFGExporter(graph, self.export_format, self.export_clusters)\
+                    .export(self.export_cfg)
+            except OSError as e:
+                raise BOAModuleException(f"could not export the CFG to '{self.export_cfg}'",
+                                         self) from e
         if self.display_cfg:
             self.display_graph(graph, False)
         if (self.is_matplotlib_loaded and self.plot_cfg):
@@ -446,10 +529,23 @@ class BOAModuleControlFlowGraph(BOAModuleAbstract):
         are not being used in this basic CFG. The way
         it has been built is instruction by instruction.
 
+        If the argument *lazy* is *True*, the returned CFG will be a
+        *pycparser_cfg.LazyCFG*, which computes and resolves the CFG of a
+        function (and the functions which are connected to it in the call
+        graph) the first time that it is requested and memoizes the result.
+        Only the function calls of the functions are computed beforehand.
+
         Returns:
             dict: basic CFG
         """
-        return self.process_cfg.get_basic_cfg()
+        if self.graph is None:
+            # The module has not finished yet
+            if self.lazy:
+                return self.process_cfg.get_lazy_cfg()
+
+            return self.process_cfg.get_basic_cfg()
+
+        return self.graph
 
 class ProcessCFG():
     """Class which builds the CFG.
@@ -467,6 +563,16 @@ class ProcessCFG():
         self.basic_cfg = cfg.CFG()
         self.funcion_calls = {}
         self.propagate_func_call = propagate_func_call
+        self.resolved_functions = set()
+        # Only used when the CFG of a function is computed alone (check
+        #  *compute_function_cfg_fragment*)
+        self.defined_functions = None
+        self.is_invoked = False
+        self.weak_links = False
+        self.pending_calls = {}
+        # {function_name: list of pycparser.c_ast.FuncDef}: functions whose
+        #  instructions will be computed on demand (check *defer*)
+        self.deferred_functions = {}
 
     def process(self, function_name, function):
         """It process a concrete function for the CFG.
@@ -478,12 +584,46 @@ class ProcessCFG():
         """
         self.compute_function_cfg(function_name, function)
 
-    def compute_function_cfg(self, function_name, function):
+    def defer(self, function_name, function):
+        """It process a concrete function for the CFG, but only its function
+        calls are appended. The instructions are appended the first time that
+        the function is resolved (check *resolve_function*).
+
+        Arguments:
+            function_name (str): function name.
+            function (pycparser.c_ast.FuncDef): code of the function.
+        """
+        self.compute_function_cfg(function_name, function, append_instructions=False)
+
+        if function_name not in self.deferred_functions:
+            self.deferred_functions[function_name] = []
+
+            # The functions keep the same order that they would have if
+            #  they were not deferred
+            self.basic_cfg.reserve_function(function_name)
+
+        self.deferred_functions[function_name].append(function)
+
+    def compute_deferred_function(self, function_name):
+        """It appends the instructions of a deferred function (check *defer*).
+
+        Arguments:
+            function_name (str): function name.
+        """
+        for function in self.deferred_functions.pop(function_name, []):
+            self.compute_function_cfg(function_name, function, append_function_calls=False)
+
+    def compute_function_cfg(self, function_name, function, append_instructions=True,
+                             append_function_calls=True):
         """It computes the CFG for a function.
 
         Arguments:
             function_name (str): function name.
             function (pycparser.c_ast.FuncDef): code of the function.
+            append_instructions (bool): if *False*, the instructions will
+                not be appended.
+            append_function_calls (bool): if *False*, the function calls will
+                not be appended.
         """
         visitor = PreorderVisitor(self.compute_function_cfg_callback)
 
@@ -495,21 +635,24 @@ class ProcessCFG():
             return
         except Exception as _:
             self.compute_function_cfg_function = function_name
+            self.compute_function_cfg_append = (append_instructions, append_function_calls)
 
         # Append first instruction (it should be FuncDef)
-        self.basic_cfg.append_instruction(function_name, function)
+        if append_instructions:
+            self.basic_cfg.append_instruction(function_name, function)
 
         # Append the rest of instructions
         visitor.visit(function)
 
         # Even if there was any function call, the node has to be in the graph
-        if not function_name in self.funcion_calls.keys():
+        if (append_function_calls and not function_name in self.funcion_calls.keys()):
             # There was any function call and we create the node
             self.funcion_calls[function_name] = []
             self.basic_cfg.append_function_call(function_name, None)
 
         # Remove self.compute_function_cfg_function
         del self.compute_function_cfg_function
+        del self.compute_function_cfg_append
 
     def compute_function_cfg_callback(self, node):
         """Callback which will be invoked from the PreorderVisitor.
@@ -524,8 +667,9 @@ class ProcessCFG():
             logging.error("variable 'self.compute_function_cfg_function' should exist")
 
         current_function_name = self.compute_function_cfg_function
+        append_instructions, append_function_calls = self.compute_function_cfg_append
 
-        if isinstance(node, ast.FuncCall):
+        if (append_function_calls and isinstance(node, ast.FuncCall)):
             # Create a list if no element was inserted before
             if not is_key_in_dict(self.funcion_calls, current_function_name):
                 self.funcion_calls[current_function_name] = []
@@ -543,7 +687,8 @@ class ProcessCFG():
                                                 name)
 
         # Append instruction
-        self.basic_cfg.append_instruction(current_function_name, node)
+        if append_instructions:
+            self.basic_cfg.append_instruction(current_function_name, node)
 
     def resolve_succs_return_calls(self, from_function_name, to_function_name,
                                    first_from_function_name, instruction,
@@ -746,15 +891,24 @@ class ProcessCFG():
         functions = self.get_function_calls()
 
         for function_name in functions.keys():
-            function_cfg = self.basic_cfg.get_cfg(function_name)
-            function = list(map(lambda x: x.get_instruction(), function_cfg))
-            end_of_func = cfg.EndOfFunc()
+            self.append_end_of_function_node(function_name)
 
-            if not pycutil.append_element_to_function(end_of_func, func_def=function[0]):
-                logging.warning("could not insert 'EndOfFunc' node in '%s'", function_name)
-                continue
+    def append_end_of_function_node(self, function_name):
+        """It appends the special node *EndOfFunc* to a function
+        (check *append_end_of_function_nodes*).
+
+        Arguments:
+            function_name (str): function.
+        """
+        function_cfg = self.basic_cfg.get_cfg(function_name)
+        function = list(map(lambda x: x.get_instruction(), function_cfg))
+        end_of_func = cfg.EndOfFunc()
+
+        if not pycutil.append_element_to_function(end_of_func, func_def=function[0]):
+            logging.warning("could not insert 'EndOfFunc' node in '%s'", function_name)
+            return
 
-            self.basic_cfg.append_instruction(function_name, end_of_func)
+        self.basic_cfg.append_instruction(function_name, end_of_func)
 
     def resolve_end_of_graph_nodes(self):
         """It resolves those nodes which are the end of
@@ -762,72 +916,82 @@ class ProcessCFG():
         """
         functions = self.basic_cfg.get_cfg(None)
 
-        for function_name, instructions in functions.items():
-            instructions_pyc = list(map(lambda x: x.get_instruction(),
-                                        instructions))
+        for function_name in functions.keys():
+            self.resolve_end_of_graph_node(function_name)
 
-            # Main function
-            if function_name == "main":
-                end_of_graph_node = cfg.FinalNode()
+    def resolve_end_of_graph_node(self, function_name):
+        """It resolves the nodes of a function which are the end
+        of our CFG (check *resolve_end_of_graph_nodes*).
 
-                if not pycutil.append_element_to_function(end_of_graph_node,
-                                                          func_def=instructions_pyc[0]):
-                    logging.warning("could not insert 'FinalNode' node in '%s'", function_name)
-                    continue
+        Arguments:
+            function_name (str): function.
+        """
+        instructions = self.basic_cfg.get_cfg(function_name)
+        instructions_pyc = list(map(lambda x: x.get_instruction(),
+                                    instructions))
 
-                self.basic_cfg.append_instruction(function_name, end_of_graph_node)
-
-            last_compound = None
-
-            # Exit functions
-            for instr in instructions_pyc:
-                if isinstance(instr, ast.Compound):
-                    last_compound = instr
-                elif isinstance(instr, ast.FuncCall):
-                    name = instr
-
-                    # Get iteratively the name
-                    while not isinstance(name, str):
-                        name = name.name
-
-                    if name in CFGConstants.exit_functions:
-                        if last_compound is None:
-                            logging.warning("trying to append a 'FinalNode', but no 'Compound'"
-                                            " was found (exit function out of a function?)")
-
-                        end_of_graph_node = cfg.FinalNode()
-                        pycutil.append_element_to_function(end_of_graph_node,
-                                                           func_def=instructions_pyc[0],
-                                                           after_element=instr)
-                        instr_position = -1
-                        func_call_instrs =\
-                            pycutil.get_real_next_instruction(instructions_pyc[0],
-                                                              instr)
-
-                        if func_call_instrs is not None:
-                            if func_call_instrs in instructions_pyc:
-                                instr_position = instructions_pyc.index(
-                                    func_call_instrs)
-                            else:
-                                all_instructions =\
-                                    pycutil.get_instruction_path(instructions_pyc[0],
-                                                                 True)
+        # Main function
+        if function_name == "main":
+            end_of_graph_node = cfg.FinalNode()
+
+            if not pycutil.append_element_to_function(end_of_graph_node,
+                                                      func_def=instructions_pyc[0]):
+                logging.warning("could not insert 'FinalNode' node in '%s'", function_name)
+                return
 
-                                if func_call_instrs in all_instructions:
-                                    #instr_index_1 = instructions_pyc.index(instr)
-                                    #instr_index_2 = all_instructions.index(instr)
+            self.basic_cfg.append_instruction(function_name, end_of_graph_node)
 
-                                    instr_position = all_instructions.index(
-                                        func_call_instrs)
+        last_compound = None
 
-                                    #instr_position += instr_index_1 - instr_index_2
-                                else:
-                                    instr_position = len(instructions_pyc) - 1
+        # Exit functions
+        for instr in instructions_pyc:
+            if isinstance(instr, ast.Compound):
+                last_compound = instr
+            elif isinstance(instr, ast.FuncCall):
+                name = instr
+
+                # Get iteratively the name
+                while not isinstance(name, str):
+                    name = name.name
+
+                if name in CFGConstants.exit_functions:
+                    if last_compound is None:
+                        logging.warning("trying to append a 'FinalNode', but no 'Compound'"
+                                        " was found (exit function out of a function?)")
+
+                    end_of_graph_node = cfg.FinalNode()
+                    pycutil.append_element_to_function(end_of_graph_node,
+                                                       func_def=instructions_pyc[0],
+                                                       after_element=instr)
+                    instr_position = -1
+                    func_call_instrs =\
+                        pycutil.get_real_next_instruction(instructions_pyc[0],
+                                                          instr)
+
+                    if func_call_instrs is not None:
+                        if func_call_instrs in instructions_pyc:
+                            instr_position = instructions_pyc.index(
+                                func_call_instrs)
+                        else:
+                            all_instructions =\
+                                pycutil.get_instruction_path(instructions_pyc[0],
+                                                             True)
+
+                            if func_call_instrs in all_instructions:
+                                #instr_index_1 = instructions_pyc.index(instr)
+                                #instr_index_2 = all_instructions.index(instr)
+
+                                instr_position = all_instructions.index(
+                                    func_call_instrs)
+
+                                #instr_position += instr_index_1 - instr_index_2
+                            else:
+                                instr_position = len(instructions_pyc) - 1
 
-                        # It appends the new node
-                        self.basic_cfg.append_instruction(function_name,
-                                                          end_of_graph_node,
-                                                          instr_position)
+                    # It appends the new node
+                    self.basic_cfg.append_instruction(function_name,
+                                                      end_of_graph_node,
+                                                      instr_position)
 
     def resolve_broken_succs(self):
         """It resolves those dependencies which could not
@@ -884,12 +1048,22 @@ class ProcessCFG():
 
             instr_to_functions = rtn_instrs[-1]
 
-        for invoke in function_invoked_by:
-            self.resolve_succs_return_calls(function_name, invoke,
-                                            function_name, instr_to_functions,
-                                            [(function_name, invoke, function_name)])
-            #rtn_instrs[-1].append_succ(
-            #    self.basic_cfg.get_cfg(invoke)[0])
+        if self.defined_functions is not None:
+            # The function is being computed alone: the callers will be linked later
+            if (self.is_invoked or self.is_invoked is None):
+                instr_index = cfg.Instruction.get_instructions(function_instructions)\
+                                .index(instr_to_functions)
+
+                # If it is not known if the function is invoked, it might be linked to nothing
+                function_instructions[instr_index].append_succ(
+                    cfg.PendingSucc(cfg.PendingSucc.ret, weak=self.is_invoked is None))
+        else:
+            for invoke in function_invoked_by:
+                self.resolve_succs_return_calls(function_name, invoke,
+                                                function_name, instr_to_functions,
+                                                [(function_name, invoke, function_name)])
+                #rtn_instrs[-1].append_succ(
+                #    self.basic_cfg.get_cfg(invoke)[0])
 
         if len(rtn_instruction.get_succs()) == 0:
             # The return statement does not have dependencies yet
@@ -898,6 +1072,11 @@ class ProcessCFG():
 
             if index + 1 != len(function_instructions):
                 rtn_instruction.append_succ(function_instructions[index + 1])
+        elif self.weak_links:
+            index = function_instructions.index(rtn_instruction)
+
+            if index + 1 != len(function_instructions):
+                self.append_fallback_succ(rtn_instruction, function_instructions[index + 1])
 
     def resolve_succs_goto(self, instruction, instructions):
         """It resolves the Goto and Label statements.
@@ -1211,6 +1390,25 @@ class ProcessCFG():
             callee_instructions = self.basic_cfg.get_cfg(func_call_name)
 
             instructions[last_instruction_index].append_succ(callee_instructions[0])
+        elif (self.propagate_func_call and self.defined_functions is not None and
+              func_call_name in self.defined_functions):
+            # The callee is computed alone as well: it will be linked later
+            if func_call_name not in self.pending_calls:
+                self.pending_calls[func_call_name] =\
+                    cfg.PendingSucc(cfg.PendingSucc.call, func_call_name)
+
+            instructions[last_instruction_index].append_succ(
+                self.pending_calls[func_call_name])
+        elif (self.propagate_func_call and self.defined_functions is not None and
+              self.weak_links):
+            # The callee might be defined in other file: it will be linked later (if found)
+            pending_calls = [succ for succ in instructions[last_instruction_index].get_succs()
+                             if isinstance(succ, cfg.PendingSucc) and
+                             succ.kind == cfg.PendingSucc.call and succ.value == func_call_name]
+
+            if len(pending_calls) == 0:
+                instructions[last_instruction_index].append_succ(
+                    cfg.PendingSucc(cfg.PendingSucc.call, func_call_name, weak=True))
 
     def resolve_succs_if(self, instruction, instructions):
         """It resolves the If statements dependencies.
@@ -1639,6 +1837,8 @@ class ProcessCFG():
                         # If contains previous dependencies, this default
                         #  appendinness should not happen
                         instruction.append_succ(instructions[index + 1])
+                    elif self.weak_links:
+                        self.append_fallback_succ(instruction, instructions[index + 1])
                 else:
                     # Is the last instruction -> successive instruction will
                     #  be the function which invokes to the current function
@@ -1647,6 +1847,466 @@ class ProcessCFG():
 
             index += 1
 
+    def resolve_all(self):
+        """It resolves the successive instructions of all the functions.
+        """
+        function_invoked_by = self.get_function_invoked_by()
+
+        # Resolve special nodes
+
+        # Special node: end of function
+        self.append_end_of_function_nodes()
+
+        # Special node: functions not invoked
+        #self.resolve_functions_not_invoked()
+
+        # Special node: end of graph (e.g. last instruction in main,
+        #  exit(), ...)
+        self.resolve_end_of_graph_nodes()
+
+        # Resolve dependencies (successive instructions)
+        for function_name, invoked in function_invoked_by.items():
+            self.resolve_succs(function_name, invoked)
+
+        # Resolve those dependencies which could not be resolved before
+        #  for some reason
+        #self.resolve_broken_succs()
+
+        self.resolved_functions.update(function_invoked_by.keys())
+        self.resolved_functions.update(self.basic_cfg.get_cfg(None).keys())
+
+    def append_fallback_succ(self, instruction, succ_instruction):
+        """It appends a successive instruction to an instruction whose
+        successive instructions are all weak pending successive instructions
+        (check *pycparser_cfg.PendingSucc*), since they might be resolved to
+        nothing.
+
+        Arguments:
+            instruction (pycparser_cfg.Instruction): instruction.
+            succ_instruction (pycparser_cfg.Instruction): successive
+                instruction which would be appended if *instruction* had
+                not successive instructions.
+        """
+        succs = instruction.get_succs()
+
+        for succ in succs:
+            if not (isinstance(succ, cfg.PendingSucc) and succ.weak):
+                return
+
+        for succ in succs:
+            succ.fallback = succ_instruction
+
+        instruction.append_succ(succ_instruction)
+
+    def compute_function_cfg_fragment(self, function_name, function,
+                                      defined_functions, is_invoked, weak_links=False):
+        """It computes the CFG of a function alone (i.e. without the
+        rest of functions) and resolves all its intraprocedural successive
+        instructions. The successive instructions which depend on other
+        functions (function calls and returns to the callers) are left
+        pending (check *pycparser_cfg.PendingSucc*) in order to be linked
+        later (check *link_fragments*).
+
+        Arguments:
+            function_name (str): function name.
+            function (pycparser.c_ast.FuncDef): code of the function.
+            defined_functions (set): functions which are defined in
+                the program.
+            is_invoked (bool): if *True*, the function is invoked by
+                some function of the program. If *None*, it is not known
+                (e.g. it might be invoked from other file).
+            weak_links (bool): if *True*, the function calls to functions
+                which are not in *defined_functions* will be left pending
+                as well, since they might be defined in other file.
+
+        Returns:
+            pycparser_cfg.CFGFragment: CFG of the function
+        """
+        self.defined_functions = defined_functions
+        self.is_invoked = is_invoked
+        self.weak_links = weak_links
+        self.pending_calls = {}
+        is_static = function.decl.storage is not None and "static" in function.decl.storage
+
+        self.compute_function_cfg(function_name, function)
+
+        # Special nodes
+        self.append_end_of_function_node(function_name)
+        self.resolve_end_of_graph_node(function_name)
+
+        # Intraprocedural dependencies (successive instructions)
+        self.resolve_succs(function_name, [])
+
+        fragment = cfg.CFGFragment(function_name,
+                                   self.basic_cfg.get_cfg(function_name),
+                                   self.funcion_calls[function_name], is_static)
+
+        self.defined_functions = None
+        self.is_invoked = False
+        self.weak_links = False
+        self.pending_calls = {}
+
+        return fragment
+
+    def link_fragments(self):
+        """It resolves the successive instructions which were left pending
+        when the CFG of the functions was computed alone: the function calls
+        are linked to the first instruction of the callees and the end of
+        the functions (e.g. Return statements) to their callers, following
+        the same order that *resolve_all* follows.
+
+        The weak pending successive instructions which are resolved to
+        nothing are removed, and the fallback successive instructions of
+        the ones which are resolved to some instruction are removed too.
+        """
+        functions = self.basic_cfg.get_cfg(None)
+        function_invoked_by = self.get_function_invoked_by()
+
+        # Function calls
+        for instructions in functions.values():
+            for instruction in instructions:
+                for succ in list(instruction.get_succs()):
+                    if (isinstance(succ, cfg.PendingSucc) and
+                            succ.kind == cfg.PendingSucc.call):
+                        callee_instructions = self.basic_cfg.get_cfg(succ.value)
+                        links = []
+
+                        if callee_instructions is not None:
+                            links.append(callee_instructions[0])
+
+                        self.replace_pending_succ(instruction, succ, links)
+
+        # Returns to the callers
+        for function_name, invoked in function_invoked_by.items():
+            instructions = self.basic_cfg.get_cfg(function_name)
+
+            if instructions is None:
+                continue
+
+            for instruction in instructions:
+                for succ in list(instruction.get_succs()):
+                    if (isinstance(succ, cfg.PendingSucc) and
+                            succ.kind == cfg.PendingSucc.ret):
+                        succs = instruction.get_succs()
+
+                        # The links are appended to the instruction, so they are
+                        #  collected apart in order to insert them in the same position
+                        instruction.remove_all_succs()
+
+                        for invoke in invoked:
+                            self.resolve_succs_return_calls(function_name, invoke,
+                                                            function_name,
+                                                            instruction.get_instruction(),
+                                                            [(function_name, invoke,
+                                                              function_name)])
+
+                        links = instruction.get_succs()
+                        instruction.succs = succs
+
+                        self.replace_pending_succ(instruction, succ, links)
+
+        self.resolved_functions.update(function_invoked_by.keys())
+        self.resolved_functions.update(functions.keys())
+
+    @staticmethod
+    def replace_pending_succ(instruction, pending_succ, links):
+        """It replaces a pending successive instruction by the instructions
+        which it was resolved to.
+
+        Arguments:
+            instruction (pycparser_cfg.Instruction): instruction.
+            pending_succ (pycparser_cfg.PendingSucc): pending successive
+                instruction of *instruction*.
+            links (list): instructions which *pending_succ* was resolved to.
+        """
+        instruction.replace_succ(pending_succ, links)
+
+        if (pending_succ.weak and pending_succ.fallback is not None and len(links) != 0):
+            # The fallback would not have been appended
+            instruction.remove_succ(pending_succ.fallback)
+
+    def compute_fragments(self, functions, processes, is_program=False):
+        """It computes the CFG of the functions alone in a pool of processes
+        (map phase, check *compute_function_cfg_fragment*). Only the compact
+        fragments are sent back.
+
+        Arguments:
+            functions (list): list of tuples of format (str,
+                pycparser.c_ast.FuncDef) which contains the name and
+                the code of the functions.
+            processes (int): number of processes of the pool.
+            is_program (bool): if *True*, *functions* are the functions of
+                a file of a program, so the rest of functions of the
+                program might invoke them or be invoked.
+
+        Returns:
+            list: fragments of type *pycparser_cfg.CFGFragment* in
+            the same order that *functions*
+        """
+        invoked_functions = set()
+
+        def append_invoked_function(node):
+            if isinstance(node, ast.FuncCall):
+                invoked_functions.add(get_func_call_name(node))
+
+        visitor = PreorderVisitor(append_invoked_function)
+
+        for _, function in functions:
+            visitor.visit(function)
+
+        defined_functions = set(function_name for function_name, _ in functions)
+        tasks = []
+
+        for function_name, function in functions:
+            is_invoked = function_name in invoked_functions
+
+            if (is_program and not is_invoked and
+                    not (function.decl.storage is not None and "static" in function.decl.storage)):
+                # It might be invoked from other file
+                is_invoked = None
+
+            tasks.append((function_name, function, self.propagate_func_call, defined_functions,
+                          is_invoked, is_program))
+
+        if (len(tasks) <= 1 or processes == 1):
+            return list(map(compute_function_cfg_fragment, tasks))
+
+        chunksize = max(1, len(tasks) // (processes * 4))
+
+        with multiprocessing.Pool(processes) as pool:
+            # The order of the functions is kept
+            return list(pool.imap(compute_function_cfg_fragment, tasks, chunksize))
+
+    def compute_cfg_in_parallel(self, functions, processes):
+        """It computes the CFG of the functions in parallel and links them.
+
+        The CFG of each function is computed alone in a pool of processes
+        (map phase, check *compute_fragments*). Then, the fragments are
+        linked sequentially (link phase, check *link_fragments*). The
+        fragments which were computed in other processes contain copies of
+        the functions, so the functions of the AST are updated with the
+        copies (check *pycparser_cfg.CFGFragment.share_function*) and the
+        rest of modules find the same nodes in the AST and the CFG.
+
+        Arguments:
+            functions (list): list of tuples of format (str,
+                pycparser.c_ast.FuncDef) which contains the name and
+                the code of the functions.
+            processes (int): number of processes of the pool.
+        """
+        fragments = self.compute_fragments(functions, processes)
+
+        for (_, function), fragment in zip(functions, fragments):
+            fragment.share_function(function)
+
+            self.basic_cfg.append_fragment(fragment)
+
+        self.link_fragments()
+
+    def compute_program_cfg(self, functions, processes, store):
+        """It computes the CFG of the functions and links them with the
+        functions of the other files of the program (i.e. translation units).
+
+        The functions are grouped by the file where they are defined, and
+        the fragments of each file (check *pycparser_cfg.CFGUnit*) are stored
+        in *store*. If a file has not changed since it was stored, its
+        fragments are reused instead of computed again. Then, the functions
+        are linked with the stored files which define the functions that
+        they invoke (transitively). The functions of the AST are updated
+        with the copies of the fragments of the analyzed files, but the
+        fragments of the rest of stored files only contain copies (their
+        functions are not in the AST).
+
+        Arguments:
+            functions (list): list of tuples of format (str,
+                pycparser.c_ast.FuncDef) which contains the name and
+                the code of the functions.
+            processes (int): number of processes of the pool.
+            store (pycparser_cfg.CFGUnitStore): store of the files of
+                the program.
+        """
+        files_functions = {}    # {file: [(name, FuncDef)]}
+        units = []
+
+        for function_name, function in functions:
+            path = "<unknown>"
+
+            if (function.coord is not None and function.coord.file):
+                path = os.path.normpath(function.coord.file)
+
+            if path not in files_functions:
+                files_functions[path] = []
+
+            files_functions[path].append((function_name, function))
+
+        for path, file_functions in files_functions.items():
+            key = cfg.CFGUnit.get_key(file_functions, self.propagate_func_call)
+            unit = store.load(path)
+
+            if (unit is None or unit.key != key):
+                unit = cfg.CFGUnit(path, key,
+                                   self.compute_fragments(file_functions, processes, True))
+
+                store.store(unit)
+
+            # The fragments are in the same order that the functions, even if they were reused
+            for (_, function), fragment in zip(file_functions, unit.fragments):
+                fragment.share_function(function)
+
+            units.append(unit)
+
+        units.extend(self.get_imported_units(units, store))
+
+        for unit in units:
+            for fragment in unit.fragments:
+                if fragment.function_name in self.basic_cfg.get_cfg(None):
+                    logging.warning("function '%s' from '%s' is already defined: skipping",
+                                    fragment.function_name, unit.path)
+                    continue
+
+                self.basic_cfg.append_fragment(fragment)
+
+        self.link_fragments()
+
+    @staticmethod
+    def get_imported_units(units, store):
+        """It returns the stored files of the program which define the
+        functions that are invoked from some files, transitively.
+
+        Only the stored files which are imported are loaded, since the
+        functions which each one defines are looked for in the manifest
+        of the store (check *pycparser_cfg.CFGUnitStore.get_manifest*).
+
+        Arguments:
+            units (list): files of type *pycparser_cfg.CFGUnit*.
+            store (pycparser_cfg.CFGUnitStore): store of the files of
+                the program.
+
+        Returns:
+            list: files of type *pycparser_cfg.CFGUnit*
+        """
+        paths = set(unit.path for unit in units)
+        exported_by = {}    # {function: stored unit}
+        manifest = store.get_manifest()
+        imported = set()
+        result = []
+
+        for stored_path, entry in manifest.items():
+            if entry["path"] in paths:
+                continue
+
+            for function_name in entry["exported"]:
+                if function_name in exported_by:
+                    logging.warning("function '%s' is exported by '%s' and '%s': using the"
+                                    " first one", function_name,
+                                    manifest[exported_by[function_name]]["path"], entry["path"])
+                    continue
+
+                exported_by[function_name] = stored_path
+
+        pending = []
+
+        for unit in units:
+            pending.extend(sorted(unit.imported))
+
+        while len(pending) != 0:
+            function_name = pending.pop(0)
+
+            if function_name not in exported_by:
+                # Not defined in the program (e.g. C library)
+                continue
+
+            stored_path = exported_by[function_name]
+
+            if stored_path in imported:
+                # Already imported
+                continue
+
+            imported.add(stored_path)
+
+            unit = store.load(None, stored_path)
+
+            if unit is None:
+                continue
+
+            result.append(unit)
+            pending.extend(sorted(unit.imported))
+
+        return result
+
+    def get_call_graph_component(self, function_name):
+        """It returns the functions which are connected to a function
+        in the call graph (callers and callees, transitively).
+
+        Arguments:
+            function_name (str): function.
+
+        Returns:
+            set: functions of the component
+        """
+        function_calls = self.get_function_calls()
+        function_invoked_by = self.get_function_invoked_by()
+        component = {function_name}
+        pending = [function_name]
+
+        while len(pending) != 0:
+            current = pending.pop()
+            neighbours = function_calls.get(current, []) + function_invoked_by.get(current, [])
+
+            for neighbour in neighbours:
+                if (neighbour is not None and neighbour not in component):
+                    component.add(neighbour)
+                    pending.append(neighbour)
+
+        return component
+
+    def resolve_function(self, function_name):
+        """It computes the instructions of a function (if it was deferred) and
+        resolves its successive instructions on demand.
+
+        The successive instructions of a function depend on its callers (e.g.
+        the successive instruction of a Return statement) and the ones of its
+        callers depend on their callees, so the whole component of the call
+        graph which contains the function is resolved, following the same
+        order that *resolve_all* follows, and the result is memoized. If
+        *function_name* is *None*, all the functions which have not been
+        resolved yet will be resolved.
+
+        Arguments:
+            function_name (str): function.
+        """
+        if function_name is None:
+            for name in list(self.get_function_invoked_by().keys()):
+                self.resolve_function(name)
+
+            return
+        if function_name in self.resolved_functions:
+            return
+
+        component = self.get_call_graph_component(function_name)
+        function_invoked_by = self.get_function_invoked_by()
+
+        # Instructions of the deferred functions
+        for name in list(self.deferred_functions.keys()):
+            if name in component:
+                self.compute_deferred_function(name)
+
+        # Special nodes
+        for name in self.get_function_calls().keys():
+            if name in component:
+                self.append_end_of_function_node(name)
+
+        for name in self.basic_cfg.get_cfg(None).keys():
+            if name in component:
+                self.resolve_end_of_graph_node(name)
+
+        # Dependencies (successive instructions)
+        for name, invoked in function_invoked_by.items():
+            if name in component:
+                self.resolve_succs(name, invoked)
+
+        self.resolved_functions.update(component)
+
     def get_basic_cfg(self):
         """It returns the basic CFG. Basic blocks (bb)
         are not being used in this basic CFG. The way
@@ -1657,6 +2317,16 @@ class ProcessCFG():
         """
         return self.basic_cfg
 
+    def get_lazy_cfg(self):
+        """It returns the basic CFG, but the successive instructions of each
+        function are resolved the first time that its CFG is requested
+        (check *resolve_function*).
+
+        Returns:
+            pycparser_cfg.LazyCFG: lazy basic CFG
+        """
+        return cfg.LazyCFG(self.basic_cfg, self.resolve_function)
+
     def get_function_calls(self):
         """It returns a graph with the function calls
         which have been found in the program.
@@ -1674,3 +2344,43 @@ class ProcessCFG():
             dict: functions which invokes a concrete function
         """
         return self.basic_cfg.get_function_invoked_by()
+
+def get_func_call_name(func_call):
+    """It returns the name of the function which is invoked.
+
+    Arguments:
+        func_call (pycparser.c_ast.FuncCall): function call.
+
+    Returns:
+        str: name of the function
+    """
+    name = func_call
+
+    # Get iteratively the name
+    while not isinstance(name, str):
+        name = name.name
+
+    return name
+
+def compute_function_cfg_fragment(task):
+    """It computes the CFG of a function alone. This function is
+    executed in the pool of processes (check
+    *ProcessCFG.compute_cfg_in_parallel*).
+
+    Arguments:
+        task (tuple): tuple of format (str, pycparser.c_ast.FuncDef, bool,
+            set, bool, bool) which contains the name of the function, the
+            code, *propagate_func_call*, the functions which are defined,
+            if the function is invoked and if the function calls to
+            functions which are not defined have to be left pending
+            (check *ProcessCFG.compute_function_cfg_fragment*).
+
+    Returns:
+        pycparser_cfg.CFGFragment: CFG of the function
+    """
+    function_name, function, propagate_func_call, defined_functions, is_invoked, weak_links = task
+    process_cfg = ProcessCFG(propagate_func_call)
+
+    return process_cfg.compute_function_cfg_fragment(function_name, function,
+                                                     defined_functions, is_invoked,
+                                                     weak_links)
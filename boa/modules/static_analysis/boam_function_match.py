@@ -3,6 +3,10 @@
 
 This module goal is to look for unsafe functions that should
 be avoided or generally are misused.
+
+It can be used with the AST (lifecycle *BOALCPycparserAST*) or with
+the function calls found by the prescan of the file, which does not
+need to parse the file (lifecycle *BOALCPycparserPrescan*).
 """
 
 # Std libs
@@ -15,6 +19,8 @@ from pycparser.c_ast import FuncCall
 from boam_abstract import BOAModuleAbstract
 from exceptions import BOAModuleException
 from constants import Meta
+from auxiliary_modules.method_matcher import MethodMatcher, MethodMatcherException
+from auxiliary_modules.pycparser_prescan import FunctionCallCandidate
 
 class BOAModuleFunctionMatch(BOAModuleAbstract):
     """BOAModuleFunctionMatch class. It implements the class BOAModuleAbstract.
@@ -26,42 +32,40 @@ class BOAModuleFunctionMatch(BOAModuleAbstract):
     def initialize(self):
         """It initializes the module.
 
-        It creates 2 lists to iterate throught them after. These lists
-        are created at the same time to have a concrete order. The goal
-        of this is to avoid to iterate over all the dictionaries that
+        It compiles the dangerous methods which are defined in the rules
+        file (check *auxiliary_modules.method_matcher.MethodMatcher*). The
+        goal of this is to avoid to iterate over all the dictionaries that
         are created in the rules file (rules file uses dictionaries to define
         dangerous functions to increasing the readibility of the rules)
-        every time that a new AST token is processed.
+        every time that a new AST token is processed. A method can be defined
+        with its exact name ("method"), a glob pattern ("glob") or a regular
+        expression ("regex").
 
         Raises:
             BOAModuleException: when a method is defined more than once
-                in the arguments.
+                in the arguments or is not valid.
         """
-        self.all_methods_name = []
-        self.all_methods_reference = []
-
-        for method in self.args["methods"]:
-            method_name = method["method"]
-
-            if method_name in self.all_methods_name:
-                raise BOAModuleException(f"method '{method_name}' duplicated in rules", self)
-
-            self.all_methods_name.append(method_name)
-            self.all_methods_reference.append(method)
+        try:
+            self.matcher = MethodMatcher(self.args["methods"])
+        except MethodMatcherException as e:
+            raise BOAModuleException(e.message, self) from e
 
     def process(self, token):
-        """It processes an AST node.
+        """It processes an AST node or a function call found by the prescan.
 
         It looks if the AST node is a function call and if so,
         it checks if it is one of the dangerous functions defined
         in the rules file.
 
         Arguments:
-            token: AST node.
+            token: AST node or
+                *auxiliary_modules.pycparser_prescan.FunctionCallCandidate*.
         """
         # Look for function calls
         if isinstance(token, FuncCall):
             self.pycparser_funccall(token)
+        elif isinstance(token, FunctionCallCandidate):
+            self.append_threat_if_dangerous(token.name, token.row, token.col)
 
     def clean(self):
         """It does nothing.
@@ -82,19 +86,33 @@ class BOAModuleFunctionMatch(BOAModuleAbstract):
         # Get the calling function name
         function_name = token.name.name
 
-        if function_name in self.all_methods_name:
-            index = self.all_methods_name.index(function_name)
+        if self.matcher.match(function_name) is not None:
             row = str(token.coord).split(':')[-2]
             col = str(token.coord).split(':')[-1]
+
+            self.append_threat_if_dangerous(function_name, row, col)
+
+    def append_threat_if_dangerous(self, function_name, row, col):
+        """It adds a new threat if the function which is being invoked
+        is defined as dangerous.
+
+        Arguments:
+            function_name (str): name of the function which is being invoked.
+            row: row of the function call.
+            col: column of the function call.
+        """
+        rule = self.matcher.match(function_name)
+
+        if rule is not None:
             severity = None
             description = None
             advice = None
             append = True
 
             try:
-                severity = self.all_methods_reference[index]["severity"]
-                description = self.all_methods_reference[index]["description"]
-                advice = self.all_methods_reference[index]["advice"]
+                severity = rule["severity"]
+                description = rule["description"]
+                advice = rule["advice"]
             except KeyError:
                 if (severity is None or description is None):
                     append = False
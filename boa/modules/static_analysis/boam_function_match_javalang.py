@@ -3,6 +3,10 @@
 
 This module goal is to look for unsafe functions that should
 be avoided or generally are misused.
+
+If the parser module provides a Java project ("project" callback result)
+instead of an AST, the method invocations of all the files of the project
+are looked for in parallel (check *auxiliary_modules.javalang_project*).
 """
 
 # Std libs
@@ -15,6 +19,10 @@ import javalang
 from boam_abstract import BOAModuleAbstract
 from exceptions import BOAModuleException
 from constants import Meta
+from auxiliary_modules.method_matcher import MethodMatcher, MethodMatcherException
+from utils import is_key_in_dict
+from auxiliary_modules.javalang_project import get_method_invocations,\
+                                               get_method_invocation_names
 
 class BOAModuleFunctionMatch(BOAModuleAbstract):
     """BOAModuleFunctionMatch class. It implements the class BOAModuleAbstract.
@@ -26,28 +34,23 @@ class BOAModuleFunctionMatch(BOAModuleAbstract):
     def initialize(self):
         """It initializes the module.
 
-        It creates 2 lists to iterate throught them after. These lists
-        are created at the same time to have a concrete order. The goal
-        of this is to avoid to iterate over all the dictionaries that
+        It compiles the dangerous methods which are defined in the rules
+        file (check *auxiliary_modules.method_matcher.MethodMatcher*). The
+        goal of this is to avoid to iterate over all the dictionaries that
         are created in the rules file (rules file uses dictionaries to define
         dangerous functions to increasing the readibility of the rules)
-        every time that a new AST token is processed.
+        every time that a new AST token is processed. A method can be defined
+        with its exact name ("method"), a glob pattern ("glob") or a regular
+        expression ("regex").
 
         Raises:
             BOAModuleException: when a method is defined more than once
-                in the arguments.
+                in the arguments or is not valid.
         """
-        self.all_methods_name = []
-        self.all_methods_reference = []
-
-        for method in self.args["methods"]:
-            method_name = method["method"]
-
-            if method_name in self.all_methods_name:
-                raise BOAModuleException(f"method '{method_name}' duplicated in rules", self)
-
-            self.all_methods_name.append(method_name)
-            self.all_methods_reference.append(method)
+        try:
+            self.matcher = MethodMatcher(self.args["methods"])
+        except MethodMatcherException as e:
+            raise BOAModuleException(e.message, self) from e
 
     def process(self, token):
         """It processes an AST node.
@@ -59,11 +62,41 @@ class BOAModuleFunctionMatch(BOAModuleAbstract):
         Arguments:
             token: AST node.
         """
+        if is_key_in_dict(token, "parser.project", split="."):
+            self.process_project(token["parser"]["project"])
+
+            return
+
         # Look for function calls
         for _, node in token["parser"]["ast"]:
             if isinstance(node, javalang.tree.MethodInvocation):
                 self.javalang_funccall(node)
 
+    def process_project(self, project):
+        """It looks for the dangerous method invocations of all the
+        files of a Java project. The files are parsed and the method
+        invocations are looked for in a pool of processes.
+
+        Arguments:
+            project (auxiliary_modules.javalang_project.JavaProject): project.
+        """
+        if project is None:
+            logging.warning("no project was provided to '%s'", self.who_i_am)
+
+            return
+
+        results = project.map(get_method_invocations, self.matcher)
+
+        for path, method_invocations in results:
+            relative_path = project.get_relative_path(path)
+
+            if method_invocations is None:
+                logging.warning("could not parse the file '%s'", path)
+                continue
+
+            for function_name, row, col in method_invocations:
+                self.append_threat_if_dangerous(function_name, row, col, relative_path)
+
     def clean(self):
         """It does nothing.
         """
@@ -73,27 +106,53 @@ class BOAModuleFunctionMatch(BOAModuleAbstract):
         """
 
     def javalang_funccall(self, token):
-        # Get the calling function name
-        function_name = token.member
+        """It adds a new threat if the method which is being
+        invoked is defined as dangerous.
+
+        Arguments:
+            token (javalang.tree.MethodInvocation): AST node.
+        """
+        # Get the calling function name (qualified name first)
+        function_name, _ = self.matcher.match_any(get_method_invocation_names(token))
 
-        if function_name in self.all_methods_name:
-            index = self.all_methods_name.index(function_name)
+        if function_name is not None:
             row = token.position.line
             col = token.position.column
+
+            self.append_threat_if_dangerous(function_name, row, col)
+
+    def append_threat_if_dangerous(self, function_name, row, col, path=None):
+        """It adds a new threat if the method which is being invoked
+        is defined as dangerous.
+
+        Arguments:
+            function_name (str): name of the method which is being invoked.
+            row (int): row of the method invocation.
+            col (int): column of the method invocation.
+            path (str): path of the file which contains the method
+                invocation. If not *None*, it will be added to the
+                description.
+        """
+        rule = self.matcher.match(function_name)
+
+        if rule is not None:
             severity = None
             description = None
             advice = None
             append = True
 
             try:
-                severity = self.all_methods_reference[index]["severity"]
-                description = self.all_methods_reference[index]["description"]
-                advice = self.all_methods_reference[index]["advice"]
+                severity = rule["severity"]
+                description = rule["description"]
+                advice = rule["advice"]
             except KeyError:
                 if (severity is None or description is None):
                     append = False
 
             if append:
+                if path is not None:
+                    description = f"{path}: {description}"
+
                 self.threats.append((self.who_i_am,
                                      description,
                                      severity,
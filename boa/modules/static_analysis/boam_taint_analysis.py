@@ -15,12 +15,23 @@ Things which this implementation DOES NOT do:
 3. It ignores those function calls which are not defined as
    a Source nor Sink.
 
+If the argument "demand_driven" is enabled, kildall's algorithm is not
+applied to all the functions. Instead, only the variables which reach
+the Sinks are analyzed walking backwards the CFG (check the class
+DemandDrivenTaintAnalysis, which can be used as well by other modules
+through the callback "get_taint_query").
+
+If the argument "ssa" is enabled, the demand-driven analysis converts
+each function to SSA form and propagates the taint status sparsely
+through the def-use chains (check the class SSATaintAnalysis).
+
 """
 
 # Std libs
-from copy import deepcopy
 from collections import OrderedDict as odict
 import logging
+import heapq
+import time
 
 # Own libs
 from constants import Meta
@@ -29,6 +40,7 @@ from utils import is_key_in_dict, get_just_type
 from exceptions import BOAModuleException
 import auxiliary_modules.pycparser_utils as pycutil
 import auxiliary_modules.pycparser_cfg as pycfg
+import auxiliary_modules.pycparser_ssa as pycssa
 
 # 3rd libs
 import pycparser.c_ast as ast
@@ -82,6 +94,56 @@ class BOAModuleTaintAnalysis(BOAModuleAbstract):
                                          "'append_tainted_variables_to_report'"
                                          " only allows the values 'true' or 'false'")
 
+        self.demand_driven = False
+
+        if is_key_in_dict(self.args, "demand_driven"):
+            if self.args["demand_driven"].lower() == "true":
+                self.demand_driven = True
+            elif self.args["demand_driven"].lower() != "false":
+                raise BOAModuleException("the argument 'demand_driven' only allows"
+                                         " the values 'true' or 'false'", self)
+
+        self.ssa = False
+
+        if is_key_in_dict(self.args, "ssa"):
+            if self.args["ssa"].lower() == "true":
+                self.ssa = True
+            elif self.args["ssa"].lower() != "false":
+                raise BOAModuleException("the argument 'ssa' only allows"
+                                         " the values 'true' or 'false'", self)
+
+        if (self.ssa and not self.demand_driven):
+            logging.warning("'%s': the argument 'ssa' only changes the results of this module when"
+                            " 'demand_driven' is 'true' (otherwise, it only changes the instance"
+                            " which is returned by the callback 'get_taint_query')", self.who_i_am)
+
+        # Budgets of the analysis of each function (None means no limit)
+        self.max_iterations_per_function = None
+        self.max_time_per_function = None
+
+        if is_key_in_dict(self.args, "max_iterations_per_function"):
+            try:
+                self.max_iterations_per_function =\
+                    int(self.args["max_iterations_per_function"])
+            except ValueError as e:
+                raise BOAModuleException("the argument 'max_iterations_per_function'"
+                                         " has to be an integer", self) from e
+
+            if self.max_iterations_per_function <= 0:
+                raise BOAModuleException("the argument 'max_iterations_per_function'"
+                                         " has to be greater than 0", self)
+
+        if is_key_in_dict(self.args, "max_time_per_function"):
+            try:
+                self.max_time_per_function = float(self.args["max_time_per_function"])
+            except ValueError as e:
+                raise BOAModuleException("the argument 'max_time_per_function'"
+                                         " has to be a number (seconds)", self) from e
+
+            if self.max_time_per_function <= 0.0:
+                raise BOAModuleException("the argument 'max_time_per_function'"
+                                         " has to be greater than 0", self)
+
         # Load Sources from rules file
         if (is_key_in_dict(self.args, "sources") and
                 isinstance(self.args["sources"], list)):
@@ -96,9 +158,25 @@ class BOAModuleTaintAnalysis(BOAModuleAbstract):
         else:
             logging.warning("no 'Sinks' were found in the rules file")
 
-        self.taint_analysis = TaintAnalysis(self.cfg, self.sources, self.sinks)
+        if self.ssa:
+            self.taint_query = SSATaintAnalysis(self.cfg, self.sources, self.sinks,
+                                                self.max_iterations_per_function,
+                                                self.max_time_per_function)
+        else:
+            self.taint_query = DemandDrivenTaintAnalysis(self.cfg, self.sources, self.sinks,
+                                                         self.max_iterations_per_function,
+                                                         self.max_time_per_function)
+
+        self.taint_analysis = None
         self.results = None
 
+        if self.demand_driven:
+            self.taint_analysis = self.taint_query
+        else:
+            self.taint_analysis = TaintAnalysis(self.cfg, self.sources, self.sinks,
+                                                self.max_iterations_per_function,
+                                                self.max_time_per_function)
+
     def process(self, args):
         """It process the given information from the rules
         file and attempts to look for security threats.
@@ -106,7 +184,22 @@ class BOAModuleTaintAnalysis(BOAModuleAbstract):
         Arguments:
             args: given information.
         """
-        self.results = self.taint_analysis.apply_kildall_to_all_functions()
+        if self.demand_driven:
+            self.results = self.taint_analysis.apply_to_all_sinks()
+        else:
+            self.results = self.taint_analysis.apply_kildall_to_all_functions()
+
+    def get_taint_query(self):
+        """It returns the instance which allows to ask on demand about the
+        taint status of the variables (e.g. if an argument of a function
+        call is tainted) without running the full analysis. This method is
+        expected to be used as callback by the modules which have this
+        module as dependency.
+
+        Returns:
+            DemandDrivenTaintAnalysis: demand-driven taint analysis instance
+        """
+        return self.taint_query
 
     def clean(self):
         """It does nothing.
@@ -133,6 +226,63 @@ class BOAModuleTaintAnalysis(BOAModuleAbstract):
         if self.append_tainted_variables_to_report:
             self.save_results(report, results, severity_instance)
 
+        self.save_approximated_functions(report, severity_instance)
+
+    def get_approximated_description(self, function):
+        """It returns the text which is appended to the descriptions of the
+        records of a function whose results have been approximated.
+
+        Arguments:
+            function (str): function name.
+
+        Returns:
+            str: text to append. Empty string if the results of *function*
+            have not been approximated
+        """
+        approximated_functions = self.taint_analysis.approximated_functions
+
+        if function not in approximated_functions:
+            return ""
+
+        return f" (approximated result: {approximated_functions[function]})"
+
+    def save_approximated_functions(self, report, severity_instance,
+                                    severity_value="WARNING"):
+        """It appends the functions whose taint analysis did not finish
+        because of the budgets and, so, whose results have been
+        approximated.
+
+        Arguments:
+            report: report which will contain the threats records.
+            severity_instance: severity instance used to retrieve
+                the position of concrete severity from name.
+            severity_value (str): severity to use in the report. The
+                default value is "WARNING" of
+                *severity_syslog.SeveritySyslog*.
+        """
+        for function, reason in self.taint_analysis.approximated_functions.items():
+            description = ""
+            description += f"function '{function}': the taint analysis exceeded"
+            description += f" the budget ({reason}), so the variables which were"
+            description += " not tainted have been considered to could be tainted"
+            description += " or not and the results might contain false positives"
+
+            advice = ""
+            advice += "increase the budgets of the taint analysis"
+            advice += " ('max_iterations_per_function' and 'max_time_per_function')"
+            advice += " if you need precise results for this function"
+
+            rtn_code = report.add(self.who_i_am,
+                                  description,
+                                  severity_instance[severity_value],
+                                  advice,
+                                  -1,
+                                  -1)
+
+            if rtn_code != Meta.ok_code:
+                logging.error("could not append a threat record (status code: %d)"
+                              " in '%s'", rtn_code, self.who_i_am)
+
     def save_threats(self, report, threats, severity_instance):
         """It appends the found threats in Taint Analysis.
 
@@ -168,6 +318,7 @@ class BOAModuleTaintAnalysis(BOAModuleAbstract):
                 description += " tainted value has been found, in"
                 description += f" the parameter with position '{affected_parameter}'"
                 description += " (the first parameter starts with 1)"
+                description += self.get_approximated_description(container_func_name)
 
                 advice = ""
                 advice += "try to avoid that the user has access to information"
@@ -231,6 +382,8 @@ class BOAModuleTaintAnalysis(BOAModuleAbstract):
                     description += " could be tainted or not, because has"
                     description += " both status (i.e. tainted and not tainted)"
 
+                description += self.get_approximated_description(function)
+
                 advice = None
 
                 rtn_code = report.add(self.who_i_am,
@@ -510,6 +663,209 @@ class Source:
 
         return result
 
+class SourceSinkIndex:
+    """It indexes the *Source* and *Sink* instances of the rules file in
+    hash tables keyed by the name of the invoked function and the function
+    which contains the invocation, so the check of a function call does not
+    depend on the number of defined *Source* and *Sink* instances.
+
+    The order of the *Source* instances of the rules file is kept in the
+    results because the order matters when a function call matches with
+    more than one *Source*.
+    """
+
+    def __init__(self, sources, sinks):
+        """It initializes the index.
+
+        Arguments:
+            sources (list): list of *Source*.
+            sinks (list): list of *Sink*.
+        """
+        # {name: [(position, Source, action)]}: Sources of type "function" which
+        #  affect the arguments (i.e. affected argument position different of 0)
+        self.call_sources = {}
+        # {name: [(position, Source, action)]}: Sources of type "function" which
+        #  affect the variable which is declared or assigned (i.e. affected
+        #  argument position 0)
+        self.init_sources = {}
+        # Functions which contain Sources which affect the declared or assigned
+        #  variables (None means all the functions)
+        self.init_sources_containers = set()
+        # {name: [(Sink, position)]}: the position is the index of the dangerous
+        #  argument (None means all the arguments)
+        self.sinks = {}
+        # {(name, function_name, bool): list of (Source, action)} and
+        #  {(name, number of arguments): list of (Sink, list of int)}
+        self.cache = {}
+
+        for position, source in enumerate(sources):
+            if source.type != "function":
+                continue
+
+            entry = (position, source, self.get_action(source))
+
+            if source.affected_argument_position == 0:
+                self.init_sources.setdefault(source.name, []).append(entry)
+                self.init_sources_containers.add(source.function_name_container)
+            else:
+                self.call_sources.setdefault(source.name, []).append(entry)
+
+        for sink in sinks:
+            position = None
+
+            if sink.dangerous_parameter != 0:
+                position = sink.dangerous_parameter - 1
+
+            self.sinks.setdefault(sink.function_name, []).append((sink, position))
+
+    def get_action(self, source):
+        """It returns how a *Source* of type "function" affects, with the
+        positions of the arguments starting with 0.
+
+        Arguments:
+            source (Source): *Source* instance of type "function".
+
+        Returns:
+            list: list which contains the value of *Source.how*, the index
+            of the affected argument and the index of the argument which has
+            to be tainted in order to apply the *Source* (the indexes are
+            *None* if the positions are not defined or, for the affected
+            argument, if it is the declared or assigned variable)
+        """
+        affected = source.affected_argument_position
+        if_tainted = source.tainted_argument_position
+
+        return [source.how,
+                None if affected in [None, 0] else affected - 1,
+                None if if_tainted is None else if_tainted - 1]
+
+    def get_sources(self, index, name, function_name, init):
+        """It returns the *Source* instances of an index which apply to a
+        function call. The result is cached.
+
+        Arguments:
+            index (dict): *self.call_sources* or *self.init_sources*.
+            name (str): name of the invoked function.
+            function_name (str): name of the function which contains the
+                function call.
+            init (bool): *True* if *index* is *self.init_sources*.
+
+        Returns:
+            list: list of (*Source*, action) sorted like in the rules file
+            (check *get_action*)
+        """
+        key = (name, function_name, init)
+
+        if key not in self.cache:
+            self.cache[key] = [(source, action) for _, source, action in index.get(name, [])
+                               if source.function_name_container in [function_name, None]]
+
+        return self.cache[key]
+
+    def get_call_sources(self, name, function_name):
+        """It returns the *Source* instances which affect the arguments of a
+        function call.
+
+        Arguments:
+            name (str): name of the invoked function.
+            function_name (str): name of the function which contains the
+                function call.
+
+        Returns:
+            list: list of (*Source*, action)
+        """
+        return self.get_sources(self.call_sources, name, function_name, False)
+
+    def get_init_sources(self, name, function_name):
+        """It returns the *Source* instances which affect the variable which is
+        declared or assigned with a function call.
+
+        Arguments:
+            name (str): name of the invoked function.
+            function_name (str): name of the function which contains the
+                function call.
+
+        Returns:
+            list: list of (*Source*, action)
+        """
+        return self.get_sources(self.init_sources, name, function_name, True)
+
+    def get_init_sources_by_names(self, names, function_name):
+        """It returns the *Source* instances which affect the variable which is
+        declared or assigned with any of the function calls.
+
+        Arguments:
+            names (list): list of *str* with the names of the invoked functions.
+            function_name (str): name of the function which contains the
+                function calls.
+
+        Returns:
+            list: list of (*Source*, action) sorted like in the rules file
+        """
+        sources = []
+
+        for name in set(names):
+            sources.extend([entry for entry in self.init_sources.get(name, [])
+                            if entry[1].function_name_container in [function_name, None]])
+
+        sources.sort(key=lambda x: x[0])
+
+        return [(source, action) for _, source, action in sources]
+
+    def has_init_sources(self, function_name):
+        """It checks if there are *Source* instances which affect the declared
+        or assigned variables of a function.
+
+        Arguments:
+            function_name (str): name of the function.
+
+        Returns:
+            bool: *True* if there are. Otherwise, *False*
+        """
+        return (function_name in self.init_sources_containers or
+                None in self.init_sources_containers)
+
+    def has_sinks(self, name):
+        """It checks if there are *Sink* instances of a function.
+
+        Arguments:
+            name (str): name of the invoked function.
+
+        Returns:
+            bool: *True* if there are. Otherwise, *False*
+        """
+        return name in self.sinks
+
+    def get_sinks(self, name, number_of_arguments):
+        """It returns the *Sink* instances of a function with the indexes
+        of the arguments which they check. The result is cached.
+
+        Arguments:
+            name (str): name of the invoked function.
+            number_of_arguments (int): number of arguments of the function
+                call.
+
+        Returns:
+            list: list of (*Sink*, list of *int*). The list of indexes is
+            empty if the dangerous argument is not in the function call
+        """
+        key = (name, number_of_arguments)
+
+        if key not in self.cache:
+            self.cache[key] = []
+
+            for sink, position in self.sinks.get(name, []):
+                if position is None:
+                    arguments_index = list(range(0, number_of_arguments))
+                elif 0 <= position < number_of_arguments:
+                    arguments_index = [position]
+                else:
+                    arguments_index = []
+
+                self.cache[key].append((sink, arguments_index))
+
+        return self.cache[key]
+
 class Taint:
     """It represents a Taint, which in Taint Analysis terminology is
     a Source (we are talking about a Source like a real Source (variable
@@ -595,13 +951,54 @@ class Taint:
 
         return False
 
+    @classmethod
+    def join_status(cls, status1, status2):
+        """It joins two taint status following the lattice of the
+        allowed status (i.e. "UNK" is the bottom element and "MT"
+        is the top element).
+
+        Arguments:
+            status1 (str): taint status.
+            status2 (str): taint status.
+
+        Returns:
+            str: least upper bound of *status1* and *status2*
+        """
+        if (status1 == status2 or status2 == "UNK"):
+            return status1
+        if status1 == "UNK":
+            return status2
+
+        # "T" + "NT" or any status + "MT"
+        return "MT"
+
+    @classmethod
+    def merge_status(cls, status1, status2):
+        """It merges the taint status of a variable which reaches a program
+        point through different paths of the CFG. A variable which might be
+        tainted through any path is tainted ("T"), like kildall's algorithm
+        applies, so "MT" is only the result of merging "MT" (i.e. the status
+        of expressions with tainted and not tainted variables). The status
+        are sorted ("UNK" < "NT" < "T" < "MT"), so the merge is monotone.
+
+        Arguments:
+            status1 (str): taint status.
+            status2 (str): taint status.
+
+        Returns:
+            str: merged taint status
+        """
+        order = ("UNK", "NT", "T", "MT")
+
+        return max(status1, status2, key=order.index)
+
 class TaintAnalysis:
     """TaintAnalysis class.
 
     It performs the Taint Analysis.
     """
 
-    def __init__(self, cfg, sources, sinks):
+    def __init__(self, cfg, sources, sinks, max_iterations=None, max_time=None):
         """It initializes the class.
 
         Arguments:
@@ -610,11 +1007,20 @@ class TaintAnalysis:
                 in the following taint analysis.
             sinks (list): list of *Sink* which will contain the sinks in the
                 following taint analysis.
+            max_iterations (int): maximum number of iterations of kildall's
+                algorithm for each function. If *None*, there is no limit.
+            max_time (float): maximum time, in seconds, of kildall's algorithm
+                for each function. If *None*, there is no limit.
         """
         self.cfg = cfg
         self.sources = sources
         self.sinks = sinks
+        self.sources_sinks_index = SourceSinkIndex(sources, sinks)
         self.threats = []
+        self.max_iterations = max_iterations
+        self.max_time = max_time
+        # {function_name: reason}: functions whose results have been approximated
+        self.approximated_functions = {}
 
     def apply_kildall_to_all_functions(self, main_first_if_defined=True):
         """It applies kildall's algorithm to all the defined functions
@@ -700,6 +1106,11 @@ class TaintAnalysis:
         tainted_variables_names = list(map(lambda x: x.name, known_tainted))
         input_dict = odict()
         whole_instructions = pycutil.get_full_instruction_function(real_instructions)
+        # {id(whole instruction): index of the whole instruction}
+        whole_instructions_index = {id(whole): index for index, whole
+                                    in enumerate(whole_instructions)}
+        # {id(whole instruction): transfer record}
+        records = {}
 
         worklist = []
 
@@ -711,17 +1122,26 @@ class TaintAnalysis:
                                    tainted_variables_names, result, whole_instructions[0],
                                    None)
 
-        visited = []
+        visited = set()
         # Store the taints of control flow structures to affect the inner statements
         temporal_taints_of_control_structures = []
 
         # Debug
         times_len_worklist_neq_zero = 0
+        # Budgets
+        start_time = time.time()
+        budget_exceeded = None
 
         # Work with the worklist and the CFG
         while len(worklist) != 0:
             times_len_worklist_neq_zero += 1
 
+            budget_exceeded = self.get_exceeded_budget(times_len_worklist_neq_zero,
+                                                       start_time)
+
+            if budget_exceeded is not None:
+                break
+
             # Take the first instruction of the worklist
             first_instruction = worklist[0]
             # Take off the first instruction of the worklist
@@ -730,23 +1150,26 @@ class TaintAnalysis:
             outputs = []
 
             whole_instruction = first_instruction
-            whole_instruction_index = whole_instructions.index(whole_instruction)
 
             if len(whole_instruction) == 0:
                 continue
 
-            ids = self.get_all_id_names(whole_instruction)
+            # The information which does not depend on the taint status is
+            #  computed only the first time that the whole instruction is visited
+            record = self.get_transfer_record(records, whole_instruction, whole_instructions,
+                                              whole_instructions_index, instructions,
+                                              real_instructions)
+            whole_instruction_index = record["index"]
+            ids = record["ids"]
 
             # Control flow structures (inheritance of taints)
             # Avoid literal Compound elements because does not add any relevant
             #  information
-            if (isinstance(whole_instruction[0],
-                           pycutil.PycparserUtilConstants.strict_compound_instr) and
-                    not isinstance(whole_instruction[0], ast.Compound)):
+            if record["compound_instructions"] is not None:
                 compound_element_identifier =\
-                    self.get_taint_information_from_compound_element(whole_instruction,
-                                                                     whole_instructions,
-                                                                     input_dict, ids)
+                    self.get_taint_information_from_compound_element(
+                        whole_instruction, whole_instructions, input_dict, ids,
+                        [whole_instruction_index, record["compound_end"]])
 
                 if compound_element_identifier is not None:
                     already_inserted = len(list(
@@ -758,58 +1181,26 @@ class TaintAnalysis:
                         temporal_taints_of_control_structures\
                             .append(compound_element_identifier)
 
-            func_calls = pycutil.get_instructions_of_instance(ast.FuncCall, whole_instruction)
-
             # Func calls (check sources and sinks)
-            if len(func_calls) != 0:
-                # There are func call elements in the current whole instruction
-
-                for func_call in func_calls:
-                    # Check sources
-                    self.check_sources(func_call, input_dict,
-                                       outputs, function_name)
-                    # Check if any taint variable reached a sink
-                    self.check_sinks(func_call, result, function_name)
-
-            variable_decls = [whole_instruction]
-
-            # Check if there are variable declarations or assignments inside
-            #  a structure (i.e. the main instruction is not a declaration
-            #  nor assingment, but that does not mean which could have not
-            #  declarations or assignments)
-            if (not (pycutil.is_variable_decl(whole_instruction[0]) or
-                     isinstance(whole_instruction[0], ast.Assignment))):
-                # There are declarations or assignments inside a structure
-                #  (e.g. for(int i = 0; ...; ...);)
-                variable_decls =\
-                    pycutil.get_instructions_of_instance(ast.Decl, whole_instruction)
-                aux_result = []
-
-                for index, variable_decl in enumerate(variable_decls):
-                    if pycutil.is_variable_decl(variable_decl):
-                        variable_decls[index] = pycutil.get_full_instruction(
-                            variable_decl,
-                            real_instructions)
-
-                        for aux in variable_decls[index]:
-                            aux_result.append(aux)
-
-                variable_decls = aux_result
+            for func_call, func_call_information in record["func_calls"]:
+                # Check sources
+                self.check_sources(func_call, input_dict,
+                                   outputs, function_name,
+                                   [func_call_information])
+                # Check if any taint variable reached a sink
+                self.check_sinks(func_call, result, function_name,
+                                 func_call_information)
 
             # Check if there are variable declarations or assignments
-            for variable_decl in variable_decls:
-                if (pycutil.is_variable_decl(variable_decl[0]) or
-                        isinstance(variable_decl[0], ast.Assignment)):
-                    current_ids = self.get_all_id_names(variable_decl)
-
-                    # Initialize those variables which have "UNK" status
-                    self.process_output_from_decl_or_asign(outputs, variable_decl,
-                                                           input_dict,
-                                                           tainted_variables_names,
-                                                           current_ids, result)
-                    # Once initialized, check the Sources knowing that are initialized!
-                    self.check_sources(variable_decl[0], input_dict,
-                                       outputs, function_name)
+            for variable_decl, current_ids, init_func_calls in record["variable_decls"]:
+                # Initialize those variables which have "UNK" status
+                self.process_output_from_decl_or_asign(outputs, variable_decl,
+                                                       input_dict,
+                                                       tainted_variables_names,
+                                                       current_ids, result)
+                # Once initialized, check the Sources knowing that are initialized!
+                self.check_sources(variable_decl[0], input_dict,
+                                   outputs, function_name, init_func_calls)
 
             # Once reached this point, outputs is already calculated
 
@@ -849,21 +1240,16 @@ class TaintAnalysis:
             if len(input_dict) != 0:
                 last_input_dict = input_dict[list(input_dict)[-1]]
 
-            # [instruction index, current result, new output values, current result, succ]
+            # (instruction index, current result, new output values, current result, succ)
             # If we visit the same values again, it means we have reached a loop
-            visiting = [whole_instructions.index(whole_instruction),
-                        last_input_dict, outputs,
-                        list(map(lambda x: x[0], result)), None]
+            outputs_visiting = tuple(map(tuple, outputs))
+            result_visiting = tuple(map(lambda x: x[0], result))
 
-            # Get succ whole instructions from current whole instruction
-            succs = self.get_succs_from_whole_instruction(whole_instruction, whole_instructions,
-                                                          instructions, real_instructions)
-
-            # Sort reversely because the instructions are appended in the front of the worklist
-            succs.sort(reverse=True, key=whole_instructions.index)
+            # Get succ whole instructions from current whole instruction (sorted reversely
+            #  because the instructions are appended in the front of the worklist)
+            succs = record["succs"]
 
             for succ_instruction in succs:
-                visiting[-1] = id(succ_instruction)
                 abort = False
 
                 if succ_instruction[0] not in real_instructions:
@@ -883,8 +1269,7 @@ class TaintAnalysis:
                         last_input_dict_id = list(input_dict)[-1]
 
                         instruction_reference =\
-                            pycutil.get_full_instruction_from_id(whole_instructions,
-                                                                 last_input_dict_id)
+                            whole_instructions[whole_instructions_index[last_input_dict_id]]
 
                         self.initialize_input_dict(input_dict, variables_decl,
                                                    function_name,
@@ -930,6 +1315,10 @@ class TaintAnalysis:
                             append_succ = True
 
                 abort = False
+                visiting = (whole_instruction_index,
+                            None if last_input_dict is None else
+                            frozenset(last_input_dict.items()),
+                            outputs_visiting, result_visiting, id(succ_instruction))
 
                 # Check if we are in a loop
                 if visiting in visited:
@@ -949,9 +1338,10 @@ class TaintAnalysis:
                         # Look for the If structure which contains the EndOfIfElse element
                         for control_structure in temporal_taints_of_control_structures:
                             if isinstance(control_structure[0][0], ast.If):
-                                if_instructions = pycutil.get_instruction_path(control_structure[0][0])
+                                if_instructions =\
+                                    records[id(control_structure[0])]["compound_instructions"]
 
-                                if succ_instruction[0] in if_instructions:
+                                if id(succ_instruction[0]) in if_instructions:
                                     # Found
                                     succ_control_structure = control_structure
                                     break
@@ -968,7 +1358,7 @@ class TaintAnalysis:
                             # Look for the first element of the worklist which does
                             #  not belong to the If statement
                             for wl_index_enum, wl in enumerate(worklist):
-                                wl_index = whole_instructions.index(wl)
+                                wl_index = whole_instructions_index[id(wl)]
 
                                 # Check if the current element of the worklist does not
                                 #  belong to the control flow structure
@@ -987,7 +1377,12 @@ class TaintAnalysis:
                         worklist.insert(0, succ_instruction)
 
                     # Append this current and concrete result as visited
-                    visited.append(deepcopy(visiting))
+                    visited.add(visiting)
+
+        if budget_exceeded is not None:
+            # Sound over-approximation of the results
+            self.widen(function_name, result, whole_instructions, whole_instructions_index,
+                       records, instructions, real_instructions, budget_exceeded)
 
         # Get only those Taint instantes which are tainted (T and MT status)
         result = list(filter(lambda x: x[1].status in ["T", "MT"], result))
@@ -1023,7 +1418,99 @@ class TaintAnalysis:
 
         return result
 
-    def check_sources(self, instruction, input_dict, outputs, function_name):
+    def get_exceeded_budget(self, iterations, start_time):
+        """It checks if the budgets of the analysis of a function have been exceeded.
+
+        Arguments:
+            iterations (int): current number of iterations.
+            start_time (float): time when the algorithm started (*time.time()*).
+
+        Returns:
+            str: description of the exceeded budget. If no budget has been
+            exceeded, *None* will be returned
+        """
+        if (self.max_iterations is not None and iterations > self.max_iterations):
+            return f"more than {self.max_iterations} iterations"
+
+        if (self.max_time is not None and time.time() - start_time > self.max_time):
+            return f"more than {self.max_time} seconds"
+
+        return None
+
+    def set_approximated_function(self, function_name, reason):
+        """It records that the results of a function have been approximated
+        because a budget has been exceeded.
+
+        Arguments:
+            function_name (str): name of the function.
+            reason (str): description of the exceeded budget.
+        """
+        logging.warning("function '%s': the taint analysis has been approximated"
+                        " (%s)", function_name, reason)
+
+        self.approximated_functions[function_name] = reason
+
+    def widen(self, function_name, result, whole_instructions, whole_instructions_index,
+              records, instructions, real_instructions, reason):
+        """It widens the results of a function whose analysis has not been
+        finished to a sound over-approximation: the variables of the function
+        which are not tainted ("T"), even those which have not been reached
+        yet, are considered to have both status ("MT") and all the *Sink*
+        call sites of the function are checked with these results.
+
+        Arguments:
+            function_name (str): name of the function.
+            result (list): list of tuples of format (str, *Taint*) which contains
+                taint information about all the variables of the function. This
+                argument will mutate.
+            whole_instructions (list): list of lists of *pycparser.c_ast.Node* which
+                represents the whole instructions of the function.
+            whole_instructions_index (dict): check *get_transfer_record*.
+            records (dict): check *get_transfer_record*.
+            instructions (list): list of *pycparser_cfg.Instruction* which are all the
+                instructions of the function.
+            real_instructions (list): list of *pycparser.c_ast.Node* which are all the real
+                instructions of the function.
+            reason (str): description of the exceeded budget.
+        """
+        self.set_approximated_function(function_name, reason)
+
+        for _, taint in result:
+            if taint.status != "T":
+                taint.status = "MT"
+
+        whole_instructions_records = []
+
+        for whole_instruction in whole_instructions:
+            if len(whole_instruction) == 0:
+                continue
+
+            record = self.get_transfer_record(records, whole_instruction, whole_instructions,
+                                              whole_instructions_index, instructions,
+                                              real_instructions)
+
+            whole_instructions_records.append(record)
+
+            # The variables which have not been reached yet (e.g. global variables
+            #  which are used for first time in the not visited instructions)
+            func_call_names = [name for _, (name, _) in record["func_calls"]]
+
+            for var in record["ids"]:
+                if (var in func_call_names or
+                        self.get_result_index_by_var_name(result, var) is not None):
+                    continue
+
+                source = Source(var, "variable", function_name)
+
+                result.append((var, Taint(source, None, None, "MT")))
+
+        # The Sinks of the not visited instructions might have not been checked
+        for record in whole_instructions_records:
+            for func_call, func_call_information in record["func_calls"]:
+                self.check_sinks(func_call, result, function_name, func_call_information)
+
+    def check_sources(self, instruction, input_dict, outputs, function_name,
+                      func_calls_information=None):
         """It checks if the current instruction is a *Source* and if is
         dangerous.
 
@@ -1039,6 +1526,12 @@ class TaintAnalysis:
                 the output values for the found variables for all the processed
                 whole instructions. This argument will mutate.
             function_name (str): name of the current function being analyzed.
+            func_calls_information (list): list of [name, arguments] (check
+                *get_func_call_information*) of the function calls. If *instruction*
+                is a function call, it will contain only the information of
+                *instruction*. Otherwise, it will contain the information of the
+                function calls of the initialization. If *None*, the information
+                will be computed.
 
         Raises:
             BOAModuleException: if *instruction* is not an instance of the expected
@@ -1052,7 +1545,6 @@ class TaintAnalysis:
                                      f"but actual is '{get_just_type(instruction)}'",
                                      self)
 
-        sources = self.get_sources(None)
         last_input_dict = None
 
         if len(input_dict) != 0:
@@ -1060,20 +1552,15 @@ class TaintAnalysis:
 
         if isinstance(instruction, ast.FuncCall):
             # Function information
-            name = pycutil.get_name(instruction)
-            arguments = pycutil.get_func_call_parameters_name(instruction, False)
+            if func_calls_information is None:
+                func_calls_information = [self.get_func_call_information(instruction)]
 
-            # Filter sources
-            sources = list(filter(lambda x: x.type == "function" and x.name == name and
-                                  x.function_name_container in [function_name, None] and
-                                  x.affected_argument_position != 0,
-                                  sources))
+            name, arguments = func_calls_information[0]
 
-            for source in sources:
-                how = source.how
-                affected = source.affected_argument_position
-                if_tainted = source.tainted_argument_position
+            # Filter sources
+            sources = self.sources_sinks_index.get_call_sources(name, function_name)
 
+            for source, (how, affected, if_tainted) in sources:
                 arg_tainted = "NT"
 
                 if how in Source.allowed_how:
@@ -1085,7 +1572,7 @@ class TaintAnalysis:
                                                      " file in order to continue", self)
 
                         # Check if "affected" is a position of an argument
-                        if not 0 <= affected - 1 < len(arguments):
+                        if not 0 <= affected < len(arguments):
                             continue
 
                         arg_tainted = "T"
@@ -1107,11 +1594,11 @@ class TaintAnalysis:
 
                         # Check if "affected" and "if_tainted" are positions
                         #  of arguments
-                        if (not 0 <= affected - 1 < len(arguments) or
-                                not 0 <= if_tainted - 1 < len(arguments)):
+                        if (not 0 <= affected < len(arguments) or
+                                not 0 <= if_tainted < len(arguments)):
                             continue
 
-                        target_args = arguments[if_tainted - 1]
+                        target_args = arguments[if_tainted]
                         arg_tainted = "NT"
 
                         for target_arg in target_args:
@@ -1142,11 +1629,11 @@ class TaintAnalysis:
                     # Check if there is only 1 variable as argument, because
                     #  it will only affect the variable if is a reference, and
                     #  only can be 1 variable as reference
-                    if (len(arguments[affected - 1]) != 1 or
-                            not isinstance(arguments[affected - 1][0], str)):
+                    if (len(arguments[affected]) != 1 or
+                            not isinstance(arguments[affected][0], str)):
                         continue
 
-                    name = arguments[affected - 1][0]
+                    name = arguments[affected][0]
                     found = False
                     index = 0
 
@@ -1173,12 +1660,7 @@ class TaintAnalysis:
             # Assignment or declaration
 
             # Filter sources
-            sources = list(filter(lambda x: x.type == "function" and
-                                  x.function_name_container in [function_name, None] and
-                                  x.affected_argument_position == 0,
-                                  sources))
-
-            if len(sources) == 0:
+            if not self.sources_sinks_index.has_init_sources(function_name):
                 return
 
             name = None
@@ -1218,23 +1700,18 @@ class TaintAnalysis:
             if init is not None:
                 # There are instructions to analyze. If there are not, we are done
 
-                instructions = pycutil.get_instruction_path(init)
-                func_calls = pycutil.get_instructions_of_instance(ast.FuncCall,
-                                                                  instructions)
-                func_call_names = list(map(pycutil.get_name, func_calls))
-                func_call_arguments = list(map(lambda x: pycutil\
-                                               .get_func_call_parameters_name(x, False),
-                                               func_calls))
+                if func_calls_information is None:
+                    func_calls_information = self.get_init_func_calls_information(init)
+
+                func_call_names = list(map(lambda x: x[0], func_calls_information))
+                func_call_arguments = list(map(lambda x: x[1], func_calls_information))
 
                 # Get only those Sources which are being used in the declaration
                 #  or assignment
-                sources = list(filter(lambda x: x.name in func_call_names, sources))
-
-                for source in sources:
-                    how = source.how
-                    affected = source.affected_argument_position    # 0
-                    if_tainted = source.tainted_argument_position
+                sources = self.sources_sinks_index.get_init_sources_by_names(func_call_names,
+                                                                             function_name)
 
+                for source, (how, _, if_tainted) in sources:
                     if how in Source.allowed_how:
                         if how == "argument":
                             pass
@@ -1246,7 +1723,7 @@ class TaintAnalysis:
                                                          "targ', but 'if_tainted' attr"
                                                          " is not defined. Fix your rules"
                                                          " file in order to continue", self)
-                            if not 0 <= if_tainted - 1 < len(arguments):
+                            if not 0 <= if_tainted < len(arguments):
                                 continue
                             if last_input_dict is None:
                                 # There is not input_dict (i.e. function without arguments
@@ -1255,7 +1732,7 @@ class TaintAnalysis:
 
                             index = func_call_names.index(source.name)
 
-                            target_args = func_call_arguments[index][if_tainted - 1]
+                            target_args = func_call_arguments[index][if_tainted]
                             arg_tainted = "NT"
 
                             for target_arg in target_args:
@@ -1307,7 +1784,7 @@ class TaintAnalysis:
                             # Not found, so append the taint
                             outputs.append([name, "T"])
 
-    def check_sinks(self, func_call, result, function_name):
+    def check_sinks(self, func_call, result, function_name, func_call_information=None):
         """It checks if the known sinks have been reached by a tainted variable
         and, if so, a found threat will be created.
 
@@ -1324,72 +1801,62 @@ class TaintAnalysis:
             result (dict): dict of dicts which contains information about all the
                 variables of the function and their taint information.
             function_name (str): function which we are analyzing.
+            func_call_information (list): [name, arguments] of *func_call* (check
+                *get_func_call_information*). If *None*, it will be computed.
         """
-        name = pycutil.get_name(func_call)
-        arguments = pycutil.get_func_call_parameters_name(func_call, False)
-        arguments_index = []
-
-        for sink in self.sinks:
-            if sink.function_name == name:
-                # A taint has been found -> check if dangerous
-
-                # Get the arguments which will be checked
-                if sink.dangerous_parameter == 0:
-                    # Check all arguments if contain any tainted variable
-                    arguments_index = list(range(0, len(arguments)))
-                else:
-                    # Check dangerous_parameter if contain any tainted
-                    #  variable if defined (if the parameter is not found,
-                    #  will not raise any exception)
-                    # 0 < sink.dangerous_parameter <= len(arguments)
-                    if 0 <= sink.dangerous_parameter - 1 < len(arguments):
-                        arguments_index = [sink.dangerous_parameter - 1]
-
-                # Check every parameter of the function call
-                for arg_index in arguments_index:
-                    arg = arguments[arg_index]
-
-                    # Check every variable found in the argument
-                    for arg_name in arg:
-                        if isinstance(arg_name, str):
-                            # Variable found in argument
-                            result_index =\
-                                self.get_result_index_by_var_name(\
-                                    result, arg_name)
-
-                            # Check if the variable exists
-                            if result is None:
-                                continue
+        if func_call_information is None:
+            func_call_information = self.get_func_call_information(func_call)
+
+        name, arguments = func_call_information
+
+        # The arguments which will be checked are precomputed in the index (all
+        #  the arguments or the dangerous parameter if it is in the function call)
+        for _, arguments_index in self.sources_sinks_index.get_sinks(name, len(arguments)):
+            # Check every parameter of the function call
+            for arg_index in arguments_index:
+                arg = arguments[arg_index]
+
+                # Check every variable found in the argument
+                for arg_name in arg:
+                    if isinstance(arg_name, str):
+                        # Variable found in argument
+                        result_index =\
+                            self.get_result_index_by_var_name(\
+                                result, arg_name)
+
+                        # Check if the variable exists
+                        if result_index is None:
+                            continue
 
-                            taint_status = result[result_index][1].status
+                        taint_status = result[result_index][1].status
 
-                            if taint_status in ["T", "MT"]:
-                                # Tainted variable in sink!
-                                severity = None
+                        if taint_status in ["T", "MT"]:
+                            # Tainted variable in sink!
+                            severity = None
 
-                                if taint_status == "T":
-                                    severity = "ALERT"
-                                else:
-                                    severity = "CRITICAL"
+                            if taint_status == "T":
+                                severity = "ALERT"
+                            else:
+                                severity = "CRITICAL"
 
-                                current_threat = {
-                                    "threat": "sink",
-                                    "func_name": name,
-                                    "container_func_name": function_name,
-                                    "affected_parameter": str(arg_index + 1),
-                                    "instruction": func_call,
-                                    "severity": severity
-                                    }
+                            current_threat = {
+                                "threat": "sink",
+                                "func_name": name,
+                                "container_func_name": function_name,
+                                "affected_parameter": str(arg_index + 1),
+                                "instruction": func_call,
+                                "severity": severity
+                                }
 
-                                if current_threat not in self.threats:
-                                    self.threats.append(current_threat)
-                        else:
-                            # Function calls as arguments found.
-                            # Will not be processed!
-                            pass
+                            if current_threat not in self.threats:
+                                self.threats.append(current_threat)
+                    else:
+                        # Function calls as arguments found.
+                        # Will not be processed!
+                        pass
 
     def get_taint_information_from_compound_element(self, whole_instruction, whole_instructions,
-                                                    input_dict, ids):
+                                                    input_dict, ids, indexes=None):
         """It analyzes a compound element and gets taint information and
         useful information for the taint analysis.
 
@@ -1403,6 +1870,9 @@ class TaintAnalysis:
                 variables of the current analysis.
             ids (list): list of *str* which contains all the ID's of the current
                 statement.
+            indexes (list): index where the statement starts and index where the
+                statement finishes (check the returned value). If *None*, they will
+                be computed.
 
         Returns:
             list: list which contains the following information:\n
@@ -1460,17 +1930,45 @@ class TaintAnalysis:
             # There are tainted variables
             compound_element_identifier.append("T")
 
+        if indexes is not None:
+            compound_element_identifier.extend(indexes)
+
+            return compound_element_identifier
+
         # Append the index in which this compound element starts
         compound_element_identifier.append(whole_instructions.index(whole_instruction))
 
         # Append the index in which this compound element finishes
         compound_instructions = [whole_instruction[0]] +\
             pycutil.get_instruction_path(whole_instruction[0])
-        index = compound_element_identifier[-1]
+        index = self.get_compound_element_end(whole_instructions,
+                                              compound_element_identifier[-1],
+                                              set(map(id, compound_instructions)))
+
+        # Append index because contains the position where the compund elmenet finishes
+        # The instruction which has the position targetted by index does not belong to
+        #  the compound element!
+        compound_element_identifier.append(index)
+
+        return compound_element_identifier
+
+    def get_compound_element_end(self, whole_instructions, index, compound_instructions):
+        """It looks for the index where a compound element finishes.
+
+        Arguments:
+            whole_instructions (list): list of lists of *pycparser.c_ast.Node* which
+                represents all the full instructions of the current function.
+            index (int): index where the compound element starts.
+            compound_instructions (set): set of the ID's (i.e. id()) of the
+                instructions which belong to the compound element.
 
+        Returns:
+            int: index of the first whole instruction which does not belong to
+            the compound element
+        """
         while index < len(whole_instructions):
             if (len(whole_instructions[index]) != 0 and
-                    whole_instructions[index][0] not in compound_instructions):
+                    id(whole_instructions[index][0]) not in compound_instructions):
                 # We have found the first instruction which does not belongs to
                 #  the compound element. Now, index contain the position where
                 #  the compound element finishes (not including that element!)
@@ -1478,12 +1976,149 @@ class TaintAnalysis:
 
             index += 1
 
-        # Append index because contains the position where the compund elmenet finishes
-        # The instruction which has the position targetted by index does not belong to
-        #  the compound element!
-        compound_element_identifier.append(index)
+        return index
 
-        return compound_element_identifier
+    def get_transfer_record(self, records, whole_instruction, whole_instructions,
+                            whole_instructions_index, instructions, real_instructions):
+        """It returns the transfer record of a whole instruction, which contains
+        all the information that kildall's algorithm needs when the whole
+        instruction is visited and does not depend on the taint status. The
+        record is compiled the first time that the whole instruction is visited
+        and reused the next times.
+
+        Arguments:
+            records (dict): dict with the ID's (i.e. id()) of the whole instructions
+                as keys and the compiled records as values. This argument will mutate.
+            whole_instruction (list): list of *pycparser.c_ast.Node* which represents
+                a whole instruction.
+            whole_instructions (list): list of lists of *pycparser.c_ast.Node* which
+                represents the whole instructions of the function.
+            whole_instructions_index (dict): dict with the ID's (i.e. id()) of the whole
+                instructions as keys and their index in *whole_instructions* as values.
+            instructions (list): list of *pycparser_cfg.Instruction* which are all the
+                instructions of the function.
+            real_instructions (list): list of *pycparser.c_ast.Node* which are all the real
+                instructions of the function.
+
+        Returns:
+            dict: dict with the following keys:\n
+            * "index" (int): index of the whole instruction.
+            * "ids" (list): ID's of the whole instruction (check *get_all_id_names*).
+            * "func_calls" (list): list of [*pycparser.c_ast.FuncCall*, [name, arguments]].
+            * "variable_decls" (list): list of [whole instruction, ID's, [name, arguments]
+              of the function calls of the initialization] of the variable declarations
+              and assignments.
+            * "compound_instructions" (set): ID's (i.e. id()) of the instructions inside
+              the control flow structure (the structure itself is not included). *None*
+              if it is not a control flow structure.
+            * "compound_end" (int): index where the control flow structure finishes.
+            * "succs" (list): succ whole instructions sorted reversely.
+        """
+        if id(whole_instruction) in records:
+            return records[id(whole_instruction)]
+
+        index = whole_instructions_index[id(whole_instruction)]
+        record = {"index": index,
+                  "ids": self.get_all_id_names(whole_instruction),
+                  "func_calls": [],
+                  "variable_decls": [],
+                  "compound_instructions": None,
+                  "compound_end": None,
+                  "succs": None}
+
+        # Control flow structures
+        if (isinstance(whole_instruction[0],
+                       pycutil.PycparserUtilConstants.strict_compound_instr) and
+                not isinstance(whole_instruction[0], ast.Compound)):
+            record["compound_instructions"] =\
+                set(map(id, pycutil.get_instruction_path(whole_instruction[0])))
+            # The control flow structure itself belongs to the compound element
+            record["compound_end"] =\
+                self.get_compound_element_end(whole_instructions, index,
+                                              record["compound_instructions"] |
+                                              {id(whole_instruction[0])})
+
+        # Func calls
+        for func_call in pycutil.get_instructions_of_instance(ast.FuncCall, whole_instruction):
+            record["func_calls"].append([func_call, self.get_func_call_information(func_call)])
+
+        variable_decls = [whole_instruction]
+
+        # Check if there are variable declarations or assignments inside
+        #  a structure (i.e. the main instruction is not a declaration
+        #  nor assingment, but that does not mean which could have not
+        #  declarations or assignments)
+        if (not (pycutil.is_variable_decl(whole_instruction[0]) or
+                 isinstance(whole_instruction[0], ast.Assignment))):
+            # There are declarations or assignments inside a structure
+            #  (e.g. for(int i = 0; ...; ...);)
+            variable_decls = []
+
+            for variable_decl in pycutil.get_instructions_of_instance(ast.Decl,
+                                                                      whole_instruction):
+                if pycutil.is_variable_decl(variable_decl):
+                    variable_decls.extend(pycutil.get_full_instruction(variable_decl,
+                                                                       real_instructions))
+
+        for variable_decl in variable_decls:
+            if (pycutil.is_variable_decl(variable_decl[0]) or
+                    isinstance(variable_decl[0], ast.Assignment)):
+                init = None
+
+                if isinstance(variable_decl[0], ast.Assignment):
+                    init = variable_decl[0].rvalue
+                else:
+                    init = variable_decl[0].init
+
+                init_func_calls = []
+
+                if init is not None:
+                    init_func_calls = self.get_init_func_calls_information(init)
+
+                record["variable_decls"].append([variable_decl,
+                                                 self.get_all_id_names(variable_decl),
+                                                 init_func_calls])
+
+        # Succs
+        succs = self.get_succs_from_whole_instruction(whole_instruction, whole_instructions,
+                                                      instructions, real_instructions)
+
+        succs.sort(reverse=True, key=lambda succ: whole_instructions_index[id(succ)])
+
+        record["succs"] = succs
+        records[id(whole_instruction)] = record
+
+        return record
+
+    def get_func_call_information(self, func_call):
+        """It returns the name and the arguments of a function call.
+
+        Arguments:
+            func_call (pycparser.c_ast.FuncCall): function call.
+
+        Returns:
+            list: list containing:
+                * str: name of the function call\n
+                * list: result of *pycutil.get_func_call_parameters_name*
+        """
+        return [pycutil.get_name(func_call),
+                pycutil.get_func_call_parameters_name(func_call, False)]
+
+    def get_init_func_calls_information(self, init):
+        """It returns the name and the arguments of the function calls of
+        the initialization of a declaration or assignment.
+
+        Arguments:
+            init (pycparser.c_ast.Node): initialization of a declaration or
+                rvalue of an assignment.
+
+        Returns:
+            list: list of [name, arguments] (check *get_func_call_information*)
+        """
+        instructions = pycutil.get_instruction_path(init)
+        func_calls = pycutil.get_instructions_of_instance(ast.FuncCall, instructions)
+
+        return list(map(self.get_func_call_information, func_calls))
 
     def process_output_from_decl_or_asign(self, outputs, whole_instruction,
                                           input_dict, tainted_variables_names,
@@ -1901,3 +2536,1068 @@ class TaintAnalysis:
             source,
             *args),
                     self.sources))
+
+class DemandDrivenTaintAnalysis(TaintAnalysis):
+    """DemandDrivenTaintAnalysis class.
+
+    It performs the Taint Analysis on demand. Instead of applying
+    kildall's algorithm to all the variables of all the functions,
+    the analysis starts from the call sites of the *Sink* instances
+    and walks backwards the CFG and the def-use relations only as far
+    as needed to know the taint status of the arguments of the *Sink*.
+
+    The results are memoized by (program point, variable), where the
+    program point is a whole instruction of a function, so the instance
+    can also be used by other modules as a query API (e.g. "is this
+    argument tainted here?") without running the full analysis.
+    """
+
+    def __init__(self, cfg, sources, sinks, max_iterations=None, max_time=None):
+        """It initializes the class.
+
+        Arguments:
+            cfg (auxiliary_modules.pycparser_cfg.CFG): Control Flow Graph.
+            sources (list): list of *Source* which will contain the sources
+                in the following taint analysis.
+            sinks (list): list of *Sink* which will contain the sinks in the
+                following taint analysis.
+            max_iterations (int): maximum number of iterations of the fixed
+                point computations of each function (all the queries about the
+                function are taken into account). If *None*, there is no limit.
+            max_time (float): maximum time, in seconds, of the fixed point
+                computations of each function. If *None*, there is no limit.
+        """
+        super().__init__(cfg, sources, sinks, max_iterations, max_time)
+
+        # {(function_name, whole instruction index, variable): taint status}
+        self.memo = {}
+        # {function_name: dict with the necessary information of the function}
+        self.functions_information = {}
+        # {function_name: [iterations, seconds]}: consumed budgets
+        self.budgets = {}
+
+    def apply_to_all_sinks(self):
+        """It checks all the *Sink* call sites of all the defined functions
+        in the file: *self.check_sinks_of_function(function)*.
+
+        Returns:
+            dict: dict with the functions as key and a list of tuples of
+            format (str, *Taint*), which contains the tainted variables
+            which reach a *Sink*, as value
+        """
+        results = {}
+
+        for function in self.cfg.get_function_calls().keys():
+            results[function] = self.check_sinks_of_function(function)
+
+        return results
+
+    def check_sinks_of_function(self, function_name):
+        """It checks if the *Sink* call sites of a function are reached by
+        a tainted variable and, if so, a found threat will be created.
+
+        Like *TaintAnalysis.check_sinks*, only direct arguments are checked.
+
+        Arguments:
+            function_name (str): name of the function which will be looked
+                for in the CFG.
+
+        Returns:
+            list: list of tuples of format (str, *Taint*) which contains the
+            tainted variables which reach a *Sink*
+        """
+        result = []
+        information = self.get_function_information(function_name)
+
+        if information is None:
+            return result
+
+        for index, whole_instruction in enumerate(information["whole_instructions"]):
+            func_calls = pycutil.get_instructions_of_instance(ast.FuncCall, whole_instruction)
+
+            for func_call in func_calls:
+                name = pycutil.get_name(func_call)
+
+                if not self.sources_sinks_index.has_sinks(name):
+                    continue
+
+                arguments = pycutil.get_func_call_parameters_name(func_call, False)
+
+                for _, arguments_index in self.sources_sinks_index.get_sinks(name,
+                                                                            len(arguments)):
+                    for arg_index in arguments_index:
+                        # Function calls as arguments will not be processed
+                        variables = list(filter(lambda arg: isinstance(arg, str),
+                                                arguments[arg_index]))
+
+                        self.solve(information, function_name,
+                                   [(index, variable) for variable in variables])
+
+                        for variable in variables:
+                            taint_status = self.memo[(function_name, index, variable)]
+
+                            if taint_status not in ["T", "MT"]:
+                                continue
+
+                            severity = "ALERT" if taint_status == "T" else "CRITICAL"
+                            current_threat = {
+                                "threat": "sink",
+                                "func_name": name,
+                                "container_func_name": function_name,
+                                "affected_parameter": str(arg_index + 1),
+                                "instruction": func_call,
+                                "severity": severity
+                                }
+
+                            if current_threat not in self.threats:
+                                self.threats.append(current_threat)
+
+                            if variable not in list(map(lambda x: x[0], result)):
+                                source = Source(variable, "variable", function_name)
+                                taint = Taint(source, None, whole_instruction, taint_status)
+
+                                result.append((variable, taint))
+
+        return result
+
+    def get_taint_status(self, function_name, instruction, variable):
+        """It returns the taint status of a variable just before the execution
+        of the whole instruction which contains a concrete instruction.
+
+        Arguments:
+            function_name (str): name of the function which contains
+                *instruction*.
+            instruction (pycparser.c_ast.Node): instruction which defines the
+                program point.
+            variable (str): name of the variable.
+
+        Returns:
+            str: taint status of *variable* (check *Taint.allowed_status*).
+            If the function or the instruction are not found, "UNK" will
+            be returned
+        """
+        information = self.get_function_information(function_name)
+
+        if information is None:
+            return "UNK"
+
+        index = information["node_index"].get(id(instruction))
+
+        if index is None:
+            logging.warning("instruction not found in function '%s'", function_name)
+            return "UNK"
+
+        self.solve(information, function_name, [(index, variable)])
+
+        return self.memo[(function_name, index, variable)]
+
+    def is_tainted(self, function_name, instruction, variable):
+        """It checks if a variable is tainted just before the execution
+        of the whole instruction which contains *instruction*.
+
+        Arguments:
+            function_name (str): name of the function which contains
+                *instruction*.
+            instruction (pycparser.c_ast.Node): instruction which defines the
+                program point.
+            variable (str): name of the variable.
+
+        Returns:
+            bool: *True* if tainted. Otherwise, *False*
+        """
+        return self.get_taint_status(function_name, instruction, variable) in ["T", "MT"]
+
+    def get_argument_taint_status(self, function_name, func_call, position):
+        """It returns the taint status of an argument of a function call.
+
+        Arguments:
+            function_name (str): name of the function which contains
+                *func_call*.
+            func_call (pycparser.c_ast.FuncCall): function call.
+            position (int): position of the argument (the first argument
+                starts with 1).
+
+        Returns:
+            str: taint status of the argument, which is the join of the
+            taint status of all its variables. If the argument does not
+            exist, "UNK" will be returned
+        """
+        arguments = pycutil.get_func_call_parameters_name(func_call, False)
+
+        if not 0 <= position - 1 < len(arguments):
+            return "UNK"
+
+        taint_status = "UNK"
+
+        for variable in arguments[position - 1]:
+            if isinstance(variable, str):
+                taint_status = Taint.join_status(
+                    taint_status,
+                    self.get_taint_status(function_name, func_call, variable))
+
+        return taint_status
+
+    def solve(self, information, function_name, facts):
+        """It solves and memoizes the taint status of a list of facts.
+
+        A fact is the taint status of a variable just before the execution
+        of a whole instruction. First, the facts which the given facts depend
+        on are discovered walking backwards the CFG (only those which have not
+        been memoized before). Then, the discovered facts are solved in
+        dependency order (strongly connected components), so only the facts
+        which belong to a loop need to be iterated until the fixed point. The
+        taint status which reach a whole instruction through different paths
+        are merged like kildall's algorithm does (check *Taint.merge_status*).
+
+        If the budget of the function is exceeded, the facts which have not
+        been solved are considered to have both status ("MT"), which is a
+        sound over-approximation.
+
+        Arguments:
+            information (dict): information of the function (check
+                *get_function_information*).
+            function_name (str): name of the function.
+            facts (list): list of tuples of format (int, str) which contains
+                the index of the whole instruction and the variable name.
+        """
+        dependencies = {}
+        stack = list(filter(lambda fact: (function_name, *fact) not in self.memo, facts))
+
+        # Demand: discover the facts which are necessary
+        while len(stack) != 0:
+            fact = stack.pop()
+
+            if fact in dependencies:
+                continue
+
+            index, variable = fact
+            fact_dependencies = []
+
+            for pred in information["preds"][index]:
+                for dependency in self.get_output_dependencies(information, function_name,
+                                                               pred, variable):
+                    if ((function_name, *dependency) not in self.memo and
+                            dependency not in fact_dependencies):
+                        fact_dependencies.append(dependency)
+
+            dependencies[fact] = fact_dependencies
+
+            for dependency in fact_dependencies:
+                if dependency not in dependencies:
+                    stack.append(dependency)
+
+        dependents = {}
+
+        for fact, fact_dependencies in dependencies.items():
+            for dependency in fact_dependencies:
+                if dependency not in dependents:
+                    dependents[dependency] = []
+
+                dependents[dependency].append(fact)
+
+        values = {}
+
+        def get_value(index, variable):
+            if (function_name, index, variable) in self.memo:
+                return self.memo[(function_name, index, variable)]
+
+            return values.get((index, variable), "UNK")
+
+        start_time = time.time()
+        budget_exceeded = False
+
+        # Solve the discovered facts (the dependencies of a component are solved
+        #  before the component itself)
+        for component in self.get_strongly_connected_components(dependencies):
+            members = set(component)
+            worklist = sorted(component)
+            in_worklist = set(component)
+
+            while (len(worklist) != 0 and not budget_exceeded):
+                budget_exceeded = self.consume_budget(function_name, start_time)
+
+                if budget_exceeded:
+                    break
+
+                # The first instructions are processed first
+                fact = heapq.heappop(worklist)
+                index, variable = fact
+                taint_status = "UNK"
+
+                in_worklist.discard(fact)
+
+                if (index == 0 and variable in information["known_tainted"]):
+                    taint_status = "T"
+
+                for pred in information["preds"][index]:
+                    taint_status =\
+                        Taint.merge_status(taint_status,
+                                           self.get_output_status(information, function_name,
+                                                                  pred, variable, get_value))
+
+                previous_taint_status = values.get(fact, "UNK")
+                taint_status = Taint.merge_status(previous_taint_status, taint_status)
+
+                if (taint_status != previous_taint_status or fact not in values):
+                    values[fact] = taint_status
+
+                    # Only the facts of the same component might change
+                    for dependent in dependents.get(fact, []):
+                        if (dependent in members and dependent not in in_worklist):
+                            heapq.heappush(worklist, dependent)
+                            in_worklist.add(dependent)
+
+            for fact in component:
+                self.memo[(function_name, *fact)] = "MT" if budget_exceeded else values[fact]
+
+        self.stop_budget(function_name, start_time)
+
+    def consume_budget(self, function_name, start_time):
+        """It consumes an iteration of the budget of a function and checks
+        if the budget has been exceeded. If so, the function is recorded as
+        approximated (check *set_approximated_function*).
+
+        Arguments:
+            function_name (str): name of the function.
+            start_time (float): time when the current fixed point computation
+                started (*time.time()*).
+
+        Returns:
+            bool: *True* if the budget has been exceeded. Otherwise, *False*
+        """
+        if function_name in self.approximated_functions:
+            return True
+
+        iterations, seconds = self.budgets.get(function_name, [0, 0.0])
+        iterations += 1
+        reason = self.get_exceeded_budget(iterations, start_time - seconds)
+
+        self.budgets[function_name] = [iterations, seconds]
+
+        if reason is None:
+            return False
+
+        self.set_approximated_function(function_name, reason)
+
+        return True
+
+    def stop_budget(self, function_name, start_time):
+        """It accumulates the time of a fixed point computation in the budget
+        of a function.
+
+        Arguments:
+            function_name (str): name of the function.
+            start_time (float): time when the fixed point computation started
+                (*time.time()*).
+        """
+        iterations, seconds = self.budgets.get(function_name, [0, 0.0])
+
+        self.budgets[function_name] = [iterations, seconds + time.time() - start_time]
+
+    def get_strongly_connected_components(self, graph):
+        """It returns the strongly connected components of a graph (Tarjan's
+        algorithm without recursion).
+
+        Arguments:
+            graph (dict): dict with the nodes as keys and a list with the nodes
+                which the key depends on as value.
+
+        Returns:
+            list: list of lists of nodes. A component is always after the
+            components which it depends on
+        """
+        result = []
+        indexes = {}
+        lowlinks = {}
+        stack = []
+        on_stack = set()
+
+        for root in graph:
+            if root in indexes:
+                continue
+
+            work = [[root, 0]]
+
+            while len(work) != 0:
+                node, child_index = work[-1]
+
+                if child_index == 0:
+                    indexes[node] = len(indexes)
+                    lowlinks[node] = indexes[node]
+
+                    stack.append(node)
+                    on_stack.add(node)
+
+                children = list(filter(lambda child: child in graph, graph[node]))
+                pushed = False
+
+                while child_index < len(children):
+                    child = children[child_index]
+                    child_index += 1
+
+                    if child not in indexes:
+                        work[-1][1] = child_index
+                        work.append([child, 0])
+                        pushed = True
+                        break
+                    if child in on_stack:
+                        lowlinks[node] = min(lowlinks[node], indexes[child])
+
+                if pushed:
+                    continue
+
+                work.pop()
+
+                if len(work) != 0:
+                    parent = work[-1][0]
+                    lowlinks[parent] = min(lowlinks[parent], lowlinks[node])
+
+                if lowlinks[node] == indexes[node]:
+                    component = []
+
+                    while True:
+                        member = stack.pop()
+
+                        on_stack.discard(member)
+                        component.append(member)
+
+                        if member == node:
+                            break
+
+                    result.append(component)
+
+        return result
+
+    def get_output_dependencies(self, information, function_name, index, variable):
+        """It returns the facts which the taint status of a variable just after
+        the execution of a whole instruction depends on.
+
+        Arguments:
+            information (dict): information of the function.
+            function_name (str): name of the function.
+            index (int): index of the whole instruction.
+            variable (str): name of the variable.
+
+        Returns:
+            list: list of tuples of format (int, str) (check *solve*)
+        """
+        record = self.get_record(information, function_name, index)
+
+        if variable not in record["definitions"]:
+            return [(index, variable)]
+
+        definition = record["definitions"][variable]
+        result = []
+
+        if definition["used"] is not None:
+            result.extend([(index, used) for used in definition["used"]])
+
+        for action in definition["init_sources"] + definition["arg_sources"]:
+            result.extend([(index, target) for target in action[1]])
+
+        if not definition["decl"]:
+            result.append((index, variable))
+
+        for control_structure in record["control_structures"]:
+            result.extend([(control_structure[0], _id) for _id in control_structure[2]])
+
+        return result
+
+    def get_output_status(self, information, function_name, index, variable, get_value):
+        """It returns the taint status of a variable just after the execution
+        of a whole instruction.
+
+        The semantics are the same that *TaintAnalysis.kildall* applies.
+
+        Arguments:
+            information (dict): information of the function.
+            function_name (str): name of the function.
+            index (int): index of the whole instruction.
+            variable (str): name of the variable.
+            get_value (function): function which receives the index of a whole
+                instruction and a variable and returns its current taint status.
+
+        Returns:
+            str: taint status
+        """
+        record = self.get_record(information, function_name, index)
+
+        if variable not in record["definitions"]:
+            return get_value(index, variable)
+
+        definition = record["definitions"][variable]
+        taint_status = None
+
+        if definition["decl"]:
+            if definition["used"] is None:
+                # The variable is not initialized, so is not tainted
+                taint_status = "NT"
+            else:
+                taint_status = self.get_status_of_variables(
+                    [get_value(index, used) for used in definition["used"]])
+
+            for action in definition["init_sources"]:
+                action_status = self.get_action_status(action, index, get_value)
+
+                if (action_status is not None and taint_status == "NT"):
+                    taint_status = action_status
+
+        for action in definition["arg_sources"]:
+            action_status = self.get_action_status(action, index, get_value)
+
+            if (action_status is not None and taint_status in [None, "NT"]):
+                taint_status = action_status
+
+        if taint_status is None:
+            # The variable has not been defined in the whole instruction
+            return get_value(index, variable)
+
+        # Control flow structures (inheritance of taints)
+        for control_structure in record["control_structures"]:
+            control_structure_status = self.get_status_of_variables(
+                [get_value(control_structure[0], _id) for _id in control_structure[2]])
+
+            if control_structure_status == "NT":
+                continue
+
+            if taint_status == "NT":
+                taint_status = control_structure_status
+            elif (taint_status == "T" and control_structure_status == "MT"):
+                taint_status = "MT"
+
+        return taint_status
+
+    def get_status_of_variables(self, status):
+        """It returns the taint status of an expression from the taint
+        status of its variables.
+
+        Arguments:
+            status (list): list of *str* which contains the taint status
+                of the variables of the expression.
+
+        Returns:
+            str: "NT" if there are not tainted variables, "MT" if there are
+            variables with status "MT" or tainted and not tainted variables
+            and "T" otherwise
+        """
+        tainted = list(filter(lambda x: x in ["T", "MT"], status))
+
+        if len(tainted) == 0:
+            return "NT"
+        if ("MT" in tainted or "NT" in status):
+            return "MT"
+
+        return "T"
+
+    def get_action_status(self, action, index, get_value):
+        """It returns the taint status which a *Source* applies.
+
+        Arguments:
+            action (list): action of the *Source* (check *get_source_action*).
+            index (int): index of the whole instruction.
+            get_value (function): check *get_output_status*.
+
+        Returns:
+            str: taint status. If the *Source* does not apply any
+            taint status, *None* will be returned
+        """
+        if action[0] == "argument":
+            return "T"
+
+        # "targ": the target arguments have to be tainted
+        taint_status = "NT"
+
+        for target in action[1]:
+            target_status = get_value(index, target)
+
+            if target_status in ["T", "MT"]:
+                if taint_status == "NT":
+                    taint_status = target_status
+                elif (taint_status == "MT" and target_status == "T"):
+                    # "T" has more priority than "MT" in this case
+                    taint_status = "T"
+
+        if taint_status == "NT":
+            return None
+
+        return taint_status
+
+    def get_source_action(self, action, arguments):
+        """It returns how a *Source* affects when is invoked with
+        concrete arguments.
+
+        Arguments:
+            action (list): precomputed action of the *Source* (check
+                *SourceSinkIndex.get_action*).
+            arguments (list): result of
+                *pycutil.get_func_call_parameters_name* of the function call.
+
+        Returns:
+            list: list which contains the value of *Source.how* and a list
+            of *str* which contains the variables which have to be tainted
+            in order to apply the *Source* (only for "targ"). If the *Source*
+            does not apply, *None* will be returned
+
+        Raises:
+            BOAModuleException: if the *Source* has not the necessary values
+                defined.
+        """
+        how, _, if_tainted = action
+
+        if how == "argument":
+            return ["argument", []]
+        if how == "targ":
+            if if_tainted is None:
+                raise BOAModuleException("'Source' defined with 'how="
+                                         "targ', but 'if_tainted' attr"
+                                         " is not defined. Fix your rules"
+                                         " file in order to continue", self)
+            if not 0 <= if_tainted < len(arguments):
+                return None
+
+            return ["targ", list(filter(lambda arg: isinstance(arg, str),
+                                        arguments[if_tainted]))]
+
+        return None
+
+    def get_assigned_variable(self, instruction):
+        """It returns the name of the variable which is defined in a
+        declaration or assignment.
+
+        Arguments:
+            instruction (pycparser.c_ast.Node): declaration or assignment.
+
+        Returns:
+            list: list containing:
+                * str: name of the variable\n
+                * int: index of the first ID of *self.get_all_id_names*
+                  which does not belong to the name of the variable
+
+            If the name could not be found, [*None*, *None*] will be returned
+        """
+        name = instruction
+
+        if isinstance(instruction, ast.Assignment):
+            name = instruction.lvalue
+
+        # Try to find the root of the name
+        try:
+            name = name.name
+        except Exception as _:
+            while True:
+                try:
+                    name.name
+                    break
+                except Exception as _:
+                    try:
+                        name = name.exprs[0]
+                    except Exception as _:
+                        try:
+                            name = name.expr
+                        except Exception as _:
+                            return [None, None]
+
+        ids_valid_index = 1
+
+        while not isinstance(name, str):
+            name = name.name
+            ids_valid_index += 1
+
+        return [name, ids_valid_index]
+
+    def get_record(self, information, function_name, index):
+        """It returns the variables which a whole instruction defines and how.
+        The record is created the first time that is needed.
+
+        Arguments:
+            information (dict): information of the function.
+            function_name (str): name of the function.
+            index (int): index of the whole instruction.
+
+        Returns:
+            dict: dict which contains the definitions of the variables
+            ("definitions") and the control flow structures which contain
+            the whole instruction ("control_structures")
+        """
+        if index in information["records"]:
+            return information["records"][index]
+
+        whole_instruction = information["whole_instructions"][index]
+        real_instructions = information["real_instructions"]
+        definitions = {}
+        record = {"definitions": definitions,
+                  "control_structures": list(filter(
+                      lambda cs: cs[0] <= index < cs[1],
+                      information["control_structures"]))}
+
+        information["records"][index] = record
+
+        if len(whole_instruction) == 0:
+            return record
+
+        variable_decls = [whole_instruction]
+
+        # Declarations inside a structure (e.g. for(int i = 0; ...; ...);)
+        if (not (pycutil.is_variable_decl(whole_instruction[0]) or
+                 isinstance(whole_instruction[0], ast.Assignment))):
+            variable_decls = []
+
+            for variable_decl in pycutil.get_instructions_of_instance(ast.Decl,
+                                                                      whole_instruction):
+                if pycutil.is_variable_decl(variable_decl):
+                    variable_decls.extend(pycutil.get_full_instruction(variable_decl,
+                                                                       real_instructions))
+
+        for variable_decl in variable_decls:
+            if (len(variable_decl) == 0 or
+                    not (pycutil.is_variable_decl(variable_decl[0]) or
+                         isinstance(variable_decl[0], ast.Assignment))):
+                continue
+
+            name, ids_valid_index = self.get_assigned_variable(variable_decl[0])
+
+            if name is None:
+                continue
+
+            init = None
+            used = None
+            init_sources = []
+
+            if isinstance(variable_decl[0], ast.Assignment):
+                init = variable_decl[0].rvalue
+            else:
+                init = variable_decl[0].init
+
+            if init is not None:
+                used = self.get_all_id_names(variable_decl)[ids_valid_index:]
+                init_instructions = [init] + pycutil.get_instruction_path(init)
+
+                for func_call in pycutil.get_instructions_of_instance(ast.FuncCall,
+                                                                      init_instructions):
+                    arguments = pycutil.get_func_call_parameters_name(func_call, False)
+
+                    for _, source_action in self.sources_sinks_index.get_init_sources(
+                            pycutil.get_name(func_call), function_name):
+                        action = self.get_source_action(source_action, arguments)
+
+                        if action is not None:
+                            init_sources.append(action)
+
+            definitions[name] = {"decl": True, "used": used,
+                                 "init_sources": init_sources, "arg_sources": []}
+
+        # Sources which affect the arguments (e.g. gets(x))
+        for func_call in pycutil.get_instructions_of_instance(ast.FuncCall, whole_instruction):
+            arguments = pycutil.get_func_call_parameters_name(func_call, False)
+
+            for _, source_action in self.sources_sinks_index.get_call_sources(
+                    pycutil.get_name(func_call), function_name):
+                affected = source_action[1]
+
+                if affected is None:
+                    continue
+
+                # Only 1 variable as argument, because it will only affect
+                #  the variable if is a reference
+                if (not 0 <= affected < len(arguments) or
+                        len(arguments[affected]) != 1 or
+                        not isinstance(arguments[affected][0], str)):
+                    continue
+
+                action = self.get_source_action(source_action, arguments)
+
+                if action is None:
+                    continue
+
+                name = arguments[affected][0]
+
+                if name not in definitions:
+                    definitions[name] = {"decl": False, "used": None,
+                                         "init_sources": [], "arg_sources": []}
+
+                definitions[name]["arg_sources"].append(action)
+
+        return record
+
+    def get_function_information(self, function_name):
+        """It returns the necessary information of a function in order to
+        perform the demand-driven analysis. The information is created
+        the first time that is needed.
+
+        Arguments:
+            function_name (str): name of the function which will be looked
+                for in the CFG.
+
+        Returns:
+            dict: information of the function. If the function is not found,
+            *None* will be returned
+        """
+        if function_name in self.functions_information:
+            return self.functions_information[function_name]
+
+        instructions = self.cfg.get_cfg(function_name)
+
+        if instructions is None:
+            logging.warning("function '%s' was not found in the CFG", function_name)
+            self.functions_information[function_name] = None
+
+            return None
+
+        real_instructions = pycfg.Instruction.get_instructions(instructions)
+        whole_instructions = pycutil.get_full_instruction_function(real_instructions)
+        whole_index = {}    # {id(whole instruction): index}
+        node_index = {}     # {id(instruction): index of the whole instruction}
+        preds = [[] for _ in whole_instructions]
+        control_structures = []
+
+        for index, whole_instruction in enumerate(whole_instructions):
+            whole_index[id(whole_instruction)] = index
+
+            for instruction in whole_instruction:
+                if id(instruction) not in node_index:
+                    node_index[id(instruction)] = index
+
+        for index, whole_instruction in enumerate(whole_instructions):
+            if len(whole_instruction) == 0:
+                continue
+
+            succs = self.get_succs_from_whole_instruction(whole_instruction, whole_instructions,
+                                                          instructions, real_instructions)
+
+            for succ_instruction in succs:
+                # Instructions of other functions are ignored
+                succ_index = whole_index.get(id(succ_instruction))
+
+                if (succ_index is not None and index not in preds[succ_index]):
+                    preds[succ_index].append(index)
+
+            # Control flow structures: [index, index where finishes, ID's]
+            if (isinstance(whole_instruction[0],
+                           pycutil.PycparserUtilConstants.strict_compound_instr) and
+                    not isinstance(whole_instruction[0], ast.Compound)):
+                compound_instructions = set(map(id, [whole_instruction[0]] +
+                                                pycutil.get_instruction_path(
+                                                    whole_instruction[0])))
+                end_index = self.get_compound_element_end(whole_instructions, index,
+                                                          compound_instructions)
+
+                control_structures.append([index, end_index,
+                                           self.get_all_id_names(whole_instruction)])
+
+        known_tainted =\
+            self.get_sources(["variable", function_name]) +\
+                self.get_sources(["variable", None])
+
+        information = {"real_instructions": real_instructions,
+                       "whole_instructions": whole_instructions,
+                       "node_index": node_index,
+                       "preds": preds,
+                       "control_structures": control_structures,
+                       "known_tainted": list(map(lambda x: x.name, known_tainted)),
+                       "records": {}}
+
+        self.functions_information[function_name] = information
+
+        return information
+
+class SSATaintAnalysis(DemandDrivenTaintAnalysis):
+    """SSATaintAnalysis class.
+
+    It answers the same queries that *DemandDrivenTaintAnalysis*, but the
+    first time that a function is queried, the function is converted to
+    SSA form (check *auxiliary_modules.pycparser_ssa*) and the taint status
+    is propagated sparsely through the def-use chains: every definition
+    (i.e. a variable defined in a whole instruction or a phi function) is
+    evaluated only when a definition which it uses changes, instead of
+    propagating the taint status of every variable through every whole
+    instruction of the CFG.
+
+    The whole instructions which are not reachable from the beginning
+    of the function are not part of the SSA form, so the queries about
+    them are solved by *DemandDrivenTaintAnalysis*.
+    """
+
+    def __init__(self, cfg, sources, sinks, max_iterations=None, max_time=None):
+        """It initializes the class.
+
+        Arguments:
+            cfg (auxiliary_modules.pycparser_cfg.CFG): Control Flow Graph.
+            sources (list): list of *Source* which will contain the sources
+                in the following taint analysis.
+            sinks (list): list of *Sink* which will contain the sinks in the
+                following taint analysis.
+            max_iterations (int): check *DemandDrivenTaintAnalysis*.
+            max_time (float): check *DemandDrivenTaintAnalysis*.
+        """
+        super().__init__(cfg, sources, sinks, max_iterations, max_time)
+
+        # {function_name: [SSA form, {definition: taint status}]}
+        self.ssa_information = {}
+
+    def solve(self, information, function_name, facts):
+        """It solves and memoizes the taint status of a list of facts
+        (check *DemandDrivenTaintAnalysis.solve*) from the taint status
+        of the definitions of the SSA form which reach them.
+
+        Arguments:
+            information (dict): information of the function (check
+                *get_function_information*).
+            function_name (str): name of the function.
+            facts (list): list of tuples of format (int, str) which contains
+                the index of the whole instruction and the variable name.
+        """
+        ssa, values = self.get_ssa_information(information, function_name)
+        unreachable_facts = []
+
+        for index, variable in facts:
+            if (function_name, index, variable) in self.memo:
+                continue
+
+            definition = ssa.get_reaching_definition(index, variable)
+
+            if definition is None:
+                unreachable_facts.append((index, variable))
+            else:
+                self.memo[(function_name, index, variable)] =\
+                    self.get_definition_status(information, values, definition)
+
+        if len(unreachable_facts) != 0:
+            super().solve(information, function_name, unreachable_facts)
+
+    def get_definition_status(self, information, values, definition):
+        """It returns the current taint status of a definition of the SSA form.
+
+        Arguments:
+            information (dict): information of the function.
+            values (dict): taint status of the definitions.
+            definition (tuple): definition (check
+                *auxiliary_modules.pycparser_ssa.SSA*).
+
+        Returns:
+            str: taint status
+        """
+        if definition is None:
+            return "UNK"
+        if definition[0] == "entry":
+            return "T" if definition[1] in information["known_tainted"] else "UNK"
+
+        return values.get(definition, "UNK")
+
+    def get_ssa_information(self, information, function_name):
+        """It converts a function to SSA form and propagates the taint status
+        of its definitions through the def-use chains until the fixed point.
+        The result is created the first time that is needed. If the budget of
+        the function is exceeded, the definitions which have not been solved
+        are considered to have both status ("MT").
+
+        Arguments:
+            information (dict): information of the function.
+            function_name (str): name of the function.
+
+        Returns:
+            list: list containing:
+                * auxiliary_modules.pycparser_ssa.SSA: SSA form\n
+                * dict: taint status of the definitions
+        """
+        if function_name in self.ssa_information:
+            return self.ssa_information[function_name]
+
+        whole_instructions = information["whole_instructions"]
+        definitions = [self.get_record(information, function_name, index)["definitions"].keys()
+                       for index in range(len(whole_instructions))]
+        ssa = pycssa.SSA(information["preds"], definitions)
+        values = {}
+        dependencies = {}   # {definition: definitions which it uses}
+
+        for index in ssa.order:
+            if index == ssa.virtual_entry:
+                continue
+
+            for variable in ssa.phis.get(index, ()):
+                definition = ("phi", index, variable)
+                dependencies[definition] = list(filter(
+                    lambda d: d[0] != "entry", ssa.get_phi_operands(index, variable)))
+
+            for variable in definitions[index]:
+                definition = ("def", index, variable)
+                dependencies[definition] = []
+
+                for dependency in self.get_output_dependencies(information, function_name,
+                                                               index, variable):
+                    dependency = ssa.get_reaching_definition(*dependency)
+
+                    if (dependency is not None and dependency[0] != "entry" and
+                            dependency not in dependencies[definition]):
+                        dependencies[definition].append(dependency)
+
+        dependents = {}
+
+        for definition, definition_dependencies in dependencies.items():
+            for dependency in definition_dependencies:
+                if dependency not in dependents:
+                    dependents[dependency] = []
+
+                dependents[dependency].append(definition)
+
+        def get_value(index, variable):
+            return self.get_definition_status(information, values,
+                                              ssa.get_reaching_definition(index, variable))
+
+        start_time = time.time()
+        budget_exceeded = False
+
+        # Sparse propagation (the dependencies of a component are solved
+        #  before the component itself)
+        for component in self.get_strongly_connected_components(dependencies):
+            members = set(component)
+            # The definitions of the first instructions are processed first
+            #  (the phi functions of a whole instruction before its definitions)
+            worklist = sorted(map(lambda d: (d[1], d[0] == "def", d[2]), component))
+            in_worklist = set(component)
+
+            while (len(worklist) != 0 and not budget_exceeded):
+                budget_exceeded = self.consume_budget(function_name, start_time)
+
+                if budget_exceeded:
+                    break
+
+                index, is_def, variable = heapq.heappop(worklist)
+                kind = "def" if is_def else "phi"
+                definition = (kind, index, variable)
+                taint_status = "UNK"
+
+                in_worklist.discard(definition)
+
+                if kind == "phi":
+                    for operand in ssa.get_phi_operands(index, variable):
+                        taint_status =\
+                            Taint.merge_status(taint_status,
+                                               self.get_definition_status(information, values,
+                                                                          operand))
+                else:
+                    taint_status = self.get_output_status(information, function_name,
+                                                          index, variable, get_value)
+
+                previous_taint_status = values.get(definition, "UNK")
+                taint_status = Taint.merge_status(previous_taint_status, taint_status)
+
+                if (taint_status != previous_taint_status or definition not in values):
+                    values[definition] = taint_status
+
+                    # Only the definitions of the same component might change
+                    for dependent in dependents.get(definition, []):
+                        if (dependent in members and dependent not in in_worklist):
+                            heapq.heappush(worklist, (dependent[1], dependent[0] == "def",
+                                                      dependent[2]))
+                            in_worklist.add(dependent)
+
+            if budget_exceeded:
+                # Sound over-approximation of the definitions which have not been solved
+                for definition in component:
+                    values[definition] = "MT"
+
+        self.stop_budget(function_name, start_time)
+
+        self.ssa_information[function_name] = [ssa, values]
+
+        return self.ssa_information[function_name]
@@ -5,14 +5,24 @@ about all the found threats.
 
 # Std libs
 import re
+import glob
+import time
+import heapq
+import argparse
 from abc import abstractmethod
 import logging
 
 # Own libs
 from constants import Meta, Error, Regex
+from args_manager import ArgsManager
+import auxiliary_modules.threat_streams as threat_streams
+import auxiliary_modules.threat_index as threat_index
+import auxiliary_modules.report_shards as report_shards
+import auxiliary_modules.results_store as results_store
 from enumerations.severity.severity_base import SeverityBase
 from utils import is_key_in_dict, get_name_from_class_instance
-from exceptions import BOAReportWhoNotFound, BOAReportEnumTypeNotExpected
+from exceptions import BOAReportWhoNotFound, BOAReportEnumTypeNotExpected, \
+                       BOAReportException
 
 class BOAReportAbstract:
     """BOAReportAbstract class.
@@ -23,6 +33,30 @@ class BOAReportAbstract:
     If you want to define your own Report class you will have
     to define a new class which inherits from this one.
 
+    The threats are stored by module and sorted by severity only
+    when they are requested (check *summary*). Optionally, the
+    threats can be written to JSON lines or SARIF files as soon as
+    they are added (args "stream_jsonl" and "stream_sarif", which
+    contain the path of the files).
+
+    The threats can be identified by their fingerprint (check
+    *auxiliary_modules.threat_index*) in order to drop the duplicated
+    threats (arg "deduplicate"), to suppress the threats of a baseline
+    file (arg "threat_baseline") and to store the fingerprints of the
+    found threats, which can be used as baseline later (arg
+    "threat_index").
+
+    The reports can be written to shard files, which are sorted by
+    severity, and the shards of several executions (e.g. parallel
+    workers) can be merged into a report with a k-way merge (check
+    *write_shard* and *merge_shards*, and the args "shard" and
+    "merge_shards").
+
+    The execution, the time that the lifecycle of each module took and
+    the threats can be stored in a SQLite database (check
+    *auxiliary_modules.results_store* and the arg "results_database"),
+    which can be queried later with *boa_query.py*.
+
     Raises:
         BOAReportException: this exception could be raised
             anywhere in the class.
@@ -35,29 +69,186 @@ class BOAReportAbstract:
             severity_enum (type): enumeration which will be used
                 for the threats severity. It has to inherit from
                 *SeverityBase* but not be *SeverityBase*.
+            args (dict): report args.
 
         Raises:
             BOAReportEnumTypeNotExpected: when *severity_enum* is
                 not a type of *SeverityBase* or is *SeverityBase*.
             TypeError: when *severity_enum* is not a type or at
                 least not an expected instance.
+            OSError: when a stream or the baseline could not be opened.
+            BOAReportException: when an argument has not a valid value.
         """
-        self.who = []
-        self.description = []
-        self.severity = []
-        self.advice = []
-        self.rows = []
-        self.cols = []
-        self.summary = {}
+        self._summary = {}              # {who: [threat tuple]}
+        self.unsorted_threats = {}      # {who: [threat tuple]} added, but not sorted yet
+        self.is_summary_sorted = {}     # {who: bool} if the threats of who are sorted by severity
+        self.valid_who = set()          # Modules which passed the regex
         self.severity_enum = severity_enum
         self.severity_enum_mapping = {}
         self.args = args
         self.who_i_am = get_name_from_class_instance(self)
+        self.streams = []
+        self.target = None
+        self.rules_file = None
+        self.started = time.time()
+        self.module_timings = {}        # {who: seconds}
+        self.deduplicate = False
+        self.baseline = None
+        self.threat_index = None        # Fingerprints of the added threats
 
         if (not issubclass(severity_enum, SeverityBase) or
                 severity_enum is SeverityBase):
             raise BOAReportEnumTypeNotExpected()
 
+        if isinstance(getattr(ArgsManager, "args", None), argparse.Namespace):
+            self.target = ArgsManager.args.target
+            self.rules_file = ArgsManager.args.rules_file
+
+        self.initialize_streams()
+        self.initialize_threat_index()
+
+    def initialize_streams(self):
+        """It opens the streams which are defined in the args. The
+        streams are shared by all the reports (check
+        *auxiliary_modules.threat_streams.get_stream*).
+
+        Raises:
+            OSError: when a stream could not be opened.
+        """
+        if not isinstance(self.args, dict):
+            return
+
+        if is_key_in_dict(self.args, "stream_jsonl"):
+            self.streams.append(threat_streams.get_stream(
+                threat_streams.ThreatStreamConstants.format_jsonl, self.args["stream_jsonl"]))
+        if is_key_in_dict(self.args, "stream_sarif"):
+            self.streams.append(threat_streams.get_stream(
+                threat_streams.ThreatStreamConstants.format_sarif, self.args["stream_sarif"],
+                self.target))
+
+    def initialize_threat_index(self):
+        """It initializes the deduplication and the baseline of the
+        threats which are defined in the args. The baseline is loaded
+        once and shared by all the reports (check
+        *auxiliary_modules.threat_index.get_threat_index*).
+
+        Raises:
+            OSError: when the baseline could not be read.
+            BOAReportException: when an argument has not a valid value.
+        """
+        if not isinstance(self.args, dict):
+            return
+
+        if is_key_in_dict(self.args, "deduplicate"):
+            if self.args["deduplicate"].lower() not in ("true", "false"):
+                raise BOAReportException("the argument 'deduplicate' only allows the values 'true' or 'false'")
+
+            self.deduplicate = self.args["deduplicate"].lower() == "true"
+        if is_key_in_dict(self.args, "threat_baseline"):
+            self.baseline = threat_index.get_threat_index(self.args["threat_baseline"])
+
+        if (self.deduplicate or is_key_in_dict(self.args, "threat_index")):
+            self.threat_index = threat_index.ThreatIndex()
+
+    def close_streams(self):
+        """It closes the streams. It should be invoked once all the
+        threats have been added to the reports.
+        """
+        for stream in self.streams:
+            stream.close()
+
+        self.streams = []
+
+    def close(self):
+        """It closes the streams and stores the fingerprints of the
+        threats (the fingerprints of the baseline are stored as well,
+        so the stored index can be used as baseline of the next
+        executions), the shard of the report (arg "shard") and the
+        results of the execution (arg "results_database"). It should
+        be invoked on the final report once all the threats have been
+        added.
+
+        Raises:
+            OSError: when the fingerprints or the shard could not be stored.
+            sqlite3.Error: when the results could not be stored.
+        """
+        self.close_streams()
+
+        if (isinstance(self.args, dict) and is_key_in_dict(self.args, "shard")):
+            self.write_shard(self.args["shard"])
+
+        if (isinstance(self.args, dict) and is_key_in_dict(self.args, "threat_index")):
+            if self.baseline is not None:
+                for fingerprint in self.baseline.fingerprints:
+                    self.threat_index.add(fingerprint)
+
+            self.threat_index.store(self.args["threat_index"])
+
+        if (isinstance(self.args, dict) and is_key_in_dict(self.args, "results_database")):
+            self.store_results(self.args["results_database"])
+
+    def set_module_timing(self, who, seconds):
+        """It sets the time that the lifecycle of a module took.
+
+        Arguments:
+            who (str): module name (i.e. "module_name.class_name").
+            seconds (float): time.
+        """
+        self.module_timings[who] = seconds
+
+    def store_results(self, path):
+        """It stores the execution, the time that the lifecycle of each
+        module took and the threats of the report in a database.
+
+        Arguments:
+            path (str): path of the database.
+
+        Returns:
+            int: id of the execution in the database
+
+        Raises:
+            sqlite3.Error: when the results could not be stored.
+        """
+        threats = (threat for who in self.summary for threat in self.summary[who])
+
+        with results_store.ResultsStore(path) as store:
+            return store.store_run(self.started, time.time(), self.target, self.rules_file,
+                                   str(Meta.version), threats, self.module_timings)
+
+    @property
+    def summary(self):
+        """Threat records by module (i.e. "module_name.class_name"). The
+        threats which were added sorting by severity are sorted now.
+
+        Returns:
+            dict: summary of threat records
+        """
+        for who in list(self.unsorted_threats.keys()):
+            self.sort_threats(who)
+
+        return self._summary
+
+    def sort_threats(self, who):
+        """It sorts the threats of a module which were added sorting by
+        severity but have not been sorted yet. The sort is stable, so the
+        result is the same that inserting them one by one after the
+        threats with higher or equal severity.
+
+        Arguments:
+            who (str): module.
+        """
+        if not is_key_in_dict(self.unsorted_threats, who):
+            return
+
+        threats = self.unsorted_threats.pop(who)
+
+        if not is_key_in_dict(self._summary, who):
+            # The threats of the module were removed
+            self._summary[who] = []
+
+        self._summary[who].extend(threats)
+        self._summary[who].sort(key=lambda threat: threat[2], reverse=True)
+
     @abstractmethod
     def pretty_print_tuple(self, t, first_time=False, reported_by=False, display=True):
         """It prints a pretty line about a found threat record.
@@ -78,6 +269,10 @@ class BOAReportAbstract:
         7. type: SeverityBase type which will be used to display
             the severity. This value is intented to be able to
             join different Report instances.
+        8. str (optional): signature of the threat, which identifies
+            it instead of the description when the fingerprint is
+            computed (check *auxiliary_modules.threat_index*). It is
+            *None* if not provided.
 
         Arguments:
             t (tuple): threat record.
@@ -117,7 +312,7 @@ class BOAReportAbstract:
         Returns:
             str: text to be displayed
         """
-        if who not in self.who:
+        if who not in self.summary:
             raise BOAReportWhoNotFound()
 
     @abstractmethod
@@ -137,7 +332,10 @@ class BOAReportAbstract:
             display (bool): if *True*, it displays the threat.
 
         Returns:
-            str: text to be displayed
+            str: text to be displayed. The reports which write the
+            threats to a file while they are generated (e.g.
+            *BOARBasicHTML*) return the path of the file instead, so
+            the whole document is never kept in memory
         """
 
     def get_who(self):
@@ -147,9 +345,10 @@ class BOAReportAbstract:
             list (str): list containing the modules which are in the
             current report
         """
-        return self.who
+        return list(self.summary.keys())
 
-    def add(self, who, description, severity, advice=None, row=None, col=None, sort_by_severity=True, severity_enum=None):
+    def add(self, who, description, severity, advice=None, row=None, col=None, sort_by_severity=True, severity_enum=None, stream=True,
+            signature=None):
         """It adds a new record to the main report.
 
         Arguments:
@@ -167,6 +366,13 @@ class BOAReportAbstract:
                 for the threats severity. This arg is intended to
                 be able to join different Report instances. Default
                 is *None* which means to use *self.severity_enum*.
+            stream (bool): if *True*, the threat will be written to the
+                streams. The default value is *True*.
+            signature (str): signature of the threat (e.g. the crash
+                signature of a dynamic module), which is used instead
+                of the description in order to identify the threat
+                when the description contains values which change in
+                each execution. It is optional.
         Returns:
             int: status code
         """
@@ -193,56 +399,113 @@ class BOAReportAbstract:
                 (row is not None and
                  not isinstance(row, int)) or
                 (col is not None and
-                 not isinstance(col, int))):
+                 not isinstance(col, int)) or
+                (signature is not None and
+                 not isinstance(signature, str))):
             return Error.error_report_args_not_expected_type
 
-        who_regex_result = re.match(Regex.regex_general_module_class_name, who)
+        rtn_code = self.check_who(who, severity_enum)
 
-        if who_regex_result is None:
-            return Error.error_report_who_regex_fail
+        if rtn_code != Meta.ok_code:
+            return rtn_code
+
+        threat_tuple = (who,
+                        description,
+                        severity,
+                        advice,
+                        row,
+                        col,
+                        severity_enum,
+                        signature)
+
+        return self.add_threat(threat_tuple, sort_by_severity, stream)
+
+    def check_who(self, who, severity_enum):
+        """It checks the name of a module and its severity enumeration,
+        and initializes the structures of the module the first time. The
+        regex is only checked the first time for each module.
+
+        Arguments:
+            who (str): module name in format "module_name.class_name".
+            severity_enum (type): severity enumeration of the module.
+
+        Returns:
+            int: status code
+        """
+        if who not in self.valid_who:
+            who_regex_result = re.match(Regex.regex_general_module_class_name, who)
+
+            if who_regex_result is None:
+                return Error.error_report_who_regex_fail
+
+            self.valid_who.add(who)
 
         if not is_key_in_dict(self.severity_enum_mapping, who):
             self.severity_enum_mapping[who] = severity_enum
         elif self.severity_enum_mapping[who] != severity_enum:
             return Error.error_report_severity_enum_does_not_match
 
-        self.who.append(who)
-        self.description.append(description)
-        self.severity.append(severity)
-        self.advice.append(advice)
-        self.rows.append(row)
-        self.cols.append(col)
-
-        if not is_key_in_dict(self.summary, who):
+        if not is_key_in_dict(self._summary, who):
             # If it is the first threat found by the module, create a list to iterate after
-            self.summary[who] = []
-
-        added = False
-        threat_tuple = (self.who[-1],
-                        self.description[-1],
-                        self.severity[-1],
-                        self.advice[-1],
-                        self.rows[-1],
-                        self.cols[-1],
-                        severity_enum)
-
-        if sort_by_severity:
-            index = 0
+            self._summary[who] = []
+            self.is_summary_sorted[who] = True
 
-            # Iterate to find the first element whose severity is lesser than current
-            while index < len(self.summary[who]):
-                threat = self.summary[who][index]
+        return Meta.ok_code
+
+    def add_threat(self, threat_tuple, sort_by_severity=True, stream=True):
+        """It adds a threat record whose module has been checked with
+        *check_who* and whose values have the expected types.
+
+        Arguments:
+            threat_tuple (tuple): threat record (check *pretty_print_tuple*).
+            sort_by_severity (bool): check *add*.
+            stream (bool): check *add*.
 
-                if threat[2] < self.severity[-1]:
-                    self.summary[who].insert(index, threat_tuple)
-                    added = True
-                    break
+        Returns:
+            int: status code
+        """
+        who = threat_tuple[0]
+        severity = threat_tuple[2]
+
+        if (self.baseline is not None or self.threat_index is not None):
+            fingerprint = threat_index.get_fingerprint(threat_tuple, self.target)
+
+            if (self.baseline is not None and fingerprint in self.baseline):
+                logging.debug("'%s': threat suppressed by the baseline: %s", self.who_i_am, fingerprint)
+
+                return Meta.ok_code
+            if (self.threat_index is not None and not self.threat_index.add(fingerprint) and
+                    self.deduplicate):
+                return Meta.ok_code
+
+        if stream:
+            for threat_stream in self.streams:
+                threat_stream.write(threat_tuple)
+
+        if (sort_by_severity and self.is_summary_sorted.get(who, True)):
+            # The threats will be sorted when they are requested
+            if not is_key_in_dict(self.unsorted_threats, who):
+                self.unsorted_threats[who] = []
+
+            self.unsorted_threats[who].append(threat_tuple)
+        elif sort_by_severity:
+            # The threats are not sorted because some of them were not added sorting by
+            #  severity: iterate to find the first element whose severity is lesser than current
+            threats = self.summary[who]
+            index = 0
 
+            while (index < len(threats) and threats[index][2] >= severity):
                 index += 1
 
-        if (not sort_by_severity or not added):
+            threats.insert(index, threat_tuple)
+        else:
+            threats = self.summary[who]
+
+            if (len(threats) != 0 and threats[-1][2] < severity):
+                self.is_summary_sorted[who] = False
+
             # Append the tuple with all the threat information
-            self.summary[who].append(threat_tuple)
+            threats.append(threat_tuple)
 
         return Meta.ok_code
 
@@ -284,8 +547,16 @@ class BOAReportAbstract:
             raise TypeError()
 
         for who_list in report_instance.summary.values():
+            if len(who_list) == 0:
+                continue
+
+            # The threats were checked by the other report, so only the module is checked
+            tmp_rtn_code = self.check_who(who_list[0][0], who_list[0][6])
+
             for t in who_list:
-                tmp_rtn_code = self.add(t[0], t[1], t[2], t[3], t[4], t[5], sort_by_severity, t[6])
+                if tmp_rtn_code == Meta.ok_code:
+                    # The threats were already written to the streams by the other report
+                    tmp_rtn_code = self.add_threat(t, sort_by_severity, stream=False)
 
                 if tmp_rtn_code != Meta.ok_code:
                     logging.error("could not append the element: %s", t)
@@ -307,6 +578,89 @@ class BOAReportAbstract:
 
         return rtn_code
 
+    def write_shard(self, path):
+        """It writes the threats to a shard file sorted by severity
+        (check *auxiliary_modules.report_shards*).
+
+        Arguments:
+            path (str): path of the shard.
+
+        Returns:
+            int: number of written threats
+
+        Raises:
+            OSError: if the shard could not be written.
+        """
+        threats = []
+
+        for who, who_list in self.summary.items():
+            if not self.is_summary_sorted[who]:
+                who_list = sorted(who_list, key=lambda threat: threat[2], reverse=True)
+
+            threats.append(who_list)
+
+        # The threats of each module are sorted, so they are merged instead of sorted
+        threats = heapq.merge(*threats, key=lambda threat: threat[2], reverse=True)
+
+        return report_shards.write_shard(path, threats, self.severity_enum_mapping)
+
+    def merge_shards(self, paths=None):
+        """It merges shard files in the report. The shards are merged with
+        a k-way merge by severity, so only one threat of each shard is read
+        at the same time, and the threats are added without checking them
+        again, except the name and severity enumeration of each module.
+
+        Arguments:
+            paths (list): paths of the shards. If *None*, the arg
+                "merge_shards" will be used, which contains glob patterns
+                separated by ','.
+
+        Returns:
+            int: status code
+
+        Raises:
+            OSError: if some shard could not be read.
+            ValueError: if some file is not a shard or a module has
+                different severity enumerations in different shards.
+        """
+        if paths is None:
+            paths = []
+
+            if (isinstance(self.args, dict) and is_key_in_dict(self.args, "merge_shards")):
+                for pattern in self.args["merge_shards"].split(","):
+                    paths.extend(sorted(glob.glob(pattern.strip())))
+
+        if len(paths) == 0:
+            return Meta.ok_code
+
+        severity_enum_mapping, threats = report_shards.merge_shards(paths)
+
+        for who, severity_enum in severity_enum_mapping.items():
+            if (is_key_in_dict(self.severity_enum_mapping, who) and
+                    self.severity_enum_mapping[who] != severity_enum):
+                logging.error("could not merge the threats of the module '%s': the severity"
+                              " enumeration does not match", who)
+
+                return Error.error_report_append_failed
+
+        checked_who = set()
+
+        for threat in threats:
+            if threat[0] not in checked_who:
+                rtn_code = self.check_who(threat[0], threat[6])
+
+                if rtn_code != Meta.ok_code:
+                    logging.error("could not merge the threats of the module '%s'", threat[0])
+
+                    return Error.error_report_append_failed
+
+                checked_who.add(threat[0])
+
+            # The threats were already written to the streams by the execution which created the shard
+            self.add_threat(threat, stream=False)
+
+        return Meta.ok_code
+
     def set_severity_enum_mapping(self, who, severity_enum_instance):
         """It sets the relation between a module and a severity enum.
 
@@ -1,11 +1,19 @@
-
 """This file contains the implementation of the necessary
 methods of the report abstract class. This report class
 uses HTML files to report about the found threats.
+
+The report is written to the file while it is generated, so the
+whole document is never kept in memory. The modules with more threats
+than the threats per page (arg "threats_per_page") are written to
+separate pages which are linked from the main file, so the browsers
+do not need to load a huge page. A text field which filters the rows
+of the tables in the browser is added to each page (arg "filter").
 """
 
 # Std libs
 from datetime import datetime
+import io
+import os
 import logging
 
 # Own libs
@@ -20,6 +28,9 @@ class BOARBasicHTML(BOAReportAbstract):
     the found threats and interact with the HTML file.
     """
 
+    # Max. number of threats of each page if the arg "threats_per_page" is not defined
+    default_threats_per_page = 1000
+
     def pretty_print_tuple(self, t, first_time=False, reported_by=False, display=True):
         """It prints a pretty line about a found threat record.
 
@@ -92,11 +103,26 @@ f"""                    <td>{who}</td>
         """
         super().display(who, display)
 
+        inner_html = io.StringIO()
+
+        self.write_table(inner_html, who, self.summary[who], len(self.summary[who]))
+
+        return inner_html.getvalue()
+
+    def write_table(self, f, who, threats, total_threats):
+        """It writes the HTML table of the threats of a module row by row.
+
+        Arguments:
+            f (file): file where the table will be written.
+            who (str): the module which found the threats.
+            threats (list): threat records which will be written.
+            total_threats (int): value of the footer of the table.
+        """
         first_time = True
         # Add HTML table header
-        inner_html = \
+        f.write(
 f"""        <h3>{who}</h3>
-        <table>
+        <table class="threats">
             <thead>
                 <tr>
                     <th>Who</th>
@@ -108,34 +134,134 @@ f"""        <h3>{who}</h3>
                 </tr>
             </thead>
             <tbody>
-"""
+""")
 
-        for threat in self.summary[who]:
-            inner_html +=\
+        for threat in threats:
+            f.write(
 f"""                <tr>
 {self.pretty_print_tuple(threat, first_time, display=False)}
-                </tr>"""
+                </tr>
+""")
             first_time = False
-            inner_html += "\n"
 
         # Close HTML tags and append footer with found threats
-        inner_html += \
+        f.write(
 f"""            </tbody>
             <tfoot>
                 <tr>
                     <td colspan="5">Total threats:</td>
-                    <td>{len(self.summary[who])}</td>
+                    <td>{total_threats}</td>
                 </tr>
             </tfoot>
-        </table>"""
+        </table>""")
 
-        return inner_html
+    def write_header(self, f, title="BOA - Report"):
+        """It writes the initial HTML tags, the style and, optionally,
+        the filter of the tables.
+
+        Arguments:
+            f (file): file.
+            title (str): title of the page.
+        """
+        f.write(
+f"""<!DOCTYPE html>
+<html lang="en">
+    <head>
+        <title>{title}</title>
+        <meta charset="utf-8" />
+        <style>
+            table, th, td{{
+                border: 1px solid black;
+            }}
+
+            td{{
+                padding: 5px;
+            }}
+
+            tfoot{{
+                font-weight: bold;
+            }}
+        </style>
+    </head>
+    <body>
+        <h1>{title}</h1>
+
+""")
+
+        if self.is_filter_enabled():
+            f.write(
+"""        <input type="text" placeholder="Filter threats" onkeyup="filterThreats(this.value)" />
+        <script>
+            function filterThreats(value){
+                value = value.toLowerCase();
+
+                document.querySelectorAll("table.threats tbody tr").forEach(function(row){
+                    row.style.display = row.textContent.toLowerCase().includes(value) ? "" : "none";
+                });
+            }
+        </script>
+
+""")
+
+    @staticmethod
+    def write_footer(f):
+        """It writes the closing HTML tags.
+
+        Arguments:
+            f (file): file.
+        """
+        f.write(
+"""
+    </body>
+</html>""")
+
+    def is_filter_enabled(self):
+        """It returns if the filter of the tables has to be added.
+
+        Returns:
+            bool: value of the arg "filter". The default value is *True*
+
+        Raises:
+            BOAReportException: if the arg has not a valid value.
+        """
+        if not is_key_in_dict(self.args, "filter"):
+            return True
+        if self.args["filter"].lower() not in ("true", "false"):
+            raise BOAReportException("the argument 'filter' only allows the values 'true' or 'false'")
+
+        return self.args["filter"].lower() == "true"
+
+    def get_threats_per_page(self):
+        """It returns the maximum number of threats of each page.
+
+        Returns:
+            int: value of the arg "threats_per_page". The default value
+            is *default_threats_per_page*
+
+        Raises:
+            BOAReportException: if the arg has not a valid value.
+        """
+        if not is_key_in_dict(self.args, "threats_per_page"):
+            return self.default_threats_per_page
+
+        try:
+            threats_per_page = int(self.args["threats_per_page"])
+        except ValueError as e:
+            raise BOAReportException("the argument 'threats_per_page' has to be an integer") from e
+
+        if threats_per_page <= 0:
+            raise BOAReportException("the argument 'threats_per_page' has to be greater than 0")
+
+        return threats_per_page
 
     def display_all(self, print_summary=True, display=True):
         """It displays all the threats from all the modules.
         Moreover, it prints a summary at the end optionally.
         All in HTML format.
 
+        The HTML is written to the file while it is generated
+        (check *write_report*), so the text is not returned.
+
         Arguments:
             print_summary (bool): if *True*, it prints a
                 summary with statistics about all the found
@@ -143,45 +269,57 @@ f"""            </tbody>
             display (bool): if *True*, it displays the threat.
 
         Returns:
-            str: text to be displayed in HTML format.
+            str: path of the HTML file. If the file could not be
+            generated, *None* will be returned
+        """
+        try:
+            path = self.get_path()
+            threats_per_page = self.get_threats_per_page()
+
+            with open(path, "w") as f:
+                self.write_report(f, path, threats_per_page, print_summary)
+
+            logging.info("report: HTML report generated at '%s'", path)
+        except Exception as e:
+            logging.error("BOARBasicHTML: %s", str(e))
+
+            return None
+
+        return path
+
+    def write_report(self, f, path, threats_per_page, print_summary=True):
+        """It writes the main HTML file. The tables of the modules which
+        have more threats than *threats_per_page* are written to pages
+        and the main file contains the links to them.
+
+        Arguments:
+            f (file): main file.
+            path (str): path of the main file.
+            threats_per_page (int): maximum number of threats of each table.
+            print_summary (bool): if *True*, it prints a
+                summary with statistics about all the found
+                threats.
+
+        Raises:
+            OSError: if some page could not be written.
         """
         total_threats = 0
-        who = list(self.summary.keys())
-        index = 0
-        # Initial HTML tags and style
-        inner_html =\
-"""<!DOCTYPE html>
-<html lang="en">
-    <head>
-        <title>BOA - Report</title>
-        <meta charset="utf-8" />
-        <style>
-            table, th, td{
-                border: 1px solid black;
-            }
 
-            td{
-                padding: 5px;
-            }
+        self.write_header(f)
 
-            tfoot{
-                font-weight: bold;
-            }
-        </style>
-    </head>
-    <body>
-        <h1>BOA - Report</h1>
+        for module_index, who in enumerate(self.summary.keys()):
+            threats = self.summary[who]
 
-"""
+            if len(threats) <= threats_per_page:
+                self.write_table(f, who, threats, len(threats))
+            else:
+                self.write_pages(f, path, module_index, who, threats, threats_per_page)
 
-        while index < len(who):
-            inner_html += self.display(who[index], False)
-            total_threats += len(self.summary[who[index]])
-            index += 1
+            total_threats += len(threats)
 
         # Print summary
         if print_summary:
-            inner_html +=\
+            f.write(
 f"""
         <h2>Summary</h2>
         <table>
@@ -197,48 +335,78 @@ f"""
                     <td>{total_threats}</td>
                 </tr>
             </tbody>
-        </table>"""
+        </table>""")
 
-        # Close HTML tags
-        inner_html +=\
-"""
-    </body>
-</html>"""
+        self.write_footer(f)
 
-        # Save inner HTML in a file
-        self.save_html(inner_html)
+    def write_pages(self, f, path, module_index, who, threats, threats_per_page):
+        """It writes the threats of a module to pages and the links to
+        the pages to the main file.
 
-        return inner_html
+        Arguments:
+            f (file): main file.
+            path (str): path of the main file. The pages are written
+                in the same directory.
+            module_index (int): index of the module (used in the name
+                of the pages).
+            who (str): the module which found the threats.
+            threats (list): threat records of the module.
+            threats_per_page (int): maximum number of threats of each page.
+
+        Raises:
+            OSError: if some page could not be written.
+        """
+        root, extension = os.path.splitext(path)
+        pages = (len(threats) + threats_per_page - 1) // threats_per_page
+
+        f.write(
+f"""        <h3>{who}</h3>
+        <p>Total threats: {len(threats)}</p>
+        <ul>
+""")
+
+        for page in range(1, pages + 1):
+            page_path = f"{root}_{module_index + 1}_{page}{extension}"
+            first = (page - 1) * threats_per_page
+
+            with open(page_path, "w") as page_file:
+                self.write_header(page_file, f"BOA - Report - {who} ({page}/{pages})")
 
-    def save_html(self, inner_html):
-        """It saves the HTML content in the expectified file.
+                page_file.write(f"        <p><a href=\"{os.path.basename(path)}\">Index</a></p>\n")
+
+                self.write_table(page_file, who, threats[first:first + threats_per_page], len(threats))
+                self.write_footer(page_file)
+
+            f.write(f"            <li><a href=\"{os.path.basename(page_path)}\">Page {page}"
+                    f" (threats {first + 1}-{min(first + threats_per_page, len(threats))})</a></li>\n")
+
+        f.write("        </ul>")
+
+    def get_path(self):
+        """It returns the path of the HTML file.
 
         Args "absolute_path" and "filename" has to be defined
         in the rules file.
 
-        Arguments:
-            inner_html (str): HTML content.
-        """
-        try:
-            path = None
-
-            if (not is_key_in_dict(self.args, "absolute_path") or
-                    not is_key_in_dict(self.args, "filename")):
-                raise BOAReportException("'absolute_path' and 'filename' has to be defined as args")
+        Returns:
+            str: path
 
-            if is_key_in_dict(self.args, "prefix_time"):
-                if self.args["prefix_time"].lower() == "true":
-                    now = datetime.now().strftime('%d-%m-%Y_%H:%M:%S')
+        Raises:
+            BOAReportException: if the args are not defined.
+        """
+        path = None
 
-                    path = f"{self.args['absolute_path']}/{now}{self.args['filename']}"
+        if (not is_key_in_dict(self.args, "absolute_path") or
+                not is_key_in_dict(self.args, "filename")):
+            raise BOAReportException("'absolute_path' and 'filename' has to be defined as args")
 
-            if path is None:
-                path = f"{self.args['absolute_path']}/{self.args['filename']}"
+        if is_key_in_dict(self.args, "prefix_time"):
+            if self.args["prefix_time"].lower() == "true":
+                now = datetime.now().strftime('%d-%m-%Y_%H:%M:%S')
 
-            file = open(path, "w")
+                path = f"{self.args['absolute_path']}/{now}{self.args['filename']}"
 
-            file.write(inner_html)
+        if path is None:
+            path = f"{self.args['absolute_path']}/{self.args['filename']}"
 
-            logging.info("report: HTML report generated at '%s'", path)
-        except Exception as e:
-            logging.error("BOARBasicHTML: %s", str(e))
+        return path
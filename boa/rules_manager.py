@@ -14,12 +14,20 @@ Each rules file should contain a complete analysis
 technique defined. If multiple modules are being used,
 this should be to reach the goal of execute a complex
 but concrete analysis.
+
+The rules which passed the checking can be stored in a cache directory
+and loaded from it in the next executions (check
+*RulesManager.load_cache*), so the rules file is not parsed and checked
+again unless it (or BOA) changed. The cached rules are pickled, so they
+are signed and the cache directory is not used if it can be modified by
+other users (check *auxiliary_modules.signed_cache*).
 """
 
 # Std libs
 import os
 import re
 import copy
+import hashlib
 import logging
 
 # 3rd libs
@@ -29,6 +37,7 @@ import xmltodict
 from constants import Meta, Error, Other, Regex
 from utils import is_key_in_dict, get_index_if_match_element_in_tuples
 from exceptions import BOARulesUnexpectedFormat, BOARulesIncomplete, BOARulesError
+import auxiliary_modules.signed_cache as signed_cache
 
 class RulesManager:
     """RulesManager class.
@@ -37,13 +46,16 @@ class RulesManager:
     check and process the rules from a file.
     """
 
-    def __init__(self, rules_file):
+    def __init__(self, rules_file, cache_directory=None):
         """It initializes the necessary variables.
 
         Arguments:
             rules_file (str): path to the rules file.
+            cache_directory (str): directory where the checked rules
+                will be cached. If *None*, the rules will not be cached.
         """
         self.rules_file_path = rules_file
+        self.cache_directory = cache_directory
         self.file = None
         self.xml = None
         self.xml_str = None
@@ -79,10 +91,7 @@ class RulesManager:
         """
         try:
             self.xml = self.file.readlines()
-            self.xml_str = ''
-
-            for line in self.xml:
-                self.xml_str += line.replace("\n", "")
+            self.xml_str = "".join([line.replace("\n", "") for line in self.xml])
 
             self.rules = xmltodict.parse(self.xml_str)
         except Exception as e:
@@ -104,6 +113,99 @@ class RulesManager:
 
         return Meta.ok_code
 
+    def get_cache_path(self):
+        """It returns the path of the cached rules. The name of the file
+        is the hash of the content of the rules file, the BOA version and
+        this file, so the cached rules are not used if any of them changed.
+        The cache directory is created if it does not exist.
+
+        Returns:
+            str: path. If there is no cache directory, *None* will be returned
+
+        Raises:
+            OSError: if the rules file could not be read or the cache
+                directory could not be created.
+            auxiliary_modules.signed_cache.SignedCacheError: if the cache
+                directory can not be trusted.
+        """
+        if self.cache_directory is None:
+            return None
+
+        signed_cache.check_directory(self.cache_directory)
+
+        rules_hash = hashlib.sha256()
+
+        for path in (self.rules_file_path, __file__):
+            with open(path, "rb") as f:
+                rules_hash.update(hashlib.sha256(f.read()).digest())
+
+        rules_hash.update(str(Meta.version).encode("utf-8"))
+
+        return os.path.join(self.cache_directory, f"{rules_hash.hexdigest()}.rules.pickle")
+
+    def load_cache(self):
+        """It loads the checked rules and the processed args from the
+        cache instead of reading and checking the rules file. The cached
+        rules which are not valid (e.g. the signature does not match) are
+        not used, like if they were not cached.
+
+        Returns:
+            bool: *True* if the rules were loaded; *False* otherwise
+        """
+        try:
+            path = self.get_cache_path()
+
+            if path is None:
+                return False
+
+            with open(path, "rb") as f:
+                entry = f.read()
+
+            cache = signed_cache.loads(entry, signed_cache.get_key(self.cache_directory),
+                                       os.path.basename(path))
+
+            self.rules = cache["rules"]
+            self.args = cache["args"]
+            self.dependencies = cache["dependencies"]
+            self.report_args = cache["report_args"]
+            self.runner_args = cache["runner_args"]
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logging.warning("could not load the cached rules: %s", str(e))
+            return False
+
+        return True
+
+    def store_cache(self):
+        """It stores the checked rules and the processed args in the
+        cache. It should be invoked once the rules passed the checking.
+        """
+        path = None
+        tmp_path = None
+
+        try:
+            path = self.get_cache_path()
+
+            if path is None:
+                return
+
+            key = signed_cache.get_key(self.cache_directory)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            cache = {"rules": self.rules, "args": self.args, "dependencies": self.dependencies,
+                     "report_args": self.report_args, "runner_args": self.runner_args}
+
+            with open(tmp_path, "wb") as f:
+                f.write(signed_cache.dumps(cache, key, os.path.basename(path)))
+
+            # Atomic in order to avoid races between processes
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logging.warning("could not store the rules in the cache: %s", str(e))
+
+            if (tmp_path is not None and os.path.isfile(tmp_path)):
+                os.remove(tmp_path)
+
     # This method will be called by 'check_rules_arg' with the
     #   purpose of get recursively the args from the rules file
     def check_rules_arg_recursive(self, arg, element, father, arg_reference,
@@ -58,11 +58,7 @@ class BOAPMJavalang(BOAParserModuleAbstract):
 
         # Read file
         try:
-            lines = file_desc.readlines()
-            self.code = ""
-
-            for line in lines:
-                self.code += line
+            self.code = file_desc.read()
         except Exception as e:
             raise BOAPMParseError(f"could not read the file '{self.path_to_file}'") from e
 
@@ -0,0 +1,78 @@
+"""BOA Parser Module for Java projects with Javalang.
+
+Language: Java.
+
+The target is expected to be a directory, and all the ".java" files
+under it are analyzed (a single file is allowed as well). The files
+are not parsed here: they are parsed in a pool of processes when a
+module applies its analysis (check
+*auxiliary_modules.javalang_project.JavaProject*).
+
+Environment variables:
+
+* BOA_JAVALANG_PROCESSES: number of processes of the pool. The default
+  value is the number of CPUs.
+* BOA_JAVALANG_CACHE_DIR: directory where the ASTs will be cached by the
+  hash of the content of the files. By default, the ASTs are not cached.
+"""
+
+# Std libs
+import logging
+
+# Own libs
+from boapm_abstract import BOAParserModuleAbstract
+from exceptions import BOAPMInitializationError, BOAPMParseError
+from utils import get_environment_varibles
+from auxiliary_modules.javalang_project import JavaProject
+
+class BOAPMJavalangProject(BOAParserModuleAbstract):
+    """BOAPMJavalangProject class.
+    """
+
+    def initialize(self):
+        """It initializes the necessary variables.
+
+        Raises:
+            BOAPMInitializationError: if the environment variables
+                have not valid values.
+        """
+        self.project = None
+        self.processes = None
+        self.cache_directory = None
+
+        env_vars = get_environment_varibles(["BOA_JAVALANG_PROCESSES", "BOA_JAVALANG_CACHE_DIR"])
+
+        if "BOA_JAVALANG_PROCESSES" in env_vars:
+            try:
+                self.processes = int(env_vars["BOA_JAVALANG_PROCESSES"])
+            except ValueError as e:
+                raise BOAPMInitializationError("environment variable 'BOA_JAVALANG_PROCESSES'"
+                                               " has to be an integer") from e
+
+            if self.processes <= 0:
+                raise BOAPMInitializationError("environment variable 'BOA_JAVALANG_PROCESSES'"
+                                               " has to be greater than 0")
+        if "BOA_JAVALANG_CACHE_DIR" in env_vars:
+            self.cache_directory = env_vars["BOA_JAVALANG_CACHE_DIR"]
+
+    def parse(self):
+        """It looks for the Java files and reads them.
+        """
+        try:
+            self.project = JavaProject(self.path_to_file, self.processes, self.cache_directory)
+        except Exception as e:
+            raise BOAPMParseError(f"could not read the Java files of '{self.path_to_file}'") from e
+
+        if len(self.project.files) == 0:
+            logging.warning("'%s': no Java files were found in '%s'", self.who_i_am, self.path_to_file)
+
+    def get_project(self):
+        """It returns the project.
+
+        Returns:
+            auxiliary_modules.javalang_project.JavaProject
+        """
+        if self.project is None:
+            logging.warning("'%s': returning project = None", self.who_i_am)
+
+        return self.project
@@ -2,6 +2,21 @@
 """BOA Parser Module for Pycparser.
 
 Language: C99.
+
+Environment variables:
+
+* PYCPARSER_FAKE_LIBC_INCLUDE_PATH: path to the fake libc headers of
+  pycparser. If defined, the file is preprocessed with gcc.
+* PYCPARSER_CPP_ARGS: additional arguments of the preprocessor.
+* PYCPARSER_CPP_ARGS_SPLIT_CHAR: character which separates the arguments
+  of *PYCPARSER_CPP_ARGS* (default: ';').
+* PYCPARSER_LOWER_IR: if "true", the functions are lowered to the compact
+  IR (check *auxiliary_modules.pycparser_ir*) after the file is parsed.
+* PYCPARSER_DROP_AST: if "true", the AST is released once it has been
+  lowered to the IR in order to reduce the memory usage. It only has effect
+  if *PYCPARSER_LOWER_IR* is "true", and the callback *get_ast* cannot be
+  used if the AST has been released (the modules which need the AST would
+  not find any threat).
 """
 
 # Std libs
@@ -15,6 +30,8 @@ from boapm_abstract import BOAParserModuleAbstract
 from utils import is_key_in_dict
 from exceptions import ParseError, BOAPMParseError
 from utils import get_environment_varibles
+import auxiliary_modules.pycparser_ir as pycir
+import auxiliary_modules.pycparser_utils as pycutil
 
 class BOAPMPycparser(BOAParserModuleAbstract):
     """BOAPMPycparser class.
@@ -24,11 +41,16 @@ class BOAPMPycparser(BOAParserModuleAbstract):
         """It initializes the necessary variables.
         """
         self.ast = None
+        self.ir = None
+        self.origins = None
         self.pycparser_fake_libc_include_ev = None
         self.compiler_args = []
+        self.lower_ir = False
+        self.drop_ast = False
 
         env_vars = get_environment_varibles(["PYCPARSER_FAKE_LIBC_INCLUDE_PATH", "PYCPARSER_CPP_ARGS",
-                                             "PYCPARSER_CPP_ARGS_SPLIT_CHAR"])
+                                             "PYCPARSER_CPP_ARGS_SPLIT_CHAR", "PYCPARSER_LOWER_IR",
+                                             "PYCPARSER_DROP_AST"])
 
         if "PYCPARSER_FAKE_LIBC_INCLUDE_PATH" in env_vars:
             self.pycparser_fake_libc_include_ev = env_vars["PYCPARSER_FAKE_LIBC_INCLUDE_PATH"]
@@ -44,6 +66,14 @@ class BOAPMPycparser(BOAParserModuleAbstract):
                     split_char = env_vars["PYCPARSER_CPP_ARGS_SPLIT_CHAR"]
 
             self.compiler_args = self.compiler_args.split(split_char)
+        if "PYCPARSER_LOWER_IR" in env_vars:
+            self.lower_ir = env_vars["PYCPARSER_LOWER_IR"].lower() == "true"
+        if "PYCPARSER_DROP_AST" in env_vars:
+            self.drop_ast = env_vars["PYCPARSER_DROP_AST"].lower() == "true"
+
+            if (self.drop_ast and not self.lower_ir):
+                logging.warning("environment variable 'PYCPARSER_DROP_AST' has no effect"
+                                " if 'PYCPARSER_LOWER_IR' is not 'true'")
 
     def parse(self):
         """It parses the file and save the necessary data structures.
@@ -64,13 +94,64 @@ class BOAPMPycparser(BOAParserModuleAbstract):
                                   " #include), try defining the environment variable"
                                   f" 'PYCPARSER_FAKE_LIBC_INCLUDE_PATH' in order to solve the problem)") from e
 
+        # Origin of the external declarations
+        system_directories = []
+
+        if self.pycparser_fake_libc_include_ev is not None:
+            system_directories.append(self.pycparser_fake_libc_include_ev)
+
+        self.origins = pycutil.get_ext_origins(self.ast, self.path_to_file, system_directories)
+
+        if self.lower_ir:
+            try:
+                self.ir = pycir.lower_ast(self.ast)
+            except pycir.IRException as e:
+                raise BOAPMParseError(f"could not lower the file '{self.path_to_file}' to the IR: {e.message}") from e
+
+            if self.drop_ast:
+                self.ast = None
+
     def get_ast(self):
         """It returns the AST.
 
         Returns:
             AST (Abstract Syntax Tree)
+
+        Raises:
+            BOAPMParseError: if the AST was released once it was lowered
+                to the IR (check *PYCPARSER_DROP_AST*).
         """
+        if (self.drop_ast and self.ir is not None):
+            raise BOAPMParseError("the AST was released once it was lowered to the IR, but the callback 'get_ast'"
+                                  " was requested: the environment variable 'PYCPARSER_DROP_AST' cannot be 'true'"
+                                  " while some module needs the AST")
         if self.ast is None:
             logging.warning("'%s': returning AST = None", self.who_i_am)
 
         return self.ast
+
+    def get_origins(self):
+        """It returns the origin of the external declarations of the AST
+        (check *auxiliary_modules.pycparser_utils.get_ext_origins*).
+
+        Returns:
+            list: list of tuples of format (str, str) which contains the file
+            and the kind of origin of each external declaration
+        """
+        if self.origins is None:
+            logging.warning("'%s': returning origins = None", self.who_i_am)
+
+        return self.origins
+
+    def get_ir(self):
+        """It returns the IR of the functions.
+
+        Returns:
+            auxiliary_modules.pycparser_ir.IRModule: IR. If the environment
+            variable *PYCPARSER_LOWER_IR* is not "true", *None* will be
+            returned
+        """
+        if self.ir is None:
+            logging.warning("'%s': returning IR = None", self.who_i_am)
+
+        return self.ir
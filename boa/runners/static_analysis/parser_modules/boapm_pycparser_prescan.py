@@ -0,0 +1,144 @@
+"""BOA Parser Module for a fast prescan of C files.
+
+Language: C99.
+
+It looks for the function calls with a single pass of a lexer over
+the raw file (check *auxiliary_modules.pycparser_prescan*), so neither
+the preprocessor nor a full parse are necessary. Only when the prescan
+can not decide if an "identifier (" is a function call, *BOAPMPycparser*
+is loaded and the file is parsed in order to disambiguate.
+"""
+
+# Std libs
+import logging
+
+# Own libs
+from boapm_abstract import BOAParserModuleAbstract
+from modules_importer import ModulesImporter
+from exceptions import BOAPMInitializationError, BOAPMParseError
+from utils import get_current_path
+from auxiliary_modules.pycparser_ast_preorder_visitor import PreorderVisitor
+from auxiliary_modules.pycparser_prescan import prescan_function_calls
+
+# 3rd libs
+from pycparser.c_ast import FuncCall, ID
+
+class BOAPMPycparserPrescan(BOAParserModuleAbstract):
+    """BOAPMPycparserPrescan class.
+    """
+
+    def initialize(self):
+        """It initializes the necessary variables.
+        """
+        self.function_calls = None
+        self.ast = None
+        self.ast_parsed = False
+        # Parser used when disambiguation is needed (it is created the first
+        #  time that is needed)
+        self.pycparser = None
+
+    def get_pycparser(self):
+        """It loads and initializes *BOAPMPycparser*.
+
+        Returns:
+            BOAPMPycparser: parser of the file
+
+        Raises:
+            BOAPMInitializationError: if *BOAPMPycparser* could not be loaded
+                or initialized.
+        """
+        if self.pycparser is None:
+            pycparser_class = ModulesImporter.load_and_get_instance(
+                "boapm_pycparser", f"{get_current_path(__file__)}/boapm_pycparser.py",
+                "BOAPMPycparser")
+
+            if pycparser_class is None:
+                raise BOAPMInitializationError("could not load 'boapm_pycparser.BOAPMPycparser'")
+
+            pycparser = pycparser_class(self.path_to_file)
+
+            pycparser.initialize()
+
+            self.pycparser = pycparser
+
+        return self.pycparser
+
+    def parse(self):
+        """It looks for the function calls of the file.
+        """
+        try:
+            with open(self.path_to_file, errors="replace") as f:
+                source = f.read()
+        except OSError as e:
+            raise BOAPMParseError(f"could not read the file '{self.path_to_file}'") from e
+
+        self.function_calls = prescan_function_calls(source)
+
+    def get_function_calls(self):
+        """It returns the function calls of the file. If there are
+        ambiguous function calls, the AST will be used in order to
+        decide which of them are function calls. If the AST is not
+        available, the ambiguous function calls will be kept.
+
+        Returns:
+            list: list of *auxiliary_modules.pycparser_prescan.FunctionCallCandidate*
+        """
+        if self.function_calls is None:
+            logging.warning("'%s': returning function calls = None", self.who_i_am)
+
+            return None
+
+        ambiguous = list(filter(lambda call: call.ambiguous, self.function_calls))
+
+        if len(ambiguous) == 0:
+            return self.function_calls
+
+        ast = self.get_ast()
+
+        if ast is None:
+            logging.warning("'%s': could not disambiguate %d function calls: keeping them",
+                            self.who_i_am, len(ambiguous))
+
+            return self.function_calls
+
+        # The columns of the AST might not be the same that the columns of the file
+        #  when macros are expanded, so only the rows are taken into account
+        ast_function_calls = set()
+
+        def add_function_call(node):
+            if (isinstance(node, FuncCall) and isinstance(node.name, ID) and
+                    node.coord is not None and node.coord.file == self.path_to_file):
+                ast_function_calls.add((node.name.name, node.coord.line))
+
+        PreorderVisitor(add_function_call).visit(ast)
+
+        for call in ambiguous:
+            call.ambiguous = False
+
+        self.function_calls = list(filter(
+            lambda call: call not in ambiguous or (call.name, call.row) in ast_function_calls,
+            self.function_calls))
+
+        return self.function_calls
+
+    def get_ast(self):
+        """It returns the AST, which is parsed the first time that is needed.
+
+        Returns:
+            AST (Abstract Syntax Tree). If the file could not be parsed,
+            *None* will be returned
+        """
+        if not self.ast_parsed:
+            self.ast_parsed = True
+
+            try:
+                pycparser = self.get_pycparser()
+
+                pycparser.parse()
+
+                self.ast = pycparser.ast
+            except (BOAPMInitializationError, BOAPMParseError) as e:
+                logging.warning("'%s': could not parse the file '%s': %s",
+                                self.who_i_am, self.path_to_file, str(e))
+
+        return self.ast
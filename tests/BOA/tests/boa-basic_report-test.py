@@ -5,6 +5,12 @@ import importlib.util
 import sys
 import os
 import copy
+import json
+import shutil
+import tempfile
+import subprocess
+import argparse
+from unittest import mock
 
 def get_script_dir():
     return os.path.dirname(os.path.realpath(__file__))
@@ -46,6 +52,12 @@ class BOAReportMethods(unittest.TestCase):
         except Exception as e:
             sys.stderr.write(f"{e}\n")
 
+    def get_args(self, target, rules_file="rules.xml"):
+        # Args of BOA which are used by the reports
+        from args_manager import ArgsManager
+
+        return mock.patch.object(ArgsManager, "args", argparse.Namespace(target=target, rules_file=rules_file), create=True)
+
     def test_report_display_all(self):
         syslog_enum = self.severity_syslog
         syslog_report = self.report(syslog_enum, None)
@@ -209,5 +221,264 @@ class BOAReportMethods(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_report_threat_streams(self):
+        syslog_enum = self.severity_syslog
+        directory = tempfile.mkdtemp()
+        jsonl_file = f"{directory}/threats.jsonl"
+        sarif_file = f"{directory}/threats.sarif"
+
+        self.addCleanup(shutil.rmtree, directory)
+
+        # The target is the location of the SARIF results
+        with self.get_args("main.c"):
+            syslog_report = self.report(syslog_enum, {"stream_jsonl": jsonl_file, "stream_sarif": sarif_file})
+
+        # The threats are written to the streams as soon as they are added
+        syslog_report.add("mod.class", "description1", syslog_enum.WARNING, "advice1", 1, 1)
+        syslog_report.add("mod.class", "description2", syslog_enum.INFORMATIONAL, "advice2", 2, 2)
+        syslog_report.add("mod.class", "description3", syslog_enum.CRITICAL, "advice3", 3, 3)
+        syslog_report.close()
+
+        with open(jsonl_file) as f:
+            threats = [json.loads(line) for line in f]
+        with open(sarif_file) as f:
+            results = json.load(f)["runs"][0]["results"]
+
+        self.assertEqual(3, len(threats))
+        self.assertEqual(3, len(results))
+        self.assertEqual([(1, 1), (2, 2), (3, 3)], [(t["row"], t["col"]) for t in threats])
+        self.assertEqual([t["row"] for t in threats],
+                         [r["locations"][0]["physicalLocation"]["region"]["startLine"] for r in results])
+        self.assertEqual({"main.c"}, set(r["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] for r in results))
+
+    def test_report_threat_baseline(self):
+        import auxiliary_modules.threat_index as threat_index
+
+        syslog_enum = self.severity_syslog
+        directory = tempfile.mkdtemp()
+        baseline_file = f"{directory}/threats.baseline"
+        args = {"deduplicate": "true", "threat_baseline": baseline_file, "threat_index": baseline_file}
+        reports = []
+
+        self.addCleanup(shutil.rmtree, directory)
+
+        with open(baseline_file, "w"):
+            pass
+
+        # The baseline is empty in the first execution and contains the found threats in the second one
+        for _ in range(2):
+            # Each execution of BOA loads the baseline once
+            threat_index.__threat_indexes__.pop(baseline_file, None)
+
+            with self.get_args("main.c"):
+                syslog_report = self.report(syslog_enum, args)
+
+            syslog_report.add("mod.class", "description1", syslog_enum.WARNING, "advice1", 1, 1)
+            syslog_report.add("mod.class", "description2", syslog_enum.INFORMATIONAL, "advice2", 2, 2)
+            syslog_report.add("mod.class", "description3", syslog_enum.CRITICAL, "advice3", 3, 3)
+            syslog_report.add("mod.class", "description1", syslog_enum.WARNING, "advice1", 1, 1)
+            syslog_report.close()
+
+            with open(baseline_file) as baseline:
+                reports.append((sum(map(len, syslog_report.summary.values())), baseline.read().split()))
+
+        # The duplicated threat is only added once and the fingerprints of the baseline are kept
+        self.assertEqual(3, reports[0][0])
+        self.assertEqual(3, len(reports[0][1]))
+        self.assertEqual(0, reports[1][0])
+        self.assertEqual(reports[0][1], reports[1][1])
+
+    def test_report_threat_baseline_moved_lines(self):
+        import auxiliary_modules.threat_index as threat_index
+
+        syslog_enum = self.severity_syslog
+        directory = tempfile.mkdtemp()
+        target = f"{directory}/main.c"
+        baseline_file = f"{directory}/threats.baseline"
+        code = ["#include <string.h>",
+                "void f(char *s) {",
+                "  char buffer[8];",
+                "  strcpy(buffer, s);",
+                "}",
+                "int main(int argc, char **argv) {",
+                "  char buffer[8];",
+                "  strcpy(buffer, argv[1]);",
+                "  return 0;",
+                "}"]
+        reports = []
+
+        self.addCleanup(shutil.rmtree, directory)
+
+        with open(baseline_file, "w"):
+            pass
+
+        # A line is inserted above the threats in the second execution
+        for rows, lines in (((4, 8), code), ((5, 9), [code[0], "", *code[1:]])):
+            threat_index.__threat_indexes__.pop(baseline_file, None)
+
+            with open(target, "w") as f:
+                f.write("\n".join(lines) + "\n")
+
+            os.utime(target, ns=(len(reports), len(reports)))
+
+            with self.get_args(target):
+                syslog_report = self.report(syslog_enum, {"threat_baseline": baseline_file, "threat_index": baseline_file})
+
+            for row in rows:
+                syslog_report.add("mod.class", "strcpy", syslog_enum.WARNING, "advice", row, 3 + len(reports))
+
+            syslog_report.close()
+
+            with open(baseline_file) as baseline:
+                reports.append((sum(map(len, syslog_report.summary.values())), baseline.read().split()))
+
+        # The threats of different functions have different fingerprints
+        self.assertEqual(2, reports[0][0])
+        self.assertEqual(2, len(reports[0][1]))
+        self.assertEqual(0, reports[1][0])
+        self.assertEqual(reports[0][1], reports[1][1])
+        self.assertEqual(["f", "main", None], [threat_index.get_enclosing_function(target, row) for row in (5, 9, 1)])
+
+    def test_report_html_pages(self):
+        syslog_enum = self.severity_syslog
+        report_directory = tempfile.mkdtemp()
+        html_report = self.get_module(
+            "BOARBasicHTML",
+            f"{get_script_dir()}/../../../boa/reports/boar_basic_html.py").BOARBasicHTML
+
+        self.addCleanup(shutil.rmtree, report_directory)
+
+        syslog_report = html_report(syslog_enum, {"absolute_path": report_directory, "filename": "report.html",
+                                                  "threats_per_page": "4"})
+
+        for idx in range(6):
+            syslog_report.add("mod.class", f"description{idx}", syslog_enum.WARNING, f"advice{idx}", idx, idx)
+
+        self.assertEqual(f"{report_directory}/report.html", syslog_report.display_all(display=False))
+        self.assertEqual(["report.html", "report_1_1.html", "report_1_2.html"], sorted(os.listdir(report_directory)))
+
+        with open(f"{report_directory}/report.html") as report:
+            index = report.read()
+
+        # 6 threats: 4 in the first page and 2 in the second one
+        self.assertIn("<a href=\"report_1_1.html\">Page 1 (threats 1-4)</a>", index)
+        self.assertIn("<a href=\"report_1_2.html\">Page 2 (threats 5-6)</a>", index)
+
+        for page, rows in (("report_1_1.html", 4), ("report_1_2.html", 2)):
+            with open(f"{report_directory}/{page}") as report:
+                self.assertEqual(rows, report.read().count("<td>Threat</td>"))
+
+    def test_report_shards_merge(self):
+        from constants import Meta
+
+        syslog_enum = self.severity_syslog
+        fm_enum = self.severity_function_match
+        shard_directory = tempfile.mkdtemp()
+
+        self.addCleanup(shutil.rmtree, shard_directory)
+
+        # Each execution writes its own shard
+        syslog_report = self.report(syslog_enum, {"shard": f"{shard_directory}/0.shard"})
+        fm_report = self.report(fm_enum, {"shard": f"{shard_directory}/1.shard"})
+
+        syslog_report.add("mod1.class1", "description1", syslog_enum.WARNING, "advice1", 1, 1)
+        syslog_report.add("mod1.class1", "description2", syslog_enum.INFORMATIONAL, "advice2", 2, 2)
+        syslog_report.add("mod1.class1", "description3", syslog_enum.CRITICAL, "advice3", 3, 3)
+
+        fm_report.add("mod2.class2", "description1", fm_enum.HIGH, "advice1", 1, 1)
+        fm_report.add("mod2.class2", "description2", fm_enum.LOW, "advice2", 2, 2)
+
+        syslog_report.close()
+        fm_report.close()
+
+        with open(f"{shard_directory}/0.shard") as f:
+            self.assertEqual(1 + 3, len(f.readlines()))
+
+        # The last execution merges all of them with its own threats
+        merged_report = self.report(syslog_enum, {"merge_shards": f"{shard_directory}/*.shard"})
+
+        merged_report.add("mod1.class1", "description4", syslog_enum.ERROR, "advice4", 4, 4)
+
+        self.assertEqual(Meta.ok_code, merged_report.merge_shards())
+        self.assertEqual({"mod1.class1": [3, 4, 1, 2], "mod2.class2": [1, 2]},
+                         {who: [threat[4] for threat in threats] for who, threats in merged_report.summary.items()})
+        self.assertIs(fm_enum, merged_report.get_severity_enum_instance_by_who("mod2.class2"))
+        self.assertTrue(merged_report.display_all(display=False).endswith(" - Total threats (all modules): 6"))
+
+    def test_report_results_database(self):
+        syslog_enum = self.severity_syslog
+        database_directory = tempfile.mkdtemp()
+        database = f"{database_directory}/results.db"
+        runs = ((f"{database_directory}/a.c", "boam_function_match.BOAModuleFunctionMatch", 3),
+                (f"{database_directory}/b.c", "boam_taint_analysis.BOAModuleTaintAnalysis", 2))
+
+        self.addCleanup(shutil.rmtree, database_directory)
+
+        # The first target is analyzed twice, so its threats are not new the second time
+        for target, who, threats in runs + (runs[0],):
+            with self.get_args(target):
+                syslog_report = self.report(syslog_enum, {"results_database": database})
+
+            for idx in range(threats):
+                syslog_report.add(who, f"description{idx}", syslog_enum.WARNING, f"advice{idx}", idx, idx)
+
+            syslog_report.set_module_timing(who, 1.0)
+            syslog_report.close()
+
+        def query(*args):
+            result = subprocess.run([f"{get_script_dir()}/../../../boa/boa_query.py", database, *args], check=False, capture_output=True, text=True)
+
+            self.assertEqual(0, result.returncode, result.stderr)
+
+            return [line.split("\t") for line in result.stdout.splitlines()]
+
+        runs_stdout = query("runs")
+        new_stdout = query("new", "--since", "1h")
+        top_files_stdout = query("top-files", "--module", "taint")
+        timings_stdout = {timing[0]: timing[1] for timing in query("timings")}
+
+        self.assertEqual(["3", "2", "3"], [run[3] for run in runs_stdout])
+        self.assertEqual(5, len(new_stdout))
+        self.assertEqual([["2", f"{database_directory}/b.c"]], top_files_stdout)
+        self.assertEqual(3, len(query("new", "--since", "1h", "--module", "function_match")))
+        self.assertEqual({"boam_function_match.BOAModuleFunctionMatch": "2",
+                          "boam_taint_analysis.BOAModuleTaintAnalysis": "1"}, timings_stdout)
+
+    def test_report_results_database_not_found(self):
+        database_directory = tempfile.mkdtemp()
+        database = f"{database_directory}/results.db"
+
+        self.addCleanup(shutil.rmtree, database_directory)
+
+        # The database is opened in read-only mode, so it is not created
+        result = subprocess.run([f"{get_script_dir()}/../../../boa/boa_query.py", database, "runs"], check=False, capture_output=True, text=True)
+
+        self.assertNotEqual(0, result.returncode)
+        self.assertIn(database, result.stderr)
+        self.assertFalse(os.path.exists(database))
+
+    def test_results_store_new_threats_by_file(self):
+        import auxiliary_modules.results_store as results_store
+
+        syslog_enum = self.severity_syslog
+        directory = tempfile.mkdtemp()
+
+        self.addCleanup(shutil.rmtree, directory)
+
+        threat = ("mod.class", "description1", syslog_enum.WARNING, "advice1", 1, 1, syslog_enum)
+
+        with results_store.ResultsStore(f"{directory}/results.db") as store:
+            # The same threat in two files with the same name has different fingerprints
+            store.store_run(10.0, 11.0, f"{directory}/a/main.c", "rules.xml", "0.1", [threat])
+            store.store_run(20.0, 21.0, f"{directory}/b/main.c", "rules.xml", "0.1", [threat])
+            store.store_run(30.0, 31.0, f"{directory}/a/main.c", "rules.xml", "0.1", [threat])
+
+            new_threats = store.get_new_threats(0.0)
+
+            self.assertEqual(2, len(set(threat["fingerprint"] for threat in new_threats)))
+            self.assertEqual([(f"{directory}/b/main.c", 20.0), (f"{directory}/a/main.c", 10.0)],
+                             [(threat["file"], threat["first_seen"]) for threat in new_threats])
+            self.assertEqual([f"{directory}/b/main.c"], [threat["file"] for threat in store.get_new_threats(15.0)])
+
 if __name__ == "__main__":
     unittest.main()
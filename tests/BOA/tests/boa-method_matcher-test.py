@@ -0,0 +1,50 @@
+# Std libs
+import unittest
+
+# Own libs
+#  Your PYTHONPATH has to have the directory to BOA code (i.e. boa.py visible)
+from auxiliary_modules.method_matcher import MethodMatcher, MethodMatcherException
+
+class BOAMethodMatcher(unittest.TestCase):
+
+    def test_match(self):
+        methods = [{"method": "gets"}, {"glob": "str*cpy"}, {"regex": ".*printf"}, {"regex": "s.*"}]
+        matcher = MethodMatcher(methods)
+
+        self.assertIs(methods[0], matcher.match("gets"))
+        self.assertIs(methods[1], matcher.match("strncpy"))
+        self.assertIs(methods[2], matcher.match("sprintf"))
+        self.assertIs(methods[3], matcher.match("scanf"))
+        self.assertIsNone(matcher.match("printf_s"))
+        self.assertEqual((None, None), matcher.match_any(["x", "y"]))
+        self.assertEqual(("sprintf", methods[2]), matcher.match_any(["x", "sprintf"]))
+
+        # All the patterns are combined
+        self.assertEqual(1, len(matcher.segments))
+
+    def test_match_groups(self):
+        methods = [{"regex": "(a)\\1"}, {"glob": "str*cpy"}, {"regex": "(?P<x>b)(?P=x)"},
+                   {"regex": "(?P<x>c)(?P=x)"}, {"regex": ".*printf"}, {"regex": "(?i)S.*"}]
+        matcher = MethodMatcher(methods)
+
+        self.assertIs(methods[0], matcher.match("aa"))
+        self.assertIsNone(matcher.match("ab"))
+        self.assertIs(methods[1], matcher.match("strcpy"))
+        self.assertIs(methods[2], matcher.match("bb"))
+        self.assertIs(methods[3], matcher.match("cc"))
+        self.assertIsNone(matcher.match("bc"))
+
+        # The order of the patterns is kept
+        self.assertIs(methods[4], matcher.match("sprintf"))
+        self.assertIs(methods[5], matcher.match("scanf"))
+
+    def test_not_valid(self):
+        with self.assertRaises(MethodMatcherException):
+            MethodMatcher([{"regex": "(a"}])
+        with self.assertRaises(MethodMatcherException):
+            MethodMatcher([{"glob": "str*cpy"}, {"glob": "str*cpy"}])
+        with self.assertRaises(MethodMatcherException):
+            MethodMatcher([{"method": "gets", "regex": "gets"}])
+
+if __name__ == "__main__":
+    unittest.main()
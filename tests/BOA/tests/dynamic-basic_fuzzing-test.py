@@ -2,12 +2,19 @@
 # Std libs
 import os
 import re
+import shutil
 import unittest
 import subprocess
+import tempfile
 
 def get_script_dir():
     return os.path.dirname(os.path.realpath(__file__))
 
+def emit_threat(idx):
+    import auxiliary_modules.threat_sink as threat_sink
+
+    return threat_sink.emit("test", ("mod.class", f"threat {idx}"))
+
 class BOADynamicBasicFuzzing(unittest.TestCase):
 
     def test_basic_fuzzing_1(self):
@@ -31,5 +38,122 @@ class BOADynamicBasicFuzzing(unittest.TestCase):
 
         self.assertEqual(expected_stdout, actual_stdout_grep_stdout_after)
 
+    def test_basic_fuzzing_1_input_store(self):
+        target = "/usr/bin/false"
+        rules_file = f"{get_script_dir()}/../../../boa/rules/rules-dynamic-basic_fuzzing.xml"
+        input_store = tempfile.mkdtemp()
+
+        self.addCleanup(shutil.rmtree, input_store)
+
+        with open(rules_file) as f:
+            rules = f.read()
+
+        rules = rules.replace('<element name="iterations" value="10" />',
+                              '<element name="iterations" value="10" />\n'
+                              f'<element name="input_store" value="{input_store}" />')
+
+        with tempfile.NamedTemporaryFile("w", suffix=".xml", delete=False) as f:
+            f.write(rules)
+
+        self.addCleanup(os.remove, f.name)
+
+        actual = subprocess.run([f"{get_script_dir()}/../../../boa/boa.py", target, f.name], check=False, capture_output=True, text=True)
+        hashes = re.findall(r"the input sha256:([0-9a-f]{64}) \(b[\'\"]", actual.stdout)
+        stored_hashes = set(filename for _, _, filenames in os.walk(input_store) for filename in filenames)
+
+        # The inputs are stored once even if they are duplicated
+        self.assertEqual(10, len(hashes))
+        self.assertEqual(set(hashes), stored_hashes)
+
+    def test_basic_fuzzing_1_threat_sink(self):
+        target = "/usr/bin/false"
+        rules_file = f"{get_script_dir()}/../../../boa/rules/rules-dynamic-basic_fuzzing.xml"
+
+        with open(rules_file) as f:
+            rules = f.read()
+
+        # The threats are reported by the workers
+        rules = rules.replace('<element name="iterations" value="10" />',
+                              '<element name="iterations" value="10" />\n'
+                              '<element name="processes" value="2" />\n'
+                              '<element name="threat_sink" value="true" />\n'
+                              '<element name="threat_sink_buffer_size" value="2" />')
+
+        with tempfile.NamedTemporaryFile("w", suffix=".xml", delete=False) as f:
+            f.write(rules)
+
+        self.addCleanup(os.remove, f.name)
+
+        actual = subprocess.run([f"{get_script_dir()}/../../../boa/boa.py", target, f.name], check=False, capture_output=True, text=True)
+        actual_stdout_grep = subprocess.run(["egrep", "\\s*\\+ Threat|\\s*Severity:|\\s*Advice:"], input=actual.stdout, capture_output=True, check=False, text=True)
+
+        expected_stdout = \
+"""\
+ + Threat (-1, -1): the input b'' returned the status code 1.
+   Severity: FAILED.
+   Advice: check if the fail is not a false positive.
+""" * 10
+
+        # Remove the dynamic input
+        actual_stdout_grep_stdout_after = re.sub(r"the input b\'[^\']*\' returned the status code ([-]{0,1}[0-9]+) [^\n]*[.]\n", r"the input b'' returned the status code \g<1>.\n", actual_stdout_grep.stdout)
+
+        self.assertEqual(expected_stdout, actual_stdout_grep_stdout_after)
+
+    def test_basic_fuzzing_1_crash_fingerprint(self):
+        target = "/usr/bin/false"
+        rules_file = f"{get_script_dir()}/../../../boa/rules/rules-dynamic-basic_fuzzing.xml"
+        index_directory = tempfile.mkdtemp()
+
+        self.addCleanup(shutil.rmtree, index_directory)
+
+        with open(rules_file) as f:
+            rules = f.read()
+
+        fingerprints = []
+
+        # The inputs, the time and the faked instrumentation ids change in each execution, but the crash is the same
+        for idx in range(2):
+            report_start, report_end = rules.index("<report>"), rules.index("</report>")
+            rules_idx = rules[:report_start] + f"""<report><args><dict>
+                <element name="threat_index" value="{index_directory}/{idx}.index" />
+            </dict></args>""" + rules[report_end:]
+
+            with tempfile.NamedTemporaryFile("w", suffix=".xml", delete=False) as f:
+                f.write(rules_idx)
+
+            self.addCleanup(os.remove, f.name)
+
+            actual = subprocess.run([f"{get_script_dir()}/../../../boa/boa.py", target, f.name], check=False, capture_output=True, text=True)
+
+            self.assertEqual(0, actual.returncode)
+            self.assertEqual(10, actual.stdout.count(" + Threat"))
+
+            with open(f"{index_directory}/{idx}.index") as index:
+                fingerprints.append(index.read().split())
+
+        self.assertEqual(1, len(fingerprints[0]))
+        self.assertEqual(fingerprints[0], fingerprints[1])
+
+    def test_threat_sink_spawn(self):
+        import multiprocessing
+        import auxiliary_modules.threat_sink as threat_sink
+
+        # The registered sinks are not inherited by the workers, so the queue is provided when they are created
+        context = multiprocessing.get_context("spawn")
+        threats = []
+        sink = threat_sink.open_sink("test", threats.append, 2, context)
+        pool = context.Pool(processes=2, initializer=threat_sink.attach_sink, initargs=("test", sink.queue))
+
+        sink.start()
+
+        emitted = pool.map(emit_threat, range(10))
+
+        pool.close()
+        pool.join()
+
+        self.assertEqual(10, threat_sink.close_sink("test"))
+        self.assertEqual([True] * 10, emitted)
+        self.assertEqual(sorted(f"threat {idx}" for idx in range(10)), sorted(threat[1] for threat in threats))
+
 if __name__ == "__main__":
     unittest.main()
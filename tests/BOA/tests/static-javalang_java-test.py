@@ -0,0 +1,103 @@
+# Std libs
+import os
+import glob
+import shutil
+import pickle
+import unittest
+import tempfile
+import subprocess
+
+# Own libs
+#  Your PYTHONPATH has to have the directory to BOA code (i.e. boa.py visible)
+import auxiliary_modules.javalang_project as javalang_project
+
+def get_script_dir():
+    return os.path.dirname(os.path.realpath(__file__))
+
+class BOAStaticJavalangJava(unittest.TestCase):
+
+    def run_boa(self, target, rules_file, env=None):
+        actual = subprocess.run([f"{get_script_dir()}/../../../boa/boa.py", target, rules_file], check=False, capture_output=True, text=True, env=env)
+        actual_stdout_grep = subprocess.run(["egrep", "\\s*\\+ Threat|\\s*Severity:"], input=actual.stdout, capture_output=True, check=False, text=True)
+
+        return actual_stdout_grep.stdout
+
+    def test_functions_command_execution(self):
+        target = f"{get_script_dir()}/../../Java/synthetic/test_command_execution.java"
+        rules_file = f"{get_script_dir()}/../../../boa/rules/rules-static-function_match_javalang.xml"
+
+        expected_stdout = \
+"""\
+ + Threat (9, 45): exec: the function 'exec' allows to execute a command.
+   Severity: HIGH.
+"""
+
+        self.assertEqual(expected_stdout, self.run_boa(target, rules_file))
+
+    def test_functions_project(self):
+        target = f"{get_script_dir()}/../../Java"
+        rules_file = f"{get_script_dir()}/../../../boa/rules/rules-static-function_match_javalang_project.xml"
+        env = os.environ.copy()
+
+        env["BOA_JAVALANG_PROCESSES"] = "2"
+
+        expected_stdout = \
+"""\
+ + Threat (9, 45): synthetic/test_command_execution.java: exec: the function 'exec' allows to execute a command.
+   Severity: HIGH.
+"""
+
+        self.assertEqual(expected_stdout, self.run_boa(target, rules_file, env))
+
+    def test_parse_cache_integrity(self):
+        directory = tempfile.mkdtemp()
+
+        self.addCleanup(shutil.rmtree, directory)
+
+        code = "class A { void f() { g(); } }"
+        code_hash = javalang_project.get_code_hash(code)
+        cache = javalang_project.ParseCache(directory)
+
+        self.assertIsNone(cache.load(code_hash))
+
+        cache.store(code_hash, "ast")
+
+        self.assertEqual("ast", cache.load(code_hash))
+
+        # An entry which is not signed with the key of the directory is not unpickled
+        marker = f"{directory}/unpickled"
+
+        for path in glob.glob(f"{directory}/{code_hash}.*"):
+            with open(path, "wb") as f:
+                f.write(pickle.dumps(EvilPickle(marker)))
+
+        self.assertIsNone(cache.load(code_hash))
+        self.assertFalse(os.path.exists(marker))
+
+        # An entry can not be replaced by another one with a valid signature
+        cache.store("other", "other ast")
+
+        for path in glob.glob(f"{directory}/other.*"):
+            shutil.copyfile(path, path.replace("other", code_hash))
+
+        self.assertIsNone(cache.load(code_hash))
+
+        # A directory which is writable by others is not used
+        os.chmod(directory, 0o777)
+        self.addCleanup(os.chmod, directory, 0o700)
+
+        cache = javalang_project.ParseCache(directory)
+
+        self.assertIsNone(cache.directory)
+        self.assertIsNone(cache.load("other"))
+
+class EvilPickle:
+
+    def __init__(self, marker):
+        self.marker = marker
+
+    def __reduce__(self):
+        return (open, (self.marker, "w"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# Std libs
+import os
+import sys
+import unittest
+import importlib.util
+from unittest import mock
+
+# 3rd libs
+from pycparser import parse_file
+
+# Own libs
+#  Your PYTHONPATH has to have the directory to BOA code (i.e. boa.py visible)
+import auxiliary_modules.pycparser_utils as pycutil
+
+def get_script_dir():
+    return os.path.dirname(os.path.realpath(__file__))
+
+class BOAStaticPycparserASTLifecycle(unittest.TestCase):
+
+    def get_module(self, module, path):
+        if module in sys.modules:
+            return sys.modules[module]
+
+        spec = importlib.util.spec_from_file_location(module, path)
+
+        self.assertIsNotNone(spec, f"could lot load specification from file (module '{module}' with path '{path}')")
+
+        loaded_module = importlib.util.module_from_spec(spec)
+
+        sys.modules[module] = loaded_module
+
+        spec.loader.exec_module(loaded_module)
+
+        return loaded_module
+
+    def setUp(self):
+        lifecycles_directory = f"{get_script_dir()}/../../../boa/lifecycles"
+
+        # The lifecycles are loaded as BOA does (check ModulesImporter)
+        self.get_module("boalc_abstract", f"{lifecycles_directory}/boalc_abstract.py")
+
+        self.lifecycle = self.get_module("boalc_pycparser_ast",
+                                         f"{lifecycles_directory}/boalc_pycparser_ast.py").BOALCPycparserAST
+        self.target = f"{get_script_dir()}/../../C/real/huffman/prog6.c"
+        self.fake_libc_include = os.environ.get("PYCPARSER_FAKE_LIBC_INCLUDE_PATH",
+                                                f"{get_script_dir()}/../pycparser-2.20/utils/fake_libc_include")
+        self.ast = parse_file(self.target, use_cpp=True, cpp_path="gcc",
+                              cpp_args=["-E", f"-I{self.fake_libc_include}"])
+        self.origins = pycutil.get_ext_origins(self.ast, self.target, [self.fake_libc_include])
+
+    def get_visited_nodes(self, lifecycle_args, skip=None):
+        visited_nodes = []
+
+        def execute_method(instance, method, args, force_invocation):
+            if method == "process":
+                visited_nodes.append(args)
+
+        env = {} if skip is None else {"BOA_LC_PYCPARSER_AST_SKIP": skip}
+
+        with mock.patch.dict(os.environ, env):
+            if skip is None:
+                os.environ.pop("BOA_LC_PYCPARSER_AST_SKIP", None)
+
+            self.lifecycle(None, None, lifecycle_args, execute_method, "static").execute_lifecycle()
+
+        return visited_nodes
+
+    def test_ext_origins(self):
+        kinds = [kind for _, kind in self.origins]
+
+        self.assertEqual(len(self.ast.ext), len(self.origins))
+        self.assertEqual(151, kinds.count(pycutil.PycparserUtilConstants.origin_system))
+        self.assertEqual(30, kinds.count(pycutil.PycparserUtilConstants.origin_header))
+        self.assertEqual(1, kinds.count(pycutil.PycparserUtilConstants.origin_main))
+        self.assertEqual({"prog6.c"}, set(os.path.basename(filename) for filename, kind in self.origins
+                                          if kind == pycutil.PycparserUtilConstants.origin_main))
+
+    def test_filter_ast(self):
+        lifecycle = self.lifecycle(None, None, {}, None, "static")
+        expected = {"system": [pycutil.PycparserUtilConstants.origin_header,
+                               pycutil.PycparserUtilConstants.origin_main],
+                    "headers": [pycutil.PycparserUtilConstants.origin_main]}
+
+        for skip, kept_origins in expected.items():
+            with mock.patch.dict(os.environ, {"BOA_LC_PYCPARSER_AST_SKIP": skip}):
+                ast = lifecycle.filter_ast(self.ast, self.origins)
+
+            kept = [node for node, (_, kind) in zip(self.ast.ext, self.origins) if kind in kept_origins]
+
+            self.assertEqual(len(kept), len(ast.ext), skip)
+            self.assertTrue(all(a is b for a, b in zip(kept, ast.ext)), skip)
+
+        # The default value skips the system headers
+        with mock.patch.dict(os.environ):
+            os.environ.pop("BOA_LC_PYCPARSER_AST_SKIP", None)
+
+            self.assertEqual(31, len(lifecycle.filter_ast(self.ast, self.origins).ext))
+
+        # Nothing is skipped
+        for skip in ("none", "not valid"):
+            with mock.patch.dict(os.environ, {"BOA_LC_PYCPARSER_AST_SKIP": skip}):
+                self.assertIs(self.ast, lifecycle.filter_ast(self.ast, self.origins))
+
+        self.assertIs(self.ast, lifecycle.filter_ast(self.ast, None))
+        self.assertIs(self.ast, lifecycle.filter_ast(self.ast, self.origins[1:]))
+
+    def test_traversal_without_origins(self):
+        # Without the callback "origins" (or with nothing skipped), the whole AST is visited as before
+        whole_ast_nodes = self.get_visited_nodes({"parser": {"ast": self.ast}})
+        not_skipped_nodes = self.get_visited_nodes({"parser": {"ast": self.ast, "origins": self.origins}}, "none")
+        skipped_nodes = self.get_visited_nodes({"parser": {"ast": self.ast, "origins": self.origins}})
+
+        self.assertEqual(list(map(id, whole_ast_nodes)), list(map(id, not_skipped_nodes)))
+        self.assertLess(len(skipped_nodes), len(whole_ast_nodes))
+
+        # The nodes of the kept external declarations are visited in the same order
+        whole_ast_ids = iter(map(id, whole_ast_nodes))
+
+        self.assertTrue(all(node_id in whole_ast_ids for node_id in map(id, skipped_nodes)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,11 @@
-
 # Std libs
 import os
+import glob
+import pickle
+import shutil
 import unittest
 import subprocess
+import tempfile
 
 def get_script_dir():
     return os.path.dirname(os.path.realpath(__file__))
@@ -17,13 +20,44 @@ class BOAStaticPycparserC(unittest.TestCase):
 
         return env
 
+    def get_rules_file(self, rules_file, replacements=()):
+        # Copy of the rules file where each (old, new) replacement has been applied
+        if len(replacements) == 0:
+            return rules_file
+
+        with open(rules_file) as f:
+            rules = f.read()
+
+        for old, new in replacements:
+            self.assertIn(old, rules)
+
+            rules = rules.replace(old, new)
+
+        with tempfile.NamedTemporaryFile("w", suffix=".xml", delete=False) as f:
+            f.write(rules)
+
+        self.addCleanup(os.remove, f.name)
+
+        return f.name
+
+    def run_boa(self, target, rules_file, replacements=(), boa_args=(), env=None):
+        rules_file = self.get_rules_file(rules_file, replacements)
+
+        if env is None:
+            env = self.get_env()
+
+        actual = subprocess.run([f"{get_script_dir()}/../../../boa/boa.py", *boa_args, target, rules_file], check=False, capture_output=True, text=True, env=env)
+        actual_stdout_grep = subprocess.run(["egrep", "\\s*\\+ Threat|\\s*Severity:|\\s*Advice:"], input=actual.stdout, capture_output=True, check=False, text=True)
+
+        self.assertEqual(0, actual.returncode, actual.stderr)
+
+        return actual_stdout_grep.stdout, actual.stderr
+
     def test_functions_basic_overflow_1(self):
         target = f"{get_script_dir()}/../../C/synthetic/test_basic_buffer_overflow.c"
         rules_file = f"{get_script_dir()}/../../../boa/rules/rules-static-function_match_pycparser.xml"
-        env = self.get_env()
 
-        actual = subprocess.run([f"{get_script_dir()}/../../../boa/boa.py", target, rules_file], check=False, capture_output=True, text=True, env=env)
-        actual_stdout_grep = subprocess.run(["egrep", "\\s*\\+ Threat|\\s*Severity:|\\s*Advice:"], input=actual.stdout, capture_output=True, check=False, text=True)
+        actual_stdout_grep, _ = self.run_boa(target, rules_file)
 
         expected_stdout = \
 """\
@@ -38,7 +72,241 @@ class BOAStaticPycparserC(unittest.TestCase):
    Advice: Use a constant value as first parameter.
 """
 
-        self.assertEqual(expected_stdout, actual_stdout_grep.stdout)
+        self.assertEqual(expected_stdout, actual_stdout_grep)
+
+    def test_functions_basic_overflow_1_prescan(self):
+        target = f"{get_script_dir()}/../../C/synthetic/test_basic_buffer_overflow.c"
+        rules_file = f"{get_script_dir()}/../../../boa/rules/rules-static-function_match_pycparser.xml"
+        rules_file_prescan = f"{get_script_dir()}/../../../boa/rules/rules-static-function_match_pycparser_prescan.xml"
+
+        expected_stdout_grep, _ = self.run_boa(target, rules_file)
+        actual_stdout_grep, _ = self.run_boa(target, rules_file_prescan)
+
+        self.assertEqual(3, actual_stdout_grep.count(" + Threat"))
+        self.assertEqual(expected_stdout_grep, actual_stdout_grep)
+
+    def test_functions_prescan_disabled_regions(self):
+        target = f"{get_script_dir()}/../../C/synthetic/test_prescan_disabled_regions.c"
+        rules_file = f"{get_script_dir()}/../../../boa/rules/rules-static-function_match_pycparser.xml"
+        rules_file_prescan = f"{get_script_dir()}/../../../boa/rules/rules-static-function_match_pycparser_prescan.xml"
+
+        # The calls inside "#if 0" and through members are not reported
+        expected_stdout_grep, _ = self.run_boa(target, rules_file)
+        actual_stdout_grep, actual_stderr = self.run_boa(target, rules_file_prescan)
+
+        self.assertEqual(2, actual_stdout_grep.count(" + Threat"))
+        self.assertEqual(sorted(expected_stdout_grep.split(" + Threat")), sorted(actual_stdout_grep.split(" + Threat")))
+
+        # There are not ambiguous function calls, so the file is not parsed
+        self.assertNotIn("module 'boapm_pycparser' successfully loaded", actual_stderr)
+
+    def test_functions_basic_overflow_1_glob(self):
+        target = f"{get_script_dir()}/../../C/synthetic/test_basic_buffer_overflow.c"
+        rules_file = f"{get_script_dir()}/../../../boa/rules/rules-static-function_match_pycparser.xml"
+
+        # Family of functions instead of the exact name
+        expected_stdout_grep, _ = self.run_boa(target, rules_file)
+        actual_stdout_grep, _ = self.run_boa(target, rules_file, [('<element name="method" value="strcpy" />',
+                                                                   '<element name="glob" value="str*cpy" />')])
+
+        self.assertEqual(3, actual_stdout_grep.count(" + Threat"))
+        self.assertEqual(expected_stdout_grep, actual_stdout_grep)
+
+    def test_functions_basic_overflow_1_function_stream(self):
+        target = f"{get_script_dir()}/../../C/synthetic/test_basic_buffer_overflow.c"
+        rules_file = f"{get_script_dir()}/../../../boa/rules/rules-static-function_match_pycparser.xml"
+        env = self.get_env()
+
+        # The bodies of the functions are released once they are processed
+        env["BOA_LC_FUNCTION_STREAM_RELEASE"] = "true"
+
+        expected_stdout_grep, _ = self.run_boa(target, rules_file, env=env)
+        actual_stdout_grep, _ = self.run_boa(target, rules_file, [("boalc_pycparser_ast.BOALCPycparserAST",
+                                                                   "boalc_pycparser_function_stream.BOALCPycparserFunctionStream")],
+                                             env=env)
+
+        self.assertEqual(3, actual_stdout_grep.count(" + Threat"))
+        self.assertEqual(expected_stdout_grep, actual_stdout_grep)
+
+    def test_taint_control_flow_structures_parallel_cfg(self):
+        target = f"{get_script_dir()}/../../C/synthetic/test_taint_control_flow_structures.c"
+        rules_file = f"{get_script_dir()}/../../../boa/rules/rules-static-taint_analysis_pycparser.xml"
+
+        # The CFG of the functions is computed in a pool of processes and linked later
+        expected_stdout_grep, _ = self.run_boa(target, rules_file)
+        actual_stdout_grep, _ = self.run_boa(target, rules_file, [('<element name="propagate_func_call" value="false" />',
+                                                                   '<element name="propagate_func_call" value="false" />\n'
+                                                                   '<element name="processes" value="2" />')])
+
+        self.assertEqual(6, actual_stdout_grep.count(" + Threat"))
+        self.assertEqual(expected_stdout_grep, actual_stdout_grep)
+
+    def test_taint_1_program_cfg(self):
+        target = f"{get_script_dir()}/../../C/synthetic/test_taint_1.c"
+        rules_file = f"{get_script_dir()}/../../../boa/rules/rules-static-taint_analysis_pycparser.xml"
+        program_directory = tempfile.mkdtemp()
+
+        self.addCleanup(shutil.rmtree, program_directory)
+
+        # The CFG of the file is stored in order to link it with other files
+        program_rules_file = self.get_rules_file(rules_file, [('<element name="propagate_func_call" value="false" />',
+                                                               '<element name="propagate_func_call" value="false" />\n'
+                                                               f'<element name="program_directory" value="{program_directory}" />')])
+        expected_stdout_grep, _ = self.run_boa(target, rules_file)
+
+        # The second time, the stored CFG is reused
+        for _ in range(2):
+            actual_stdout_grep, _ = self.run_boa(target, program_rules_file)
+
+            self.assertEqual(1, len(list(filter(lambda filename: filename.endswith(".cfg.pickle"), os.listdir(program_directory)))))
+            self.assertEqual(1, len(list(filter(lambda filename: filename.startswith("manifest."), os.listdir(program_directory)))))
+            self.assertEqual(4, actual_stdout_grep.count(" + Threat"))
+            self.assertEqual(expected_stdout_grep, actual_stdout_grep)
+
+    def test_taint_control_flow_structures_rules_cache(self):
+        target = f"{get_script_dir()}/../../C/synthetic/test_taint_control_flow_structures.c"
+        cache_directory = tempfile.mkdtemp()
+        rules_directory = tempfile.mkdtemp()
+        rules_file = f"{rules_directory}/rules.xml"
+
+        self.addCleanup(shutil.rmtree, cache_directory)
+        self.addCleanup(shutil.rmtree, rules_directory)
+
+        shutil.copyfile(f"{get_script_dir()}/../../../boa/rules/rules-static-taint_analysis_pycparser.xml", rules_file)
+
+        def run(expected_warning=None):
+            actual_stdout_grep, actual_stderr = self.run_boa(target, rules_file, boa_args=("--rules-cache", cache_directory, "--logging-level", "10"))
+
+            if expected_warning is not None:
+                self.assertIn(expected_warning, actual_stderr)
+
+            return actual_stdout_grep, "rules loaded from the cache" in actual_stderr
+
+        # The rules are checked and cached in the first execution and loaded from the cache in the second one
+        first_stdout_grep, first_cached = run()
+        second_stdout_grep, second_cached = run()
+
+        self.assertFalse(first_cached)
+        self.assertTrue(second_cached)
+        self.assertEqual(["cache.key"], [name for name in os.listdir(cache_directory) if not name.endswith(".rules.pickle")])
+        self.assertEqual(1, len(glob.glob(f"{cache_directory}/*.rules.pickle")))
+        self.assertEqual(6, first_stdout_grep.count(" + Threat"))
+        self.assertEqual(first_stdout_grep, second_stdout_grep)
+
+        # The cached rules which are not signed are not unpickled, but checked and cached again
+        marker = f"{rules_directory}/marker"
+
+        for path in glob.glob(f"{cache_directory}/*.rules.pickle"):
+            with open(path, "wb") as f:
+                f.write(pickle.dumps(EvilPickle(marker)))
+
+        tampered_stdout_grep, tampered_cached = run("could not load the cached rules")
+
+        self.assertFalse(tampered_cached)
+        self.assertFalse(os.path.exists(marker))
+        self.assertEqual(first_stdout_grep, tampered_stdout_grep)
+        self.assertTrue(run()[1])
+
+        # The cache directory is not used if other users can modify it
+        os.chmod(cache_directory, 0o777)
+
+        untrusted_stdout_grep, untrusted_cached = run("is writable by the group or others")
+
+        self.assertFalse(untrusted_cached)
+        self.assertEqual(first_stdout_grep, untrusted_stdout_grep)
+
+        os.chmod(cache_directory, 0o700)
+
+        # The cached rules are not used once the rules file changes
+        with open(rules_file, "a") as f:
+            f.write("\n")
+
+        third_stdout_grep, third_cached = run()
+
+        self.assertFalse(third_cached)
+        self.assertEqual(2, len(glob.glob(f"{cache_directory}/*.rules.pickle")))
+        self.assertEqual(first_stdout_grep, third_stdout_grep)
+
+    def test_taint_control_flow_structures_result_cache(self):
+        rules_file = f"{get_script_dir()}/../../../boa/rules/rules-static-taint_analysis_pycparser.xml"
+        cache_directory = tempfile.mkdtemp()
+
+        self.addCleanup(shutil.rmtree, cache_directory)
+
+        with open(f"{get_script_dir()}/../../C/synthetic/test_taint_control_flow_structures.c") as f:
+            code = f.read()
+
+        # The target includes a header of its directory
+        target_directory = tempfile.mkdtemp()
+        target = f"{target_directory}/target.c"
+        header = f"{target_directory}/header.h"
+
+        self.addCleanup(shutil.rmtree, target_directory)
+
+        with open(header, "w") as f:
+            f.write("#define HEADER_VALUE 1\n")
+
+        with open(target, "w") as f:
+            f.write(f"#include \"header.h\"\n{code}")
+
+        def run():
+            actual_stdout_grep, actual_stderr = self.run_boa(target, rules_file, boa_args=("--result-cache", cache_directory))
+
+            return actual_stdout_grep, "report replayed from the result cache" in actual_stderr
+
+        # The report is cached in the first execution and replayed in the second one
+        first_stdout_grep, first_replayed = run()
+        second_stdout_grep, second_replayed = run()
+
+        self.assertFalse(first_replayed)
+        self.assertTrue(second_replayed)
+        self.assertEqual(1, len(os.listdir(cache_directory)))
+        self.assertEqual(6, first_stdout_grep.count(" + Threat"))
+        self.assertEqual(first_stdout_grep, second_stdout_grep)
+
+        # The cached report is not replayed once the target changes
+        with open(target, "a") as f:
+            f.write("\n")
+
+        third_stdout_grep, third_replayed = run()
+
+        self.assertFalse(third_replayed)
+        self.assertEqual(2, len(os.listdir(cache_directory)))
+        self.assertEqual(first_stdout_grep, third_stdout_grep)
+
+        # The cached report is not replayed once an included header changes
+        with open(header, "a") as f:
+            f.write("#define OTHER_HEADER_VALUE 2\n")
+
+        fourth_stdout_grep, fourth_replayed = run()
+
+        self.assertFalse(fourth_replayed)
+        self.assertEqual(3, len(os.listdir(cache_directory)))
+        self.assertEqual(first_stdout_grep, fourth_stdout_grep)
+
+    def test_ast_pattern_basic_overflow_1(self):
+        target = f"{get_script_dir()}/../../C/synthetic/test_basic_buffer_overflow.c"
+        rules_file = f"{get_script_dir()}/../../../boa/rules/rules-static-ast_pattern_pycparser.xml"
+
+        actual_stdout_grep, _ = self.run_boa(target, rules_file)
+
+        # The call with a constant source (row 14) and the call to 'printf' with a constant format (row 17) do not match
+        expected_stdout = \
+"""\
+ + Threat (10, 9): strcpy: the source (second argument) is not a constant, so its length might be higher or equal than the destination buffer and lead to a buffer overflow.
+   Severity: FREQUENTLY MISUSED.
+   Advice: Check the length of the source or use 'strncpy' or 'strlcpy'.
+"""
+
+        self.assertEqual(expected_stdout, actual_stdout_grep)
+
+class EvilPickle:
+
+    def __init__(self, marker):
+        self.marker = marker
+
+    def __reduce__(self):
+        return (open, (self.marker, "w"))
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,275 @@
+# Std libs
+import os
+import sys
+import json
+import shutil
+import unittest
+import tempfile
+import subprocess
+import importlib.util
+
+# 3rd libs
+from pycparser import c_parser
+
+# Own libs
+#  Your PYTHONPATH has to have the directory to BOA code (i.e. boa.py visible)
+import auxiliary_modules.pycparser_cfg as cfg
+
+def get_script_dir():
+    return os.path.dirname(os.path.realpath(__file__))
+
+class BOAStaticPycparserCFG(unittest.TestCase):
+
+    def get_env(self, force=False):
+        env = os.environ.copy()
+
+        if ("PYCPARSER_FAKE_LIBC_INCLUDE_PATH" not in os.environ or force):
+            env["PYCPARSER_FAKE_LIBC_INCLUDE_PATH"] = f"{get_script_dir()}/../pycparser-2.20/utils/fake_libc_include"
+
+        return env
+
+    def get_module(self, module, path):
+        if module in sys.modules:
+            return sys.modules[module]
+
+        spec = importlib.util.spec_from_file_location(module, path)
+
+        self.assertIsNotNone(spec, f"could lot load specification from file (module '{module}' with path '{path}')")
+
+        loaded_module = importlib.util.module_from_spec(spec)
+
+        sys.modules[module] = loaded_module
+
+        spec.loader.exec_module(loaded_module)
+
+        return loaded_module
+
+    def get_process_cfg(self, code, lazy):
+        modules_directory = f"{get_script_dir()}/../../../boa/modules/static_analysis"
+
+        # The modules are loaded as BOA does (check ModulesImporter)
+        self.get_module("boam_abstract", f"{modules_directory}/boam_abstract.py")
+
+        boam_cfg = self.get_module("boam_cfg", f"{modules_directory}/boam_cfg.py")
+        process_cfg = boam_cfg.ProcessCFG(False)
+
+        for function in c_parser.CParser().parse(code).ext:
+            if lazy:
+                process_cfg.defer(function.decl.name, function)
+            else:
+                process_cfg.process(function.decl.name, function)
+
+        return process_cfg
+
+    def export_cfg(self, target, lazy, processes=1):
+        rules_file = f"{get_script_dir()}/../../../boa/rules/rules-static-cfg_pycparser.xml"
+
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as f:
+            export_file = f.name
+
+        self.addCleanup(os.remove, export_file)
+
+        with open(rules_file) as f:
+            rules = f.read()
+
+        rules = rules.replace('<element name="plot_cfg" value="true" />',
+                              '<element name="plot_cfg" value="false" />\n'
+                              f'<element name="export_cfg" value="{export_file}" />')
+        rules = rules.replace('<element name="lazy" value="false" />',
+                              f'<element name="lazy" value="{str(lazy).lower()}" />')
+        rules = rules.replace('<element name="processes" value="1" />',
+                              f'<element name="processes" value="{processes}" />')
+
+        with tempfile.NamedTemporaryFile("w", suffix=".xml", delete=False) as f:
+            f.write(rules)
+
+        self.addCleanup(os.remove, f.name)
+
+        actual = subprocess.run([f"{get_script_dir()}/../../../boa/boa.py", target, f.name], check=False, capture_output=True, text=True, env=self.get_env())
+
+        self.assertEqual(0, actual.returncode)
+
+        with open(export_file) as f:
+            return [json.loads(line) for line in f]
+
+    def get_unit(self, path, function_name, function_calls):
+        fragment = cfg.CFGFragment(function_name, [], function_calls)
+
+        return cfg.CFGUnit(path, f"key of {path}", [fragment])
+
+    def test_unit_store_manifest(self):
+        directory = tempfile.mkdtemp()
+        store_directory = f"{directory}/store"
+
+        self.addCleanup(shutil.rmtree, directory)
+
+        files = {}
+
+        for name in ("a.c", "b.c"):
+            files[name] = f"{directory}/{name}"
+
+            with open(files[name], "w") as f:
+                f.write("\n")
+
+        store = cfg.CFGUnitStore(store_directory)
+
+        store.store(self.get_unit(files["a.c"], "f", ["g", "printf"]))
+        store.store(self.get_unit(files["b.c"], "g", []))
+
+        # The symbols are looked for in the manifest
+        manifest = store.get_manifest()
+
+        self.assertEqual(sorted(store.get_paths()), sorted(manifest.keys()))
+        self.assertEqual({files["a.c"]: (["f"], ["g", "printf"]), files["b.c"]: (["g"], [])},
+                         {entry["path"]: (entry["exported"], entry["imported"]) for entry in manifest.values()})
+
+        # The manifest is rebuilt from the stored units if it is not valid
+        with open(store.get_manifest_path(), "w") as f:
+            f.write("not valid")
+
+        self.assertEqual(manifest, store.get_manifest())
+        self.assertEqual(manifest, {os.path.join(store_directory, name): entry
+                                    for name, entry in store.read_manifest().items()})
+
+        # The entry of a stored unit which was modified after the manifest was written is not used
+        store.store(self.get_unit(files["b.c"], "h", []))
+
+        manifest = store.read_manifest()
+
+        for entry in manifest.values():
+            entry["mtime_ns"] -= 1
+
+        store.write_manifest(manifest)
+
+        self.assertEqual([["f"], ["h"]], sorted(entry["exported"] for entry in store.get_manifest().values()))
+
+        # The units of the files which do not exist anymore are removed
+        os.remove(files["b.c"])
+
+        manifest = store.get_manifest()
+
+        self.assertEqual(1, len(store.get_paths()))
+        self.assertEqual([files["a.c"]], [entry["path"] for entry in manifest.values()])
+        self.assertEqual(1, len(store.read_manifest()))
+        self.assertEqual("f", store.load(files["a.c"]).fragments[0].function_name)
+        self.assertIsNone(store.load(files["b.c"]))
+
+    def test_cfg_export_jsonl(self):
+        target = f"{get_script_dir()}/../../C/synthetic/test_basic_functions_call.c"
+        nodes = self.export_cfg(target, False)
+        ids = set(node["id"] for node in nodes)
+        functions = set(node["function"] for node in nodes)
+
+        self.assertEqual(len(nodes), len(ids))
+        self.assertIn("main", functions)
+        self.assertTrue(all(succ in ids for node in nodes for succ in node["succs"]))
+
+    def test_lazy_cfg_export(self):
+        for sample in ("test_basic_functions_call.c", "test_buffer_overflow_dyn_mult_funcs.c"):
+            target = f"{get_script_dir()}/../../C/synthetic/{sample}"
+            eager_nodes = self.export_cfg(target, False)
+
+            # The functions are resolved on demand, but the whole CFG is the same
+            self.assertLess(1, len(set(node["function"] for node in eager_nodes)), sample)
+            self.assertEqual(eager_nodes, self.export_cfg(target, True), sample)
+
+    def test_parallel_cfg_export(self):
+        # The rules propagate the function calls, so the pending calls and returns are linked
+        for sample in ("test_basic_functions_call.c", "test_buffer_overflow_dyn_mult_funcs.c"):
+            target = f"{get_script_dir()}/../../C/synthetic/{sample}"
+            sequential_nodes = self.export_cfg(target, False)
+
+            self.assertLess(1, len(set(node["function"] for node in sequential_nodes)), sample)
+            self.assertEqual(sequential_nodes, self.export_cfg(target, False, 2), sample)
+
+    def test_parallel_cfg_shares_ast(self):
+        code = "int f(int a) { if (a) { a++; } return a; }\n" \
+               "int g(int b) { while (b) { b--; } return f(b); }\n"
+        ast = c_parser.CParser().parse(code)
+        process_cfg = self.get_process_cfg("", False)
+        ast_nodes = set()
+
+        def append_nodes(node):
+            ast_nodes.add(id(node))
+
+            for _, child in node.children():
+                append_nodes(child)
+
+        process_cfg.compute_cfg_in_parallel([(function.decl.name, function) for function in ast.ext], 2)
+        append_nodes(ast)
+
+        # The nodes which were inserted in the other processes are in the AST as well
+        for function_name in ("f", "g"):
+            instructions = process_cfg.basic_cfg.get_cfg(function_name)
+            node_names = [type(instruction.get_instruction()).__name__ for instruction in instructions]
+
+            self.assertTrue(any(node_name.startswith("EndOf") and node_name != "EndOfFunc"
+                                for node_name in node_names), function_name)
+            self.assertEqual([], [node_name for instruction, node_name in zip(instructions, node_names)
+                                  if id(instruction.get_instruction()) not in ast_nodes and
+                                  node_name not in ("EndOfFunc", "FinalNode")], function_name)
+
+    def test_lazy_cfg_deferred_functions(self):
+        code = "int f(int a) { return a + 1; }\n" \
+               "int g(int b) { if (b) { return f(b); } return 0; }\n" \
+               "int h(int c) { while (c) { c--; } return c; }\n"
+        eager_process_cfg = self.get_process_cfg(code, False)
+        process_cfg = self.get_process_cfg(code, True)
+        lazy_cfg = process_cfg.get_lazy_cfg()
+
+        eager_process_cfg.resolve_all()
+
+        def get_summary(instructions):
+            return [(type(instruction.get_instruction()).__name__, len(instruction.get_succs()))
+                    for instruction in instructions]
+
+        # Only the function calls are computed beforehand
+        self.assertEqual(eager_process_cfg.get_function_calls(), process_cfg.get_function_calls())
+        self.assertEqual({"f": [], "g": [], "h": []}, process_cfg.basic_cfg.instructions)
+
+        # The component of the call graph is computed when a function is requested
+        self.assertEqual(get_summary(eager_process_cfg.basic_cfg.get_cfg("g")), get_summary(lazy_cfg.get_cfg("g")))
+        self.assertNotEqual([], process_cfg.basic_cfg.instructions["f"])
+        self.assertEqual([], process_cfg.basic_cfg.instructions["h"])
+
+        # The rest of functions are computed when the whole CFG is requested
+        self.assertEqual(["f", "g", "h"], list(lazy_cfg.get_cfg(None).keys()))
+
+        for function_name in ("f", "g", "h"):
+            self.assertEqual(get_summary(eager_process_cfg.basic_cfg.get_cfg(function_name)),
+                             get_summary(lazy_cfg.get_cfg(function_name)), function_name)
+
+    def test_lazy_cfg_demand_driven_taint(self):
+        rules_file = f"{get_script_dir()}/../../../boa/rules/rules-static-taint_analysis_pycparser.xml"
+
+        with open(rules_file) as f:
+            rules = f.read()
+
+        # Only the functions which are queried by the demand-driven analysis are resolved
+        rules = rules.replace('<element name="demand_driven" value="false" />',
+                              '<element name="demand_driven" value="true" />')
+
+        for sample in ("test_taint_1.c", "test_taint_control_flow_structures.c"):
+            target = f"{get_script_dir()}/../../C/synthetic/{sample}"
+            stdouts = []
+
+            for lazy in ("false", "true"):
+                with tempfile.NamedTemporaryFile("w", suffix=".xml", delete=False) as f:
+                    f.write(rules.replace('<element name="propagate_func_call" value="false" />',
+                                          '<element name="propagate_func_call" value="false" />\n'
+                                          f'<element name="lazy" value="{lazy}" />'))
+
+                self.addCleanup(os.remove, f.name)
+
+                actual = subprocess.run([f"{get_script_dir()}/../../../boa/boa.py", target, f.name], check=False, capture_output=True, text=True, env=self.get_env())
+                actual_stdout_grep = subprocess.run(["egrep", "\\s*\\+ Threat|\\s*Severity:|\\s*Advice:"], input=actual.stdout, capture_output=True, check=False, text=True)
+
+                self.assertEqual(0, actual.returncode)
+
+                stdouts.append(actual_stdout_grep.stdout)
+
+            self.assertIn(" + Threat", stdouts[0], sample)
+            self.assertEqual(stdouts[0], stdouts[1], sample)
+
+if __name__ == "__main__":
+    unittest.main()
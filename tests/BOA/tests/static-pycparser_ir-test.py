@@ -0,0 +1,196 @@
+# Std libs
+import os
+import unittest
+import subprocess
+
+# 3rd libs
+from pycparser import c_ast, c_parser, parse_file
+
+# Own libs
+#  Your PYTHONPATH has to have the directory to BOA code (i.e. boa.py visible)
+import auxiliary_modules.pycparser_ir as pycir
+
+def get_script_dir():
+    return os.path.dirname(os.path.realpath(__file__))
+
+class BOAStaticPycparserIR(unittest.TestCase):
+
+    def get_env(self, force=False):
+        env = os.environ.copy()
+
+        if ("PYCPARSER_FAKE_LIBC_INCLUDE_PATH" not in os.environ or force):
+            env["PYCPARSER_FAKE_LIBC_INCLUDE_PATH"] = f"{get_script_dir()}/../pycparser-2.20/utils/fake_libc_include"
+
+        return env
+
+    def lower(self, code):
+        return pycir.lower_ast(c_parser.CParser().parse(code))
+
+    def check_blocks(self, function):
+        # Each instruction belongs to one block and only the last instruction of a block might be a terminator
+        instructions = []
+
+        for block in function.block_order:
+            block_instructions = list(function.get_block_instructions(block))
+
+            instructions.extend(block_instructions)
+
+            for idx in block_instructions[:-1]:
+                self.assertNotIn(function.get_instruction(idx)[0], pycir.IRConstants.terminators)
+
+            for successor in function.get_successors(block):
+                self.assertIn(block, function.get_predecessors()[successor])
+
+        self.assertEqual(list(range(len(function))), instructions)
+        self.assertEqual(sorted(function.block_order), list(range(function.get_number_of_blocks())))
+
+    def test_lower_control_flow(self):
+        module = self.lower("""
+            int f(int a, int b) {
+                int c = a + b;
+                if (a && b) { c = c * 2; } else c = 0;
+                while (c > 0) { c--; if (c == 3) break; }
+                return c;
+            }
+        """)
+        function = module.functions["f"]
+
+        expected = \
+"""function f(a, b)
+  B0: -> [B4, B3]
+    decl c
+    %t0 = a + b
+    c = %t0
+    branch a, B4, B3
+  B4: -> [B1, B3]
+    branch b, B1, B3
+  B1: -> [B2]
+    %t1 = c * 2
+    c = %t1
+    jump B2
+  B3: -> [B2]
+    c = 0
+    jump B2
+  B2: -> [B5]
+    jump B5
+  B5: -> [B6, B7]
+    %t2 = c > 0
+    branch %t2, B6, B7
+  B6: -> [B8, B9]
+    %t3 = c - 1
+    %t4 = c
+    c = %t3
+    %t5 = c == 3
+    branch %t5, B8, B9
+  B8: -> [B7]
+    jump B7
+  B9: -> [B5]
+    jump B5
+  B7: -> []
+    return c"""
+
+        self.assertEqual(expected, function.format())
+        self.assertEqual(21, len(function))
+        self.check_blocks(function)
+
+    def test_lower_memory_switch_goto_call(self):
+        module = self.lower("""
+            int f(int a, int b);
+            void g(char *s, int n) {
+                s[n] = 0;
+                *s = 'a';
+                switch (n) { case 1: n = 2; break; default: n = 3; }
+                goto end;
+            end:
+                f(n, 1);
+            }
+        """)
+        function = module.functions["g"]
+
+        expected = \
+"""function g(s, n)
+  B0: -> [B2, B4]
+    s[n] = 0
+    *s = 'a'
+    %t0 = n == 1
+    branch %t0, B2, B4
+  B4: -> [B3]
+    jump B3
+  B2: -> [B1]
+    n = 2
+    jump B1
+  B3: -> [B1]
+    n = 3
+  B1: -> [B5]
+    jump B5
+  B5: -> []
+    param 1 n
+    param 2 1
+    %t1 = call f, 2"""
+
+        self.assertEqual(["g"], list(module.functions.keys()))
+        self.assertEqual(expected, function.format())
+        self.check_blocks(function)
+
+    def test_string_table_is_shared(self):
+        module = self.lower("""
+            int f(int a) { return a + 1; }
+            int g(int a) { return a + 1; }
+        """)
+        f, g = module.functions["f"], module.functions["g"]
+
+        self.assertIs(module.strings, f.strings)
+        self.assertIs(module.strings, g.strings)
+        self.assertEqual(list(f.opcodes), list(g.opcodes))
+        self.assertEqual(list(f.srcs1), list(g.srcs1))
+        self.assertEqual(list(f.extras), list(g.extras))
+
+    def test_operands(self):
+        for kind in (pycir.IRConstants.operand_variable, pycir.IRConstants.operand_temporary,
+                     pycir.IRConstants.operand_constant):
+            operand = pycir.make_operand(kind, 12345)
+
+            self.assertEqual(kind, pycir.get_operand_kind(operand))
+            self.assertEqual(12345, pycir.get_operand_value(operand))
+
+    def test_undefined_label(self):
+        with self.assertRaises(pycir.IRException):
+            self.lower("void h() { goto nowhere; }")
+
+    def test_lower_real_program(self):
+        target = f"{get_script_dir()}/../../C/real/huffman/prog6.c"
+        fake_libc_include = self.get_env(force=True)["PYCPARSER_FAKE_LIBC_INCLUDE_PATH"]
+        ast = parse_file(target, use_cpp=True, cpp_path="gcc", cpp_args=["-E", f"-I{fake_libc_include}"])
+        module = pycir.lower_ast(ast)
+        function_names = [ext.decl.name for ext in ast.ext if isinstance(ext, c_ast.FuncDef)]
+
+        self.assertNotEqual(0, len(function_names))
+        self.assertEqual(function_names, list(module.functions.keys()))
+
+        for function in module.functions.values():
+            self.check_blocks(function)
+
+    def test_drop_ast_with_ast_callback(self):
+        target = f"{get_script_dir()}/../../C/synthetic/test_basic_buffer_overflow.c"
+        rules_file = f"{get_script_dir()}/../../../boa/rules/rules-static-function_match_pycparser.xml"
+        env = self.get_env()
+
+        env["PYCPARSER_LOWER_IR"] = "true"
+        env["PYCPARSER_DROP_AST"] = "true"
+
+        # The modules which need the AST would not find any threat
+        actual = subprocess.run([f"{get_script_dir()}/../../../boa/boa.py", target, rules_file], check=False, capture_output=True, text=True, env=env)
+
+        self.assertNotEqual(0, actual.returncode)
+        self.assertIn("'PYCPARSER_DROP_AST' cannot be 'true'", actual.stderr)
+
+        # The AST is kept if it is not released
+        env["PYCPARSER_DROP_AST"] = "false"
+
+        actual = subprocess.run([f"{get_script_dir()}/../../../boa/boa.py", target, rules_file], check=False, capture_output=True, text=True, env=env)
+
+        self.assertEqual(0, actual.returncode)
+        self.assertIn(" + Threat", actual.stdout)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,260 @@
+
+# Std libs
+import os
+import sys
+import unittest
+import subprocess
+import tempfile
+import importlib.util
+
+def get_script_dir():
+    return os.path.dirname(os.path.realpath(__file__))
+
+class BOAStaticPycparserTaintAnalysis(unittest.TestCase):
+
+    def get_env(self, force=False):
+        env = os.environ.copy()
+
+        if ("PYCPARSER_FAKE_LIBC_INCLUDE_PATH" not in os.environ or force):
+            env["PYCPARSER_FAKE_LIBC_INCLUDE_PATH"] = f"{get_script_dir()}/../pycparser-2.20/utils/fake_libc_include"
+
+        return env
+
+    def get_module(self, module, path):
+        if module in sys.modules:
+            return sys.modules[module]
+
+        spec = importlib.util.spec_from_file_location(module, path)
+
+        self.assertIsNotNone(spec, f"could lot load specification from file (module '{module}' with path '{path}')")
+
+        loaded_module = importlib.util.module_from_spec(spec)
+
+        sys.modules[module] = loaded_module
+
+        spec.loader.exec_module(loaded_module)
+
+        return loaded_module
+
+    def get_taint_analysis_module(self):
+        modules_directory = f"{get_script_dir()}/../../../boa/modules/static_analysis"
+
+        # The modules are loaded as BOA does (check ModulesImporter)
+        self.get_module("boam_abstract", f"{modules_directory}/boam_abstract.py")
+
+        return self.get_module("boam_taint_analysis", f"{modules_directory}/boam_taint_analysis.py")
+
+    def get_rules_file(self, demand_driven, extra_args="", ssa=False):
+        rules_file = f"{get_script_dir()}/../../../boa/rules/rules-static-taint_analysis_pycparser.xml"
+
+        with open(rules_file) as f:
+            rules = f.read()
+
+        rules = rules.replace('<element name="demand_driven" value="false" />',
+                              f'<element name="demand_driven" value="{str(demand_driven).lower()}" />{extra_args}')
+        rules = rules.replace('<element name="ssa" value="false" />',
+                              f'<element name="ssa" value="{str(ssa).lower()}" />')
+
+        with tempfile.NamedTemporaryFile("w", suffix=".xml", delete=False) as f:
+            f.write(rules)
+
+        self.addCleanup(os.remove, f.name)
+
+        return f.name
+
+    def run_boa(self, target, demand_driven, extra_args="", ssa=False, threats="(a sink|budget)"):
+        rules_file = self.get_rules_file(demand_driven, extra_args, ssa)
+        env = self.get_env()
+
+        actual = subprocess.run([f"{get_script_dir()}/../../../boa/boa.py", target, rules_file], check=False, capture_output=True, text=True, env=env)
+        actual_stdout_grep = subprocess.run(["egrep", "-A1", f"\\s*\\+ Threat.*{threats}"], input=actual.stdout, capture_output=True, check=False, text=True)
+
+        return actual_stdout_grep.stdout.replace("--\n", "")
+
+    def test_sources_sinks_index(self):
+        taint_analysis = self.get_taint_analysis_module()
+        Source = taint_analysis.Source
+        Sink = taint_analysis.Sink
+
+        sources = [Source("gets", "function", None, "argument", "1"),
+                   Source("getenv", "function", None, "argument", "0"),
+                   Source("strcpy", "function", None, "targ", "1", "2"),
+                   Source("fgets", "function", "read_input", "argument", "1"),
+                   Source("getenv", "function", "main", "targ", "0", "1"),
+                   Source("argv", "variable", "main")]
+        sinks = [Sink("system", "1"), Sink("printf", "0"), Sink("execl", "2"), Sink("system", "2")]
+        index = taint_analysis.SourceSinkIndex(sources, sinks)
+
+        # The positions of the arguments are precomputed starting with 0
+        self.assertEqual([(sources[0], ["argument", 0, None])], index.get_call_sources("gets", "main"))
+        self.assertEqual([(sources[2], ["targ", 0, 1])], index.get_call_sources("strcpy", "f"))
+        self.assertEqual([(sources[3], ["argument", 0, None])], index.get_call_sources("fgets", "read_input"))
+        self.assertEqual([], index.get_call_sources("fgets", "main"))
+
+        # The order of the rules file is kept
+        self.assertEqual([(sources[1], ["argument", None, None]), (sources[4], ["targ", None, 0])],
+                         index.get_init_sources("getenv", "main"))
+        self.assertEqual([(sources[1], ["argument", None, None])], index.get_init_sources("getenv", "f"))
+        self.assertEqual([sources[1], sources[4]],
+                         [source for source, _ in index.get_init_sources_by_names(["getenv", "gets", "getenv"],
+                                                                                  "main")])
+        self.assertTrue(index.has_init_sources("f"))
+
+        # The dangerous arguments which are in the function call
+        self.assertEqual([(sinks[0], [0]), (sinks[3], [1])], index.get_sinks("system", 2))
+        self.assertEqual([(sinks[0], [0]), (sinks[3], [])], index.get_sinks("system", 1))
+        self.assertEqual([(sinks[1], [0, 1, 2])], index.get_sinks("printf", 3))
+        self.assertEqual([(sinks[2], [])], index.get_sinks("execl", 1))
+        self.assertTrue(index.has_sinks("execl"))
+
+        # Unknown functions and variables as sources
+        self.assertEqual([], index.get_call_sources("unknown", "main"))
+        self.assertEqual([], index.get_init_sources("unknown", "main"))
+        self.assertEqual([], index.get_init_sources_by_names(["unknown"], "main"))
+        self.assertEqual([], index.get_call_sources("argv", "main"))
+        self.assertEqual([], index.get_sinks("unknown", 1))
+        self.assertFalse(index.has_sinks("unknown"))
+
+    def test_taint_1_demand_driven(self):
+        target = f"{get_script_dir()}/../../C/synthetic/test_taint_1.c"
+
+        expected_stdout = \
+"""\
+ + Threat (19, 5): function 'main': a sink (function 'system') with a tainted value has been found, in the parameter with position '1' (the first parameter starts with 1).
+   Severity: ALERT.
+"""
+
+        self.assertEqual(expected_stdout, self.run_boa(target, True))
+        self.assertEqual(self.run_boa(target, False), self.run_boa(target, True))
+
+    def test_taint_control_flow_structures_demand_driven(self):
+        target = f"{get_script_dir()}/../../C/synthetic/test_taint_control_flow_structures.c"
+
+        expected_stdout = \
+"""\
+ + Threat (20, 5): function 'main': a sink (function 'strcpy') with a tainted value has been found, in the parameter with position '2' (the first parameter starts with 1).
+   Severity: ALERT.
+"""
+
+        self.assertEqual(expected_stdout, self.run_boa(target, True))
+        self.assertEqual(expected_stdout, self.run_boa(target, True, ssa=True))
+
+    def test_taint_2_iterations_budget(self):
+        target = f"{get_script_dir()}/../../C/synthetic/test_taint_2.c"
+
+        expected_stdout = \
+"""\
+ + Threat (17, 5): function 'main': a sink (function 'system') with a tainted value has been found, in the parameter with position '1' (the first parameter starts with 1) (approximated result: more than 3 iterations).
+   Severity: CRITICAL.
+ + Threat (18, 5): function 'main': a sink (function 'system') with a tainted value has been found, in the parameter with position '1' (the first parameter starts with 1) (approximated result: more than 3 iterations).
+   Severity: CRITICAL.
+ + Threat (-1, -1): function 'main': the taint analysis exceeded the budget (more than 3 iterations), so the variables which were not tainted have been considered to could be tainted or not and the results might contain false positives.
+   Severity: WARNING.
+"""
+
+        self.assertEqual(expected_stdout, self.run_boa(target, False, '<element name="max_iterations_per_function" value="3" />'))
+
+    def test_taint_budget_unreached_sink(self):
+        # The global variable of the sink is not reached until the loop finishes
+        target = f"{get_script_dir()}/../../C/synthetic/test_taint_budget.c"
+        budget = '<element name="max_iterations_per_function" value="3" />'
+
+        expected_warning = \
+"""\
+ + Threat (-1, -1): function 'main': the taint analysis exceeded the budget (more than 3 iterations), so the variables which were not tainted have been considered to could be tainted or not and the results might contain false positives.
+   Severity: WARNING.
+"""
+        expected_stdout = \
+"""\
+ + Threat (18, 5): function 'main': a sink (function 'system') with a tainted value has been found, in the parameter with position '1' (the first parameter starts with 1) (approximated result: more than 3 iterations).
+   Severity: CRITICAL.
+""" + expected_warning
+
+        for demand_driven in (False, True):
+            self.assertEqual("", self.run_boa(target, demand_driven))
+            self.assertEqual(expected_stdout, self.run_boa(target, demand_driven, budget), demand_driven)
+
+        # The SSA form knows that the definition which reaches the sink is not affected by the loop
+        self.assertEqual(expected_warning, self.run_boa(target, True, budget, ssa=True))
+
+    def test_taint_kildall_transfer_records(self):
+        # Results of kildall's algorithm before the transfer records were compiled (the tainted
+        #  variables are reported as well)
+        expected_stdouts = {
+            "test_taint_1.c": \
+"""\
+ + Threat (19, 5): function 'main': a sink (function 'system') with a tainted value has been found, in the parameter with position '1' (the first parameter starts with 1).
+   Severity: ALERT.
+ + Threat (3, 10): function 'main': variable 'x' is tainted with status 'T' which means that the variable is, if is not a false positive, tainted.
+   Severity: INFORMATIONAL.
+ + Threat (7, 9): function 'main': variable 'y' is tainted with status 'T' which means that the variable is, if is not a false positive, tainted.
+   Severity: INFORMATIONAL.
+ + Threat (10, 5): function 'main': variable 'z' is tainted with status 'T' which means that the variable is, if is not a false positive, tainted.
+   Severity: INFORMATIONAL.
+""",
+            "test_taint_2.c": \
+"""\
+ + Threat (17, 5): function 'main': a sink (function 'system') with a tainted value has been found, in the parameter with position '1' (the first parameter starts with 1).
+   Severity: ALERT.
+ + Threat (18, 5): function 'main': a sink (function 'system') with a tainted value has been found, in the parameter with position '1' (the first parameter starts with 1).
+   Severity: ALERT.
+ + Threat (12, 9): function 'main': variable 'x' is tainted with status 'T' which means that the variable is, if is not a false positive, tainted.
+   Severity: INFORMATIONAL.
+ + Threat (11, 9): function 'main': variable 'y' is tainted with status 'T' which means that the variable is, if is not a false positive, tainted.
+   Severity: INFORMATIONAL.
+ + Threat (15, 9): function 'main': variable 'z' is tainted with status 'T' which means that the variable is, if is not a false positive, tainted.
+   Severity: INFORMATIONAL.
+""",
+            "test_taint_control_flow_structures.c": \
+"""\
+ + Threat (20, 5): function 'main': a sink (function 'strcpy') with a tainted value has been found, in the parameter with position '2' (the first parameter starts with 1).
+   Severity: ALERT.
+ + Threat (3, 14): function 'main': variable 'argc' is tainted with status 'T' which means that the variable is, if is not a false positive, tainted.
+   Severity: INFORMATIONAL.
+ + Threat (3, 25): function 'main': variable 'argv' is tainted with status 'T' which means that the variable is, if is not a false positive, tainted.
+   Severity: INFORMATIONAL.
+ + Threat (16, 9): function 'main': variable 'd' is tainted with status 'T' which means that the variable is, if is not a false positive, tainted.
+   Severity: INFORMATIONAL.
+ + Threat (17, 9): function 'main': variable 'e' is tainted with status 'T' which means that the variable is, if is not a false positive, tainted.
+   Severity: INFORMATIONAL.
+ + Threat (19, 10): function 'main': variable 'copy' is tainted with status 'T' which means that the variable is, if is not a false positive, tainted.
+   Severity: INFORMATIONAL.
+""",
+            # The sink is only reached in the second iteration of the loop
+            "test_taint_loops.c": \
+"""\
+ + Threat (12, 9): function 'main': a sink (function 'system') with a tainted value has been found, in the parameter with position '1' (the first parameter starts with 1).
+   Severity: ALERT.
+ + Threat (3, 10): function 'main': variable 'a' is tainted with status 'T' which means that the variable is, if is not a false positive, tainted.
+   Severity: INFORMATIONAL.
+ + Threat (13, 9): function 'main': variable 'b' is tainted with status 'T' which means that the variable is, if is not a false positive, tainted.
+   Severity: INFORMATIONAL.
+""",
+        }
+
+        for sample, expected_stdout in expected_stdouts.items():
+            target = f"{get_script_dir()}/../../C/synthetic/{sample}"
+
+            self.assertEqual(expected_stdout, self.run_boa(target, False, threats=""), sample)
+
+    def test_taint_ssa_kildall(self):
+        for sample in ("test_taint_1.c", "test_taint_2.c", "test_taint_control_flow_structures.c", "test_taint_loops.c"):
+            target = f"{get_script_dir()}/../../C/synthetic/{sample}"
+            kildall_stdout = self.run_boa(target, False)
+            ssa_stdout = self.run_boa(target, True, ssa=True)
+
+            self.assertNotEqual("", kildall_stdout, sample)
+            self.assertEqual(kildall_stdout, ssa_stdout, sample)
+            self.assertEqual(self.run_boa(target, True), ssa_stdout, sample)
+
+    def test_taint_ssa_without_demand_driven(self):
+        target = f"{get_script_dir()}/../../C/synthetic/test_taint_1.c"
+        rules_file = self.get_rules_file(False, ssa=True)
+
+        actual = subprocess.run([f"{get_script_dir()}/../../../boa/boa.py", target, rules_file], check=False, capture_output=True, text=True, env=self.get_env())
+
+        self.assertEqual(0, actual.returncode)
+        self.assertIn("the argument 'ssa' only changes the results of this module when 'demand_driven' is 'true'", actual.stderr)
+
+if __name__ == "__main__":
+    unittest.main()
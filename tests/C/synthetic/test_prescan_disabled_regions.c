@@ -0,0 +1,30 @@
+#include <stdio.h>
+#include <string.h>
+
+struct handler
+{
+    char *(*strcpy)(char *, const char *);
+};
+
+int main()
+{
+    char a[10];
+    char b[10] = "hello";
+    struct handler h;
+
+    h.strcpy = strcpy;
+
+#if 0
+    strcpy(a, b);
+#else
+    strncpy(a, b, sizeof(a));
+#endif
+
+    // Calls through members are not calls to the functions with the same name
+    h.strcpy(a, b);
+    (&h)->strcpy(a, b);
+
+    printf(a);
+
+    return 0;
+}
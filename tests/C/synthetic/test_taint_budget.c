@@ -0,0 +1,21 @@
+#include <stdio.h>
+#include <stdlib.h>
+
+char *command;
+
+int main()
+{
+    char a[20];
+    int i = 0;
+
+    gets(a);
+
+    while (i < 10)
+    {
+        i = i + 1;
+    }
+
+    system(command);
+
+    return 0;
+}
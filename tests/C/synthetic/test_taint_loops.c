@@ -0,0 +1,16 @@
+void main()
+{
+    char a[20];
+    int b = 0;
+    int i = 0;
+
+    gets(a);
+
+    while (i < 10)
+    {
+        // 'b' is tainted in the first iteration, so the sink is reached in the second one
+        system(b);
+        b = a;
+        i = i + 1;
+    }
+}